@@ -15,6 +15,8 @@ import logging
 from functools import lru_cache
 from builtins import open as builtin_open
 
+from embedding_store import get_embedding_store
+
 logger = logging.getLogger(__name__)
 
 class TransformerMatcher:
@@ -270,19 +272,21 @@ class TransformerMatcher:
         """
         college_names = [c.get('normalized_name', c.get('name', '')) for c in colleges]
 
-        # Check if already cached
-        uncached = []
-        for name in college_names:
-            cache_key = name.strip().lower()
-            if cache_key not in self.embedding_cache or force_rebuild:
-                uncached.append(name)
+        # Master embeddings live in the shared persistent store (only new or
+        # renamed colleges are encoded); mirror them into the lookup cache
+        store = get_embedding_store(self.model_name)
+        embeddings = store.encode(
+            college_names,
+            lambda texts: self.model.encode(
+                texts, convert_to_tensor=False, show_progress_bar=True, batch_size=32
+            ),
+            refresh=force_rebuild,
+        )
 
-        if uncached:
-            logger.info(f"Building embeddings for {len(uncached)} colleges...")
-            self.batch_encode(uncached, show_progress=True)
-            self._save_cache()
-        else:
-            logger.info("All college embeddings already cached")
+        for name, embedding in zip(college_names, embeddings):
+            self.embedding_cache[name.strip().lower()] = embedding
+
+        logger.info(f"College index ready: {len(college_names)} embeddings ({len(store)} in store)")
 
     def cross_encoder_rerank(
         self,
@@ -19,51 +19,122 @@ warnings.filterwarnings("ignore", message=".*XLMRobertaTokenizerFast.*")
 import json
 import os
 
+from embedding_store import get_embedding_store
+
 logger = logging.getLogger(__name__)
 
 class NumpyIndex:
-    """Simple Numpy-based Index for exact search (Crash-proof fallback)"""
-    def __init__(self, dim: int):
+    """Numpy-based Index for exact search (Crash-proof fallback)
+
+    Drop-in for faiss.IndexFlatL2: search() returns squared L2 distances and ids,
+    shape (n_queries, k), padded with (FLT_MAX, -1) when fewer than k vectors match.
+
+    Vectors live in a preallocated float32 matrix that grows geometrically (no
+    vstack per add), with squared norms cached. A batch of queries is answered with
+    one matmul (||q||^2 + ||v||^2 - 2 q.v) and argpartition top-k; an optional
+    boolean mask (e.g. one state or stream) restricts the search before ranking.
+    """
+
+    INITIAL_CAPACITY = 1024
+    # Upper bound for one block of the (queries x vectors) distance matrix
+    MAX_BLOCK_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, dim: int, normalize: bool = False):
         self.dim = dim
-        self.vectors = None
+        self.normalize = normalize  # L2-normalize vectors and queries (cosine ranking)
+        self._matrix = np.empty((0, dim), dtype=np.float32)
+        self._sq_norms = np.empty(0, dtype=np.float32)
         self.ntotal = 0
 
+    @property
+    def vectors(self) -> Optional[np.ndarray]:
+        """View of the stored vectors (None when empty)"""
+        return self._matrix[:self.ntotal] if self.ntotal else None
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if self.normalize:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+        return vectors
+
     def add(self, vectors: np.ndarray):
-        if self.vectors is None:
-            self.vectors = vectors
+        vectors = self._prepare(vectors)
+        needed = self.ntotal + len(vectors)
+
+        if needed > len(self._matrix):
+            capacity = max(needed, 2 * len(self._matrix), self.INITIAL_CAPACITY)
+            matrix = np.empty((capacity, self.dim), dtype=np.float32)
+            sq_norms = np.empty(capacity, dtype=np.float32)
+            matrix[:self.ntotal] = self._matrix[:self.ntotal]
+            sq_norms[:self.ntotal] = self._sq_norms[:self.ntotal]
+            self._matrix, self._sq_norms = matrix, sq_norms
+
+        self._matrix[self.ntotal:needed] = vectors
+        self._sq_norms[self.ntotal:needed] = np.einsum('ij,ij->i', vectors, vectors)
+        self.ntotal = needed
+
+    def search(self, query_vectors: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact k-nearest-neighbour search (squared L2, like FAISS)
+
+        Args:
+            query_vectors: (n_queries, dim) array
+            k: Number of neighbours per query
+            mask: Optional boolean array over stored ids; only True ids are searched
+
+        Returns:
+            (distances, indices), each (n_queries, k), nearest first
+        """
+        queries = self._prepare(query_vectors)
+        n_queries = len(queries)
+        distances = np.full((n_queries, k), np.finfo(np.float32).max, dtype=np.float32)
+        indices = np.full((n_queries, k), -1, dtype=np.int64)
+
+        if self.ntotal == 0 or k <= 0 or n_queries == 0:
+            return distances, indices
+
+        if mask is not None:
+            allowed = np.flatnonzero(np.asarray(mask, dtype=bool)[:self.ntotal])
+            if len(allowed) == 0:
+                return distances, indices
+            vectors, sq_norms = self._matrix[allowed], self._sq_norms[allowed]
         else:
-            self.vectors = np.vstack((self.vectors, vectors))
-        self.ntotal = len(self.vectors)
+            allowed = None
+            vectors, sq_norms = self._matrix[:self.ntotal], self._sq_norms[:self.ntotal]
+
+        n_vectors = len(vectors)
+        top_k = min(k, n_vectors)
+        query_sq_norms = np.einsum('ij,ij->i', queries, queries)
+        block = max(1, self.MAX_BLOCK_BYTES // (4 * n_vectors))
+
+        for start in range(0, n_queries, block):
+            end = min(start + block, n_queries)
+
+            # ||q - v||^2 = ||q||^2 + ||v||^2 - 2 q.v  (one matmul per block)
+            dist = queries[start:end] @ vectors.T
+            dist *= -2
+            dist += query_sq_norms[start:end, None]
+            dist += sq_norms[None, :]
+            np.maximum(dist, 0, out=dist)
+
+            if top_k < n_vectors:
+                candidates = np.argpartition(dist, top_k - 1, axis=1)[:, :top_k]
+            else:
+                candidates = np.broadcast_to(np.arange(n_vectors), (end - start, n_vectors))
+            candidate_dist = np.take_along_axis(dist, candidates, axis=1)
+            order = np.argsort(candidate_dist, axis=1, kind='stable')
 
-    def search(self, query_vectors: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
-        # L2 distance: ||u - v||^2 = ||u||^2 + ||v||^2 - 2 <u, v>
-        # But for normalized vectors (cosine similarity), we can just use dot product
-        # Here we implement L2 to match FAISS behavior
-        
-        dists = []
-        indices = []
-        
-        for q in query_vectors:
-            # Calculate L2 distance to all vectors
-            # dist = np.linalg.norm(self.vectors - q, axis=1)
-            # Optimization: (a-b)^2 = a^2 + b^2 - 2ab
-            # Since we want nearest neighbors (min distance)
-            
-            # Simple Euclidean distance
-            diff = self.vectors - q
-            dist_sq = np.sum(diff**2, axis=1)
-            
-            # Get top k
-            idx = np.argsort(dist_sq)[:k]
-            dst = dist_sq[idx]
-            
-            dists.append(dst)
-            indices.append(idx)
-            
-        return np.array(dists), np.array(indices)
+            best = np.take_along_axis(candidates, order, axis=1)
+            distances[start:end, :top_k] = np.take_along_axis(candidate_dist, order, axis=1)
+            indices[start:end, :top_k] = best if allowed is None else allowed[best]
+
+        return distances, indices
 
     def reset(self):
-        self.vectors = None
+        self._matrix = np.empty((0, self.dim), dtype=np.float32)
+        self._sq_norms = np.empty(0, dtype=np.float32)
         self.ntotal = 0
         
     @property
@@ -84,6 +155,7 @@ class VectorSearchEngine:
         self.index_type = index_type
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
         self.use_bge_m3 = 'bge-m3' in model_name.lower()
 
         # Load transformer model - prioritize FlagEmbedding for BGE-M3
@@ -104,6 +176,12 @@ class VectorSearchEngine:
             self.use_bge_m3 = False
             logger.info("  ✓ Loaded via SentenceTransformer")
 
+        # Encoder settings that shape the vectors (key the persistent embedding store)
+        if self.use_bge_m3:
+            self.encode_params = {'backend': 'FlagEmbedding', 'use_fp16': True, 'max_length': 128}
+        else:
+            self.encode_params = {}
+
         # Initialize Index
         self.use_faiss = False
         try:
@@ -119,6 +197,7 @@ class VectorSearchEngine:
         self.id_to_data = {}
         self.data_to_id = {}
         self.next_id = 0
+        self._state_masks: Dict[str, np.ndarray] = {}  # Numpy backend: state -> id mask
 
     def _create_index(self, index_type: str, dim: int):
         """Create FAISS index based on type"""
@@ -136,6 +215,26 @@ class VectorSearchEngine:
             raise ValueError(f"Unknown index type: {index_type}")
         return index
 
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Run the embedding model - handles both FlagEmbedding and SentenceTransformer"""
+        if self.use_bge_m3:
+            # FlagEmbedding API (BGE-M3)
+            result = self.model.encode(texts, batch_size=32, max_length=128)
+            if isinstance(result, dict) and 'dense_vecs' in result:
+                embeddings = result['dense_vecs']
+            else:
+                embeddings = result
+            return np.array(embeddings, dtype='float32')
+
+        # SentenceTransformer API
+        embeddings = self.model.encode(
+            texts,
+            convert_to_tensor=False,
+            show_progress_bar=True,
+            batch_size=32
+        )
+        return np.asarray(embeddings, dtype='float32')
+
     def add_colleges(self, colleges: List[Dict], force_rebuild: bool = False):
         """Add colleges to the index"""
         index_file = self.cache_dir / f"faiss_{self.index_type}.index"
@@ -148,51 +247,38 @@ class VectorSearchEngine:
                 if self.use_faiss:
                     import faiss
                     self.index = faiss.read_index(str(index_file))
-                else:
-                    # For numpy, we just rebuild (it's fast) or load if we implemented save
-                    # For now, just rebuild to be safe
-                    pass 
-                
+
                 with open(metadata_file, 'rb') as f:
                     cache_data = pickle.load(f)
+
+                # The cached index is only valid for the same college list
+                cached_names = [d.get('name', '') for _, d in sorted(cache_data['id_to_data'].items())]
+                if self.use_faiss and cached_names == [c.get('name', '') for c in colleges]:
                     self.id_to_data = cache_data['id_to_data']
                     self.data_to_id = cache_data['data_to_id']
                     self.next_id = cache_data['next_id']
-                
-                # If we loaded metadata but not index (Numpy case), we need to rebuild vectors.
-                # But we don't have the raw vectors cached separately. 
-                # So for Numpy, we might just want to rebuild always or cache vectors.
-                # Simpler: If Numpy, just rebuild.
-                if self.use_faiss:
+                    self._state_masks = {}
                     logger.info(f"Loaded {self.next_id} colleges from cache")
                     return
+                # Numpy backend (or master data changed): rebuild from the
+                # persistent embedding store - only new names are encoded
             except Exception as e:
                 logger.warning(f"Failed to load cache: {e}. Rebuilding...")
 
         logger.info(f"Building index for {len(colleges)} colleges...")
 
-        # Generate embeddings - handle both FlagEmbedding and SentenceTransformer
         college_names = [c.get('name', '') for c in colleges]
-        
-        if self.use_bge_m3:
-            # FlagEmbedding API (BGE-M3)
-            result = self.model.encode(college_names, batch_size=32, max_length=128)
-            if isinstance(result, dict) and 'dense_vecs' in result:
-                embeddings = result['dense_vecs']
-            else:
-                embeddings = result
-            embeddings = np.array(embeddings)
-        else:
-            # SentenceTransformer API
-            embeddings = self.model.encode(
-                college_names,
-                convert_to_tensor=False,
-                show_progress_bar=True,
-                batch_size=32
-            )
+        embeddings = get_embedding_store(self.model_name, encode_params=self.encode_params).encode(
+            college_names, self._encode_texts, refresh=force_rebuild
+        )
 
-        # Convert to float32
-        embeddings = embeddings.astype('float32')
+        # Start from an empty index so a rebuild never duplicates vectors
+        if self.use_faiss:
+            self.index = self._create_index(self.index_type, self.embedding_dim)
+        else:
+            self.index = NumpyIndex(self.embedding_dim)
+        self.id_to_data = {}
+        self.data_to_id = {}
 
         # Train index if needed
         if self.use_faiss and self.index_type == 'ivf' and not self.index.is_trained:
@@ -208,6 +294,7 @@ class VectorSearchEngine:
             self.data_to_id[key] = i
 
         self.next_id = len(colleges)
+        self._state_masks = {}
 
         # Save index and metadata (Only for FAISS for now)
         if self.use_faiss:
@@ -247,11 +334,15 @@ class VectorSearchEngine:
         query_emb = query_emb.astype('float32')
 
         # Search
-        search_k = k * 5 if state_filter else k
-        if self.use_faiss and self.index_type == 'ivf':
-            self.index.nprobe = 10
+        if not self.use_faiss and state_filter:
+            # Numpy backend: restrict to the state before ranking (exact top-k)
+            distances, indices = self.index.search(query_emb, k, mask=self._state_mask(state_filter))
+        else:
+            search_k = k * 5 if state_filter else k
+            if self.use_faiss and self.index_type == 'ivf':
+                self.index.nprobe = 10
 
-        distances, indices = self.index.search(query_emb, search_k)
+            distances, indices = self.index.search(query_emb, search_k)
 
         # Convert distances to similarity scores (1 / (1 + L2))
         # For normalized vectors, L2 = 2(1-cos). So cos = 1 - L2/2.
@@ -277,6 +368,18 @@ class VectorSearchEngine:
 
         return results
 
+    def _state_mask(self, state: str) -> np.ndarray:
+        """Boolean mask over index ids for one state (cached per state)"""
+        state_key = state.strip().upper()
+        mask = self._state_masks.get(state_key)
+        if mask is None:
+            mask = np.zeros(self.index.ntotal, dtype=bool)
+            for idx, college in self.id_to_data.items():
+                if idx < len(mask) and (college.get('state') or '').strip().upper() == state_key:
+                    mask[idx] = True
+            self._state_masks[state_key] = mask
+        return mask
+
     def hybrid_search(
         self,
         query: str,
@@ -332,6 +435,7 @@ class VectorSearchEngine:
         self.id_to_data = {}
         self.data_to_id = {}
         self.next_id = 0
+        self._state_masks = {}
         logger.info("Index cleared")
 
 
@@ -23,7 +23,9 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from openrouter_client import OpenRouterClient, OpenRouterResponse
+from streaming_json import IncrementalJSONObjectDecoder
 from llm_response_cache import get_matcher_cache, LLMResponseCache
+from semantic_llm_cache import get_semantic_cache_tier
 from llm_performance_tracker import (
     get_performance_tracker, get_retry_queue, get_circuit_breaker,
     get_cost_tracker, health_check_models,
@@ -362,6 +364,7 @@ SAME-NAME WARNING: This batch contains commonly-named colleges.
         api_key: Optional[str] = None,  # Legacy single key support
         timeout: float = 300.0,
         enable_cache: bool = True,  # Enable LLM response caching
+        semantic_cache_threshold: Optional[float] = 0.92,  # Near-duplicate cache reuse (None = off)
     ):
         self.seat_db_path = seat_db_path
         self.master_db_path = master_db_path
@@ -386,6 +389,12 @@ SAME-NAME WARNING: This batch contains commonly-named colleges.
         if self.cache:
             logger.info(f"LLM Response Cache enabled")
         
+        # Second tier: reuse decisions for near-duplicate names (normalized + embedded)
+        self.semantic_cache = None
+        self.semantic_cache_stats: Dict[str, Any] = {}  # Last resolve_unmatched() run
+        if self.cache and semantic_cache_threshold is not None:
+            self.semantic_cache = get_semantic_cache_tier(self.cache, threshold=semantic_cache_threshold)
+        
         # Initialize TF-IDF pre-filter (optional, config-driven)
         self.tfidf_enabled = False
         self.tfidf_vectorizer = None
@@ -1519,14 +1528,14 @@ SAME-NAME WARNING: This batch contains commonly-named colleges.
             cached_count = 0
             uncached_records = []
             
-            for record in all_unmatched:
-                cache_entry = self.cache.get(
-                    college_name=record.get('college_name', ''),
-                    state=record.get('state', ''),
-                    address=record.get('address', ''),
-                    course_type=record.get('type'),
-                )
-                
+            # One batched lookup (LRU + chunked IN queries) instead of a query per record
+            cache_entries = self.cache.get_many([
+                (record.get('college_name', ''), record.get('state', ''),
+                 record.get('address', ''), record.get('type'))
+                for record in all_unmatched
+            ])
+            
+            for record, cache_entry in zip(all_unmatched, cache_entries):
                 if cache_entry and cache_entry.matched_college_id:
                     # Use cached result
                     cached_decisions.append(MatchDecision(
@@ -1543,6 +1552,22 @@ SAME-NAME WARNING: This batch contains commonly-named colleges.
             if cached_count > 0:
                 console.print(f"[green]✓ Cache hit: {cached_count}/{len(all_unmatched)} records from cache[/green]")
             
+            # Step 1.6: Near-duplicate tier for exact-cache misses
+            if self.semantic_cache and uncached_records:
+                semantic_decisions, uncached_records = self._semantic_cache_lookup(uncached_records)
+                saved_calls = -(-len(semantic_decisions) // max(batch_size, 1))  # ceil
+                if semantic_decisions:
+                    cached_decisions.extend(semantic_decisions)
+                    console.print(
+                        f"[green]✓ Semantic cache hit: {len(semantic_decisions)} near-duplicate records "
+                        f"(≈{saved_calls} LLM calls saved at batch size {batch_size})[/green]"
+                    )
+                self.semantic_cache_stats = {
+                    **self.semantic_cache.get_stats(),
+                    'run_hits': len(semantic_decisions),
+                    'llm_calls_saved': saved_calls,
+                }
+            
             # Update stats display
             cache_stats = self.cache.get_stats()
             console.print(f"[dim]Cache: {cache_stats['hit_rate']} hit rate, {cache_stats['total_entries']} entries[/dim]")
@@ -2043,20 +2068,21 @@ SAME-NAME WARNING: This batch contains commonly-named colleges.
                         
                         # Cache LLM suggestions (unverified) - Guardian will mark_verified() or invalidate()
                         if self.cache:
-                            for d in result:
-                                if d.matched_college_id and d.record_id in unmatched_lookup:
-                                    record = unmatched_lookup[d.record_id]
-                                    self.cache.set(
-                                        college_name=record.get('college_name', ''),
-                                        state=record.get('state', ''),
-                                        address=record.get('address', ''),
-                                        matched_college_id=d.matched_college_id,
-                                        confidence=d.confidence,
-                                        reason=d.reason,
-                                        model_name=d.model or info.get('model', 'unknown'),
-                                        course_type=record.get('type'),
-                                        verified=False,  # Will be verified by Guardian
-                                    )
+                            self.cache.set_many([
+                                {
+                                    'college_name': unmatched_lookup[d.record_id].get('college_name', ''),
+                                    'state': unmatched_lookup[d.record_id].get('state', ''),
+                                    'address': unmatched_lookup[d.record_id].get('address', ''),
+                                    'matched_college_id': d.matched_college_id,
+                                    'confidence': d.confidence,
+                                    'reason': d.reason,
+                                    'model_name': d.model or info.get('model', 'unknown'),
+                                    'course_type': unmatched_lookup[d.record_id].get('type'),
+                                    'verified': False,  # Will be verified by Guardian
+                                }
+                                for d in result
+                                if d.matched_college_id and d.record_id in unmatched_lookup
+                            ])
             else:
                 # Sequential mode (with pre-filtering)
                 for i, batch in enumerate(batches):
@@ -2948,6 +2974,8 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
         
         Uses streaming API to parse JSON records progressively, allowing
         real-time progress updates before the full response completes.
+        Records are decoded incrementally (IncrementalJSONObjectDecoder), so
+        each chunk is scanned once and each record is yielded exactly once.
         
         Args:
             batch: List of unmatched records
@@ -2958,8 +2986,6 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
         Yields:
             MatchDecision: Decisions as they are parsed from stream
         """
-        import re
-        
         if not self.clients:
             return
         
@@ -2969,7 +2995,7 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
         prompt = self._build_prompt_per_record(batch, candidates_per_record)
         
         # Stream response
-        partial_content = ""
+        decoder = IncrementalJSONObjectDecoder(required_key='record_id')
         yielded_record_ids = set()
         
         try:
@@ -2982,47 +3008,31 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
                 temperature=0.1,
                 max_tokens=8192,
             ):
-                partial_content += chunk
-                
-                # Try to extract complete JSON objects as they stream
-                # Look for complete record entries: {"record_id": "...", ...}
-                pattern = r'\{\s*"record_id"\s*:\s*"([^"]+)"[^}]+\}'
-                
-                for match in re.finditer(pattern, partial_content):
-                    record_json = match.group(0)
-                    record_id = match.group(1)
+                for data in decoder.feed(chunk):
+                    record_id = str(data['record_id'])
                     
-                    # Skip already yielded
+                    # Skip already yielded (model repeated a record)
                     if record_id in yielded_record_ids:
                         continue
+                    yielded_record_ids.add(record_id)
                     
-                    try:
-                        data = json.loads(record_json)
-                        
-                        if data.get('matched_college_id'):
-                            decision = MatchDecision(
-                                record_id=str(data['record_id']),
-                                matched_college_id=data['matched_college_id'],
-                                confidence=data.get('confidence', 0.8),
-                                reason=data.get('reason', 'Streamed match'),
-                                model=model,
-                            )
-                            yielded_record_ids.add(record_id)
-                            yield decision
-                        else:
-                            # No match - still yield for tracking
-                            decision = MatchDecision(
-                                record_id=str(data['record_id']),
-                                matched_college_id=None,
-                                confidence=0.0,
-                                reason=data.get('reason', 'No match'),
-                                model=model,
-                            )
-                            yielded_record_ids.add(record_id)
-                            yield decision
-                            
-                    except json.JSONDecodeError:
-                        continue  # Wait for more content
+                    if data.get('matched_college_id'):
+                        yield MatchDecision(
+                            record_id=record_id,
+                            matched_college_id=data['matched_college_id'],
+                            confidence=data.get('confidence', 0.8),
+                            reason=data.get('reason', 'Streamed match'),
+                            model=model,
+                        )
+                    else:
+                        # No match - still yield for tracking
+                        yield MatchDecision(
+                            record_id=record_id,
+                            matched_college_id=None,
+                            confidence=0.0,
+                            reason=data.get('reason', 'No match'),
+                            model=model,
+                        )
                         
         except Exception as e:
             logger.warning(f"Streaming failed, falling back to regular call: {e}")
@@ -3035,6 +3045,8 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
         candidates_per_record: Dict[str, List[tuple]],
         model: str = None,
         on_decision=None,
+        apply_to_table: Optional[str] = None,
+        apply_every: int = 10,
     ) -> List[MatchDecision]:
         """
         Resolve a batch using streaming with real-time callbacks.
@@ -3044,15 +3056,18 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
             candidates_per_record: Candidates per record
             model: Model to use
             on_decision: Callback(decision) called for each streamed decision
+            apply_to_table: If set, write decisions to this table while the
+                stream is still running (every `apply_every` decisions)
+            apply_every: Decisions per incremental _apply_decisions call
             
         Returns:
             List of all decisions
         """
-        model = model or WORKER_MODELS[0] if WORKER_MODELS else None
-        if not model:
-            return []
+        # WORKER_MODELS is local to resolve_unmatched - default to the primary model
+        model = model or OpenRouterClient.MODELS["primary"]
         
         decisions = []
+        pending = []
         
         for decision in self._stream_batch_response(batch, model, candidates_per_record):
             decisions.append(decision)
@@ -3063,6 +3078,15 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
             # Log progress
             if decision.matched_college_id:
                 logger.debug(f"[Stream] {decision.record_id} → {decision.matched_college_id}")
+            
+            if apply_to_table:
+                pending.append(decision)
+                if len(pending) >= apply_every:
+                    self._apply_decisions(apply_to_table, pending)
+                    pending = []
+        
+        if apply_to_table and pending:
+            self._apply_decisions(apply_to_table, pending)
         
         return decisions
     
@@ -3161,8 +3185,250 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
         
         return decisions
     
+    @staticmethod
+    def _master_table_for(college_id: str) -> Tuple[str, str]:
+        """Master table and stream for a college ID (MED*/DEN*/other -> DNB)."""
+        if college_id.startswith('MED'):
+            return 'medical_colleges', 'medical'
+        if college_id.startswith('DEN'):
+            return 'dental_colleges', 'dental'
+        return 'dnb_colleges', 'dnb'
+    
+    def _stream_block_reason(self, seat_course_type: str, expected_stream: str) -> Optional[str]:
+        """
+        Cross-stream guard shared by _apply_decisions and cache reuse.
+        
+        Returns the rejection reason, or None when the course may match a
+        college of `expected_stream`.
+        """
+        seat_stream = (seat_course_type or '').lower()
+        if not seat_stream:
+            return None
+        
+        # DNB courses should NOT match MED/DEN colleges
+        if 'dnb' in seat_stream and expected_stream != 'dnb':
+            return f"DNB course matched to {expected_stream.upper()} college"
+        
+        # MEDICAL course should not match DNB college
+        # EXCEPT for overlapping diploma courses (from config.yaml)
+        if ('mbbs' in seat_stream or 'medical' in seat_stream) and expected_stream == 'dnb':
+            if 'diploma' in seat_stream:
+                import yaml
+                try:
+                    with open('config.yaml', 'r') as f:
+                        cfg = yaml.safe_load(f)
+                    diploma_cfg = cfg.get('diploma_courses', {})
+                    dnb_only = [d.upper().replace(' IN ', ' ') for d in diploma_cfg.get('dnb_only', [])]
+                    overlapping = [d.upper().replace(' IN ', ' ') for d in diploma_cfg.get('overlapping', [])]
+                    
+                    ct_norm = seat_course_type.upper().replace(' IN ', ' ')
+                    if any(k in ct_norm for k in dnb_only) or any(k in ct_norm for k in overlapping):
+                        return None
+                except:
+                    pass
+            return "MEDICAL course matched to DNB college"
+        
+        return None
+    
+    def _semantic_cache_lookup(self, records: List[Dict]) -> Tuple[List[MatchDecision], List[Dict]]:
+        """
+        Reuse cached decisions for near-duplicates of records that missed the exact cache.
+        
+        A neighbour's decision is only reused when its master college passes the
+        same stream and state guards as _apply_decisions, and - because the names
+        of different campuses embed almost identically - when the record's address
+        shares a location with the master address (the multi-campus check, applied
+        whenever both addresses are known).
+        
+        Returns:
+            (decisions from the semantic tier, records still needing the LLM)
+        """
+        requests = [
+            (record.get('college_name', ''), record.get('state', ''),
+             record.get('address', ''), record.get('type'))
+            for record in records
+        ]
+        
+        # Master rows of all candidate colleges, loaded in one pass by prepare()
+        master_rows: Dict[str, Dict[str, Any]] = {}
+        
+        def load_master_rows(entries) -> None:
+            master_rows.update(self._load_master_rows([entry.matched_college_id for entry in entries]))
+        
+        def passes_guards(i: int, entry) -> bool:
+            college_id = entry.matched_college_id
+            record = records[i]
+            if self._stream_block_reason(record.get('type') or '', self._master_table_for(college_id)[1]):
+                return False
+            master_row = master_rows.get(college_id)
+            if master_row is None:
+                return False  # College no longer in master data
+            seat_state = (record.get('state') or '').upper().strip()
+            master_state = (master_row['state'] or '').upper().strip()
+            if seat_state and master_state and seat_state != master_state:
+                return False
+            seat_address = record.get('address') or ''
+            master_address = master_row['address'] or ''
+            return not (seat_address and master_address) or self._addresses_overlap(seat_address, master_address)
+        
+        hits = self.semantic_cache.get_many(requests, accept=passes_guards, prepare=load_master_rows)
+        
+        decisions = []
+        remaining = []
+        for record, hit in zip(records, hits):
+            if hit is None:
+                remaining.append(record)
+                continue
+            decisions.append(MatchDecision(
+                record_id=record.get('record_id'),
+                matched_college_id=hit.entry.matched_college_id,
+                confidence=hit.entry.confidence,
+                reason=f"[SEMANTIC CACHE {hit.similarity:.3f}] {hit.entry.reason}",
+                model=f"cache:{hit.entry.model_name}",
+            ))
+        return decisions, remaining
+    
+    def _load_master_rows(self, college_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Master name/address/state per college ID (IN-queries, chunked, per master table)."""
+        by_table: Dict[str, List[str]] = {}
+        for college_id in set(college_ids):
+            by_table.setdefault(self._master_table_for(college_id)[0], []).append(college_id)
+        
+        rows_by_id = {}
+        conn = sqlite3.connect(self.master_db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            for master_table, ids in by_table.items():
+                for i in range(0, len(ids), 500):
+                    chunk = ids[i:i + 500]
+                    # Normalized columns for fair comparison
+                    rows = conn.execute(f"""
+                        SELECT id, name,
+                               COALESCE(normalized_address, address) as address,
+                               COALESCE(normalized_state, state) as state,
+                               COALESCE(normalized_name, name) as norm_name
+                        FROM {master_table}
+                        WHERE id IN ({','.join('?' * len(chunk))})
+                    """, chunk).fetchall()
+                    rows_by_id.update({row['id']: dict(row) for row in rows})
+        finally:
+            conn.close()
+        return rows_by_id
+    
+    def _load_same_name_counts(self, names_by_table: Dict[str, set]) -> Dict[Tuple[str, str, str], int]:
+        """
+        Colleges per (master table, normalized name, UPPER(TRIM(state))).
+        
+        A count above 1 marks a multi-campus college, where only the address
+        tells the campuses apart.
+        """
+        counts = {}
+        conn = sqlite3.connect(self.master_db_path)
+        try:
+            for master_table, names in names_by_table.items():
+                names = list(names)
+                for i in range(0, len(names), 500):
+                    chunk = names[i:i + 500]
+                    rows = conn.execute(f"""
+                        SELECT COALESCE(normalized_name, name),
+                               UPPER(TRIM(COALESCE(normalized_state, state))),
+                               COUNT(*)
+                        FROM {master_table}
+                        WHERE COALESCE(normalized_name, name) IN ({','.join('?' * len(chunk))})
+                        GROUP BY 1, 2
+                    """, chunk).fetchall()
+                    counts.update({(master_table, name, state): count for name, state, count in rows})
+        finally:
+            conn.close()
+        return counts
+    
+    @staticmethod
+    def _load_seat_rows(cursor: sqlite3.Cursor, table: str, record_ids: List[str]) -> Dict[str, tuple]:
+        """(address, state, course_type, college_name) per seat/group ID, normalized columns first."""
+        if table == 'group_matching_queue':
+            id_col = 'group_id'
+            columns = "normalized_address, normalized_state, sample_course_type, normalized_college_name"
+        else:
+            id_col = 'id'
+            columns = ("COALESCE(normalized_address, address), COALESCE(normalized_state, state), "
+                       "course_type, COALESCE(normalized_college_name, college_name)")
+        
+        seat_rows = {}
+        record_ids = list(dict.fromkeys(record_ids))
+        for i in range(0, len(record_ids), 500):
+            chunk = record_ids[i:i + 500]
+            cursor.execute(f"""
+                SELECT {id_col}, {columns} FROM {table}
+                WHERE {id_col} IN ({','.join('?' * len(chunk))})
+            """, chunk)
+            for row in cursor.fetchall():
+                seat_rows.setdefault(str(row[0]), row[1:])
+        return seat_rows
+    
+    @staticmethod
+    def _addresses_overlap(seat_address: str, master_address: str) -> bool:
+        """
+        Whether two addresses share a location (multi-campus check of _apply_decisions).
+        
+        True when they share a distinctive word (city, district, college code), a
+        near-identical word (OCR splits / spelling), or a pincode - or when either
+        has no distinctive words to compare.
+        """
+        import re
+        
+        # Extract district/city from both addresses
+        # FIXED: Normalize addresses before comparison
+        # - Remove @ symbols (email-based identifiers: CHHSP1234@GMAIL → CHHSP1234GMAIL)
+        # - Use alphanumeric regex to match codes like CHHSP1234
+        seat_addr_norm = re.sub(r'[@.]', '', seat_address.upper())  # Remove @ and .
+        master_addr_norm = re.sub(r'[@.]', '', master_address.upper())
+        
+        # Extract alphanumeric words (4+ chars) - includes codes like CHHSP1234
+        seat_words = set(re.findall(r'\b([A-Z0-9]{4,})\b', seat_addr_norm))
+        master_words = set(re.findall(r'\b([A-Z0-9]{4,})\b', master_addr_norm))
+        
+        # Remove common stopwords
+        stopwords = {'HOSPITAL', 'COLLEGE', 'MEDICAL', 'DENTAL', 'INSTITUTE', 
+                   'GOVT', 'GOVERNMENT', 'STATE', 'AUTONOMOUS', 'SOCIETY',
+                   'DISTRICT', 'TALUK', 'POST', 'OFFICE', 'ROAD', 'STREET'}
+        seat_words -= stopwords
+        master_words -= stopwords
+        
+        if not seat_words or not master_words or seat_words & master_words:
+            return True
+        
+        # FUZZY MATCHING: Handle OCR issues like "ANANTA PURAM" vs "ANANTHAPURAM"
+        # Method 1: Check without spaces (handles "ANANTA PURAM" → "ANANTHAPURAM")
+        seat_no_space = re.sub(r'[^A-Z0-9]', '', seat_addr_norm)
+        
+        # Check if master location is in seat (without spaces)
+        # e.g., "NANDYAL" in "PRINCIPALGMCNANDYALAGMAILCOM518501"
+        if any(len(mw) >= 5 and mw in seat_no_space for mw in master_words):
+            return True
+        
+        # Method 2: Check fuzzy similarity of each word pair (80% similar)
+        from rapidfuzz import fuzz
+        for sw in seat_words:
+            for mw in master_words:
+                if len(sw) >= 5 and len(mw) >= 5 and fuzz.ratio(sw, mw) >= 80:
+                    return True
+        
+        # Method 3: Check pincode match (6-digit codes)
+        seat_pincodes = set(re.findall(r'\b[1-9][0-9]{5}\b', seat_address))
+        master_pincodes = set(re.findall(r'\b[1-9][0-9]{5}\b', master_address))
+        return bool(seat_pincodes & master_pincodes)
+    
     def _apply_decisions(self, table: str, decisions: List[MatchDecision]):
-        """Apply match decisions to the database."""
+        """
+        Apply match decisions to the database.
+        
+        Three phases: preload every referenced master and seat/group row with
+        IN-queries, run the stream/state/address/ensemble validations in
+        memory, then write all accepted and rejected outcomes with executemany
+        in one transaction.
+        """
+        from itertools import groupby
+        
         conn = sqlite3.connect(self.seat_db_path)
         cursor = conn.cursor()
         
@@ -3179,129 +3445,106 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
             match_col = 'master_college_id'
             score_col = 'college_match_score'
             method_col = 'college_match_method'
-
+        
+        rejected_sql = f"""
+            UPDATE {table}
+            SET is_processed = 1,
+                match_method = ?
+            WHERE {id_col} = ?
+        """
+        if table == 'group_matching_queue':
+            # CRITICAL: Set is_processed = 1 so auto-retry loop fetches next batch
+            accepted_sql = f"""
+                UPDATE {table}
+                SET {match_col} = ?,
+                    {score_col} = ?,
+                    {method_col} = 'agentic_llm',
+                    match_model = ?,
+                    is_processed = 1
+                WHERE {id_col} = ?
+            """
+        else:
+            # Other tables may not have match_model column
+            accepted_sql = f"""
+                UPDATE {table}
+                SET {match_col} = ?,
+                    {score_col} = ?,
+                    {method_col} = ?
+                WHERE {id_col} = ?
+            """
+        
+        # Pending writes in decision order: (sql, params)
+        writes: List[Tuple[str, tuple]] = []
+        
         # Helper: Mark rejected records as processed to prevent re-fetching
         def mark_rejected_as_processed(record_ids: list, rejection_reason: str):
-            nonlocal updated_count
             for rid in record_ids:
                 rid = rid.strip()
                 if rid and table == 'group_matching_queue':
-                    cursor.execute(f"""
-                        UPDATE {table}
-                        SET is_processed = 1,
-                            match_method = ?
-                        WHERE {id_col} = ?
-                    """, (rejection_reason, rid))
-                    updated_count += cursor.rowcount
-
-        # PRE-VALIDATION: Load master college addresses for validation
-        master_conn = sqlite3.connect(self.master_db_path)
-        master_conn.row_factory = sqlite3.Row
-        master_cursor = master_conn.cursor()
+                    writes.append((rejected_sql, (rejection_reason, rid)))
+        
+        # ==========================================
+        # PHASE 1: PRELOAD master and seat rows
+        # ==========================================
+        matched = [d for d in decisions if d.matched_college_id]
+        master_rows = self._load_master_rows([d.matched_college_id for d in matched])
+        
+        first_rids = {}
+        for decision in matched:
+            record_ids = decision.record_id.split(',') if decision.record_id else []
+            if record_ids and record_ids[0].strip():
+                first_rids[id(decision)] = record_ids[0].strip()
+        seat_rows = self._load_seat_rows(cursor, table, list(first_rids.values()))
+        
+        # Multi-campus candidates: same normalized name counted per state
+        names_by_table: Dict[str, set] = {}
+        for college_id, master_row in master_rows.items():
+            if master_row['address']:
+                names_by_table.setdefault(self._master_table_for(college_id)[0], set()).add(master_row['norm_name'])
+        same_name_counts = self._load_same_name_counts(names_by_table)
         
         rejected_count = 0
-
-        for decision in decisions:
-            if decision.matched_college_id:
-                college_id = decision.matched_college_id
-                
-                # Determine which master table to query
-                if college_id.startswith('MED'):
-                    master_table = 'medical_colleges'
-                    expected_stream = 'medical'
-                elif college_id.startswith('DEN'):
-                    master_table = 'dental_colleges'
-                    expected_stream = 'dental'
-                else:
-                    master_table = 'dnb_colleges'
-                    expected_stream = 'dnb'
-                
-                # Get master college info - use normalized columns for fair comparison
-                master_cursor.execute(f"""
-                    SELECT name, 
-                           COALESCE(normalized_address, address) as address, 
-                           COALESCE(normalized_state, state) as state 
-                    FROM {master_table} WHERE id = ?
-                """, (college_id,))
-                master_row = master_cursor.fetchone()
-                master_address = master_row['address'] if master_row else ''
-                master_state = master_row['state'] if master_row else ''
-                
-                # Get seat record info (from the first record_id)
-                # IMPORTANT: Use normalized_address and normalized_state for fair comparison
-                record_ids = decision.record_id.split(',') if decision.record_id else []
-                seat_address = ''
-                seat_state = ''
-                seat_course_type = ''
-                seat_college_name = ''
-                
-                if record_ids:
-                    first_rid = record_ids[0].strip()
-                    if first_rid and table == 'group_matching_queue':
-                        # group_matching_queue uses normalized columns
-                        cursor.execute(f"SELECT normalized_address, normalized_state, sample_course_type, normalized_college_name FROM {table} WHERE group_id = ?", (first_rid,))
-                    elif first_rid:
-                        # seat_data - use normalized columns for fair comparison
-                        cursor.execute(f"SELECT COALESCE(normalized_address, address), COALESCE(normalized_state, state), course_type, COALESCE(normalized_college_name, college_name) FROM {table} WHERE id = ?", (first_rid,))
-                    seat_row = cursor.fetchone()
+        
+        # ==========================================
+        # PHASE 2: VALIDATE in memory
+        # ==========================================
+        # Audit rows for blocked decisions are flushed in one transaction too
+        with get_audit_logger().deferred_writes():
+            for decision in decisions:
+                if decision.matched_college_id:
+                    college_id = decision.matched_college_id
+                    
+                    # Determine which master table the college lives in
+                    master_table, expected_stream = self._master_table_for(college_id)
+                    
+                    master_row = master_rows.get(college_id)
+                    master_address = master_row['address'] if master_row else ''
+                    master_state = master_row['state'] if master_row else ''
+                    
+                    # Seat record info (from the first record_id)
+                    # IMPORTANT: Uses normalized_address and normalized_state for fair comparison
+                    record_ids = decision.record_id.split(',') if decision.record_id else []
+                    seat_address = ''
+                    seat_state = ''
+                    seat_course_type = ''
+                    seat_college_name = ''
+                    
+                    seat_row = seat_rows.get(first_rids.get(id(decision)))
                     if seat_row:
                         seat_address = seat_row[0] or ''
                         seat_state = seat_row[1] or ''
                         seat_course_type = seat_row[2] or ''
-                        seat_college_name = seat_row[3] or '' if len(seat_row) > 3 else ''
-                
-                # ==========================================
-                # VALIDATION 1: STREAM CHECK (Cross-Stream Block)
-                # ==========================================
-                # DNB courses should NOT match MED/DEN colleges
-                if seat_course_type:
-                    seat_stream = seat_course_type.lower()
-                    if 'dnb' in seat_stream and expected_stream != 'dnb':
-                        console.print(f"[red]❌ STREAM BLOCKED: {decision.record_id} → {college_id} (DNB course → {expected_stream.upper()} college)[/red]")
-                        # AUDIT LOG
-                        audit = get_audit_logger()
-                        audit.log_match(
-                            group_id=decision.record_id,
-                            seat_college_name=seat_college_name,
-                            seat_state=seat_state,
-                            seat_address=seat_address,
-                            matched_college_id=college_id,
-                            master_college_name=master_row['name'] if master_row else '',
-                            master_state=master_state,
-                            master_address=master_address,
-                            confidence=decision.confidence or 0,
-                            name_similarity=0,
-                            status='STREAM_BLOCKED',
-                            reason=f"DNB course matched to {expected_stream.upper()} college",
-                            model=decision.model or '',
-                            record_count=len(record_ids),
-                        )
-                        mark_rejected_as_processed(record_ids, 'stream_blocked')
-                        rejected_count += 1
-                        continue
+                        seat_college_name = seat_row[3] or ''
                     
-                    # MEDICAL course should not match DNB college
-                    # EXCEPT for overlapping diploma courses (from config.yaml)
-                    if ('mbbs' in seat_stream or 'medical' in seat_stream) and expected_stream == 'dnb':
-                        # Check if this is a diploma that CAN be at DNB hospitals
-                        is_overlapping_diploma = False
-                        if 'diploma' in seat_stream:
-                            import yaml
-                            try:
-                                with open('config.yaml', 'r') as f:
-                                    cfg = yaml.safe_load(f)
-                                diploma_cfg = cfg.get('diploma_courses', {})
-                                dnb_only = [d.upper().replace(' IN ', ' ') for d in diploma_cfg.get('dnb_only', [])]
-                                overlapping = [d.upper().replace(' IN ', ' ') for d in diploma_cfg.get('overlapping', [])]
-                                
-                                ct_norm = seat_course_type.upper().replace(' IN ', ' ')
-                                if any(k in ct_norm for k in dnb_only) or any(k in ct_norm for k in overlapping):
-                                    is_overlapping_diploma = True
-                            except:
-                                pass
-                        
-                        if not is_overlapping_diploma:
-                            console.print(f"[red]❌ STREAM BLOCKED: {decision.record_id} → {college_id} (MEDICAL course → DNB college)[/red]")
+                    # ==========================================
+                    # VALIDATION 1: STREAM CHECK (Cross-Stream Block)
+                    # ==========================================
+                    # DNB courses should NOT match MED/DEN colleges
+                    # MEDICAL courses should NOT match DNB colleges (except overlapping diplomas)
+                    if seat_course_type:
+                        block_reason = self._stream_block_reason(seat_course_type, expected_stream)
+                        if block_reason:
+                            console.print(f"[red]❌ STREAM BLOCKED: {decision.record_id} → {college_id} ({block_reason})[/red]")
                             # AUDIT LOG
                             audit = get_audit_logger()
                             audit.log_match(
@@ -3316,130 +3559,65 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
                                 confidence=decision.confidence or 0,
                                 name_similarity=0,
                                 status='STREAM_BLOCKED',
-                                reason=f"MEDICAL course matched to DNB college",
+                                reason=block_reason,
                                 model=decision.model or '',
                                 record_count=len(record_ids),
                             )
                             mark_rejected_as_processed(record_ids, 'stream_blocked')
                             rejected_count += 1
                             continue
-                
-                # ==========================================
-                # VALIDATION 2: STATE CHECK (Cross-State Block)
-                # ==========================================
-                if seat_state and master_state:
-                    # Both seat_state and master_state are already normalized (via COALESCE)
-                    # Just compare directly - no alias mapping needed
-                    seat_state_norm = seat_state.upper().strip()
-                    master_state_norm = master_state.upper().strip()
                     
-                    if seat_state_norm != master_state_norm:
-                        console.print(f"[red]❌ STATE BLOCKED: {decision.record_id} → {college_id} ({seat_state} → {master_state})[/red]")
-                        # AUDIT LOG
-                        audit = get_audit_logger()
-                        audit.log_match(
-                            group_id=decision.record_id,
-                            seat_college_name=seat_college_name,
-                            seat_state=seat_state,
-                            seat_address=seat_address,
-                            matched_college_id=college_id,
-                            master_college_name=master_row['name'] if master_row else '',
-                            master_state=master_state,
-                            master_address=master_address,
-                            confidence=decision.confidence or 0,
-                            name_similarity=0,
-                            status='STATE_BLOCKED',
-                            reason=f"Cross-state mismatch: {seat_state} → {master_state}",
-                            model=decision.model or '',
-                            record_count=len(record_ids),
-                        )
-                        mark_rejected_as_processed(record_ids, 'state_blocked')
-                        rejected_count += 1
-                        continue
-                
-                # ==========================================
-                # VALIDATION 3: ADDRESS MISMATCH CHECK (MULTI-CAMPUS)
-                # ==========================================
-                # RE-ENABLED for multi-campus colleges where address is the ONLY differentiator
-                # Example: AUTONOMOUS STATE MEDICAL COLLEGE exists in 15+ districts
-                # AKBARPUR (MED0734) vs GHAZIPUR (MED0744) are DIFFERENT colleges!
-                
-                if seat_address and master_address:
-                    # Check if this is a multi-campus college (same name in same state)
-                    try:
-                        master_cursor.execute(f"""
-                            SELECT COALESCE(normalized_name, name) as norm_name 
-                            FROM {master_table} WHERE id = ?
-                        """, (college_id,))
-                        name_row = master_cursor.fetchone()
-                        if name_row:
-                            master_name = name_row['norm_name']
+                    # ==========================================
+                    # VALIDATION 2: STATE CHECK (Cross-State Block)
+                    # ==========================================
+                    if seat_state and master_state:
+                        # Both seat_state and master_state are already normalized (via COALESCE)
+                        # Just compare directly - no alias mapping needed
+                        seat_state_norm = seat_state.upper().strip()
+                        master_state_norm = master_state.upper().strip()
+                        
+                        if seat_state_norm != master_state_norm:
+                            console.print(f"[red]❌ STATE BLOCKED: {decision.record_id} → {college_id} ({seat_state} → {master_state})[/red]")
+                            # AUDIT LOG
+                            audit = get_audit_logger()
+                            audit.log_match(
+                                group_id=decision.record_id,
+                                seat_college_name=seat_college_name,
+                                seat_state=seat_state,
+                                seat_address=seat_address,
+                                matched_college_id=college_id,
+                                master_college_name=master_row['name'] if master_row else '',
+                                master_state=master_state,
+                                master_address=master_address,
+                                confidence=decision.confidence or 0,
+                                name_similarity=0,
+                                status='STATE_BLOCKED',
+                                reason=f"Cross-state mismatch: {seat_state} → {master_state}",
+                                model=decision.model or '',
+                                record_count=len(record_ids),
+                            )
+                            mark_rejected_as_processed(record_ids, 'state_blocked')
+                            rejected_count += 1
+                            continue
+                    
+                    # ==========================================
+                    # VALIDATION 3: ADDRESS MISMATCH CHECK (MULTI-CAMPUS)
+                    # ==========================================
+                    # RE-ENABLED for multi-campus colleges where address is the ONLY differentiator
+                    # Example: AUTONOMOUS STATE MEDICAL COLLEGE exists in 15+ districts
+                    # AKBARPUR (MED0734) vs GHAZIPUR (MED0744) are DIFFERENT colleges!
+                    
+                    if seat_address and master_address:
+                        # Check if this is a multi-campus college (same name in same state)
+                        try:
+                            master_name = master_row['norm_name']
                             # Count colleges with same name in same state
-                            master_cursor.execute(f"""
-                                SELECT COUNT(*) FROM {master_table} 
-                                WHERE COALESCE(normalized_name, name) = ?
-                                AND UPPER(TRIM(COALESCE(normalized_state, state))) = ?
-                            """, (master_name, master_state.upper().strip()))
-                            same_name_count = master_cursor.fetchone()[0]
-                            
+                            same_name_count = same_name_counts.get(
+                                (master_table, master_name, master_state.upper().strip()), 0
+                            )
                             if same_name_count > 1:
                                 # MULTI-CAMPUS: Address MUST match!
-                                # Extract district/city from both addresses
-                                import re
-                                # FIXED: Normalize addresses before comparison
-                                # - Remove @ symbols (email-based identifiers: CHHSP1234@GMAIL → CHHSP1234GMAIL)
-                                # - Use alphanumeric regex to match codes like CHHSP1234
-                                seat_addr_norm = re.sub(r'[@.]', '', seat_address.upper())  # Remove @ and .
-                                master_addr_norm = re.sub(r'[@.]', '', master_address.upper())
-                                
-                                # Extract alphanumeric words (4+ chars) - includes codes like CHHSP1234
-                                seat_words = set(re.findall(r'\b([A-Z0-9]{4,})\b', seat_addr_norm))
-                                master_words = set(re.findall(r'\b([A-Z0-9]{4,})\b', master_addr_norm))
-                                
-                                # Remove common stopwords
-                                stopwords = {'HOSPITAL', 'COLLEGE', 'MEDICAL', 'DENTAL', 'INSTITUTE', 
-                                           'GOVT', 'GOVERNMENT', 'STATE', 'AUTONOMOUS', 'SOCIETY',
-                                           'DISTRICT', 'TALUK', 'POST', 'OFFICE', 'ROAD', 'STREET'}
-                                seat_words -= stopwords
-                                master_words -= stopwords
-                                
-                                overlap = seat_words & master_words
-                                
-                                # FUZZY MATCHING: Handle OCR issues like "ANANTA PURAM" vs "ANANTHAPURAM"
-                                fuzzy_match = False
-                                if len(overlap) == 0:
-                                    # Method 1: Check without spaces (handles "ANANTA PURAM" → "ANANTHAPURAM")
-                                    seat_no_space = re.sub(r'[^A-Z0-9]', '', seat_addr_norm)
-                                    master_no_space = re.sub(r'[^A-Z0-9]', '', master_addr_norm)
-                                    
-                                    # Check if master location is in seat (without spaces)
-                                    # e.g., "NANDYAL" in "PRINCIPALGMCNANDYALAGMAILCOM518501"
-                                    for mw in master_words:
-                                        if len(mw) >= 5 and mw in seat_no_space:
-                                            fuzzy_match = True
-                                            break
-                                    
-                                    # Method 2: Check fuzzy similarity of each word pair
-                                    if not fuzzy_match:
-                                        from rapidfuzz import fuzz
-                                        for sw in seat_words:
-                                            for mw in master_words:
-                                                if len(sw) >= 5 and len(mw) >= 5:
-                                                    # Check if 80% similar
-                                                    if fuzz.ratio(sw, mw) >= 80:
-                                                        fuzzy_match = True
-                                                        break
-                                            if fuzzy_match:
-                                                break
-                                    
-                                    # Method 3: Check pincode match (6-digit codes)
-                                    if not fuzzy_match:
-                                        seat_pincodes = set(re.findall(r'\b[1-9][0-9]{5}\b', seat_address))
-                                        master_pincodes = set(re.findall(r'\b[1-9][0-9]{5}\b', master_address))
-                                        if seat_pincodes and master_pincodes and (seat_pincodes & master_pincodes):
-                                            fuzzy_match = True
-                                
-                                if seat_words and master_words and len(overlap) == 0 and not fuzzy_match:
+                                if not self._addresses_overlap(seat_address, master_address):
                                     # NO overlap between addresses - this is a FALSE MATCH!
                                     console.print(f"[red]❌ MULTI-CAMPUS ADDRESS BLOCKED: {decision.record_id} → {college_id}[/red]")
                                     console.print(f"   [red]Seat: {seat_address[:40]}... vs Master: {master_address[:40]}...[/red]")
@@ -3465,108 +3643,87 @@ Return JSON: {{"matched_college_id": "..." or null, "confidence": 0.0-1.0, "reas
                                     mark_rejected_as_processed(record_ids, 'multi_campus_blocked')
                                     rejected_count += 1
                                     continue
-                    except Exception as e:
-                        logger.debug(f"Multi-campus address check failed: {e}")
-                
-                # ==========================================
-                # VALIDATION 4: ENSEMBLE VOTE (Post-LLM Check)
-                # ==========================================
-                # Use ensemble voting to catch false matches LLM might have made
-                try:
-                    from ensemble_validator import get_ensemble_validator
-                    ensemble_validator = get_ensemble_validator()
+                        except Exception as e:
+                            logger.debug(f"Multi-campus address check failed: {e}")
                     
-                    master_name = master_row['name'] if master_row else ''
+                    # ==========================================
+                    # VALIDATION 4: ENSEMBLE VOTE (Post-LLM Check)
+                    # ==========================================
+                    # Use ensemble voting to catch false matches LLM might have made
+                    try:
+                        from ensemble_validator import get_ensemble_validator
+                        ensemble_validator = get_ensemble_validator()
+                        
+                        master_name = master_row['name'] if master_row else ''
+                        
+                        result = ensemble_validator.postvalidate_match(
+                            input_name=seat_college_name,
+                            input_address=seat_address,
+                            master_id=college_id,
+                            master_name=master_name,
+                            master_address=master_address
+                        )
+                        
+                        if not result.is_valid:
+                            console.print(f"[red]❌ ENSEMBLE BLOCKED: {decision.record_id} → {college_id}[/red]")
+                            console.print(f"   [red]{result.reasons[0]}[/red]")
+                            # AUDIT LOG
+                            audit = get_audit_logger()
+                            audit.log_match(
+                                group_id=decision.record_id,
+                                seat_college_name=seat_college_name,
+                                seat_state=seat_state,
+                                seat_address=seat_address,
+                                matched_college_id=college_id,
+                                master_college_name=master_name,
+                                master_state=master_state,
+                                master_address=master_address,
+                                confidence=decision.confidence or 0,
+                                name_similarity=result.scores.weighted_total,
+                                status='ENSEMBLE_BLOCKED',
+                                reason='; '.join(result.reasons),
+                                model=decision.model or '',
+                                record_count=len(record_ids),
+                            )
+                            mark_rejected_as_processed(record_ids, 'ensemble_blocked')
+                            rejected_count += 1
+                            continue
+                    except ImportError:
+                        pass  # Ensemble validator not available, skip check
+                    except Exception as e:
+                        logger.debug(f"Ensemble validation failed: {e}")
                     
-                    result = ensemble_validator.postvalidate_match(
-                        input_name=seat_college_name,
-                        input_address=seat_address,
-                        master_id=college_id,
-                        master_name=master_name,
-                        master_address=master_address
+                    # Apply decision to all record IDs
+                    for rid in record_ids:
+                        rid = rid.strip()
+                        if rid:
+                            # Include model in UPDATE for tracking
+                            if table == 'group_matching_queue':
+                                params = (decision.matched_college_id, decision.confidence, decision.model, rid)
+                            else:
+                                params = (
+                                    decision.matched_college_id,
+                                    decision.confidence,
+                                    f'agentic_llm:{decision.model}' if decision.model else 'agentic_llm',
+                                    rid,
+                                )
+                            writes.append((accepted_sql, params))
+                else:
+                    # FIX: Mark records with NULL match as processed too!
+                    # This prevents them from being re-counted as "remaining unprocessed"
+                    mark_rejected_as_processed(
+                        decision.record_id.split(',') if decision.record_id else [], 'no_match_by_agentic'
                     )
-                    
-                    if not result.is_valid:
-                        console.print(f"[red]❌ ENSEMBLE BLOCKED: {decision.record_id} → {college_id}[/red]")
-                        console.print(f"   [red]{result.reasons[0]}[/red]")
-                        # AUDIT LOG
-                        audit = get_audit_logger()
-                        audit.log_match(
-                            group_id=decision.record_id,
-                            seat_college_name=seat_college_name,
-                            seat_state=seat_state,
-                            seat_address=seat_address,
-                            matched_college_id=college_id,
-                            master_college_name=master_name,
-                            master_state=master_state,
-                            master_address=master_address,
-                            confidence=decision.confidence or 0,
-                            name_similarity=result.scores.weighted_total,
-                            status='ENSEMBLE_BLOCKED',
-                            reason='; '.join(result.reasons),
-                            model=decision.model or '',
-                            record_count=len(record_ids),
-                        )
-                        mark_rejected_as_processed(record_ids, 'ensemble_blocked')
-                        rejected_count += 1
-                        continue
-                except ImportError:
-                    pass  # Ensemble validator not available, skip check
-                except Exception as e:
-                    logger.debug(f"Ensemble validation failed: {e}")
-                
-                # Apply decision to all record IDs
-                for rid in record_ids:
-                    rid = rid.strip()
-                    if rid:
-                        # Include model in UPDATE for tracking
-                        if table == 'group_matching_queue':
-                            # CRITICAL: Set is_processed = 1 so auto-retry loop fetches next batch
-                            cursor.execute(f"""
-                                UPDATE {table}
-                                SET {match_col} = ?,
-                                    {score_col} = ?,
-                                    {method_col} = 'agentic_llm',
-                                    match_model = ?,
-                                    is_processed = 1
-                                WHERE {id_col} = ?
-                            """, (
-                                decision.matched_college_id,
-                                decision.confidence,
-                                decision.model,
-                                rid,
-                            ))
-                        else:
-                            # Other tables may not have match_model column
-                            cursor.execute(f"""
-                                UPDATE {table}
-                                SET {match_col} = ?,
-                                    {score_col} = ?,
-                                    {method_col} = ?
-                                WHERE {id_col} = ?
-                            """, (
-                                decision.matched_college_id,
-                                decision.confidence,
-                                f'agentic_llm:{decision.model}' if decision.model else 'agentic_llm',
-                                rid,
-                            ))
-                        updated_count += cursor.rowcount
-            else:
-                # FIX: Mark records with NULL match as processed too!
-                # This prevents them from being re-counted as "remaining unprocessed"
-                record_ids = decision.record_id.split(',') if decision.record_id else []
-                for rid in record_ids:
-                    rid = rid.strip()
-                    if rid and table == 'group_matching_queue':
-                        cursor.execute(f"""
-                            UPDATE {table}
-                            SET is_processed = 1,
-                                match_method = 'no_match_by_agentic'
-                            WHERE {id_col} = ?
-                        """, (rid,))
-                        updated_count += cursor.rowcount
         
-        master_conn.close()
+        # ==========================================
+        # PHASE 3: WRITE all outcomes in one transaction
+        # ==========================================
+        # Consecutive writes of the same kind share one executemany; decision
+        # order is kept so a record listed twice ends with its last outcome
+        for sql, run in groupby(writes, key=lambda write: write[0]):
+            cursor.executemany(sql, [params for _, params in run])
+            updated_count += cursor.rowcount
+        
         conn.commit()
         conn.close()
         console.print(f"[dim]📝 Updated {updated_count} individual records ({rejected_count} blocked by pre-validation)[/dim]")
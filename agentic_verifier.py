@@ -32,6 +32,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 from openrouter_client import OpenRouterClient
+from streaming_json import extract_json_objects
 from llm_performance_tracker import get_performance_tracker
 
 logger = logging.getLogger(__name__)
@@ -1489,18 +1490,37 @@ Return JSON array with verdict for EACH group.""")
                 if match:
                     json_str = match.group(0)
             
+            data = None
+            recovered = False
             if json_str:
-                # Clean up JSON string
-                json_str = json_str.strip()
-                data = json.loads(json_str)
-                
+                try:
+                    data = json.loads(json_str.strip())
+                except json.JSONDecodeError:
+                    data = None
+            
+            if not isinstance(data, list):
+                # Nested/unbalanced braces or a truncated array defeat the regexes
+                # above - recover every complete verdict object instead
+                data = extract_json_objects(content, required_key='verdict') or None
+                recovered = data is not None
+            
+            if data:
                 if isinstance(data, list):
                     for i, item in enumerate(data):
                         # Extract group_id - try multiple formats
                         group_id = item.get("group_id", "")
                         
+                        if recovered:
+                            # Malformed objects may have been skipped, so position says
+                            # nothing about which record this is - require GROUP_XXX
+                            if not str(group_id).startswith("GROUP_"):
+                                continue
+                            try:
+                                record_id = idx_to_record_id[int(str(group_id)[len("GROUP_"):])]
+                            except (KeyError, ValueError):
+                                continue
                         # Try to match GROUP_XXX format
-                        if group_id.startswith("GROUP_"):
+                        elif group_id.startswith("GROUP_"):
                             # Extract index from GROUP_XXX
                             try:
                                 idx = int(group_id.split("_")[1])
@@ -1616,11 +1636,17 @@ Score: {record.match_score:.2f}, Method: {record.match_method or 'N/A'}
                 import re
                 content = response.content
                 
-                # Try to extract JSON array
+                # Try to extract JSON array (fall back to complete verdict objects)
+                verdicts = None
                 array_match = re.search(r'\[[\s\S]*\]', content)
                 if array_match:
-                    verdicts = json.loads(array_match.group())
-                    
+                    try:
+                        verdicts = json.loads(array_match.group())
+                    except json.JSONDecodeError:
+                        verdicts = None
+                if not isinstance(verdicts, list):
+                    verdicts = extract_json_objects(content, required_key='group_id')
+                if verdicts:
                     for v in verdicts:
                         group_id = v.get('group_id', '')
                         verdict_str = v.get('verdict', 'REJECT').upper()
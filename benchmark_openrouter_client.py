@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: OpenRouterClient transports against a local mock server
+
+Compares, for the same batch of completions:
+1. Per-request httpx.Client in a thread pool (the old transport)
+2. Pooled keep-alive client in a thread pool (current complete())
+3. complete_many() on one event loop (optionally spread over several keys)
+
+Reports wall time, requests/s and how many TCP connections the server saw.
+Runs fully offline (plain HTTP, so TLS handshake savings are not included).
+
+Usage:
+    python benchmark_openrouter_client.py
+    python benchmark_openrouter_client.py --requests 1000 --concurrency 200 --latency 0.1 --keys 4
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from openrouter_client import OpenRouterClient, complete_many_across_keys
+from openrouter_mock_server import MockOpenRouterServer
+
+
+def _messages(i):
+    return [{"role": "user", "content": f"Match college #{i}"}]
+
+
+def run_case(name, server, n_requests, fn):
+    server.reset_stats()
+    start = time.perf_counter()
+    failures = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<38} {elapsed:7.2f}s  {n_requests / elapsed:8.1f} req/s  "
+          f"connections={server.stats['connections']:<5} 429s={server.stats['rate_limited']:<4} failures={failures}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OpenRouterClient transports offline")
+    parser.add_argument('--requests', type=int, default=400, help="Completions per case")
+    parser.add_argument('--concurrency', type=int, default=64, help="Threads / in-flight requests")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mock server seconds per completion")
+    parser.add_argument('--keys', type=int, default=1, help="API keys to spread complete_many over")
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help="Fraction of 429 responses")
+    args = parser.parse_args()
+
+    with MockOpenRouterServer(latency=args.latency, rate_limit_ratio=args.rate_limit_ratio,
+                              retry_after=0.05) as server:
+        clients = [OpenRouterClient(api_key=f"mock-key-{k}", base_url=server.url,
+                                    max_connections=args.concurrency)
+                   for k in range(args.keys)]
+        client = clients[0]
+
+        print(f"\n{args.requests} requests, concurrency {args.concurrency}, "
+              f"latency {args.latency * 1000:.0f} ms, {args.keys} key(s)")
+
+        def per_request_client():
+            def call(i):
+                with httpx.Client(timeout=30) as c:
+                    r = c.post(server.url, headers=client._headers,
+                               json={"model": "mock", "messages": _messages(i)})
+                    return r.status_code == 200
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                return sum(not ok for ok in pool.map(call, range(args.requests)))
+
+        def pooled_threads():
+            def call(i):
+                try:
+                    client.complete(messages=_messages(i), model="mock")
+                    return True
+                except httpx.HTTPStatusError:
+                    return False
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                return sum(not ok for ok in pool.map(call, range(args.requests)))
+
+        def async_many():
+            requests = [{"messages": _messages(i), "model": "mock"} for i in range(args.requests)]
+
+            async def go():
+                results = await complete_many_across_keys(
+                    clients, requests, concurrency_per_key=max(1, args.concurrency // args.keys))
+                for c in clients:
+                    await c.aclose()
+                return sum(isinstance(r, BaseException) for r in results)
+            return asyncio.run(go())
+
+        run_case("httpx.Client per request (threads)", server, args.requests, per_request_client)
+        run_case("pooled client (threads)", server, args.requests, pooled_threads)
+        run_case("complete_many (one event loop)", server, args.requests, async_many)
+
+        for c in clients:
+            c.close()
+
+
+if __name__ == "__main__":
+    main()
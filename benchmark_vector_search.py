@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: NumpyIndex vs FAISS IndexFlatL2
+
+Compares exact top-k search on:
+1. The master college set (~2.4k vectors x 768 dims, BGE-base size)
+2. A synthetic 1M-vector set (dimension configurable, default 128 to fit in RAM)
+
+Reports build time, batched search throughput and top-k agreement with FAISS.
+FAISS is optional; without it only the Numpy timings are printed.
+
+Usage:
+    python benchmark_vector_search.py
+    python benchmark_vector_search.py --large-n 1000000 --large-dim 128 --queries 256 --k 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from advanced_vector_search import NumpyIndex
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+def _timed(fn, repeat=3):
+    """Best wall time of `repeat` runs and the last result"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _recall(expected, actual):
+    """Fraction of FAISS top-k ids also returned by NumpyIndex"""
+    hits = sum(len(set(e[e >= 0]) & set(a[a >= 0])) for e, a in zip(expected, actual))
+    total = sum(int((e >= 0).sum()) for e in expected)
+    return hits / total if total else 1.0
+
+
+def run_case(name, n_vectors, dim, n_queries, k, add_chunks, seed=42):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n_vectors, dim), dtype=np.float32)
+    queries = rng.standard_normal((n_queries, dim), dtype=np.float32)
+
+    print(f"\n{'=' * 80}")
+    print(f"{name}: {n_vectors:,} vectors x {dim} dims, {n_queries} queries, k={k}")
+    print(f"{'=' * 80}")
+
+    # Build (incremental adds, as add_colleges does for growing indexes)
+    def build_numpy():
+        index = NumpyIndex(dim)
+        for chunk in np.array_split(vectors, add_chunks):
+            index.add(chunk)
+        return index
+
+    build_time, numpy_index = _timed(build_numpy, repeat=1)
+    search_time, (numpy_dist, numpy_ids) = _timed(lambda: numpy_index.search(queries, k))
+    print(f"  Numpy  build: {build_time * 1000:9.1f} ms   search: {search_time * 1000:9.1f} ms "
+          f"({n_queries / search_time:,.0f} queries/s)")
+
+    # State/stream style pre-filter: search 5% of the vectors
+    mask = rng.random(n_vectors) < 0.05
+    masked_time, _ = _timed(lambda: numpy_index.search(queries, k, mask=mask))
+    print(f"  Numpy  masked search (5% of ids): {masked_time * 1000:9.1f} ms")
+
+    if not FAISS_AVAILABLE:
+        print("  FAISS not installed - skipping comparison")
+        return
+
+    def build_faiss():
+        index = faiss.IndexFlatL2(dim)
+        for chunk in np.array_split(vectors, add_chunks):
+            index.add(chunk)
+        return index
+
+    faiss_build, faiss_index = _timed(build_faiss, repeat=1)
+    faiss_search, (faiss_dist, faiss_ids) = _timed(lambda: faiss_index.search(queries, k))
+    print(f"  FAISS  build: {faiss_build * 1000:9.1f} ms   search: {faiss_search * 1000:9.1f} ms "
+          f"({n_queries / faiss_search:,.0f} queries/s)")
+
+    print(f"  Top-{k} agreement with FAISS: {_recall(faiss_ids, numpy_ids):.4f}")
+    print(f"  Max distance difference:     {float(np.max(np.abs(faiss_dist - numpy_dist))):.2e}")
+    print(f"  Numpy / FAISS search time:   {search_time / faiss_search:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NumpyIndex against FAISS IndexFlatL2")
+    parser.add_argument('--master-n', type=int, default=2400, help="Master college set size")
+    parser.add_argument('--master-dim', type=int, default=768, help="Embedding dimension of the master set")
+    parser.add_argument('--large-n', type=int, default=1_000_000, help="Synthetic large set size")
+    parser.add_argument('--large-dim', type=int, default=128, help="Embedding dimension of the large set")
+    parser.add_argument('--queries', type=int, default=256, help="Queries per batch")
+    parser.add_argument('--k', type=int, default=10, help="Neighbours per query")
+    args = parser.parse_args()
+
+    run_case("MASTER SET", args.master_n, args.master_dim, args.queries, args.k, add_chunks=3)
+    run_case("SYNTHETIC LARGE SET", args.large_n, args.large_dim, args.queries, args.k, add_chunks=20)
+
+
+if __name__ == "__main__":
+    main()
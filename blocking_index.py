@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Inverted Blocking Index for MultiStageFilter
+
+MultiStageFilter.stage2_blocking() used to rebuild the token / trigram /
+first-char feature sets of every candidate for every query (the soundex
+test is answered by phonetic_index.PhoneticIndex). The
+master side only depends on the master names, so BlockingIndex builds the
+postings once per master load and a query just counts its own features over
+them (check_recall() compares it with the brute-force path).
+
+Usage:
+    from blocking_index import BlockingIndex
+
+    index = BlockingIndex(colleges, extract_features)   # extract_features(name) -> {family: set}
+    index.overlap_counts(extract_features("GOVT MEDICAL COLLEGE KOTA"))  # -> {family: counts per row}
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+class BlockingIndex:
+    """
+    Inverted index over master college names for MultiStageFilter.stage2_blocking().
+
+    Built once per master load: postings (feature -> rows) for name tokens, character
+    trigrams and first-3-char word prefixes, plus per-row feature counts. A query
+    counts its own features over the postings (np.bincount) instead of rebuilding
+    and intersecting the feature sets of every candidate.
+
+    Rows are keyed by (id, name) so a candidate dict is only answered from the index
+    when its name is the one that was indexed.
+    """
+
+    FEATURES = ('token', 'ngram', 'first_char')
+
+    def __init__(self, colleges: List[Dict], extract_features: Callable[[str], Dict[str, Set[str]]]):
+        self._rows: Dict[Tuple[Any, str], int] = {}
+        self._ids: List[Any] = []
+        self._vocab: Dict[str, Dict[str, int]] = {f: {} for f in self.FEATURES}
+        row_lists = {f: [] for f in self.FEATURES}
+        col_lists = {f: [] for f in self.FEATURES}
+        sizes = {f: [] for f in self.FEATURES}
+
+        for college in colleges:
+            name = college.get('name', '')
+            if not name or not isinstance(name, str):
+                continue
+            key = (college.get('id'), name)
+            if key in self._rows:
+                continue
+            row = self._rows[key] = len(self._ids)
+            self._ids.append(college.get('id'))
+
+            features = extract_features(name)
+            for f in self.FEATURES:
+                vocab = self._vocab[f]
+                terms = features[f]
+                sizes[f].append(len(terms))
+                for term in terms:
+                    row_lists[f].append(row)
+                    col_lists[f].append(vocab.setdefault(term, len(vocab)))
+
+        # CSC layout: rows of column c are postings[f][indptr[f][c]:indptr[f][c + 1]]
+        self._postings: Dict[str, np.ndarray] = {}
+        self._indptr: Dict[str, np.ndarray] = {}
+        self.sizes: Dict[str, np.ndarray] = {}
+        for f in self.FEATURES:
+            rows = np.asarray(row_lists[f], dtype=np.int32)
+            cols = np.asarray(col_lists[f], dtype=np.int64)
+            self._postings[f] = rows[np.argsort(cols, kind='stable')]
+            self._indptr[f] = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=len(self._vocab[f])))))
+            self.sizes[f] = np.asarray(sizes[f], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def row_of(self, candidate: Dict) -> Optional[int]:
+        """Index row of a candidate dict, or None if its (id, name) was not indexed"""
+        return self._rows.get((candidate.get('id'), candidate.get('name', '')))
+
+    def overlap_counts(self, query_features: Dict[str, Set[str]]) -> Dict[str, np.ndarray]:
+        """Per-row number of shared features with the query, for every feature family"""
+        counts = {}
+        for f in self.FEATURES:
+            vocab, indptr, postings = self._vocab[f], self._indptr[f], self._postings[f]
+            cols = [vocab[term] for term in query_features[f] if term in vocab]
+            if cols:
+                rows = np.concatenate([postings[indptr[c]:indptr[c + 1]] for c in cols])
+                counts[f] = np.bincount(rows, minlength=len(self._ids))
+            else:
+                counts[f] = np.zeros(len(self._ids), dtype=np.int64)
+        return counts
+
+    def query(self, query_features: Dict[str, Set[str]], min_token_overlap: float,
+              min_ngram_overlap: float, min_first_char_overlap: int = 2) -> List[Any]:
+        """College ids passing the token, n-gram or first-char test (OR-union)"""
+        counts = self.overlap_counts(query_features)
+        passed = counts['first_char'] >= min_first_char_overlap
+        for f, threshold in (('token', min_token_overlap), ('ngram', min_ngram_overlap)):
+            n_query = len(query_features[f])
+            if n_query:
+                ratio = counts[f] / np.maximum(self.sizes[f], n_query)
+                passed |= (self.sizes[f] > 0) & (ratio >= threshold)
+        return [self._ids[row] for row in np.flatnonzero(passed)]
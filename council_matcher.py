@@ -7,6 +7,9 @@ Architecture:
 1. Triage Officer: Routes requests to relevant experts.
 2. Council Members: Specialized matchers (Strict, Fuzzy, Geo, Phonetic, AI).
 3. Chairman: Synthesizes votes and applies vetoes.
+
+Batch evaluation (evaluate_candidates) cleans the query once and lets each
+member score all candidates of a record together (vote_many).
 """
 
 import logging
@@ -16,8 +19,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
 from difflib import SequenceMatcher
-import jellyfish  # For phonetic matching (metaphone)
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
 from council_utils import TheCleaner
+from phonetic_index import JELLYFISH_AVAILABLE, phonetic_code
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -49,6 +55,13 @@ class CouncilMember(ABC):
         """Cast a vote on whether the unmatched record matches the candidate."""
         pass
 
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
+        """
+        Cast one vote per candidate.
+        Members with expensive per-query work override this to do it once.
+        """
+        return [self.vote(unmatched_record, candidate) for candidate in candidates]
+
 class TheLibrarian(CouncilMember):
     """
     The Strict Librarian: Enforces rigid rules.
@@ -292,24 +305,34 @@ class ThePhoneticListener(CouncilMember):
     def __init__(self):
         super().__init__("The Phonetic Listener")
 
-    def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
-        u_name = unmatched_record['college_name']
-        c_name = candidate.name
-        
-        # Use jellyfish for metaphone
-        u_meta = jellyfish.metaphone(u_name)
-        c_meta = jellyfish.metaphone(c_name)
+    def _judge(self, u_meta: str, c_meta: str, dist: int) -> Vote:
+        if not u_meta or not c_meta:
+            # Empty codes (no jellyfish, or no letters) say nothing about the names
+            return Vote(self.name, 'ABSTAIN', 0.0, "No phonetic code")
         
         if u_meta == c_meta:
             return Vote(self.name, 'MATCH', 0.85, "Phonetic match (Metaphone)")
             
         # Levenshtein on metaphone codes
-        dist = jellyfish.levenshtein_distance(u_meta, c_meta)
         if dist <= 1:
              return Vote(self.name, 'MATCH', 0.70, "Close phonetic match")
              
         return Vote(self.name, 'ABSTAIN', 0.0, "No phonetic match")
 
+    def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
+        if not JELLYFISH_AVAILABLE:
+            return [Vote(self.name, 'ABSTAIN', 0.0, "jellyfish not installed") for _ in candidates]
+        
+        # Metaphone codes are memoized process-wide (candidates repeat across queries)
+        u_meta = phonetic_code(unmatched_record['college_name'], 'metaphone')
+        c_metas = [phonetic_code(candidate.name, 'metaphone') for candidate in candidates]
+        
+        dists = process.cdist([u_meta], c_metas, scorer=Levenshtein.distance, dtype=np.int32)[0]
+        return [self._judge(u_meta, c_meta, dist) for c_meta, dist in zip(c_metas, dists)]
+
 class WiseJudge(CouncilMember):
     """
     The Wise Judge: High-intelligence tie-breaker using GLM-4.
@@ -439,35 +462,45 @@ class TheSemanticScout(CouncilMember):
     def __init__(self, vector_engine=None):
         super().__init__("The Semantic Scout")
         self.vector_engine = vector_engine
+        self._embeddings: Dict[str, np.ndarray] = {}  # Name -> embedding
+
+    def _judge(self, sim: float) -> Vote:
+        if sim >= 0.85:
+            return Vote(self.name, 'MATCH', float(sim), f"High semantic similarity ({sim:.2f})")
+        elif sim >= 0.75:
+            return Vote(self.name, 'MATCH', float(sim) * 0.9, f"Moderate semantic similarity ({sim:.2f})")
+        elif sim < 0.40:
+            return Vote(self.name, 'REJECT', 0.8, f"Semantic mismatch ({sim:.2f})")
+            
+        return Vote(self.name, 'ABSTAIN', 0.0, f"Indeterminate semantic similarity ({sim:.2f})")
 
     def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
         if not self.vector_engine:
-            return Vote(self.name, 'ABSTAIN', 0.0, "Vector engine not available")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "Vector engine not available") for _ in candidates]
 
         u_name = unmatched_record['college_name']
-        c_name = candidate.name
+        names = [u_name] + [candidate.name for candidate in candidates]
         
         # Calculate semantic similarity
-        # We use the vector engine's model directly to encode and compare
+        # We use the vector engine's model directly: one encode call for all uncached names
         try:
-            # Encode both names
-            embeddings = self.vector_engine.model.encode([u_name, c_name])
+            pending = [name for name in dict.fromkeys(names) if name not in self._embeddings]
+            if pending:
+                for name, embedding in zip(pending, self.vector_engine.model.encode(pending)):
+                    self._embeddings[name] = embedding
             
-            # Calculate cosine similarity
+            # Cosine similarity of the query against every candidate (one matmul)
             from sklearn.metrics.pairwise import cosine_similarity
-            sim = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-            
-            if sim >= 0.85:
-                return Vote(self.name, 'MATCH', float(sim), f"High semantic similarity ({sim:.2f})")
-            elif sim >= 0.75:
-                return Vote(self.name, 'MATCH', float(sim) * 0.9, f"Moderate semantic similarity ({sim:.2f})")
-            elif sim < 0.40:
-                return Vote(self.name, 'REJECT', 0.8, f"Semantic mismatch ({sim:.2f})")
-                
-            return Vote(self.name, 'ABSTAIN', 0.0, f"Indeterminate semantic similarity ({sim:.2f})")
+            sims = cosine_similarity(
+                [self._embeddings[u_name]], [self._embeddings[name] for name in names[1:]]
+            )[0]
+            return [self._judge(sim) for sim in sims]
             
         except Exception as e:
-            return Vote(self.name, 'ABSTAIN', 0.0, f"Error calculating similarity: {e}")
+            return [Vote(self.name, 'ABSTAIN', 0.0, f"Error calculating similarity: {e}") for _ in candidates]
 
 
 class TheKeywordGuardian(CouncilMember):
@@ -481,37 +514,49 @@ class TheKeywordGuardian(CouncilMember):
         self.tfidf_matrix = tfidf_matrix
         self.master_indices = master_indices or {} # Maps college_id to matrix index
 
+    def _judge(self, sim: float) -> Vote:
+        if sim >= 0.80:
+            return Vote(self.name, 'MATCH', float(sim), f"Strong keyword match ({sim:.2f})")
+        elif sim >= 0.60:
+            return Vote(self.name, 'MATCH', float(sim) * 0.8, f"Moderate keyword match ({sim:.2f})")
+        elif sim < 0.30:
+            return Vote(self.name, 'REJECT', 0.7, f"Keyword mismatch ({sim:.2f})")
+            
+        return Vote(self.name, 'ABSTAIN', 0.0, f"Indeterminate keyword match ({sim:.2f})")
+
     def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
         if not self.vectorizer or self.tfidf_matrix is None:
-            return Vote(self.name, 'ABSTAIN', 0.0, "TF-IDF engine not available")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "TF-IDF engine not available") for _ in candidates]
 
         try:
-            # 1. Vectorize the unmatched query
+            # 1. Vectorize the unmatched query (once for all candidates)
             query_vec = self.vectorizer.transform([unmatched_record['college_name']])
             
-            # 2. Get the candidate's vector from the pre-computed matrix
-            idx = self.master_indices.get(candidate.id)
-            if idx is None:
-                return Vote(self.name, 'ABSTAIN', 0.0, "Candidate not in TF-IDF index")
-                
-            candidate_vec = self.tfidf_matrix[idx]
+            # 2. Get the candidates' rows from the pre-computed matrix
+            indices = [self.master_indices.get(candidate.id) for candidate in candidates]
+            rows = [idx for idx in indices if idx is not None]
             
-            # 3. Calculate Cosine Similarity
-            from sklearn.metrics.pairwise import cosine_similarity
-            sim = cosine_similarity(query_vec, candidate_vec)[0][0]
+            # 3. Cosine Similarity: one sparse product against all candidate rows
+            sims = []
+            if rows:
+                from sklearn.metrics.pairwise import cosine_similarity
+                sims = cosine_similarity(query_vec, self.tfidf_matrix[rows])[0]
             
             # 4. Voting Logic
-            if sim >= 0.80:
-                return Vote(self.name, 'MATCH', float(sim), f"Strong keyword match ({sim:.2f})")
-            elif sim >= 0.60:
-                return Vote(self.name, 'MATCH', float(sim) * 0.8, f"Moderate keyword match ({sim:.2f})")
-            elif sim < 0.30:
-                return Vote(self.name, 'REJECT', 0.7, f"Keyword mismatch ({sim:.2f})")
-                
-            return Vote(self.name, 'ABSTAIN', 0.0, f"Indeterminate keyword match ({sim:.2f})")
+            votes = []
+            sims = iter(sims)
+            for idx in indices:
+                if idx is None:
+                    votes.append(Vote(self.name, 'ABSTAIN', 0.0, "Candidate not in TF-IDF index"))
+                else:
+                    votes.append(self._judge(next(sims)))
+            return votes
             
         except Exception as e:
-            return Vote(self.name, 'ABSTAIN', 0.0, f"Error: {e}")
+            return [Vote(self.name, 'ABSTAIN', 0.0, f"Error: {e}") for _ in candidates]
 
 class TheLocalHero(CouncilMember):
     """
@@ -524,6 +569,7 @@ class TheLocalHero(CouncilMember):
         self.cleaner = TheCleaner()
         self.city_index = {} # Map: City -> List[Candidate]
         self.pincode_index = {} # Map: Pincode -> List[Candidate]
+        self._profiles = {} # Map: (address, name) -> cleaned candidate signals
         self.is_ready = False
 
     def load_data(self, master_colleges: List[Any]):
@@ -556,29 +602,46 @@ class TheLocalHero(CouncilMember):
         self.is_ready = True
         logger.info(f"TheLocalHero indexed {len(self.city_index)} cities and {len(self.pincode_index)} pincodes.")
 
+    def _location(self, address: str) -> Tuple[Optional[str], List[str]]:
+        """City and pincodes of an address."""
+        cleaned = self.cleaner.clean_record({'address': address})
+        return self.cleaner.extract_city(cleaned['cleaned_address']), cleaned['signals']['pincodes']
+
+    def _core_name(self, name: str) -> str:
+        return self.cleaner.clean_record({'college_name': name})['core_name']
+
+    def _candidate_profile(self, candidate: Candidate) -> Tuple[Optional[str], List[str], str, str]:
+        """(city, pincodes, upper name, core name) of a candidate, cached across queries."""
+        key = (candidate.address, candidate.name)
+        profile = self._profiles.get(key)
+        if profile is None:
+            c_city, c_pincodes = self._location(candidate.address)
+            c_name = candidate.name.upper()
+            profile = self._profiles[key] = (c_city, c_pincodes, c_name, self._core_name(c_name))
+        return profile
+
     def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
         if not self.is_ready:
-            return Vote(self.name, 'ABSTAIN', 0.0, "Index not loaded")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "Index not loaded") for _ in candidates]
 
-        # 1. Extract Location from Query
+        # 1. Extract Location from Query (once for all candidates)
         # Use raw_address to ensure we get Pincodes (which are stripped from 'address' by Chairman)
         u_addr = unmatched_record.get('raw_address') or unmatched_record.get('address', '')
-        u_cleaned = self.cleaner.clean_record({'address': u_addr})
-        u_city = self.cleaner.extract_city(u_cleaned['cleaned_address'])
-        u_pincodes = u_cleaned['signals']['pincodes']
-        
-        # 2. Check if Candidate matches the Location
-        # We need to check if the CANDIDATE provided is in the same location as Query
-        # But wait, 'candidate' passed to vote() is a specific candidate chosen by someone else?
-        # NO! The Council votes on a SPECIFIC candidate.
-        # So TheLocalHero checks: "Is this candidate in the same City/Pincode as Query?"
-        # AND "Does the Core Name match?"
-        
-        c_addr = candidate.address
-        c_cleaned = self.cleaner.clean_record({'address': c_addr})
-        c_city = self.cleaner.extract_city(c_cleaned['cleaned_address'])
-        c_pincodes = c_cleaned['signals']['pincodes']
+        u_city, u_pincodes = self._location(u_addr)
+        u_name = unmatched_record.get('college_name', '').upper()
+        u_core = self._core_name(u_name)
         
+        # 2. TheLocalHero checks per candidate: "Is this candidate in the same City/Pincode as Query?"
+        # AND "Does the Core Name match?"
+        return [
+            self._judge(u_city, u_pincodes, u_name, u_core, *self._candidate_profile(candidate))
+            for candidate in candidates
+        ]
+
+    def _judge(self, u_city, u_pincodes, u_name, u_core, c_city, c_pincodes, c_name, c_core) -> Vote:
         # Location Match?
         loc_match = False
         if u_pincodes and c_pincodes:
@@ -594,12 +657,6 @@ class TheLocalHero(CouncilMember):
             return Vote(self.name, 'ABSTAIN', 0.0, "Location mismatch or unknown")
             
         # 3. Core Name Match
-        u_name = unmatched_record.get('college_name', '').upper()
-        c_name = candidate.name.upper()
-        
-        u_core = self.cleaner.clean_record({'college_name': u_name})['core_name']
-        c_core = self.cleaner.clean_record({'college_name': c_name})['core_name']
-        
         # Debug
         logger.info(f"LocalHero: U_City={u_city} C_City={c_city} U_Core={u_core} C_Core={c_core}")
         
@@ -629,6 +686,7 @@ class TheDetective(CouncilMember):
         super().__init__("The Detective")
         self.cleaner = TheCleaner()
         self.domain_index = {} # Map: Domain -> List[Candidate]
+        self._candidate_domains = {} # Map: Address -> Set[Domain]
         self.is_ready = False
 
     def load_data(self, master_colleges: List[Any]):
@@ -641,24 +699,7 @@ class TheDetective(CouncilMember):
             addr = getattr(col, 'address', None) or col.get('address', '')
             if not addr: continue
             
-            cleaned = self.cleaner.clean_record({'address': addr})
-            emails = cleaned['signals']['emails']
-            urls = cleaned['signals']['urls']
-            
-            domains = set()
-            for email in emails:
-                domain = email.split('@')[-1]
-                if domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'rediffmail.com']:
-                    domains.add(domain)
-            
-            for url in urls:
-                # Extract domain from URL
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(url).netloc
-                    if domain.startswith('www.'): domain = domain[4:]
-                    if domain: domains.add(domain)
-                except: pass
+            domains = self._domains(addr)
                 
             for domain in domains:
                 if domain not in self.domain_index: self.domain_index[domain] = []
@@ -667,46 +708,48 @@ class TheDetective(CouncilMember):
         self.is_ready = True
         logger.info(f"TheDetective indexed {len(self.domain_index)} unique domains.")
 
-    def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
-        if not self.is_ready:
-            return Vote(self.name, 'ABSTAIN', 0.0, "Index not loaded")
-            
-        # Extract signals from Query
-        u_addr = unmatched_record.get('address', '')
-        u_cleaned = self.cleaner.clean_record({'address': u_addr})
-        u_emails = u_cleaned['signals']['emails']
-        u_urls = u_cleaned['signals']['urls']
+    def _domains(self, address: str, include_urls: bool = True) -> set:
+        """Unique (non-webmail) email domains, plus website domains, in an address."""
+        cleaned = self.cleaner.clean_record({'address': address})
         
-        u_domains = set()
-        for email in u_emails:
+        domains = set()
+        for email in cleaned['signals']['emails']:
             domain = email.split('@')[-1]
             if domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'rediffmail.com']:
-                u_domains.add(domain)
+                domains.add(domain)
+        if include_urls:
+            for url in cleaned['signals']['urls']:
+                 try:
+                    from urllib.parse import urlparse
+                    domain = urlparse(url).netloc
+                    if domain.startswith('www.'): domain = domain[4:]
+                    if domain: domains.add(domain)
+                 except: pass
+        return domains
+
+    def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
+        if not self.is_ready:
+            return [Vote(self.name, 'ABSTAIN', 0.0, "Index not loaded") for _ in candidates]
+            
+        # Extract signals from Query (emails only)
+        u_domains = self._domains(unmatched_record.get('address', ''), include_urls=False)
         
         if not u_domains:
-            return Vote(self.name, 'ABSTAIN', 0.0, "No unique domains in query")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "No unique domains in query") for _ in candidates]
             
-        # Check Candidate
-        c_addr = candidate.address
-        c_cleaned = self.cleaner.clean_record({'address': c_addr})
-        c_emails = c_cleaned['signals']['emails']
-        c_urls = c_cleaned['signals']['urls']
-        
-        c_domains = set()
-        for email in c_emails:
-            domain = email.split('@')[-1]
-            if domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'rediffmail.com']:
-                c_domains.add(domain)
-        for url in c_urls:
-             try:
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc
-                if domain.startswith('www.'): domain = domain[4:]
-                if domain: c_domains.add(domain)
-             except: pass
+        # Check Candidates (domains cached per address)
+        votes = []
+        for candidate in candidates:
+            c_domains = self._candidate_domains.get(candidate.address)
+            if c_domains is None:
+                c_domains = self._candidate_domains[candidate.address] = self._domains(candidate.address)
+            votes.append(self._judge(u_domains & c_domains))
+        return votes
 
-        common_domains = u_domains & c_domains
-        
+    def _judge(self, common_domains: set) -> Vote:
         if common_domains:
             # Check if this domain is unique to one college or shared (Chain)
             domain = list(common_domains)[0] # Take the first match
@@ -728,6 +771,7 @@ class TheCodeBreaker(CouncilMember):
     def __init__(self):
         super().__init__("The Code Breaker")
         self.code_index = {} # Code -> List[CandidateID]
+        self._candidate_codes = {} # Address -> Set[Code]
         self.is_ready = False
         self.cleaner = TheCleaner()
 
@@ -748,24 +792,51 @@ class TheCodeBreaker(CouncilMember):
         self.is_ready = True
         logger.info(f"TheCodeBreaker indexed {len(self.code_index)} unique college codes.")
 
+    def _codes(self, address: str) -> set:
+        cleaned = self.cleaner.clean_record({'address': address})
+        return set(cleaned['signals'].get('college_codes', []))
+
     def vote(self, unmatched_record: Dict, candidate: Candidate) -> Vote:
+        return self.vote_many(unmatched_record, [candidate])[0]
+
+    def vote_many(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Vote]:
         if not self.is_ready:
-            return Vote(self.name, 'ABSTAIN', 0.0, "Not initialized with Master Data")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "Not initialized with Master Data") for _ in candidates]
 
         # Check Query
         # Use raw_address if available, to preserve parentheses for code extraction
         u_addr = unmatched_record.get('raw_address') or unmatched_record.get('address', '')
-        u_cleaned = self.cleaner.clean_record({'address': u_addr})
-        u_codes = set(u_cleaned['signals'].get('college_codes', []))
+        u_codes = self._codes(u_addr)
         
         if not u_codes:
-            return Vote(self.name, 'ABSTAIN', 0.0, "No college code in query")
+            return [Vote(self.name, 'ABSTAIN', 0.0, "No college code in query") for _ in candidates]
             
-        # Check Candidate
-        c_addr = candidate.address
-        c_cleaned = self.cleaner.clean_record({'address': c_addr})
-        c_codes = set(c_cleaned['signals'].get('college_codes', []))
+        # Check Candidates (codes cached per address)
+        all_c_codes = []
+        for candidate in candidates:
+            c_codes = self._candidate_codes.get(candidate.address)
+            if c_codes is None:
+                c_codes = self._candidate_codes[candidate.address] = self._codes(candidate.address)
+            all_c_codes.append(c_codes)
         
+        # Name similarity (fuzzy) for every code-matched candidate in one cdist call
+        code_matched = [i for i, c_codes in enumerate(all_c_codes) if u_codes & c_codes]
+        name_similarities = {}
+        if code_matched:
+            u_name = unmatched_record.get('college_name', '')
+            scores = process.cdist(
+                [u_name.upper()], [candidates[i].name.upper() for i in code_matched],
+                scorer=fuzz.ratio, dtype=np.float64
+            )[0]
+            name_similarities = {i: score / 100.0 for i, score in zip(code_matched, scores)}
+        
+        return [
+            self._judge(unmatched_record, candidate, u_codes, c_codes, name_similarities.get(i))
+            for i, (candidate, c_codes) in enumerate(zip(candidates, all_c_codes))
+        ]
+
+    def _judge(self, unmatched_record: Dict, candidate: Candidate, u_codes: set, c_codes: set,
+               name_similarity: Optional[float]) -> Vote:
         common_codes = u_codes & c_codes
         
         if common_codes:
@@ -774,16 +845,12 @@ class TheCodeBreaker(CouncilMember):
             # MULTI-SIGNAL VALIDATION: Code + Name + Address
             # Code match alone is not enough - validate with name and location
             
-            # 1. Name Validation (fuzzy match)
-            u_name = unmatched_record.get('college_name', '')
-            c_name = candidate.name
-            from rapidfuzz import fuzz
-            name_similarity = fuzz.ratio(u_name.upper(), c_name.upper()) / 100.0
+            # 1. Name Validation (fuzzy match, computed by vote_many)
             
             # 2. Address Validation (lenient: state or city match)
             u_state = unmatched_record.get('state', '').upper()
             c_state = candidate.state.upper() if candidate.state else ''
-            c_addr_upper = c_addr.upper()
+            c_addr_upper = candidate.address.upper()
             
             # Check state match or state in address
             address_match = (
@@ -848,6 +915,9 @@ class CouncilChairman:
         
         # Wise Judge (LLM) is optional
         self.wise_judge = WiseJudge(api_key=glm_api_key) if glm_api_key else None
+        
+        # Query preprocessing (see _enhance_record)
+        self.cleaner = TheCleaner()
 
     def load_master_data(self, master_colleges: List[Any]):
         """
@@ -857,19 +927,11 @@ class CouncilChairman:
             if hasattr(member, 'load_data'):
                 member.load_data(master_colleges)
 
-    def evaluate_candidate(self, unmatched_record: Dict, candidate: Candidate) -> Tuple[str, float, List[Vote]]:
+    def _enhance_record(self, unmatched_record: Dict) -> Dict:
         """
-        Asks all council members to vote on the candidate.
-        Returns (Decision, Confidence, Votes).
+        Global Preprocessing (The Enlightened Chairman).
+        Normalizes the query name to help Fuzzy/Phonetic matchers handle aliases like "KIMS".
         """
-        votes = []
-        
-        # 0. Global Preprocessing (The Enlightened Chairman)
-        # Normalize the query name to help Fuzzy/Phonetic matchers handle aliases like "KIMS"
-        # We use a fresh cleaner instance or reuse one if available
-        if not hasattr(self, 'cleaner'):
-             self.cleaner = TheCleaner()
-             
         original_name = unmatched_record.get('college_name', '')
         original_addr = unmatched_record.get('address', '')
         
@@ -887,74 +949,121 @@ class CouncilChairman:
         # Also use cleaned address to remove noise (emails, URLs) that confuse TheGeographer
         if cleaned_addr is not None: # It might be empty string, which is fine
             enhanced_record['address'] = cleaned_addr
-            
-        # 1. Collect Votes
-        veto_triggered = False
-        veto_reason = ""
         
-        total_score = 0.0
-        max_possible_score = 0.0
+        return enhanced_record
+
+    def _member_votes(self, member: CouncilMember, enhanced_record: Dict, candidates: List[Candidate]) -> List[Vote]:
+        """One member's votes for all candidates; a crash only costs the affected candidates."""
+        try:
+            return member.vote_many(enhanced_record, candidates)
+        except Exception:
+            pass  # Retry one by one so a single bad candidate doesn't silence the member
         
-        for member in self.members:
+        votes = []
+        for candidate in candidates:
             try:
-                vote = member.vote(enhanced_record, candidate)
-                votes.append(vote)
+                votes.append(member.vote(enhanced_record, candidate))
             except Exception as e:
                 logger.error(f"Council Member {member.name} crashed: {e}")
                 votes.append(Vote(member.name, 'ABSTAIN', 0.0, f"Error: {e}"))
-            
-            if vote.is_veto and vote.decision == 'REJECT':
-                veto_triggered = True
-                veto_reason = f"{member.name} VETO: {vote.reason}"
-                # We continue collecting votes for audit, but decision is made
-        
-        if veto_triggered:
-            return 'REJECT', 1.0, votes
+        return votes
 
-        # Calculate weighted score
-        match_votes = 0
-        for vote in votes:
-            weight = self.weights.get(vote.member_name, 1.0)
-            if vote.decision == 'MATCH':
-                total_score += vote.confidence * weight
-                match_votes += 1
-            elif vote.decision == 'REJECT':
-                total_score -= vote.confidence * weight
-            
-            if vote.decision != 'ABSTAIN':
-                max_possible_score += weight
+    def evaluate_candidate(self, unmatched_record: Dict, candidate: Candidate) -> Tuple[str, float, List[Vote]]:
+        """
+        Asks all council members to vote on the candidate.
+        Returns (Decision, Confidence, Votes).
+        """
+        return self.evaluate_candidates(unmatched_record, [candidate])[0]
 
-        # Quorum Rule: Need at least 2 matches (unless Librarian matches exact OR Geographer matches strongly)
-        librarian_match = any(v.member_name == "The Librarian" and v.decision == 'MATCH' for v in votes)
-        geographer_strong_match = any(v.member_name == "The Geographer" and v.decision == 'MATCH' and v.confidence >= 0.9 for v in votes)
+    def evaluate_candidates(self, unmatched_record: Dict, candidates: List[Candidate]) -> List[Tuple[str, float, List[Vote]]]:
+        """
+        Asks all council members to vote on every candidate of one record.
+        The record is cleaned once and each member scores all candidates together.
+        Returns (Decision, Confidence, Votes) per candidate, in order.
+        """
+        if not candidates:
+            return []
+        
+        # 0. Global Preprocessing (once per record)
+        enhanced_record = self._enhance_record(unmatched_record)
+        
+        # 1. Collect Votes: member -> one vote per candidate
+        member_votes = [self._member_votes(member, enhanced_record, candidates) for member in self.members]
+        
+        # 2. Tally as arrays over candidates (members in council order)
+        n = len(candidates)
+        veto_triggered = np.zeros(n, dtype=bool)
+        total_score = np.zeros(n)
+        max_possible_score = np.zeros(n)
+        match_votes = np.zeros(n, dtype=np.int64)
+        librarian_match = np.zeros(n, dtype=bool)
+        geographer_strong_match = np.zeros(n, dtype=bool)
+        
+        for votes in member_votes:
+            decision = np.array([v.decision for v in votes])
+            confidence = np.array([v.confidence for v in votes], dtype=np.float64)
+            is_veto = np.array([v.is_veto for v in votes], dtype=bool)
+            weight = np.array([self.weights.get(v.member_name, 1.0) for v in votes], dtype=np.float64)
+            is_match = decision == 'MATCH'
+            is_reject = decision == 'REJECT'
+            
+            # We keep collecting votes for audit after a veto, but the decision is made
+            veto_triggered |= is_veto & is_reject
+            
+            # Calculate weighted score
+            total_score += np.where(is_match, confidence * weight, 0.0)
+            total_score -= np.where(is_reject, confidence * weight, 0.0)
+            max_possible_score += np.where(decision != 'ABSTAIN', weight, 0.0)
+            match_votes += is_match
+            
+            # Quorum exceptions: Librarian exact match OR Geographer strong match
+            names = np.array([v.member_name for v in votes])
+            librarian_match |= is_match & (names == "The Librarian")
+            geographer_strong_match |= is_match & (names == "The Geographer") & (confidence >= 0.9)
         
-        if match_votes < 2 and not librarian_match and not geographer_strong_match:
-             return 'REJECT', 0.0, votes # Quorum not met
-
         # Normalize score
-        final_confidence = 0.0
-        if max_possible_score > 0:
-            final_confidence = max(0.0, total_score / max_possible_score)
-            
-        decision = 'MATCH' if final_confidence > 0.7 else 'REJECT'
-        
-        # --- PHASE 4: THE DEVIL'S ADVOCATE ---
-        if decision == 'MATCH':
-            critic_vote = self.devils_advocate.critique(unmatched_record, candidate, votes)
-            if critic_vote.decision == 'REJECT':
-                # Log the dissent
-                votes.append(critic_vote)
-                
-                # If it's a VETO (High Risk), overturn the decision
-                if critic_vote.is_veto:
-                    return 'REJECT', 0.0, votes
-                
-                # If it's a warning, downgrade confidence
-                final_confidence *= 0.8
-                if final_confidence < 0.7:
-                    return 'REJECT', final_confidence, votes
+        final_confidence = np.zeros(n)
+        np.divide(total_score, max_possible_score, out=final_confidence, where=max_possible_score > 0)
+        final_confidence = np.maximum(0.0, final_confidence)
+        
+        # Quorum Rule: Need at least 2 matches (unless Librarian matches exact OR Geographer matches strongly)
+        quorum_met = (match_votes >= 2) | librarian_match | geographer_strong_match
+        
+        results = []
+        for i, candidate in enumerate(candidates):
+            votes = [member_votes[m][i] for m in range(len(self.members))]
+            
+            if veto_triggered[i]:
+                results.append(('REJECT', 1.0, votes))
+                continue
+            if not quorum_met[i]:
+                results.append(('REJECT', 0.0, votes)) # Quorum not met
+                continue
+            
+            confidence = float(final_confidence[i])
+            decision = 'MATCH' if confidence > 0.7 else 'REJECT'
+            
+            # --- PHASE 4: THE DEVIL'S ADVOCATE ---
+            if decision == 'MATCH':
+                critic_vote = self.devils_advocate.critique(unmatched_record, candidate, votes)
+                if critic_vote.decision == 'REJECT':
+                    # Log the dissent
+                    votes.append(critic_vote)
+                    
+                    # If it's a VETO (High Risk), overturn the decision
+                    if critic_vote.is_veto:
+                        results.append(('REJECT', 0.0, votes))
+                        continue
+                    
+                    # If it's a warning, downgrade confidence
+                    confidence *= 0.8
+                    if confidence < 0.7:
+                        results.append(('REJECT', confidence, votes))
+                        continue
+            
+            results.append((decision, confidence, votes))
         
-        return decision, final_confidence, votes
+        return results
 
 if __name__ == "__main__":
     # Test Case: Ruby Hall vs Laxmi Narasimha
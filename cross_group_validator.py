@@ -32,7 +32,8 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from collections import defaultdict, Counter
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from phonetic_index import JELLYFISH_AVAILABLE, phonetic_code
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -158,7 +159,6 @@ class CrossGroupValidator:
         self.counselling_db_path = counselling_db_path
         self.master_db_path = master_db_path
         self.table_name = table_name  # Use this instead of hardcoded table name
-        self._embedding_model = None
         self._embedding_cache: Dict[str, np.ndarray] = {}
         
         # Past decisions cache (loaded on first use)
@@ -559,56 +559,53 @@ class CrossGroupValidator:
     # ENSEMBLE SIMILARITY METHODS
     # ============================================================
     
-    def _get_embedding_model(self):
-        """Get embedding model via shared vector_index singleton (BGE-base-en-v1.5)."""
-        if self._embedding_model is None:
-            try:
-                from vector_index import get_vector_index
-                vector_index = get_vector_index()
-                if vector_index and vector_index._engine:
-                    self._embedding_model = vector_index._engine.model
-                else:
-                    self._embedding_model = False  # Mark as unavailable
-            except Exception as e:
-                logger.warning(f"Failed to get embedding model: {e}")
-                self._embedding_model = False
-        return self._embedding_model if self._embedding_model else None
-    
-    def _get_embedding(self, text: str) -> Optional[np.ndarray]:
-        """Get embedding vector for text with caching."""
-        if not text:
-            return None
-        
-        text_key = text.upper().strip()
-        if text_key in self._embedding_cache:
-            return self._embedding_cache[text_key]
+    def prefetch_embeddings(self, texts: List[str]) -> int:
+        """
+        Encode all uncached texts in large batches (one output redirect per call).
         
-        model = self._get_embedding_model()
-        if not model:
-            return None
+        Goes through the shared vector_index, so vectors come from (and are added
+        to) the persistent embedding store. Returns the number of texts embedded.
+        """
+        pending = list(dict.fromkeys(
+            key for key in (text.upper().strip() for text in texts if text)
+            if key not in self._embedding_cache
+        ))
+        if not pending:
+            return 0
         
         try:
-            # Suppress verbose progress bars by redirecting stderr temporarily
-            import sys
             import io
             from contextlib import redirect_stderr, redirect_stdout
+            from vector_index import get_vector_index
             
-            # Create null output
-            null_output = io.StringIO()
+            vector_index = get_vector_index()
+            if vector_index is None:
+                return 0
             
-            # Encode with suppressed output
+            # Suppress verbose progress bars from the encoder
+            null_output = io.StringIO()
             with redirect_stderr(null_output), redirect_stdout(null_output):
-                embeddings = model.encode([text_key], batch_size=1, max_length=128)
-                
-            if 'dense_vecs' in embeddings:
-                vec = embeddings['dense_vecs'][0]
-            else:
-                vec = embeddings[0]
-            self._embedding_cache[text_key] = vec
-            return vec
+                vectors = vector_index.get_embeddings(pending)
         except Exception as e:
             logger.warning(f"Embedding failed: {e}")
+            return 0
+        
+        embedded = 0
+        for key, vec in zip(pending, vectors):
+            if vec is not None:
+                self._embedding_cache[key] = vec
+                embedded += 1
+        return embedded
+    
+    def _get_embedding(self, text: str) -> Optional[np.ndarray]:
+        """Get embedding vector for text with caching."""
+        if not text:
             return None
+        
+        text_key = text.upper().strip()
+        if text_key not in self._embedding_cache:
+            self.prefetch_embeddings([text_key])
+        return self._embedding_cache.get(text_key)
     
     def _calc_token_set_ratio(self, name1: str, name2: str) -> float:
         """Calculate token set ratio (word overlap, order-independent)."""
@@ -737,9 +734,7 @@ class CrossGroupValidator:
         - KASTOORBA ≈ KASTURBA (both encode to KSTRB) → 100%
         - MANIPAL ≠ MANGALORE (MNPL vs MNKLR) → different sounds → low score
         """
-        try:
-            import jellyfish
-        except ImportError:
+        if not JELLYFISH_AVAILABLE:
             # Fallback to fuzzy matching if jellyfish not available
             return fuzz.ratio(name1.upper(), name2.upper())
         
@@ -750,9 +745,9 @@ class CrossGroupValidator:
         if not words1 or not words2:
             return 100.0
         
-        # Calculate phonetic encoding for each word
-        phonetics1 = [jellyfish.metaphone(w) for w in words1 if len(w) > 2]
-        phonetics2 = [jellyfish.metaphone(w) for w in words2 if len(w) > 2]
+        # Phonetic encoding for each word (memoized - master words repeat across groups)
+        phonetics1 = [phonetic_code(w, 'metaphone') for w in words1 if len(w) > 2]
+        phonetics2 = [phonetic_code(w, 'metaphone') for w in words2 if len(w) > 2]
         
         if not phonetics1 or not phonetics2:
             return 100.0
@@ -805,9 +800,13 @@ class CrossGroupValidator:
             phonetic=self._calc_phonetic_similarity(group_name, master_name),
         )
         
-        # Calculate weighted total
+        scores.weighted_total = self._weighted_total(scores)
+        return scores
+    
+    def _weighted_total(self, scores: EnsembleScores) -> float:
+        """Weighted average of the individual ensemble scores."""
         weights = self.ENSEMBLE_WEIGHTS
-        scores.weighted_total = (
+        return (
             scores.token_set * weights['token_set'] +
             scores.token_sort * weights['token_sort'] +
             scores.levenshtein * weights['levenshtein'] +
@@ -818,9 +817,130 @@ class CrossGroupValidator:
             scores.address * weights['address'] +
             scores.phonetic * weights['phonetic']
         )
+    
+    # ============================================================
+    # BATCHED ENSEMBLE SIMILARITY (all groups of one master at once)
+    # ============================================================
+    
+    @staticmethod
+    def _set_overlap_ratios(group_sets: List[set], master_set: set) -> np.ndarray:
+        """
+        |A & B| / |A | B| * 100 of every group set against the master set.
         
+        Sets become rows of a 0/1 matrix over their joint vocabulary, so all
+        intersections are one matrix-vector product. Empty sets score 0.
+        """
+        scores = np.zeros(len(group_sets), dtype=np.float64)
+        if not master_set or not group_sets:
+            return scores
+        
+        vocab = {token: col for col, token in enumerate(master_set)}
+        for tokens in group_sets:
+            for token in tokens:
+                vocab.setdefault(token, len(vocab))
+        
+        rows = [row for row, tokens in enumerate(group_sets) for _ in tokens]
+        cols = [vocab[token] for tokens in group_sets for token in tokens]
+        matrix = np.zeros((len(group_sets), len(vocab)), dtype=np.int32)
+        matrix[rows, cols] = 1
+        master_row = np.zeros(len(vocab), dtype=np.int32)
+        master_row[:len(master_set)] = 1
+        
+        intersection = matrix @ master_row
+        union = matrix.sum(axis=1) + len(master_set) - intersection
+        valid = matrix.any(axis=1)
+        scores[valid] = (intersection[valid] / union[valid]) * 100
+        return scores
+    
+    def _calc_vector_similarities(self, group_names: List[str], master_name: str) -> np.ndarray:
+        """Cosine similarity (0-100) of every group name to the master, as one matrix product."""
+        expanded_groups = [self._expand_acronyms(name) for name in group_names]
+        expanded_master = self._expand_acronyms(master_name)
+        
+        from vector_index import get_vector_index  # ImportError -> token_set fallback
+        
+        scores = np.zeros(len(group_names), dtype=np.float64)
+        if get_vector_index() is None:
+            return scores
+        self.prefetch_embeddings(expanded_groups + [expanded_master])
+        master_vec = self._embedding_cache.get(expanded_master.upper().strip()) if expanded_master else None
+        if master_vec is None:
+            return scores
+        
+        rows = [
+            row for row, name in enumerate(expanded_groups)
+            if name and name.upper().strip() in self._embedding_cache
+        ]
+        if not rows:
+            return scores
+        
+        vectors = np.stack([self._embedding_cache[expanded_groups[row].upper().strip()] for row in rows])
+        dots = vectors @ master_vec
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(master_vec)
+        cosine = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+        scores[rows] = np.clip(cosine * 100, 0.0, 100.0)
         return scores
     
+    def calculate_ensemble_similarities(
+        self,
+        group_names: List[str],
+        master_name: str,
+        group_addresses: Optional[List[str]] = None,
+        master_address: str = ''
+    ) -> List[EnsembleScores]:
+        """
+        Ensemble similarity of many groups against one master.
+        
+        Same scores as calling calculate_ensemble_similarity() per group, but
+        the embeddings are encoded in one batch and the string metrics
+        (token set/sort, Levenshtein, Jaccard, n-gram, vector) are computed
+        as matrix operations over all groups.
+        """
+        if not group_names:
+            return []
+        group_addresses = group_addresses or [''] * len(group_names)
+        
+        names_upper = [name.upper() if name else '' for name in group_names]
+        master_upper = master_name.upper() if master_name else ''
+        has_name = np.array([bool(name) for name in group_names]) & bool(master_name)
+        
+        def fuzzy(scorer) -> np.ndarray:
+            scores = process.cdist([master_upper], names_upper, scorer=scorer, dtype=np.float64)[0]
+            return np.where(has_name, scores, 0.0)
+        
+        def ngrams(text: str) -> set:
+            text = text.replace(' ', '')
+            return {text[i:i+3] for i in range(len(text) - 2)}
+        
+        token_set = fuzzy(fuzz.token_set_ratio)
+        token_sort = fuzzy(fuzz.token_sort_ratio)
+        levenshtein = fuzzy(fuzz.ratio)
+        jaccard = self._set_overlap_ratios([set(name.split()) for name in names_upper], set(master_upper.split()))
+        ngram = self._set_overlap_ratios([ngrams(name) for name in names_upper], ngrams(master_upper))
+        try:
+            vector = self._calc_vector_similarities(group_names, master_name)
+        except Exception as e:
+            # Fallback to token_set if vector index unavailable
+            logger.debug(f"Vector similarity failed: {e}")
+            vector = token_set
+        
+        results = []
+        for i, (group_name, group_address) in enumerate(zip(group_names, group_addresses)):
+            scores = EnsembleScores(
+                token_set=float(token_set[i]),
+                token_sort=float(token_sort[i]),
+                levenshtein=float(levenshtein[i]),
+                jaccard=float(jaccard[i]),
+                ngram=float(ngram[i]),
+                vector=float(vector[i]),
+                unique_id=self._calc_unique_id_match(group_name, master_name),
+                address=self._calc_address_similarity(group_address, master_address),
+                phonetic=self._calc_phonetic_similarity(group_name, master_name),
+            )
+            scores.weighted_total = self._weighted_total(scores)
+            results.append(scores)
+        return results
+    
     def _calc_address_similarity(self, addr1: str, addr2: str) -> float:
         """
         Calculate address similarity for multi-campus detection.
@@ -859,16 +979,14 @@ class CrossGroupValidator:
         fuzzy_score = fuzz.token_set_ratio(addr1_upper, addr2_upper)
         
         # Add phonetic check for addresses
-        try:
-            import jellyfish
-            
+        if JELLYFISH_AVAILABLE:
             # Extract location words (skip short words and digits)
             words1 = [w for w in addr1_upper.split() if len(w) > 2 and not w.isdigit()]
             words2 = [w for w in addr2_upper.split() if len(w) > 2 and not w.isdigit()]
             
             if words1 and words2:
-                phonetics1 = set(jellyfish.metaphone(w) for w in words1)
-                phonetics2 = set(jellyfish.metaphone(w) for w in words2)
+                phonetics1 = set(phonetic_code(w, 'metaphone') for w in words1)
+                phonetics2 = set(phonetic_code(w, 'metaphone') for w in words2)
                 
                 # Calculate phonetic overlap
                 overlap = len(phonetics1 & phonetics2)
@@ -877,8 +995,6 @@ class CrossGroupValidator:
                 
                 # Return max of fuzzy and phonetic (OCR-tolerant)
                 return max(fuzzy_score, phonetic_score)
-        except ImportError:
-            pass
         
         return fuzzy_score
     
@@ -933,24 +1049,23 @@ class CrossGroupValidator:
         total_records = sum(g.record_count for g in groups)
         majority_group = max(groups, key=lambda g: g.record_count)
         
-        for group in groups:
-            # NEW: Check past decisions first
-            past_decision = self.check_past_decision(
+        # NEW: Check past decisions first - approved matches are skipped silently
+        pending = [
+            group for group in groups
+            if self.check_past_decision(
                 master_id, group.normalized_college_name, group.normalized_state
-            )
-            
-            if past_decision == 'APPROVED':
-                # User already approved this match - skip silently
-                continue
-            
-            # Calculate ENSEMBLE similarity to master (including address)
-            ensemble_scores = self.calculate_ensemble_similarity(
-                group_name=group.normalized_college_name,
-                master_name=master_name,
-                group_address=group.normalized_address,
-                master_address=master_address
-            )
-            
+            ) != 'APPROVED'
+        ]
+        
+        # Calculate ENSEMBLE similarity to master (including address) for all groups at once
+        all_scores = self.calculate_ensemble_similarities(
+            group_names=[group.normalized_college_name for group in pending],
+            master_name=master_name,
+            group_addresses=[group.normalized_address for group in pending],
+            master_address=master_address
+        )
+        
+        for group, ensemble_scores in zip(pending, all_scores):
             # Also calculate similarity to majority (for display purposes)
             sim_to_majority = self._calculate_similarity(
                 group.normalized_college_name, majority_group.normalized_college_name
@@ -1027,11 +1142,27 @@ class CrossGroupValidator:
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
+            # Get master college info (name, address, state)
+            master_infos = {
+                master_id: self._get_master_college_info(master_id)
+                for master_id in groups_by_master
+            }
+            
+            # Encode every distinct group and master name up front, in large batches
+            task = progress.add_task("Embedding college names...", total=None)
+            names = [
+                self._expand_acronyms(group.normalized_college_name)
+                for master_id, groups in groups_by_master.items() if master_infos[master_id]
+                for group in groups
+            ]
+            names.extend(self._expand_acronyms(info[0]) for info in master_infos.values() if info)
+            self.prefetch_embeddings(names)
+            progress.update(task, completed=True, visible=False)
+            
             task = progress.add_task("Checking for deviations...", total=len(groups_by_master))
             
             for master_id, groups in groups_by_master.items():
-                # Get master college info (name, address, state)
-                master_info = self._get_master_college_info(master_id)
+                master_info = master_infos[master_id]
                 if not master_info:
                     progress.advance(task)
                     continue
@@ -1145,7 +1276,15 @@ class CrossGroupValidator:
             group_map = {}  # Map index to group info
             deviation_indices = set()
             
-            for idx, group in enumerate(groups, 1):
+            # ENSEMBLE scores for every group (with address), computed in one batch
+            ensembles = self.calculate_ensemble_similarities(
+                group_names=[group.normalized_college_name for group in groups],
+                master_name=master_name,
+                group_addresses=[group.normalized_address for group in groups],
+                master_address=master_address
+            )
+            
+            for idx, (group, ensemble) in enumerate(zip(groups, ensembles), 1):
                 group_unique = self._extract_unique_identifiers(group.normalized_college_name)
                 sim_to_master = self._calculate_similarity(group.normalized_college_name, master_name)
                 
@@ -1171,13 +1310,7 @@ class CrossGroupValidator:
                 console.print(f"  [white]Records:[/white] {group.record_count}")
                 console.print(f"  [dim]Unique IDs:[/dim] {group_unique if group_unique else '(none)'}")
                 
-                # Calculate and show ENSEMBLE scores for this group (with address)
-                ensemble = self.calculate_ensemble_similarity(
-                    group_name=group.normalized_college_name,
-                    master_name=master_name,
-                    group_address=group.normalized_address,
-                    master_address=master_address
-                )
+                # Show ENSEMBLE scores for this group
                 console.print(f"  [bold]Ensemble Scores:[/bold]")
                 console.print(f"    TSet:{ensemble.token_set:.0f} TSort:{ensemble.token_sort:.0f} Lev:{ensemble.levenshtein:.0f} Jac:{ensemble.jaccard:.0f} Ngram:{ensemble.ngram:.0f} Vec:{ensemble.vector:.0f} UID:{ensemble.unique_id:.0f} Addr:{ensemble.address:.0f} → [bold]Wgt:{ensemble.weighted_total:.0f}%[/bold]")
                 
@@ -11,7 +11,9 @@ Usage:
     python3 embedding_name_fixer.py [--db counselling|seat] [--dry-run]
 """
 
+import os
 import sqlite3
+import threading
 import numpy as np
 import logging
 import json
@@ -28,8 +30,12 @@ from rapidfuzz import fuzz
 # Embedding model
 from sentence_transformers import SentenceTransformer
 
+# Persistent embedding store (shared with vector search / transformer matchers)
+from embedding_store import get_embedding_store
+
 # OpenRouter for LLM
 from openrouter_client import OpenRouterClient
+from streaming_json import extract_json_objects
 
 # Performance tracking and resilience (shared with agentic_matcher)
 from llm_performance_tracker import (
@@ -250,13 +256,17 @@ class MasterEmbeddingBuilder:
     
     def build_embeddings(self, force_rebuild: bool = False) -> int:
         """
-        Generate embeddings for all master colleges.
+        Generate embeddings for new or changed master colleges.
+        
+        Vectors come from the shared persistent embedding store, so only names
+        never seen before hit the API; rows whose name/state are unchanged are
+        left alone and rows for deleted colleges are removed.
         
         Args:
-            force_rebuild: If True, rebuild even if embeddings exist
+            force_rebuild: If True, re-encode every college via the API
             
         Returns:
-            Number of embeddings created
+            Number of embeddings in master_embeddings after the update
         """
         conn = sqlite3.connect(self.master_db_path)
         cursor = conn.cursor()
@@ -276,20 +286,6 @@ class MasterEmbeddingBuilder:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_embed_type ON master_embeddings(course_type)")
         conn.commit()
         
-        # Check if embeddings exist
-        cursor.execute("SELECT COUNT(*) FROM master_embeddings")
-        existing_count = cursor.fetchone()[0]
-        
-        if existing_count > 0 and not force_rebuild:
-            console.print(f"[green]✅ {existing_count} embeddings already exist. Use --force to rebuild.[/green]")
-            conn.close()
-            return existing_count
-        
-        # Clear existing embeddings if rebuilding
-        if force_rebuild:
-            cursor.execute("DELETE FROM master_embeddings")
-            conn.commit()
-        
         # Load all master colleges
         tables = [
             ('medical_colleges', 'medical'),
@@ -316,10 +312,37 @@ class MasterEmbeddingBuilder:
             except sqlite3.OperationalError:
                 continue
         
-        console.print(f"[cyan]Found {len(all_colleges)} colleges to embed[/cyan]")
+        # Diff against existing rows: only new or changed colleges are (re)embedded
+        if force_rebuild:
+            cursor.execute("DELETE FROM master_embeddings")
+            conn.commit()
         
-        # Load model
-        model = self._load_model()
+        cursor.execute("SELECT college_id, college_name, state, course_type FROM master_embeddings")
+        existing = {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
+        
+        current_ids = {c['id'] for c in all_colleges}
+        stale_ids = [cid for cid in existing if cid not in current_ids]
+        pending = [
+            c for c in all_colleges
+            if existing.get(c['id']) != (c['name'], c['state'], c['course_type'])
+        ]
+        
+        if stale_ids:
+            cursor.executemany("DELETE FROM master_embeddings WHERE college_id = ?", [(cid,) for cid in stale_ids])
+            conn.commit()
+            MasterEmbeddingMatrix.invalidate(self.master_db_path)
+            console.print(f"[yellow]Removed {len(stale_ids)} embeddings for deleted colleges[/yellow]")
+        
+        if not pending:
+            existing_count = len(existing) - len(stale_ids)
+            console.print(f"[green]✅ {existing_count} embeddings already up to date. Use --force to rebuild.[/green]")
+            conn.close()
+            return existing_count
+        
+        console.print(f"[cyan]Found {len(pending)} new/changed colleges to embed "
+                      f"({len(all_colleges) - len(pending)} unchanged)[/cyan]")
+        
+        store = get_embedding_store(OpenRouterEmbedding.MODEL_NAME)
         
         # Generate embeddings in batches
         batch_size = 100
@@ -331,37 +354,45 @@ class MasterEmbeddingBuilder:
             BarColumn(),
             TextColumn("{task.completed}/{task.total}"),
         ) as progress:
-            task = progress.add_task("Generating embeddings...", total=len(all_colleges))
+            task = progress.add_task("Generating embeddings...", total=len(pending))
             
-            for i in range(0, len(all_colleges), batch_size):
-                batch = all_colleges[i:i + batch_size]
+            for i in range(0, len(pending), batch_size):
+                batch = pending[i:i + batch_size]
                 names = [c['name'] for c in batch]
                 
-                # Generate embeddings
-                embeddings = model.encode(names, show_progress_bar=False)
+                # Cached names come straight from the store; the model is only
+                # loaded when something actually needs encoding
+                embeddings = store.encode(
+                    names,
+                    lambda texts: self._load_model().encode(texts, show_progress_bar=False),
+                    refresh=force_rebuild,
+                )
                 
-                # Store in database
-                for j, college in enumerate(batch):
-                    embedding_bytes = embeddings[j].astype(np.float32).tobytes()
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO master_embeddings 
-                        (college_id, college_name, state, course_type, embedding)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO master_embeddings 
+                    (college_id, college_name, state, course_type, embedding)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (
                         college['id'],
                         college['name'],
                         college['state'],
                         college['course_type'],
-                        embedding_bytes,
-                    ))
-                    total_embedded += 1
+                        embeddings[j].astype(np.float32).tobytes(),
+                    )
+                    for j, college in enumerate(batch)
+                ])
+                total_embedded += len(batch)
                 
                 conn.commit()
+                MasterEmbeddingMatrix.invalidate(self.master_db_path)
                 progress.update(task, advance=len(batch))
         
+        cursor.execute("SELECT COUNT(*) FROM master_embeddings")
+        total_count = cursor.fetchone()[0]
         conn.close()
-        console.print(f"[green]✅ Created {total_embedded} embeddings[/green]")
-        return total_embedded
+        console.print(f"[green]✅ Embedded {total_embedded} colleges ({total_count} total)[/green]")
+        return total_count
 
 
 class WordMerger:
@@ -777,6 +808,199 @@ class IntelligentDetector:
         return broken_records
 
 
+def embedding_course_type(course_type: Optional[str]) -> Optional[str]:
+    """master_embeddings.course_type for a record course type (None = no filter)"""
+    if not course_type:
+        return None
+    course_type = course_type.lower()
+    if course_type in ('medical', 'mbbs', 'diploma'):
+        return 'medical'
+    if course_type in ('dental', 'bds'):
+        return 'dental'
+    if course_type == 'dnb':
+        return 'dnb'
+    return None
+
+
+class MasterEmbeddingMatrix:
+    """
+    The master_embeddings table held in memory for similarity search.
+
+    Rows are one contiguous, L2-normalized float32 matrix (table rowid order) with
+    upper-cased state and course_type codes alongside, so a (state, course_type)
+    partition is an index array and scoring a batch is a matmul plus argpartition.
+    One instance per database; get() reloads it when the table changed (row count,
+    max rowid, newest created_at) or MasterEmbeddingBuilder.build_embeddings() wrote
+    rows in this process.
+    """
+
+    _instances: Dict[str, 'MasterEmbeddingMatrix'] = {}
+    _generations: Dict[str, int] = {}  # db path -> bumped on every build_embeddings() write
+    _registry_lock = threading.Lock()
+
+    def __init__(self, master_db_path: str):
+        self.master_db_path = master_db_path
+        self._key = os.path.abspath(master_db_path)
+        self._signature = None
+        self._lock = threading.Lock()
+
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.states: List[str] = []
+        self.course_types: List[str] = []
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self._state_codes = np.zeros(0, dtype=np.int32)
+        self._type_codes = np.zeros(0, dtype=np.int32)
+        self._state_index: Dict[str, int] = {}
+        self._type_index: Dict[str, int] = {}
+        self._valid = np.zeros(0, dtype=bool)  # Rows with a non-zero vector
+        self._partitions: Dict[Tuple[Optional[str], Optional[str]], np.ndarray] = {}
+
+    @classmethod
+    def get(cls, master_db_path: str) -> 'MasterEmbeddingMatrix':
+        """Shared, up-to-date matrix for a master database"""
+        key = os.path.abspath(master_db_path)
+        with cls._registry_lock:
+            matrix = cls._instances.get(key)
+            if matrix is None:
+                matrix = cls._instances[key] = cls(master_db_path)
+        matrix.refresh()
+        return matrix
+
+    @classmethod
+    def invalidate(cls, master_db_path: str):
+        """Mark the cached matrix of a database as stale (called after writes)"""
+        key = os.path.abspath(master_db_path)
+        with cls._registry_lock:
+            cls._generations[key] = cls._generations.get(key, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def refresh(self) -> bool:
+        """Reload the table if it changed; returns True if reloaded"""
+        with self._lock:
+            conn = sqlite3.connect(self.master_db_path)
+            try:
+                try:
+                    table_state = conn.execute(
+                        "SELECT COUNT(*), MAX(rowid), MAX(created_at) FROM master_embeddings"
+                    ).fetchone()
+                except sqlite3.OperationalError:
+                    table_state = None  # Table not built yet
+                signature = (self._generations.get(self._key, 0), table_state)
+                if signature == self._signature:
+                    return False
+
+                rows = conn.execute("""
+                    SELECT college_id, college_name, state, course_type, embedding
+                    FROM master_embeddings ORDER BY rowid
+                """).fetchall() if table_state else []
+            finally:
+                conn.close()
+
+            self._load_rows(rows)
+            self._signature = signature
+            return True
+
+    def _load_rows(self, rows: List[tuple]):
+        if rows:
+            # All vectors share one dimension; drop odd rows (partial writes) rather than fail
+            sizes = [len(row[4]) for row in rows]
+            size = max(set(sizes), key=sizes.count)
+            if any(n != size for n in sizes):
+                logger.warning(f"Skipping {sum(n != size for n in sizes)} master embeddings with unexpected size")
+                rows = [row for row, n in zip(rows, sizes) if n == size]
+            matrix = np.frombuffer(b''.join(row[4] for row in rows), dtype=np.float32).reshape(len(rows), -1)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        norms = np.linalg.norm(matrix, axis=1) if len(matrix) else np.zeros(0, dtype=np.float32)
+        self._valid = norms > 0
+        self.matrix = np.ascontiguousarray(matrix / np.where(self._valid, norms, 1)[:, None], dtype=np.float32)
+
+        self.ids = [row[0] for row in rows]
+        self.names = [row[1] for row in rows]
+        self.states = [row[2] for row in rows]
+        self.course_types = [row[3] for row in rows]
+        self._state_index, self._state_codes = self._codes((state or '').upper() for state in self.states)
+        self._type_index, self._type_codes = self._codes(self.course_types)
+        self._partitions = {}
+
+        logger.info(f"Loaded {len(rows):,} master embeddings into memory ({self.matrix.nbytes / 1e6:.1f} MB)")
+
+    @staticmethod
+    def _codes(values) -> Tuple[Dict[str, int], np.ndarray]:
+        index: Dict[str, int] = {}
+        codes = [index.setdefault(value, len(index)) for value in values]
+        return index, np.asarray(codes, dtype=np.int32)
+
+    def partition(self, state: Optional[str] = None, course_type: Optional[str] = None) -> np.ndarray:
+        """Row indices for a state / record course type (same filters as the old SQL query)"""
+        key = (state.upper() if state else None, embedding_course_type(course_type))
+        rows = self._partitions.get(key)
+        if rows is None:
+            mask = self._valid.copy()
+            if key[0] is not None:
+                mask &= self._state_codes == self._state_index.get(key[0], -1)
+            if key[1] is not None:
+                mask &= self._type_codes == self._type_index.get(key[1], -1)
+            rows = self._partitions[key] = np.flatnonzero(mask)
+        return rows
+
+    def _candidate(self, row: int) -> Dict:
+        return {
+            'id': self.ids[row],
+            'name': self.names[row],
+            'state': self.states[row],
+            'course_type': self.course_types[row],
+            'embedding': self.matrix[row],  # L2-normalized
+        }
+
+    def top_k(
+        self,
+        query_embeddings: np.ndarray,
+        partitions: List[Tuple[Optional[str], Optional[str]]],
+        top_k: int = 10,
+    ) -> List[List[Tuple[Dict, float]]]:
+        """
+        TOP-K cosine matches per query within its (state, course_type) partition.
+
+        Queries sharing a partition are scored with one matmul; ties keep table order.
+
+        Returns:
+            List of (college_dict, similarity) lists, one per query
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        results: List[List[Tuple[Dict, float]]] = [[] for _ in partitions]
+        if not len(queries) or not len(self):
+            return results
+
+        query_norms = np.linalg.norm(queries, axis=1)
+        grouped: Dict[Tuple[Optional[str], Optional[str]], List[int]] = {}
+        for i, (state, course_type) in enumerate(partitions):
+            if query_norms[i] > 0:
+                grouped.setdefault((state, course_type), []).append(i)
+
+        for (state, course_type), members in grouped.items():
+            rows = self.partition(state, course_type)
+            if not len(rows):
+                continue
+            similarities = (queries[members] / query_norms[members, None]) @ self.matrix[rows].T
+            k = min(top_k, len(rows))
+            if k < len(rows):
+                best = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                best = np.broadcast_to(np.arange(len(rows)), (len(members), len(rows)))
+            for j, i in enumerate(members):
+                columns = best[j]
+                scores = similarities[j, columns]
+                order = np.lexsort((columns, -scores))
+                results[i] = [(self._candidate(rows[columns[o]]), float(scores[o])) for o in order]
+
+        return results
+
+
 class EmbeddingSimilaritySearch:
     """Finds similar college names using OpenRouter embeddings."""
     
@@ -787,45 +1011,6 @@ class EmbeddingSimilaritySearch:
     ):
         self.master_db_path = master_db_path
         self.model = OpenRouterEmbedding(api_keys=api_keys)
-        self._embeddings_cache = None
-    
-    def _load_embeddings(self, state: str = None, course_type: str = None) -> List[Dict]:
-        """Load embeddings from database, optionally filtered by state/course_type."""
-        conn = sqlite3.connect(self.master_db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        query = "SELECT college_id, college_name, state, course_type, embedding FROM master_embeddings WHERE 1=1"
-        params = []
-        
-        if state:
-            query += " AND UPPER(state) = UPPER(?)"
-            params.append(state)
-        
-        if course_type:
-            # Map course types
-            if course_type.lower() in ('medical', 'mbbs', 'diploma'):
-                query += " AND course_type = 'medical'"
-            elif course_type.lower() in ('dental', 'bds'):
-                query += " AND course_type = 'dental'"
-            elif course_type.lower() == 'dnb':
-                query += " AND course_type = 'dnb'"
-        
-        cursor.execute(query, params)
-        
-        results = []
-        for row in cursor.fetchall():
-            embedding = np.frombuffer(row['embedding'], dtype=np.float32)
-            results.append({
-                'id': row['college_id'],
-                'name': row['college_name'],
-                'state': row['state'],
-                'course_type': row['course_type'],
-                'embedding': embedding,
-            })
-        
-        conn.close()
-        return results
     
     def search(
         self,
@@ -840,27 +1025,15 @@ class EmbeddingSimilaritySearch:
         Returns:
             List of (college_dict, similarity_score) tuples
         """
-        # Load embeddings (filtered by state/course_type)
-        candidates = self._load_embeddings(state, course_type)
-        
-        if not candidates:
+        # In-memory master matrix (reloaded only when master_embeddings changes)
+        matrix = MasterEmbeddingMatrix.get(self.master_db_path)
+        if not len(matrix.partition(state, course_type)):
             return []
         
         # Compute query embedding
-        query_embedding = self.model.encode([query_name])[0]
+        query_embedding = self.model.encode([query_name])
         
-        # Compute cosine similarities
-        similarities = []
-        for candidate in candidates:
-            sim = np.dot(query_embedding, candidate['embedding']) / (
-                np.linalg.norm(query_embedding) * np.linalg.norm(candidate['embedding'])
-            )
-            similarities.append((candidate, float(sim)))
-        
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        return similarities[:top_k]
+        return matrix.top_k(query_embedding, [(state, course_type)], top_k)[0]
     
     def batch_search(
         self,
@@ -870,7 +1043,9 @@ class EmbeddingSimilaritySearch:
         """
         Find TOP-K most similar colleges for ALL records in ONE batch.
         
-        This dramatically reduces API calls by computing all embeddings at once.
+        This dramatically reduces API calls by computing all embeddings at once,
+        and scores every record against the in-memory master matrix (one matmul
+        per state + course_type partition).
         
         Args:
             records: List of records with 'group_id', 'normalized_college_name', 
@@ -890,45 +1065,13 @@ class EmbeddingSimilaritySearch:
         console.print(f"[cyan]   Computing embeddings for {len(query_names)} names in batch...[/cyan]")
         query_embeddings = self.model.encode(query_names, show_progress_bar=False)
         
-        # Pre-load all embeddings by state+course_type
-        embeddings_cache = {}
-        
-        results = {}
-        for idx, record in enumerate(records):
-            query_embedding = query_embeddings[idx]
-            state = record.get('normalized_state')
-            course_type = record.get('sample_course_type')
-            
-            # Cache embeddings by state+course_type
-            cache_key = (state, course_type)
-            if cache_key not in embeddings_cache:
-                embeddings_cache[cache_key] = self._load_embeddings(state, course_type)
-            
-            candidates = embeddings_cache[cache_key]
-            
-            if not candidates:
-                results[record['group_id']] = []
-                continue
-            
-            # Compute cosine similarities
-            similarities = []
-            query_norm = np.linalg.norm(query_embedding)
-            if query_norm == 0:
-                results[record['group_id']] = []
-                continue
-                
-            for candidate in candidates:
-                cand_norm = np.linalg.norm(candidate['embedding'])
-                if cand_norm == 0:
-                    continue
-                sim = np.dot(query_embedding, candidate['embedding']) / (query_norm * cand_norm)
-                similarities.append((candidate, float(sim)))
-            
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            results[record['group_id']] = similarities[:top_k]
-        
-        return results
+        matrix = MasterEmbeddingMatrix.get(self.master_db_path)
+        matches = matrix.top_k(
+            query_embeddings,
+            [(r.get('normalized_state'), r.get('sample_course_type')) for r in records],
+            top_k,
+        )
+        return {record['group_id']: hits for record, hits in zip(records, matches)}
 
 
 class MultiModelVerifier:
@@ -1044,8 +1187,6 @@ If no fix needed, return the original name with confidence 1.0.
         # Remove extra spaces and compare
         cleaned_broken = broken_name.replace(' ', '')
         
-        from rapidfuzz import fuzz
-        
         best_match = None
         best_score = 0.0
         best_id = None
@@ -1336,7 +1477,6 @@ class NameFixerPipeline:
         Returns:
             (passed: bool, confidence_score: float)
         """
-        from rapidfuzz import fuzz
         
         # ===== PHASE 1: NORMALIZE AND MERGE SPLIT WORDS =====
         # This handles encoding issues like "GOVER NMENT" → "GOVERNMENT"
@@ -2058,8 +2198,11 @@ If a name looks correct (no broken words), return it unchanged with confidence 1
             
             return []
         except Exception as e:
-            logger.debug(f"Failed to parse batch response: {e}")
-            return []
+            # Truncated array / prose around the JSON: keep every complete correction
+            corrections = extract_json_objects(content, required_key='corrected_name')
+            if not corrections:
+                logger.debug(f"Failed to parse batch response: {e}")
+            return corrections
 
 
 def main():
@@ -2298,7 +2441,7 @@ def manual_corrections(db_path: str):
         group_id, original, state, address, course_type, record_count = uncorrected[current_idx]
         
         # Get suggestions using fuzzy matching
-        from rapidfuzz import fuzz, process
+        from rapidfuzz import process
         
         # Filter by state first if available
         if state:
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Persistent Embedding Store
+
+Disk-backed cache of text embeddings shared by every component that embeds
+master college names (VectorSearchEngine, TransformerMatcher, SemanticMatcher,
+MasterEmbeddingBuilder).
+
+Layout (one directory per model and encode settings):
+    models/embedding_store/<model_slug>[-<params_hash>]/vectors.f32      raw row-major float32/float16 matrix
+    models/embedding_store/<model_slug>[-<params_hash>]/index.f32.json   model, params, dim, dtype and row keys
+    models/embedding_store/<model_slug>[-<params_hash>]/index.f32.lock   writer lock (fcntl.flock)
+
+Rows are keyed by a SHA1 of the whitespace-normalized text (case is kept), and
+the store encodes exactly that normalized text, so a key always names the input
+its vector was computed from. A renamed master college simply gets a new row
+and unchanged names are never re-encoded. A warm start memory-maps the vector
+file and reads the key list - no model inference. Processes sharing a store
+(several runs, worker pools) append under an exclusive file lock.
+
+Usage:
+    from embedding_store import get_embedding_store
+
+    store = get_embedding_store('BAAI/bge-m3', encode_params={'max_length': 128, 'use_fp16': True})
+    vectors = store.encode(names, lambda batch: model.encode(batch, max_length=128))
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = 'models/embedding_store'
+
+# Bumped when the key derivation changes; stores with another version are ignored
+KEY_FORMAT = 2
+
+# Singleton stores, one per (root, model, dtype, encode params)
+_stores: Dict[tuple, 'EmbeddingStore'] = {}
+_stores_lock = threading.Lock()
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Normalization used for store keys and encoder input (whitespace only - cased models see case)"""
+    return re.sub(r'\s+', ' ', (text or '').strip())
+
+
+def text_hash(text: str) -> str:
+    """Store key for a text"""
+    return hashlib.sha1(normalize_embedding_text(text).encode('utf-8')).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped embedding matrix with a hash -> row index.
+
+    New vectors are appended to the data file before the index is rewritten
+    (atomically), so a crash mid-append leaves only unreferenced trailing rows.
+    Writers hold an exclusive flock and re-read the index first, so concurrent
+    processes append after each other's rows instead of over them. Re-encoded
+    texts (refresh) overwrite their existing row in place. All-zero vectors
+    (what encoders return for failed API calls) are never stored.
+
+    Args:
+        encode_params: Encoder settings that change the vectors (max_length,
+            fp16, pooling, ...); each distinct set gets its own store
+    """
+
+    def __init__(self, model_name: str, root: str = DEFAULT_STORE_DIR, dtype: str = 'float32',
+                 encode_params: Optional[Dict[str, Any]] = None):
+        if dtype not in ('float32', 'float16'):
+            raise ValueError(f"Unsupported embedding store dtype: {dtype}")
+
+        self.model_name = model_name
+        self.encode_params = dict(encode_params or {})
+        self.dtype = np.dtype(dtype)
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        if self.encode_params:
+            params = json.dumps(self.encode_params, sort_keys=True)
+            slug += '-' + hashlib.sha1(params.encode('utf-8')).hexdigest()[:12]
+        self.path = Path(root) / slug
+        self.path.mkdir(parents=True, exist_ok=True)
+        suffix = 'f16' if dtype == 'float16' else 'f32'
+        self.vectors_file = self.path / f'vectors.{suffix}'
+        self.index_file = self.path / f'index.{suffix}.json'
+        self.lock_file = self.path / f'index.{suffix}.lock'
+
+        self.dim: Optional[int] = None
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive inter-process lock around read-index / write-rows / publish-index"""
+        with open(self.lock_file, 'a') as f:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_index(self) -> Optional[Dict[str, Any]]:
+        """Published index of this store, or None if missing/foreign/truncated"""
+        if not self.index_file.exists():
+            return None
+        with open(self.index_file, 'r') as f:
+            index = json.load(f)
+        if (index.get('model') != self.model_name or index.get('dtype') != self.dtype.name
+                or index.get('params', {}) != self.encode_params or index.get('key_format') != KEY_FORMAT):
+            logger.warning(f"Embedding store {self.path} has a different model/dtype/params/key format - ignoring")
+            return None
+
+        keys = index.get('keys', [])
+        row_bytes = int(index['dim']) * self.dtype.itemsize
+        available = self.vectors_file.stat().st_size // row_bytes if self.vectors_file.exists() else 0
+        if available < len(keys):
+            logger.warning(f"Embedding store {self.path} is truncated ({available} < {len(keys)} rows) - ignoring")
+            return None
+        return index
+
+    def _adopt_index(self, index: Dict[str, Any]):
+        """Take over the published key list (rows are append-only, so ours is a prefix)"""
+        dim = int(index['dim'])
+        if self.dim is not None and dim != self.dim:
+            raise ValueError(f"Embedding store {self.path} dim {dim} does not match {self.dim}")
+        self.dim = dim
+        self._keys = list(index.get('keys', []))
+        self._rows = {key: row for row, key in enumerate(self._keys)}  # Repeated keys: newest row wins
+
+    def _load(self):
+        """Map an existing store (no-op for a fresh directory)"""
+        try:
+            index = self._read_index()
+            if index is None:
+                return
+            self._adopt_index(index)
+            self._map()
+            logger.info(f"Mapped {len(self._keys):,} cached embeddings from {self.path}")
+        except Exception as e:
+            logger.warning(f"Failed to load embedding store {self.path}: {e}")
+            self.dim, self._keys, self._rows, self._matrix = None, [], {}, None
+
+    def _refresh(self):
+        """Pick up rows published by other processes since the last load/write"""
+        try:
+            index = self._read_index()
+        except Exception as e:
+            logger.debug(f"Could not re-read embedding store index {self.index_file}: {e}")
+            return
+        if index is not None and len(index.get('keys', [])) > len(self._keys):
+            self._adopt_index(index)
+            self._map()
+
+    def _map(self):
+        """(Re)map the data file for the rows referenced by the index"""
+        self._matrix = None
+        if self._keys:
+            self._matrix = np.memmap(
+                self.vectors_file, dtype=self.dtype, mode='r', shape=(len(self._keys), self.dim)
+            )
+
+    def _write(self, keys: List[str], vectors: np.ndarray):
+        """Overwrite rows of known keys, append the rest and publish them in the index"""
+        vectors = np.ascontiguousarray(vectors, dtype=self.dtype)
+        row_bytes = self.dim * self.dtype.itemsize
+
+        self._matrix = None  # drop the old mapping before writing / growing the file
+        try:
+            self._write_locked(keys, vectors, row_bytes)
+        finally:
+            self._map()
+
+    def _write_locked(self, keys: List[str], vectors: np.ndarray, row_bytes: int):
+        """Body of _write, run under the inter-process file lock"""
+        with self._file_lock():
+            # Another process may have appended since we loaded: write after its rows
+            index = self._read_index()
+            if index is not None:
+                self._adopt_index(index)
+            elif self._keys:
+                logger.warning(f"Embedding store index {self.index_file} vanished - starting over")
+                self._keys, self._rows = [], {}
+            new = [i for i, key in enumerate(keys) if key not in self._rows]
+
+            with open(self.vectors_file, 'r+b' if self.vectors_file.exists() else 'wb') as f:
+                for i, key in enumerate(keys):
+                    if key in self._rows:
+                        f.seek(self._rows[key] * row_bytes)
+                        f.write(vectors[i].tobytes())
+                # Overwrite any unreferenced rows left behind by an interrupted append
+                f.seek(len(self._keys) * row_bytes)
+                f.write(vectors[new].tobytes())
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+
+            if new or index is None:
+                base = len(self._keys)
+                for offset, i in enumerate(new):
+                    self._keys.append(keys[i])
+                    self._rows[keys[i]] = base + offset
+
+                tmp_file = self.index_file.with_suffix(f'.{os.getpid()}.tmp')
+                with open(tmp_file, 'w') as f:
+                    json.dump({
+                        'model': self.model_name,
+                        'params': self.encode_params,
+                        'key_format': KEY_FORMAT,
+                        'dim': self.dim,
+                        'dtype': self.dtype.name,
+                        'keys': self._keys,
+                    }, f)
+                os.replace(tmp_file, self.index_file)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text: str) -> bool:
+        return text_hash(text) in self._rows
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Cached embedding for one text (float32), or None"""
+        row = self._rows.get(text_hash(text))
+        if row is None or self._matrix is None:
+            return None
+        return np.array(self._matrix[row], dtype=np.float32)
+
+    def missing(self, texts: Sequence[str]) -> List[str]:
+        """Unique texts (first occurrence order) that are not in the store"""
+        seen = set()
+        result = []
+        for text in texts:
+            key = text_hash(text)
+            if key not in self._rows and key not in seen:
+                seen.add(key)
+                result.append(text)
+        return result
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        encode_fn: Callable[[List[str]], np.ndarray],
+        refresh: bool = False,
+    ) -> np.ndarray:
+        """
+        Embeddings for `texts` in order, encoding only texts not already stored.
+
+        Args:
+            texts: Texts to embed (duplicates are encoded once)
+            encode_fn: Called with the uncached texts (whitespace-normalized, i.e.
+                exactly what their keys describe), returns (n, dim) array
+            refresh: Re-encode every text even if cached (force rebuild)
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        texts = [normalize_embedding_text(t) for t in texts]
+        keys = [text_hash(t) for t in texts]
+
+        with self._lock:
+            if not refresh and any(key not in self._rows for key in keys):
+                self._refresh()  # Another process may already have encoded them
+
+            pending, seen = [], set()
+            for text, key in zip(texts, keys):
+                if key not in seen and (refresh or key not in self._rows):
+                    seen.add(key)
+                    pending.append(text)
+
+            if pending:
+                logger.info(f"Encoding {len(pending):,} new texts ({len(texts) - len(pending):,} cached) for {self.model_name}")
+                vectors = np.asarray(encode_fn(pending), dtype=np.float32)
+                if vectors.ndim != 2 or len(vectors) != len(pending):
+                    raise ValueError(
+                        f"encode_fn returned shape {vectors.shape} for {len(pending)} texts"
+                    )
+                if self.dim is None:
+                    self.dim = int(vectors.shape[1])
+                elif vectors.shape[1] != self.dim:
+                    raise ValueError(f"Embedding dim {vectors.shape[1]} does not match store dim {self.dim}")
+
+                # Zero / non-finite rows are failed encodes: return them, but don't cache them
+                valid = np.isfinite(vectors).all(axis=1) & np.any(vectors != 0, axis=1)
+                if not valid.all():
+                    logger.warning(f"Not caching {int((~valid).sum())} empty embeddings for {self.model_name}")
+                pending_keys = [text_hash(t) for t in pending]
+                if valid.any():
+                    self._write([k for k, ok in zip(pending_keys, valid) if ok], vectors[valid])
+                # Failed encodes fall back to an earlier stored vector, else zeros
+                fresh = {k: v for k, v, ok in zip(pending_keys, vectors, valid) if not ok and k not in self._rows}
+            else:
+                fresh = {}
+
+            if not texts:
+                return np.zeros((0, self.dim or 0), dtype=np.float32)
+
+            result = np.empty((len(texts), self.dim), dtype=np.float32)
+            cached = [i for i, k in enumerate(keys) if k not in fresh]
+            if cached:
+                rows = np.fromiter((self._rows[keys[i]] for i in cached), dtype=np.int64, count=len(cached))
+                result[cached] = self._matrix[rows]
+            for i, k in enumerate(keys):
+                if k in fresh:
+                    result[i] = fresh[k]
+            return result
+
+
+def get_embedding_store(
+    model_name: str,
+    root: str = DEFAULT_STORE_DIR,
+    dtype: str = 'float32',
+    encode_params: Optional[Dict[str, Any]] = None,
+) -> EmbeddingStore:
+    """Get the shared store for a model and encoder settings (one instance per process)"""
+    key = (str(Path(root).resolve()), model_name, dtype, json.dumps(encode_params or {}, sort_keys=True))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = EmbeddingStore(model_name, root=root, dtype=dtype, encode_params=encode_params)
+            _stores[key] = store
+        return store
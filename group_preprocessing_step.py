@@ -19,6 +19,8 @@ Performance:
 
 import sqlite3
 import logging
+import hashlib
+import json
 from collections import defaultdict
 from datetime import datetime
 import re
@@ -112,18 +114,134 @@ def create_composite_college_key(normalized_college_name, normalized_address):
     return composite_key
 
 
+def create_group_key(normalized_state, normalized_college_name, normalized_address, course_type):
+    """
+    Create the stable group key: a content hash of the normalized matching fields.
+
+    NULL and empty addresses hash the same as NO_ADDRESS (same rule as grouping).
+    Stored on each seat row as match_content_hash and on the queue as group_key.
+    """
+    fields = [normalized_state, normalized_college_name, normalized_address or 'NO_ADDRESS', course_type]
+    return hashlib.sha1(json.dumps(fields).encode('utf-8')).hexdigest()
+
+
+# Master tables whose colleges make up the candidate pool of a group
+MASTER_COLLEGE_TABLES = ('medical_colleges', 'dental_colleges', 'dnb_colleges')
+
+
+def compute_master_dependencies(master_db_path):
+    """
+    Fingerprint the master colleges each group depends on, per state.
+
+    A group is matched against the master colleges of its state, so a change to
+    any college (id, name, address) in that state changes its fingerprint.
+
+    Returns:
+        (per-state fingerprints keyed by UPPER(TRIM(state)), fingerprint of all colleges)
+        The all-colleges fingerprint is used for states with no master colleges.
+    """
+    per_state = defaultdict(hashlib.sha1)
+    overall = hashlib.sha1()
+
+    try:
+        conn = sqlite3.connect(master_db_path)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not open master data for dependency hashes: {e}")
+        return {}, 'missing'
+
+    try:
+        for table in MASTER_COLLEGE_TABLES:
+            try:
+                rows = conn.execute(f"""
+                SELECT UPPER(TRIM(state)), id, name, address
+                FROM {table}
+                ORDER BY id
+                """).fetchall()
+            except sqlite3.Error:
+                continue  # Table might not exist
+
+            for state_key, college_id, name, address in rows:
+                row_bytes = json.dumps([table, college_id, name, address]).encode('utf-8')
+                per_state[state_key].update(row_bytes)
+                overall.update(row_bytes)
+    finally:
+        conn.close()
+
+    return {state: digest.hexdigest() for state, digest in per_state.items()}, overall.hexdigest()
+
+
+# Persistent seat row id -> group_id mapping (written by set-based grouping)
+GROUP_MAPPING_TABLE = 'group_seat_mapping'
+
+
+def register_group_functions(conn, master_dependencies=None):
+    """
+    Register the Python helpers used by set-based grouping as SQLite functions.
+
+    composite_college_key(normalized_college_name, normalized_address) returns the
+    same value as create_composite_college_key(), group_key_hash(...) the same as
+    create_group_key(). If master_dependencies (from compute_master_dependencies())
+    is given, master_dependency(normalized_state) returns that state's fingerprint.
+    """
+    conn.create_function('composite_college_key', 2, create_composite_college_key, deterministic=True)
+    conn.create_function('group_key_hash', 4, create_group_key, deterministic=True)
+
+    if master_dependencies is not None:
+        per_state, overall = master_dependencies
+
+        def master_dependency(normalized_state):
+            state_key = str(normalized_state).strip().upper() if normalized_state is not None else None
+            return per_state.get(state_key, overall)
+
+        conn.create_function('master_dependency', 1, master_dependency, deterministic=True)
+
+
+def has_group_mapping(cursor):
+    """
+    Check whether the seat -> group mapping can be used for propagation.
+
+    True only when the mapping table exists, has rows, and group_matching_queue
+    has a group_id column to join on.
+    """
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (GROUP_MAPPING_TABLE,)
+    )
+    if cursor.fetchone() is None:
+        return False
+
+    cursor.execute("PRAGMA table_info(group_matching_queue)")
+    if 'group_id' not in {row[1] for row in cursor.fetchall()}:
+        return False
+
+    cursor.execute(f"SELECT 1 FROM {GROUP_MAPPING_TABLE} LIMIT 1")
+    return cursor.fetchone() is not None
+
+
 class GroupPreprocessor:
     """Create exact match groups from seat_data or other source table"""
 
-    def __init__(self, seat_db_path='data/sqlite/seat_data.db', table_name='seat_data'):
+    def __init__(self, seat_db_path='data/sqlite/seat_data.db', table_name='seat_data', set_based=False,
+                 master_db_path='data/sqlite/master_data.db'):
         self.seat_db_path = seat_db_path
         self.table_name = table_name  # Allow custom table name to avoid VIEW overhead
+        # set_based=True: build the queue with one INSERT ... SELECT ... GROUP BY
+        # and keep a seat -> group_id mapping table for propagation
+        self.set_based = set_based
+        self.master_db_path = master_db_path  # For per-state master dependency hashes
 
-    def create_groups(self):
+    def create_groups(self, incremental=False):
         """
         Group seat_data by exact (state, college_name, address) match.
 
         Creates group_matching_queue table with one record per unique combination.
+        In set-based mode, also writes the group_seat_mapping table (seat id -> group_id).
+
+        Args:
+            incremental: Keep the existing queue and only enqueue (needs_match = 1)
+                groups whose key is new or whose master dependency changed.
+                Requires set-based mode and a queue built by it; otherwise the
+                queue is rebuilt in full.
         """
         logger.info("\n" + "="*80)
         logger.info("📋 PRE-PROCESSING: Creating exact match groups")
@@ -142,6 +260,64 @@ class GroupPreprocessor:
         conn = sqlite3.connect(self.seat_db_path)
         cursor = conn.cursor()
 
+        if incremental and not self.set_based:
+            logger.warning("Incremental grouping needs set-based mode - rebuilding the queue in full")
+            incremental = False
+        if incremental and not self._supports_incremental(cursor):
+            logger.info("Queue was not built with group keys yet - rebuilding the queue in full")
+            incremental = False
+
+        if incremental:
+            source_count = self._update_groups_incremental(conn, cursor)
+        else:
+            self._create_queue_table(cursor)
+            if self.set_based:
+                source_count = self._insert_groups_set_based(conn, cursor)
+            else:
+                source_count = self._insert_groups(conn, cursor)
+
+        # STEP 5: Verify and print statistics
+        cursor.execute("SELECT COUNT(*) FROM group_matching_queue")
+        total_groups = cursor.fetchone()[0]
+
+        cursor.execute("""
+        SELECT SUM(record_count)
+        FROM group_matching_queue
+        """)
+        total_records = cursor.fetchone()[0] or 0
+
+        cursor.execute("SELECT COUNT(*) FROM group_matching_queue WHERE needs_match = 1")
+        enqueued_groups = cursor.fetchone()[0]
+
+        conn.close()
+
+        if total_groups == 0:
+            logger.info(f"No records in {self.table_name} - nothing to group")
+            return total_groups, total_records
+
+        logger.info("\n" + "="*80)
+        logger.info("✅ PRE-PROCESSING COMPLETE")
+        logger.info("="*80)
+        logger.info(f"\n📊 GROUP STATISTICS:")
+        logger.info(f"   Total records in seat_data:  {source_count:,}")
+        logger.info(f"   Unique groups created:       {total_groups:,}")
+        logger.info(f"   Total records in groups:     {total_records:,}")
+        logger.info(f"   Reduction ratio:             {source_count/total_groups:.1f}x")
+        logger.info(f"   Average records per group:   {total_records/total_groups:.1f}")
+        if incremental:
+            logger.info(f"   Groups enqueued for matching: {enqueued_groups:,}")
+
+        logger.info(f"\n⏱️  EXPECTED PERFORMANCE:")
+        logger.info(f"   Old method: {source_count:,} × 7.3ms = ~{source_count*7.3/1000:.0f}s")
+        logger.info(f"   New method: {total_groups:,} × 7.3ms = ~{total_groups*7.3/1000:.0f}s")
+        logger.info(f"   Time saved: ~{(source_count-total_groups)*7.3/1000:.0f}s")
+
+        logger.info(f"\n{'='*80}\n")
+
+        return total_groups, total_records
+
+    def _create_queue_table(self, cursor):
+        """Drop and recreate group_matching_queue (full rebuild)"""
         # STEP 1: Drop and recreate group_matching_queue table with new schema
         # RULE #1: Store NORMALIZED fields for matching
         logger.info("Dropping and recreating group_matching_queue table...")
@@ -165,10 +341,198 @@ class GroupPreprocessor:
             match_method TEXT,
             match_model TEXT,
             is_processed INTEGER DEFAULT 0,
+            group_key TEXT UNIQUE,
+            master_dependency_hash TEXT,
+            needs_match INTEGER DEFAULT 1,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """)
 
+    def _supports_incremental(self, cursor):
+        """True if the queue, mapping and seat hashes were written by set-based grouping"""
+        cursor.execute("PRAGMA table_info(group_matching_queue)")
+        if 'group_key' not in {row[1] for row in cursor.fetchall()}:
+            return False
+
+        cursor.execute(f"PRAGMA table_info({self.table_name})")
+        if 'match_content_hash' not in {row[1] for row in cursor.fetchall()}:
+            return False
+
+        if not has_group_mapping(cursor):
+            return False
+
+        cursor.execute("SELECT 1 FROM group_matching_queue WHERE group_key IS NULL LIMIT 1")
+        return cursor.fetchone() is None
+
+    def _refresh_content_hashes(self, cursor):
+        """
+        Store the group key hash on every seat row whose normalized fields changed.
+
+        Returns:
+            Number of seat rows that are new or changed since the last run
+        """
+        cursor.execute(f"PRAGMA table_info({self.table_name})")
+        if 'match_content_hash' not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN match_content_hash TEXT")
+        cursor.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_{self.table_name}_match_content_hash
+        ON {self.table_name}(match_content_hash)
+        """)
+
+        cursor.execute(f"""
+        UPDATE {self.table_name}
+        SET match_content_hash = group_key_hash(normalized_state, normalized_college_name,
+                                                NULLIF(normalized_address, ''), course_type)
+        WHERE match_content_hash IS NOT group_key_hash(normalized_state, normalized_college_name,
+                                                       NULLIF(normalized_address, ''), course_type)
+        """)
+        return cursor.rowcount
+
+    def _update_groups_incremental(self, conn, cursor):
+        """
+        Update the existing queue in place instead of rebuilding it.
+
+        - Seat rows whose content hash changed (or is new) move to the matching group
+          and lose their own match; propagation refills them from that group
+        - Groups with a new key are inserted and enqueued
+        - Groups whose master dependency changed lose their match and are enqueued
+        - Every other group keeps its group_id and match result
+        - Groups with no seat rows left are removed
+
+        Returns:
+            Number of rows in the source table
+        """
+        logger.info("Incremental grouping: updating group_matching_queue in place...")
+        register_group_functions(conn, compute_master_dependencies(self.master_db_path))
+
+        changed_rows = self._refresh_content_hashes(cursor)
+        logger.info(f"  {changed_rows:,} new or changed {self.table_name} rows")
+
+        # Only groups touched by this run are marked for matching
+        cursor.execute("UPDATE group_matching_queue SET needs_match = 0 WHERE needs_match != 0")
+
+        cursor.execute(f"""
+        INSERT INTO group_matching_queue
+        (normalized_state, normalized_college_name, normalized_address,
+         state, college_name, address, composite_college_key,
+         sample_course_type, sample_course_name, record_count,
+         group_key, master_dependency_hash, needs_match)
+        SELECT g.normalized_state,
+               g.normalized_college_name,
+               NULLIF(g.group_address, 'NO_ADDRESS'),
+               r.state, r.college_name, r.address,
+               composite_college_key(g.normalized_college_name, NULLIF(g.group_address, 'NO_ADDRESS')),
+               g.course_type, r.course_name, g.record_count,
+               g.match_content_hash, master_dependency(g.normalized_state), 1
+        FROM (
+            SELECT match_content_hash, normalized_state, normalized_college_name,
+                   COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') AS group_address,
+                   course_type,
+                   MIN(id) AS representative_id,
+                   COUNT(*) AS record_count
+            FROM {self.table_name}
+            WHERE match_content_hash NOT IN (SELECT group_key FROM group_matching_queue)
+            GROUP BY match_content_hash
+        ) g
+        JOIN {self.table_name} r ON r.id = g.representative_id
+        ORDER BY g.normalized_state, g.normalized_college_name, g.group_address, g.course_type
+        """)
+        new_groups = cursor.rowcount
+
+        # Seat rows may have joined or left existing groups
+        cursor.execute(f"""
+        UPDATE group_matching_queue
+        SET record_count = (
+            SELECT COUNT(*) FROM {self.table_name} s
+            WHERE s.match_content_hash = group_matching_queue.group_key
+        )
+        """)
+        cursor.execute("DELETE FROM group_matching_queue WHERE record_count = 0")
+        removed_groups = cursor.rowcount
+
+        cursor.execute("""
+        UPDATE group_matching_queue
+        SET needs_match = 1,
+            matched_college_id = NULL,
+            match_score = NULL,
+            match_method = NULL,
+            match_model = NULL,
+            is_processed = 0,
+            master_dependency_hash = master_dependency(normalized_state)
+        WHERE master_dependency_hash IS NOT master_dependency(normalized_state)
+        """)
+        dependency_changed = cursor.rowcount
+
+        cursor.execute("DROP TABLE IF EXISTS temp.previous_group_mapping")
+        cursor.execute(f"""
+        CREATE TEMP TABLE previous_group_mapping AS
+        SELECT seat_id, group_id FROM {GROUP_MAPPING_TABLE}
+        """)
+        cursor.execute("CREATE INDEX temp.idx_previous_group_mapping ON previous_group_mapping(seat_id)")
+
+        cursor.execute(f"DELETE FROM {GROUP_MAPPING_TABLE}")
+        cursor.execute(f"""
+        INSERT OR REPLACE INTO {GROUP_MAPPING_TABLE} (seat_id, group_id)
+        SELECT s.id, gmq.group_id
+        FROM {self.table_name} s
+        JOIN group_matching_queue gmq ON gmq.group_key = s.match_content_hash
+        """)
+        moved_rows = self._clear_moved_matches(cursor)
+        cursor.execute("DROP TABLE temp.previous_group_mapping")
+        conn.commit()
+
+        logger.info(f"  {new_groups:,} new groups, {dependency_changed:,} groups with changed master data, "
+                    f"{removed_groups:,} empty groups removed")
+        if moved_rows:
+            logger.info(f"  Cleared stale matches on {moved_rows:,} rows that changed group")
+
+        cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+        return cursor.fetchone()[0]
+
+    def _clear_moved_matches(self, cursor):
+        """
+        Clear the match of seat rows that are new or changed group since the last run.
+
+        Such a row may now belong to an already matched group that is not re-queued;
+        clearing it lets propagation fill it from that group instead of keeping the
+        match of its old content. Needs temp.previous_group_mapping.
+
+        Returns:
+            Number of rows cleared
+        """
+        cursor.execute(f"PRAGMA table_info({self.table_name})")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'master_college_id' not in columns:
+            return 0
+
+        set_clauses = ['master_college_id = NULL']
+        for column in ('college_match_score', 'college_match_method'):
+            if column in columns:
+                set_clauses.append(f'{column} = NULL')
+
+        cursor.execute(f"""
+        UPDATE {self.table_name}
+        SET {', '.join(set_clauses)}
+        WHERE master_college_id IS NOT NULL
+        AND id IN (
+            SELECT m.seat_id
+            FROM {GROUP_MAPPING_TABLE} m
+            LEFT JOIN temp.previous_group_mapping p ON p.seat_id = m.seat_id
+            WHERE p.group_id IS NOT m.group_id
+        )
+        """)
+        return cursor.rowcount
+
+    def _insert_groups(self, conn, cursor):
+        """
+        Group rows in Python and insert one representative per group.
+
+        Returns:
+            Number of rows read from the source table
+        """
+        # Group ids are reassigned on every rebuild, so any old mapping is stale
+        cursor.execute(f"DROP TABLE IF EXISTS {GROUP_MAPPING_TABLE}")
+
         # STEP 3: Read all source data and group by NORMALIZED (state, college_name, address) + COURSE_TYPE
         # RULE #1: Always use normalized fields for matching
         logger.info(f"Reading {self.table_name} and grouping by NORMALIZED (state, college_name, address) + COURSE_TYPE...")
@@ -245,36 +609,85 @@ class GroupPreprocessor:
 
         conn.commit()
 
-        # STEP 5: Verify and print statistics
-        cursor.execute("SELECT COUNT(*) FROM group_matching_queue")
-        total_groups = cursor.fetchone()[0]
+        return len(records)
 
-        cursor.execute("""
-        SELECT SUM(record_count)
-        FROM group_matching_queue
-        """)
-        total_records = cursor.fetchone()[0]
+    def _insert_groups_set_based(self, conn, cursor):
+        """
+        Build group_matching_queue with a single INSERT ... SELECT ... GROUP BY.
 
-        conn.close()
+        Produces the same groups as _insert_groups(): NULL and empty addresses both
+        fall into the NO_ADDRESS group, composite_college_key comes from the registered
+        SQLite function, and the representative row is the one with the lowest id.
+        The seat id -> group_id mapping is then written in one more statement.
 
-        logger.info("\n" + "="*80)
-        logger.info("✅ PRE-PROCESSING COMPLETE")
-        logger.info("="*80)
-        logger.info(f"\n📊 GROUP STATISTICS:")
-        logger.info(f"   Total records in seat_data:  {len(records):,}")
-        logger.info(f"   Unique groups created:       {total_groups:,}")
-        logger.info(f"   Total records in groups:     {total_records:,}")
-        logger.info(f"   Reduction ratio:             {len(records)/total_groups:.1f}x")
-        logger.info(f"   Average records per group:   {total_records/total_groups:.1f}")
+        Returns:
+            Number of rows read from the source table
+        """
+        register_group_functions(conn, compute_master_dependencies(self.master_db_path))
+        self._refresh_content_hashes(cursor)
 
-        logger.info(f"\n⏱️  EXPECTED PERFORMANCE:")
-        logger.info(f"   Old method: {len(records):,} × 7.3ms = ~{len(records)*7.3/1000:.0f}s")
-        logger.info(f"   New method: {total_groups:,} × 7.3ms = ~{total_groups*7.3/1000:.0f}s")
-        logger.info(f"   Time saved: ~{(len(records)-total_groups)*7.3/1000:.0f}s")
+        logger.info(f"Grouping {self.table_name} in SQL by NORMALIZED (state, college_name, address) + COURSE_TYPE...")
+        # Groups are inserted in the order the Python path first sees them (its ORDER BY
+        # on the raw normalized_address, NULL first), so group_ids come out the same
+        cursor.execute(f"""
+        INSERT INTO group_matching_queue
+        (normalized_state, normalized_college_name, normalized_address,
+         state, college_name, address, composite_college_key,
+         sample_course_type, sample_course_name, record_count,
+         group_key, master_dependency_hash)
+        SELECT g.normalized_state,
+               g.normalized_college_name,
+               NULLIF(g.group_address, 'NO_ADDRESS'),
+               r.state, r.college_name, r.address,
+               composite_college_key(g.normalized_college_name, NULLIF(g.group_address, 'NO_ADDRESS')),
+               g.course_type, r.course_name, g.record_count,
+               group_key_hash(g.normalized_state, g.normalized_college_name, g.group_address, g.course_type),
+               master_dependency(g.normalized_state)
+        FROM (
+            SELECT normalized_state, normalized_college_name,
+                   COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') AS group_address,
+                   course_type,
+                   MIN(id) AS representative_id,
+                   COUNT(*) AS record_count,
+                   SUM(normalized_address IS NULL) > 0 AS has_null_address,
+                   MIN(normalized_address) AS first_address
+            FROM {self.table_name}
+            GROUP BY normalized_state, normalized_college_name, group_address, course_type
+        ) g
+        JOIN {self.table_name} r ON r.id = g.representative_id
+        ORDER BY g.normalized_state, g.normalized_college_name,
+                 g.has_null_address DESC, g.first_address, g.course_type
+        """)
+        logger.info(f"Created {cursor.rowcount:,} unique groups")
 
-        logger.info(f"\n{'='*80}\n")
+        # Persistent seat -> group mapping so propagation can join on group_id
+        logger.info(f"Writing {GROUP_MAPPING_TABLE} (seat id -> group_id)...")
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {GROUP_MAPPING_TABLE} (
+            seat_id TEXT PRIMARY KEY,
+            group_id INTEGER NOT NULL
+        )
+        """)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{GROUP_MAPPING_TABLE}_group ON {GROUP_MAPPING_TABLE}(group_id)")
+        cursor.execute(f"DELETE FROM {GROUP_MAPPING_TABLE}")
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_gmq_composite
+        ON group_matching_queue(normalized_state, normalized_college_name, normalized_address, sample_course_type)
+        """)
+        cursor.execute(f"""
+        INSERT OR REPLACE INTO {GROUP_MAPPING_TABLE} (seat_id, group_id)
+        SELECT s.id, gmq.group_id
+        FROM {self.table_name} s
+        JOIN group_matching_queue gmq
+          ON gmq.normalized_state = s.normalized_state
+         AND gmq.normalized_college_name = s.normalized_college_name
+         AND COALESCE(gmq.normalized_address, 'NO_ADDRESS') = COALESCE(NULLIF(s.normalized_address, ''), 'NO_ADDRESS')
+         AND gmq.sample_course_type IS s.course_type
+        """)
+        conn.commit()
 
-        return total_groups, total_records
+        cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+        return cursor.fetchone()[0]
 
 
 def bulk_propagate_results(seat_db_path='data/sqlite/seat_data.db', table_name='seat_data'):
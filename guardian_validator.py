@@ -8,6 +8,10 @@ Architecture:
 2. LLM Council: 9 free models for uncertain cases
 3. Zero human review: Conservative REJECT default
 
+Rules are evaluated set-based over a DataFrame of all matched rows (numpy
+masks, distinct-value evaluation, groupby for consistency, rapidfuzz cpdist
+for name similarity); validate_record() keeps the per-row path.
+
 Example usage:
     guardian = GuardianValidator()
     results = guardian.validate_all()
@@ -19,10 +23,13 @@ import logging
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Set
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from enum import Enum
 from collections import defaultdict
+import numpy as np
+import pandas as pd
 from rapidfuzz import fuzz
+from rapidfuzz.process import cpdist
 
 # Cache integration for verified-only caching
 try:
@@ -34,7 +41,6 @@ except ImportError:
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -146,6 +152,10 @@ class GuardianValidator:
         # Caches for consistency checking
         self._name_to_master_cache: Dict[str, Set[str]] = defaultdict(set)
         self._master_to_names_cache: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Set-based engine state (see validate_frame)
+        self._text_columns: Dict[Tuple[str, ...], pd.Series] = {}
+        self._r04_options = None
     
     def _detect_table_name(self) -> str:
         """Auto-detect the correct table name in the database."""
@@ -221,6 +231,49 @@ class GuardianValidator:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
+        cursor.execute(self._matched_records_query(limit))
+        
+        records = []
+        for row in cursor.fetchall():
+            records.append(MatchRecord(
+                id=row['id'],
+                college_name=row['college_name'],
+                state=row['state'],
+                address=row['address'],
+                course_type=row['course_type'],
+                master_college_id=row['master_college_id'],
+                match_score=row['match_score'] or 0,
+                match_method=row['college_match_method'],
+                normalized_college_name=row['normalized_college_name'],
+                normalized_state=row['normalized_state'],
+                normalized_address=row['normalized_address'],
+                master_name=row['master_name'],
+                master_state=row['master_state'],
+                master_address=row['master_address'],
+                master_stream=row['master_stream'],
+            ))
+        
+        conn.close()
+        return records
+    
+    def get_matched_frame(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Same rows as get_matched_records(), loaded in one pass into a DataFrame.
+        
+        Columns are the MatchRecord fields.
+        """
+        conn = sqlite3.connect(self.seat_db_path)
+        conn.execute('ATTACH DATABASE ? AS masterdb', (self.master_db_path,))
+        try:
+            frame = pd.read_sql_query(self._matched_records_query(limit), conn)
+        finally:
+            conn.close()
+        
+        frame = frame.rename(columns={'college_match_method': 'match_method'})
+        return self._prepare_frame(frame)
+    
+    def _matched_records_query(self, limit: Optional[int] = None) -> str:
+        """Matched seat rows joined to their master college."""
         query = f"""
             SELECT 
                 sd.id,
@@ -245,31 +298,7 @@ class GuardianValidator:
         
         if limit:
             query += f" LIMIT {limit}"
-        
-        cursor.execute(query)
-        
-        records = []
-        for row in cursor.fetchall():
-            records.append(MatchRecord(
-                id=row['id'],
-                college_name=row['college_name'],
-                state=row['state'],
-                address=row['address'],
-                course_type=row['course_type'],
-                master_college_id=row['master_college_id'],
-                match_score=row['match_score'] or 0,
-                match_method=row['college_match_method'],
-                normalized_college_name=row['normalized_college_name'],
-                normalized_state=row['normalized_state'],
-                normalized_address=row['normalized_address'],
-                master_name=row['master_name'],
-                master_state=row['master_state'],
-                master_address=row['master_address'],
-                master_stream=row['master_stream'],
-            ))
-        
-        conn.close()
-        return records
+        return query
     
     def _build_consistency_caches(self, records: List[MatchRecord]):
         """Build caches for consistency checking (R04).
@@ -603,59 +632,64 @@ class GuardianValidator:
                   AND LENGTH(TRIM(address)) > 3
             """, (record.master_college_id,))
             
-            distinct_addresses = cursor.fetchall()
+            distinct_addresses = [row['full_address'] for row in cursor.fetchall()]
             conn.close()
             
-            if len(distinct_addresses) <= 1:
-                return True, "Same-ID check passed (single address)"
-            
-            # IMPROVED: Extract ALL significant words from each address
-            # Then check if addresses share ANY common city/district keywords
-            def extract_location_words(addr: str) -> set:
-                """Extract significant location words from address."""
-                if not addr:
-                    return set()
-                # Remove common non-location words
-                stopwords = {
-                    'HOSPITAL', 'COLLEGE', 'MEDICAL', 'DENTAL', 'INSTITUTE', 
-                    'UNIVERSITY', 'GOVT', 'GOVERNMENT', 'PRIVATE', 'PVT',
-                    'TRUST', 'SOCIETY', 'CAMPUS', 'ROAD', 'STREET', 'MARG',
-                    'NEAR', 'OPP', 'POST', 'OFFICE', 'DISTRICT', 'TALUK'
-                }
-                words = addr.replace(',', ' ').replace('.', ' ').split()
-                # Keep words with length > 3 that aren't stopwords or numbers
-                return {w for w in words if len(w) > 3 and w not in stopwords and not w.isdigit()}
-            
-            # Build set of location words for each address
-            address_word_sets = []
-            for row in distinct_addresses:
-                words = extract_location_words(row['full_address'])
-                if words:
-                    address_word_sets.append(words)
-            
-            if len(address_word_sets) < 2:
-                return True, "Same-ID check passed (insufficient address data)"
-            
-            # Compare addresses pairwise - if ANY pair has NO overlap, it's a false match
-            for i in range(len(address_word_sets)):
-                for j in range(i + 1, len(address_word_sets)):
-                    set1 = address_word_sets[i]
-                    set2 = address_word_sets[j]
-                    overlap = set1 & set2
-                    
-                    # If addresses have NO common location words, they're different places
-                    if len(overlap) == 0:
-                        # Get first word from each for the message
-                        loc1 = list(set1)[0] if set1 else 'UNKNOWN'
-                        loc2 = list(set2)[0] if set2 else 'UNKNOWN'
-                        return False, f"Same college_id has DIFFERENT locations: {loc1} vs {loc2}"
-            
-            return True, f"Same-ID check passed ({len(distinct_addresses)} addresses with common patterns)"
+            return self._same_id_address_verdict(distinct_addresses)
             
         except Exception as e:
             logger.warning(f"R14 check failed: {e}")
             return True, f"Same-ID check error: {e}"
     
+    @staticmethod
+    def _same_id_address_verdict(distinct_addresses: List[str]) -> Tuple[bool, str]:
+        """R14 decision for the distinct addresses matched to one master_college_id."""
+        if len(distinct_addresses) <= 1:
+            return True, "Same-ID check passed (single address)"
+        
+        # IMPROVED: Extract ALL significant words from each address
+        # Then check if addresses share ANY common city/district keywords
+        def extract_location_words(addr: str) -> set:
+            """Extract significant location words from address."""
+            if not addr:
+                return set()
+            # Remove common non-location words
+            stopwords = {
+                'HOSPITAL', 'COLLEGE', 'MEDICAL', 'DENTAL', 'INSTITUTE', 
+                'UNIVERSITY', 'GOVT', 'GOVERNMENT', 'PRIVATE', 'PVT',
+                'TRUST', 'SOCIETY', 'CAMPUS', 'ROAD', 'STREET', 'MARG',
+                'NEAR', 'OPP', 'POST', 'OFFICE', 'DISTRICT', 'TALUK'
+            }
+            words = addr.replace(',', ' ').replace('.', ' ').split()
+            # Keep words with length > 3 that aren't stopwords or numbers
+            return {w for w in words if len(w) > 3 and w not in stopwords and not w.isdigit()}
+        
+        # Build set of location words for each address
+        address_word_sets = []
+        for full_address in distinct_addresses:
+            words = extract_location_words(full_address)
+            if words:
+                address_word_sets.append(words)
+        
+        if len(address_word_sets) < 2:
+            return True, "Same-ID check passed (insufficient address data)"
+        
+        # Compare addresses pairwise - if ANY pair has NO overlap, it's a false match
+        for i in range(len(address_word_sets)):
+            for j in range(i + 1, len(address_word_sets)):
+                set1 = address_word_sets[i]
+                set2 = address_word_sets[j]
+                overlap = set1 & set2
+                
+                # If addresses have NO common location words, they're different places
+                if len(overlap) == 0:
+                    # Get first word from each for the message
+                    loc1 = list(set1)[0] if set1 else 'UNKNOWN'
+                    loc2 = list(set2)[0] if set2 else 'UNKNOWN'
+                    return False, f"Same college_id has DIFFERENT locations: {loc1} vs {loc2}"
+        
+        return True, f"Same-ID check passed ({len(distinct_addresses)} addresses with common patterns)"
+    
     def _check_gross_name_mismatch(self, record: MatchRecord, threshold: float = 0.40) -> Tuple[bool, str]:
         """R15: Gross Name Mismatch Detection.
         
@@ -804,7 +838,11 @@ class GuardianValidator:
                     result.warnings.append(f"{rule.id}: {message}")
                     has_warnings = True
         
-        # Determine final action
+        self._finalize_action(result, critical_failed, has_warnings)
+        return result
+    
+    def _finalize_action(self, result: ValidationResult, critical_failed: bool, has_warnings: bool):
+        """Set PASS/QUARANTINE/BLOCK from the rule outcomes collected in `result`."""
         if critical_failed:
             # Special case: R04 multi-campus conflicts go to QUARANTINE for LLM address resolution
             if result.multi_master_options:
@@ -825,8 +863,364 @@ class GuardianValidator:
             result.action = ValidationAction.QUARANTINE
         else:
             result.action = ValidationAction.PASS
+    
+    # ==========================================
+    # SET-BASED RULE ENGINE
+    # ==========================================
+    
+    _RECORD_FIELDS = [f.name for f in dataclass_fields(MatchRecord)]
+    
+    def _prepare_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """MatchRecord-shaped frame: missing values as None, numeric match_score."""
+        frame = frame.reindex(columns=self._RECORD_FIELDS).reset_index(drop=True)
+        for name in self._RECORD_FIELDS:
+            if name != 'match_score':
+                column = frame[name].astype(object)
+                frame[name] = column.where(column.notna(), None)
+        frame['match_score'] = pd.to_numeric(frame['match_score'], errors='coerce').fillna(0).astype(float)
+        return frame
+    
+    def _records_to_frame(self, records: List[MatchRecord]) -> pd.DataFrame:
+        return self._prepare_frame(pd.DataFrame(
+            {name: [getattr(r, name) for r in records] for name in self._RECORD_FIELDS}
+        ))
+    
+    def _text(self, frame: pd.DataFrame, *names: str) -> pd.Series:
+        """First truthy column value per row ("a or b or ''"), memoized per frame."""
+        cache = self._text_columns
+        if names not in cache:
+            result = frame[names[-1]].fillna('').astype(str)
+            for name in reversed(names[:-1]):
+                column = self._text(frame, name)
+                result = column.where(column != '', result)
+            cache[names] = result
+        return cache[names]
+    
+    @staticmethod
+    def _object_array(values: List[Any]) -> np.ndarray:
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    
+    @staticmethod
+    def _partial_record(values: Dict[str, Any]) -> MatchRecord:
+        """MatchRecord carrying only the fields a scalar check reads."""
+        return MatchRecord(**{
+            'id': '', 'college_name': None, 'state': None, 'address': None, 'course_type': None,
+            'master_college_id': None, 'match_score': 0.0, 'match_method': None,
+            **values,
+        })
+    
+    def _distinct_outcomes(
+        self, frame: pd.DataFrame, names: List[str], check, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+        """
+        Run a scalar _check_* once per distinct combination of `names`.
         
-        return result
+        Args:
+            rows: Optional row positions to evaluate (default: all rows)
+        
+        Returns:
+            (row positions, outcome index per position, outcomes)
+        """
+        positions = np.arange(len(frame)) if rows is None else np.asarray(rows)
+        if len(positions) == 0:
+            return positions, positions, []
+        subset = frame if rows is None else frame.iloc[positions]
+        
+        codes = subset.groupby(names, sort=False, dropna=False).ngroup().to_numpy()
+        _, first_rows = np.unique(codes, return_index=True)
+        columns = [subset[name].to_numpy()[first_rows].tolist() for name in names]
+        outcomes = [check(self._partial_record(dict(zip(names, values)))) for values in zip(*columns)]
+        return positions, codes, outcomes
+    
+    def _evaluate_distinct(
+        self, frame: pd.DataFrame, names: List[str], check, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(passed bool array, message object array) over all rows; rows outside `rows` pass."""
+        passed = np.ones(len(frame), dtype=bool)
+        messages = np.full(len(frame), '', dtype=object)
+        positions, codes, outcomes = self._distinct_outcomes(frame, names, check, rows)
+        if outcomes:
+            passed[positions] = np.fromiter((o[0] for o in outcomes), dtype=bool, count=len(outcomes))[codes]
+            messages[positions] = self._object_array([o[1] for o in outcomes])[codes]
+        return passed, messages
+    
+    def _fail_messages(self, frame: pd.DataFrame, passed: np.ndarray, names: List[str], check) -> np.ndarray:
+        """Messages of a vectorized rule, produced by its scalar check on failing rows only."""
+        _, messages = self._evaluate_distinct(frame, names, check, rows=np.flatnonzero(~passed))
+        return messages
+    
+    @staticmethod
+    def _pair_scores(left: pd.Series, right: pd.Series, scorer) -> np.ndarray:
+        """rapidfuzz scorer for each (left, right) row pair, computed once per distinct pair."""
+        pairs = pd.DataFrame({'left': left.to_numpy(), 'right': right.to_numpy()})
+        codes = pairs.groupby(['left', 'right'], sort=False).ngroup().to_numpy()
+        _, first_rows = np.unique(codes, return_index=True)
+        scores = cpdist(
+            pairs['left'].to_numpy()[first_rows].tolist(),
+            pairs['right'].to_numpy()[first_rows].tolist(),
+            scorer=scorer, dtype=np.float64, workers=-1,
+        )
+        return np.asarray(scores)[codes]
+    
+    def _same_id_verdicts(self) -> Dict[str, Tuple[bool, str]]:
+        """R14 verdict per master_college_id from ONE grouped query."""
+        conn = sqlite3.connect(self.seat_db_path)
+        try:
+            rows = conn.execute(f"""
+                SELECT DISTINCT 
+                    master_college_id,
+                    COALESCE(UPPER(TRIM(address)), 'UNKNOWN') as full_address,
+                    state
+                FROM {self.table_name}
+                WHERE master_college_id IS NOT NULL
+                  AND address IS NOT NULL
+                  AND LENGTH(TRIM(address)) > 3
+            """).fetchall()
+        finally:
+            conn.close()
+        
+        addresses: Dict[str, List[str]] = defaultdict(list)
+        for master_id, full_address, _ in rows:
+            addresses[master_id].append(full_address)
+        return {master_id: self._same_id_address_verdict(addrs) for master_id, addrs in addresses.items()}
+    
+    def _evaluate_rule(self, rule: ValidationRule, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """(passed, message) arrays for one rule over every row of `frame`."""
+        n = len(frame)
+        score = frame['match_score'].to_numpy()
+        
+        if rule.id == 'R01':
+            return self._evaluate_distinct(frame, ['normalized_state', 'state', 'master_state'], self._check_state_match)
+        
+        if rule.id == 'R02':
+            return self._evaluate_distinct(frame, ['course_type', 'master_stream'], self._check_stream_match)
+        
+        if rule.id == 'R03':
+            passed = score >= rule.threshold
+            return passed, self._fail_messages(
+                frame, passed, ['match_score'], lambda r: self._check_score_floor(r, rule.threshold))
+        
+        if rule.id == 'R04':
+            return self._evaluate_consistency(frame)
+        
+        if rule.id == 'R05':
+            master_id = frame['master_college_id'].fillna('').astype(str)
+            passed = ((master_id != '') & ~master_id.str.contains(r'[,;]')).to_numpy()
+            return passed, self._fail_messages(frame, passed, ['master_college_id'], self._check_cardinality)
+        
+        if rule.id == 'R06':
+            # Only rows that mention a MED/DEN/DNB code can conflict
+            text = self._text(frame, 'college_name') + ' ' + self._text(frame, 'address')
+            has_code = text.str.contains(r'\b(?:MED\d{4}|DEN\d{4}|DNB\d{4})\b', case=False, regex=True).to_numpy()
+            return self._evaluate_distinct(
+                frame, ['college_name', 'address', 'master_college_id'], self._check_code_conflict,
+                rows=np.flatnonzero(has_code))
+        
+        if rule.id == 'R07':
+            return self._evaluate_distinct(
+                frame, ['normalized_address', 'address', 'master_address'],
+                lambda r: self._check_weak_address(r, rule.threshold))
+        
+        if rule.id == 'R08':
+            seat_name = self._text(frame, 'normalized_college_name', 'college_name')
+            master_name = self._text(frame, 'master_name')
+            ratio = self._pair_scores(seat_name.str.upper(), master_name.str.upper(), fuzz.ratio) / 100
+            passed = ((seat_name == '') | (master_name == '')).to_numpy() | (ratio >= rule.threshold)
+            return passed, self._fail_messages(
+                frame, passed, ['normalized_college_name', 'college_name', 'master_name'],
+                lambda r: self._check_name_drift(r, rule.threshold))
+        
+        if rule.id == 'R10':
+            method = frame['match_method'].fillna('').astype(str)
+            passed = ~method.str.lower().str.contains('unvalidated', regex=False).to_numpy()
+            return passed, self._fail_messages(frame, passed, ['match_method'], self._check_ai_unvalidated)
+        
+        if rule.id == 'R11':
+            passed = ~((score < rule.max_threshold) & (score >= rule.min_threshold))
+            return passed, self._fail_messages(
+                frame, passed, ['match_score'],
+                lambda r: self._check_low_confidence(r, rule.min_threshold, rule.max_threshold))
+        
+        if rule.id == 'R12':
+            address = self._text(frame, 'normalized_address', 'address').str.strip()
+            passed = (address.str.len() >= 10).to_numpy() | (score >= rule.score_threshold)
+            return passed, self._fail_messages(
+                frame, passed, ['normalized_address', 'address', 'match_score'],
+                lambda r: self._check_no_address_low_score(r, rule.score_threshold))
+        
+        if rule.id == 'R13':
+            return self._evaluate_distinct(
+                frame, ['master_college_id', 'normalized_address', 'address', 'master_address'],
+                self._check_multi_campus_address)
+        
+        if rule.id == 'R14':
+            master_ids = frame['master_college_id'].to_numpy()
+            try:
+                verdicts = self._same_id_verdicts()
+            except Exception as e:
+                logger.warning(f"R14 check failed: {e}")
+                return np.ones(n, dtype=bool), np.full(n, f"Same-ID check error: {e}", dtype=object)
+            single = self._same_id_address_verdict([])
+            skipped = (True, "Same-ID check skipped (no master_college_id)")
+            outcomes = [verdicts.get(mid, single) if mid else skipped for mid in master_ids]
+            return (np.fromiter((o[0] for o in outcomes), dtype=bool, count=n),
+                    self._object_array([o[1] for o in outcomes]))
+        
+        if rule.id == 'R15':
+            seat_name = self._text(frame, 'college_name').str.upper()
+            master_name = self._text(frame, 'master_name').str.upper()
+            missing = ((seat_name == '') | (master_name == '')).to_numpy()
+            passed = missing | (self._pair_scores(seat_name, master_name, fuzz.token_set_ratio) / 100 >= rule.threshold)
+            # Abbreviation fallback (partial_ratio) only for rows still failing
+            pending = np.flatnonzero(~passed)
+            if len(pending):
+                partial = self._pair_scores(seat_name.iloc[pending], master_name.iloc[pending], fuzz.partial_ratio) / 100
+                passed[pending] = partial >= 0.80
+            return passed, self._fail_messages(
+                frame, passed, ['college_name', 'master_name'],
+                lambda r: self._check_gross_name_mismatch(r, rule.threshold))
+        
+        if rule.id == 'R16':
+            return self._evaluate_distinct(
+                frame, ['normalized_state', 'state', 'master_state'], self._check_cross_state_mismatch)
+        
+        # R09 (needs batch statistics) and unknown rules pass, as in validate_record
+        return np.ones(n, dtype=bool), np.full(n, '', dtype=object)
+    
+    def _evaluate_consistency(self, frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """R04 via groupby: keys mapped to more than one master conflict."""
+        n = len(frame)
+        master_id = frame['master_college_id'].fillna('')
+        name = frame['normalized_college_name'].fillna('')
+        eligible = (name != '') & (master_id != '')
+        
+        keys = pd.DataFrame({
+            'name': name.astype(str).str.upper(),
+            'address': self._text(frame, 'normalized_address', 'address').str.upper().str[:50],
+            'state': frame['normalized_state'].fillna(''),
+            'course': frame['course_type'].fillna('').astype(str).str.upper().replace('', 'UNKNOWN'),
+            'master': master_id,
+        })[eligible.to_numpy()]
+        n_masters = keys.groupby(['name', 'address', 'state', 'course'], sort=False)['master'].transform('nunique')
+        conflict_rows = keys.index[(n_masters > 1).to_numpy()].to_numpy()
+        
+        # Caches as _build_consistency_caches() would build them (conflict keys only;
+        # other keys have one master and pass either way)
+        self._name_to_master_cache.clear()
+        self._master_to_names_cache.clear()
+        eligible_frame = frame[eligible.to_numpy()]
+        first = eligible_frame.drop_duplicates('master_college_id')
+        self._master_address_cache = dict(zip(first['master_college_id'], first['master_address'].fillna('')))
+        conflicts = keys.loc[conflict_rows]
+        for key_name, key_address, key_state, key_course, master in conflicts.itertuples(index=False, name=None):
+            key = (key_name, key_address, key_state, key_course)
+            self._name_to_master_cache[key].add(master)
+            self._master_to_names_cache[master].add(key)
+        
+        passed = np.ones(n, dtype=bool)
+        messages = np.full(n, '', dtype=object)
+        self._r04_options = np.full(n, None, dtype=object)
+        positions, codes, outcomes = self._distinct_outcomes(
+            frame,
+            ['normalized_college_name', 'normalized_address', 'address', 'normalized_state', 'course_type', 'master_college_id'],
+            self._check_consistency, rows=conflict_rows,
+        )
+        if outcomes:
+            passed[positions] = np.fromiter((o[0] for o in outcomes), dtype=bool, count=len(outcomes))[codes]
+            messages[positions] = self._object_array([o[1] for o in outcomes])[codes]
+            self._r04_options[positions] = self._object_array([o[2] for o in outcomes])[codes]
+        return passed, messages
+    
+    def validate_frame(self, frame: pd.DataFrame) -> List[ValidationResult]:
+        """
+        Validate every row of a MatchRecord-shaped frame with set-based rules.
+        
+        Produces the same ValidationResults (in row order) as calling
+        validate_record() per row after _build_consistency_caches(), and
+        updates rule_triggers the same way. PASS/QUARANTINE/BLOCK counters are
+        left to the caller.
+        """
+        n = len(frame)
+        if n == 0:
+            return []
+        
+        self._r04_options = np.full(n, None, dtype=object)
+        self._text_columns: Dict[Tuple[str, ...], pd.Series] = {}
+        bypass = self._text(frame, 'match_method').str.lower().str.contains('alias', regex=False).to_numpy()
+        
+        outcomes = [self._evaluate_rule(rule, frame) for rule in self.rules]
+        self._text_columns = {}
+        failed = np.zeros(n, dtype=bool)
+        for rule, (passed, _) in zip(self.rules, outcomes):
+            rule_failed = ~passed & ~bypass
+            if rule_failed.any():
+                self.stats['rule_triggers'][rule.id] += int(rule_failed.sum())
+            failed |= rule_failed
+        
+        # Python lists index much faster than numpy arrays in the per-row loop below
+        rule_outcomes = [
+            (rule.id, rule.severity == RuleSeverity.CRITICAL, passed.tolist(), messages.tolist())
+            for rule, (passed, messages) in zip(self.rules, outcomes)
+        ]
+        r04_options = self._r04_options.tolist()
+        bypass = bypass.tolist()
+        failed = failed.tolist()
+        
+        rule_ids = [rule.id for rule in self.rules]
+        record_ids = frame['id'].tolist()
+        college_names = frame['college_name'].tolist()
+        master_ids = frame['master_college_id'].tolist()
+        scores = frame['match_score'].tolist()
+        
+        validations = []
+        for i in range(n):
+            result = ValidationResult(
+                record_id=record_ids[i],
+                action=ValidationAction.PASS,
+                passed_rules=[],
+                failed_rules=[],
+                warnings=[],
+                details={
+                    'college_name': college_names[i],
+                    'master_id': master_ids[i],
+                    'score': scores[i],
+                }
+            )
+            if bypass[i]:
+                # BYPASS: Alias-matched records are trusted (manually verified or from knowledge loop)
+                result.passed_rules.append('ALIAS_BYPASS')
+                result.details['bypass_reason'] = 'Alias match - trusted source'
+            elif not failed[i]:
+                result.passed_rules = list(rule_ids)
+            else:
+                critical_failed = False
+                has_warnings = False
+                for rule_id, critical, passed, messages in rule_outcomes:
+                    if passed[i]:
+                        result.passed_rules.append(rule_id)
+                    elif critical:
+                        result.failed_rules.append(f"{rule_id}: {messages[i]}")
+                        critical_failed = True
+                    else:  # WARNING
+                        result.warnings.append(f"{rule_id}: {messages[i]}")
+                        has_warnings = True
+                if r04_options[i]:
+                    result.multi_master_options = list(r04_options[i])
+                self._finalize_action(result, critical_failed, has_warnings)
+            validations.append(result)
+        
+        return validations
+    
+    def _collect_results(self, validations: List[ValidationResult]) -> Dict[str, List[ValidationResult]]:
+        results = {'pass': [], 'quarantine': [], 'block': []}
+        for validation in validations:
+            results[validation.action.value].append(validation)
+        for action, items in results.items():
+            self.stats[action] += len(items)
+        self.stats['total'] += len(validations)
+        return results
     
     def validate_batch(self, records: List[MatchRecord]) -> Dict[str, List[ValidationResult]]:
         """
@@ -834,24 +1228,13 @@ class GuardianValidator:
         
         Returns dict with keys: 'pass', 'quarantine', 'block'
         """
-        # Build consistency caches first
-        self._build_consistency_caches(records)
+        validations = self.validate_frame(self._records_to_frame(records))
+        results = self._collect_results(validations)
         
         # Get LLM cache for verified-only caching
         cache = get_matcher_cache() if _cache_available else None
         
-        results = {
-            'pass': [],
-            'quarantine': [],
-            'block': [],
-        }
-        
-        for record in records:
-            validation = self.validate_record(record)
-            results[validation.action.value].append(validation)
-            self.stats[validation.action.value] += 1
-            self.stats['total'] += 1
-            
+        for record, validation in zip(records, validations):
             # CACHE INTEGRATION: Update cache based on Guardian verdict
             if cache and record.college_name:
                 if validation.action == ValidationAction.PASS:
@@ -890,36 +1273,18 @@ class GuardianValidator:
             border_style="cyan"
         ))
         
-        # Fetch records
+        # Fetch records (one pass into a DataFrame)
         with console.status("[bold green]Loading matched records..."):
-            records = self.get_matched_records(limit=limit)
+            frame = self.get_matched_frame(limit=limit)
         
-        console.print(f"[yellow]📋 Found {len(records)} matched records[/yellow]")
+        console.print(f"[yellow]📋 Found {len(frame)} matched records[/yellow]")
         
-        if not records:
+        if frame.empty:
             return {'pass': [], 'quarantine': [], 'block': []}
         
-        # Validate with progress
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Validating...", total=len(records))
-            
-            # Build caches
-            self._build_consistency_caches(records)
-            
-            results = {'pass': [], 'quarantine': [], 'block': []}
-            
-            for record in records:
-                validation = self.validate_record(record)
-                results[validation.action.value].append(validation)
-                self.stats[validation.action.value] += 1
-                self.stats['total'] += 1
-                progress.advance(task)
+        # Validate (set-based: each rule runs once over all rows)
+        with console.status(f"[bold green]Validating {len(frame):,} records against {len(self.rules)} rules..."):
+            results = self._collect_results(self.validate_frame(frame))
         
         # Print summary
         self._print_summary(results)
@@ -24,7 +24,8 @@ import logging
 import re
 import threading
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import Tuple, Optional, Dict, List, Set
 from pathlib import Path
 import sys
@@ -42,6 +43,7 @@ from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
 from normalized_matcher import NormalizedMatcher
+from group_preprocessing_step import GROUP_MAPPING_TABLE, has_group_mapping
 
 # Phase 1 AI Integration: Adaptive Confidence & Streaming Validation
 try:
@@ -149,6 +151,63 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# PROCESS-POOL MATCH WORKERS
+# _match_group is GIL-bound (rapidfuzz/regex/dict scans), so the process mode
+# runs it in worker processes. Each worker holds one orchestrator, handed to it
+# through the pool initializer (never through inherited module state) and
+# returns its queued updates + stat deltas; the parent stays the only SQLite writer.
+# =============================================================================
+
+_MATCH_WORKER = None  # Orchestrator of this worker process (set by _init_match_worker)
+_MATCH_CHUNK_SIZE = 16  # Groups per task (amortizes IPC, keeps progress smooth)
+
+
+def _init_match_worker(orchestrator=None, orchestrator_kwargs=None):
+    """
+    Process-pool initializer: prepare this worker's orchestrator once
+
+    Args:
+        orchestrator: The parent's built orchestrator - only with the 'fork' start
+            method, where the worker receives its Process arguments by fork
+            (copy-on-write, never pickled)
+        orchestrator_kwargs: Constructor paths for 'spawn'/'forkserver', where
+            arguments are pickled; the worker rebuilds the orchestrator with
+            read_only_master, so master tables are read lazily from the shared
+            mmap snapshot pages rather than decoded into a private copy
+    """
+    global _MATCH_WORKER
+    if orchestrator is None:
+        orchestrator = Integrated5PassOrchestrator(**orchestrator_kwargs)
+    _MATCH_WORKER = orchestrator
+
+    # Never reuse the parent's SQLite connections or (possibly held) locks
+    orchestrator._local = threading.local()
+    orchestrator.stats_lock = threading.Lock()
+    orchestrator._update_queue_lock = threading.Lock()
+    orchestrator._update_queue = []
+    orchestrator._batch_size = float('inf')  # Parent owns the writer - never flush here
+
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(1)  # One process per core already
+
+
+def _match_group_chunk(groups: List[Dict]) -> List[Tuple[int, List[tuple], Dict]]:
+    """Match groups in a worker; returns (group_id, queued updates, stat deltas) per group"""
+    orchestrator = _MATCH_WORKER
+    results = []
+    for group in groups:
+        before = dict(orchestrator.stats)
+        orchestrator._match_group(group)
+        deltas = {
+            key: value - before.get(key, 0)
+            for key, value in orchestrator.stats.items()
+            if isinstance(value, (int, float)) and value != before.get(key, 0)
+        }
+        updates, orchestrator._update_queue = orchestrator._update_queue, []
+        results.append((group['group_id'], updates, deltas))
+    return results
+
 
 class Integrated5PassOrchestrator:
     """
@@ -161,7 +220,7 @@ class Integrated5PassOrchestrator:
 
     def __init__(self, seat_db_path='data/sqlite/seat_data.db',
                  master_db_path='data/sqlite/master_data.db',
-                 table_name='seat_data'):
+                 table_name='seat_data', read_only_master=False):
         self.seat_db_path = seat_db_path
         self.master_db_path = master_db_path
         self.table_name = table_name  # Source table name (seat_data or counselling_records)
@@ -184,7 +243,9 @@ class Integrated5PassOrchestrator:
         import yaml
 
         # Pass table_name to avoid using VIEW (which is 335x slower!)
-        self.preprocessor = GroupPreprocessor(seat_db_path=seat_db_path, table_name=table_name)
+        # set_based: Pass 0 is one INSERT ... SELECT and propagation joins on group_id
+        self.preprocessor = GroupPreprocessor(seat_db_path=seat_db_path, table_name=table_name, set_based=True,
+                                              master_db_path=master_db_path)
         
         # Ensure ID sync triggers exist (master_*_id ↔ *_id)
         # This is a safety net - also called in GroupPreprocessor.create_groups()
@@ -243,7 +304,8 @@ class Integrated5PassOrchestrator:
         # CRITICAL: Load master data (medical, dental, dnb colleges)
         # This must be called before using the matcher
         logger.info("Loading master data (colleges, aliases, state mappings)...")
-        self.recent3_matcher.load_master_data()
+        # read_only_master (spawned match workers): tables stay in the shared mmap snapshot
+        self.recent3_matcher.load_master_data(read_only=read_only_master)
         logger.info("✅ Master data loaded successfully")
 
         self.address_matcher = AddressBasedMatcher(self.recent3_matcher)
@@ -710,8 +772,19 @@ class Integrated5PassOrchestrator:
         logger.info(f"\n✅ Alias preprocessing complete: {total_groups_transformed} groups transformed\n")
         self.stats['alias_preprocessing_transformed'] = total_groups_transformed
 
-    def run_complete_workflow(self):
-        """Execute complete 5-pass workflow with Ultimate Dashboard UI"""
+    def run_complete_workflow(self, incremental=False, execution_mode='thread', max_workers=None):
+        """Execute complete 5-pass workflow with Ultimate Dashboard UI
+
+        Args:
+            incremental: Only match groups that are new or whose master data changed
+                (see GroupPreprocessor.create_groups). Passes with no groups to
+                match are skipped; results are still propagated to new seat rows.
+            execution_mode: 'thread' (ThreadPoolExecutor) or 'process' (worker
+                processes for the GIL-bound PASS 1-5 matching)
+            max_workers: Pool size (default: os.cpu_count())
+        """
+        if execution_mode not in ('thread', 'process'):
+            raise ValueError(f"Unknown execution_mode: {execution_mode}")
         
         # Initialize Dashboard Components
         console = Console()
@@ -802,9 +875,17 @@ class Integrated5PassOrchestrator:
         add_log("Initializing workflow...")
 
         # PASS 0: PRE-PROCESSING & GROUPING
-        groups = self._pass0_preprocessing()
+        groups = self._pass0_preprocessing(incremental=incremental)
         self.stats['pass0_groups'] = len(groups)
         add_log(f"Pass 0 complete: {len(groups)} groups created")
+
+        if incremental and not groups:
+            # Nothing new to match: skip PASS 1-8, only propagate existing group
+            # results to new seat rows and rebuild the link tables
+            console.print("\n[bold green]✅ INCREMENTAL: No new or changed groups - skipping matching passes[/bold green]")
+            logger.info("INCREMENTAL: No groups enqueued, skipping PASS 1-8")
+            self._finalize_workflow(start_time)
+            return
         
         # ALIAS PREPROCESSING
         self._apply_alias_preprocessing()
@@ -843,12 +924,13 @@ class Integrated5PassOrchestrator:
         conn = sqlite3.connect(self.seat_db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        cursor.execute("""
+        cursor.execute(f"""
         SELECT group_id, normalized_state, normalized_college_name, normalized_address,
                state, college_name, address, composite_college_key,
                sample_course_type, sample_course_name, record_count
         FROM group_matching_queue
         WHERE matched_college_id IS NULL
+        {"AND needs_match = 1" if incremental else ""}
         ORDER BY record_count DESC
         """)
         groups = [dict(row) for row in cursor.fetchall()]
@@ -856,9 +938,9 @@ class Integrated5PassOrchestrator:
         self.stats['pass0_groups'] = len(groups)
 
         # PASS 1-5: Match each group (PARALLEL)
-        max_workers = os.cpu_count() or 4
+        max_workers = max_workers or os.cpu_count() or 4
         processed_count = 0
-        total_matched_count = 0
+        matched_before = self.stats.get('total_matched', 0)
         
         # Setup Progress
         progress = Progress(
@@ -874,34 +956,38 @@ class Integrated5PassOrchestrator:
         
         main_task = progress.add_task("[cyan]Processing Groups", total=len(groups))
 
+        # Start worker processes BEFORE the Live refresh thread exists (fork safety)
+        match_pool = self._start_match_pool(max_workers) if execution_mode == 'process' and groups else None
+        add_log(f"Matching with {max_workers} {execution_mode} workers")
+        match_start = time.time()
+
         # Run with Live Dashboard
         with Live(layout, refresh_per_second=4, screen=True) as live:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(self._match_group, group): group for group in groups}
+            for done, error in self._iter_match_groups(groups, max_workers, match_pool):
+                processed_count += done
+                progress.update(main_task, advance=done)
                 
-                for future in as_completed(futures):
-                    processed_count += 1
-                    progress.update(main_task, advance=1)
-                    
-                    try:
-                        result = future.result()
-                        if result: # If matched
-                            total_matched_count += 1
-                    except Exception as e:
-                        logger.error(f"Error: {e}")
-                        add_log(f"[red]Error: {str(e)[:50]}...[/red]")
-
-                    # Update Dashboard
-                    elapsed = time.time() - start_time
-                    layout["header"].update(generate_header())
-                    layout["progress"].update(Panel(progress, title="[bold green]Active Progress[/bold green]", border_style="green"))
-                    layout["metrics"].update(generate_metrics(len(groups), total_matched_count, elapsed))
-                    layout["logs"].update(generate_logs())
-                    layout["status"].update(generate_status())
-                    
-                    # Log milestones
-                    if processed_count % 500 == 0:
-                        add_log(f"Processed {processed_count} groups...")
+                if error is not None:
+                    logger.error(f"Error: {error}")
+                    add_log(f"[red]Error: {str(error)[:50]}...[/red]")
+
+                # Update Dashboard
+                elapsed = time.time() - start_time
+                total_matched_count = self.stats.get('total_matched', 0) - matched_before
+                layout["header"].update(generate_header())
+                layout["progress"].update(Panel(progress, title="[bold green]Active Progress[/bold green]", border_style="green"))
+                layout["metrics"].update(generate_metrics(len(groups), total_matched_count, elapsed))
+                layout["logs"].update(generate_logs())
+                layout["status"].update(generate_status())
+                
+                # Log milestones
+                if processed_count // 500 > (processed_count - done) // 500:
+                    add_log(f"Processed {processed_count} groups...")
+
+        match_elapsed = time.time() - match_start
+        if groups and match_elapsed > 0:
+            logger.info(f"PASS 1-5: {len(groups)} groups in {match_elapsed:.1f}s "
+                        f"({len(groups) / match_elapsed:.1f} groups/s, {execution_mode} mode, {max_workers} workers)")
 
         # CRITICAL: Flush any remaining queued updates before moving on
         self._flush_update_queue()
@@ -1021,6 +1107,10 @@ class Integrated5PassOrchestrator:
             logger.warning("PASS 7: Re-match delinked SKIPPED (Guardian not available)")
             logger.warning("PASS 8: Cross-group validation SKIPPED (Guardian not available)")
 
+        self._finalize_workflow(start_time)
+
+    def _finalize_workflow(self, start_time):
+        """Propagate queue results, rebuild link tables and print the summary"""
         # BULK PROPAGATE (AFTER all validation - only approved matches reach main table)
         # MOVED: Previously before PASS 6, now after PASS 7 so:
         # 1. All processing happens on group_matching_queue
@@ -1044,16 +1134,19 @@ class Integrated5PassOrchestrator:
         elapsed = time.time() - start_time
         self._print_summary(elapsed)
 
-    def _pass0_preprocessing(self) -> List[Dict]:
+    def _pass0_preprocessing(self, incremental=False) -> List[Dict]:
         """
         PASS 0: PRE-PROCESSING & GROUPING
 
         Group 16,280 records by exact (state, college_name, address)
         Returns 2,439 unique groups for processing
+
+        In incremental mode only the enqueued groups (needs_match = 1) are
+        returned and cleared; other groups keep their match results.
         """
 
         logger.info("Creating groups from seat_data...")
-        total_groups, total_records = self.preprocessor.create_groups()
+        total_groups, total_records = self.preprocessor.create_groups(incremental=incremental)
 
         # ============================================================
         # CRITICAL FIX: Clear seat_data matches AFTER queue rebuild
@@ -1071,20 +1164,35 @@ class Integrated5PassOrchestrator:
         # This is critical for:
         # 1. Full runs: All records in queue = all cleared
         # 2. Incremental: Only new records in queue = only new cleared
-        cursor.execute(f"""
-            UPDATE {self.table_name}
-            SET master_college_id = NULL,
-                college_match_score = NULL,
-                college_match_method = NULL
-            WHERE master_college_id IS NOT NULL
-            AND EXISTS (
-                SELECT 1 FROM group_matching_queue gmq
-                WHERE {self.table_name}.normalized_state = gmq.normalized_state
-                AND {self.table_name}.normalized_college_name = gmq.normalized_college_name
-                AND COALESCE(NULLIF({self.table_name}.normalized_address, ''), 'NO_ADDRESS') = COALESCE(NULLIF(gmq.normalized_address, ''), 'NO_ADDRESS')
-                AND {self.table_name}.course_type = gmq.sample_course_type
-            )
-        """)
+        if has_group_mapping(cursor):
+            # Set-based grouping wrote seat id -> group_id: primary key lookups only
+            cursor.execute(f"""
+                UPDATE {self.table_name}
+                SET master_college_id = NULL,
+                    college_match_score = NULL,
+                    college_match_method = NULL
+                WHERE master_college_id IS NOT NULL
+                AND id IN (
+                    SELECT m.seat_id FROM {GROUP_MAPPING_TABLE} m
+                    JOIN group_matching_queue gmq ON gmq.group_id = m.group_id
+                    {"WHERE gmq.needs_match = 1" if incremental else ""}
+                )
+            """)
+        else:
+            cursor.execute(f"""
+                UPDATE {self.table_name}
+                SET master_college_id = NULL,
+                    college_match_score = NULL,
+                    college_match_method = NULL
+                WHERE master_college_id IS NOT NULL
+                AND EXISTS (
+                    SELECT 1 FROM group_matching_queue gmq
+                    WHERE {self.table_name}.normalized_state = gmq.normalized_state
+                    AND {self.table_name}.normalized_college_name = gmq.normalized_college_name
+                    AND COALESCE(NULLIF({self.table_name}.normalized_address, ''), 'NO_ADDRESS') = COALESCE(NULLIF(gmq.normalized_address, ''), 'NO_ADDRESS')
+                    AND {self.table_name}.course_type = gmq.sample_course_type
+                )
+            """)
         cleared_count = cursor.rowcount
         conn.commit()
         
@@ -1106,20 +1214,24 @@ class Integrated5PassOrchestrator:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
-        cursor.execute("""
+        cursor.execute(f"""
         SELECT group_id, normalized_state, normalized_college_name, normalized_address,
                state, college_name, address,
                sample_course_type, sample_course_name, record_count
         FROM group_matching_queue
         WHERE matched_college_id IS NULL
+        {"AND needs_match = 1" if incremental else ""}
         ORDER BY record_count DESC
         """)
 
         groups = [dict(row) for row in cursor.fetchall()]
         conn.close()
 
-        logger.info(f"✅ PASS 0 COMPLETE: Created {len(groups):,} unique groups from {total_records:,} records")
-        logger.info(f"   Reduction: {total_records/len(groups):.1f}x ({100*(1-len(groups)/total_records):.0f}% reduction)")
+        if incremental:
+            logger.info(f"✅ PASS 0 COMPLETE: {len(groups):,} of {total_groups:,} groups enqueued for matching")
+        elif groups:
+            logger.info(f"✅ PASS 0 COMPLETE: Created {len(groups):,} unique groups from {total_records:,} records")
+            logger.info(f"   Reduction: {total_records/len(groups):.1f}x ({100*(1-len(groups)/total_records):.0f}% reduction)")
 
         return groups
     
@@ -1228,6 +1340,88 @@ class Integrated5PassOrchestrator:
         logger.debug(f"⚠️ Pass 0.5: {reason} but validation failed for all filtered candidates")
         return None, False
 
+    def _start_match_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """
+        Start match worker processes
+
+        Uses the 'fork' start method where available (Linux): this orchestrator is
+        passed to _init_match_worker and reaches every worker by fork, so master
+        data is shared copy-on-write. Fork must happen before any other thread
+        exists (the pool is started ahead of the Live dashboard) and all workers
+        are started up front, as nothing may be forked later. Elsewhere, 'spawn'
+        workers rebuild the orchestrator from its paths, reading master tables
+        from the mmap snapshot (read-only) instead of materializing them.
+        """
+        # Workers must not inherit half-written updates
+        self._flush_update_queue()
+
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            initargs = (self, None)
+        else:
+            context = multiprocessing.get_context('spawn')
+            initargs = (None, {
+                'seat_db_path': self.seat_db_path,
+                'master_db_path': self.master_db_path,
+                'table_name': self.table_name,
+                'read_only_master': True,
+            })
+
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context,
+            initializer=_init_match_worker, initargs=initargs
+        )
+        # With fork, the first submit starts every worker - do it now, while
+        # this is still the only thread
+        pool.submit(os.getpid).result()
+        return pool
+
+    def _iter_match_groups(self, groups: List[Dict], max_workers: int, match_pool: ProcessPoolExecutor = None):
+        """
+        Run _match_group over all groups, yielding (groups_done, error) as work completes.
+
+        Thread mode calls _match_group directly. Process mode (match_pool given)
+        sends chunks to the workers and applies their queued updates and stat
+        deltas here, so the dashboard and stats behave the same in both modes.
+        """
+        if match_pool is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._match_group, group): group for group in groups}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        yield 1, None
+                    except Exception as e:
+                        yield 1, e
+            return
+
+        with match_pool:
+            chunks = [groups[i:i + _MATCH_CHUNK_SIZE] for i in range(0, len(groups), _MATCH_CHUNK_SIZE)]
+            futures = {match_pool.submit(_match_group_chunk, chunk): len(chunk) for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    yield futures[future], e
+                    continue
+
+                for _, updates, deltas in results:
+                    self._apply_worker_result(updates, deltas)
+                yield len(results), None
+
+    def _apply_worker_result(self, updates: List[tuple], deltas: Dict):
+        """Merge one worker-matched group into this process's stats and update queue"""
+        with self.stats_lock:
+            for key, value in deltas.items():
+                self.stats[key] = self.stats.get(key, 0) + value
+
+        if updates:
+            with self._update_queue_lock:
+                self._update_queue.extend(updates)
+                queue_len = len(self._update_queue)
+            if queue_len >= self._batch_size:
+                self._flush_update_queue()
+
     def _match_group(self, group: Dict):
         """
         PASS 0-5: Match a single group through the 5-pass system
@@ -3602,11 +3796,9 @@ class Integrated5PassOrchestrator:
             best_confidence = 0.0
             best_decision = 'REJECT'
             
-            for candidate in candidates:
-                decision, confidence, votes = self.council_chairman.evaluate_candidate(
-                    unmatched_record, candidate
-                )
-                
+            # All candidates scored together (query cleaned once, members vectorized)
+            evaluations = self.council_chairman.evaluate_candidates(unmatched_record, candidates)
+            for candidate, (decision, confidence, votes) in zip(candidates, evaluations):
                 if decision == 'MATCH' and confidence > best_confidence:
                     best_decision = decision
                     best_confidence = confidence
@@ -4647,46 +4839,62 @@ class Integrated5PassOrchestrator:
             # ============================================================
             console.print("   [cyan]Stage 0: Clearing stale matches for unmatchable groups...[/cyan]")
             
-            # Fetch unmatchable groups (matched_college_id IS NULL in queue)
-            cursor.execute("""
-                SELECT 
-                    normalized_state,
-                    normalized_college_name,
-                    COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') as normalized_address,
-                    sample_course_type
-                FROM group_matching_queue
-                WHERE matched_college_id IS NULL OR matched_college_id = ''
-            """)
-            unmatchable_groups = cursor.fetchall()
-            
-            # Clear seat_data matches for these groups (they may have stale matches from previous runs)
+            # Build dynamic SET clause based on available columns
+            set_clauses = ['master_college_id = NULL']
+            if has_college_id:
+                set_clauses.append('college_id = NULL')
+            if has_state_id:
+                set_clauses.append('state_id = NULL')
+            if has_course_id:
+                set_clauses.append('course_id = NULL')
+            if has_match_score:
+                set_clauses.append('college_match_score = NULL')
+            if has_match_method:
+                set_clauses.append("college_match_method = 'cleared_stale_match'")
+
+            use_group_mapping = has_group_mapping(cursor)
             stale_cleared = 0
-            for group in unmatchable_groups:
-                norm_state, norm_college, norm_addr, course_type = group
-                
-                # Build dynamic SET clause based on available columns
-                set_clauses = ['master_college_id = NULL']
-                if has_college_id:
-                    set_clauses.append('college_id = NULL')
-                if has_state_id:
-                    set_clauses.append('state_id = NULL')
-                if has_course_id:
-                    set_clauses.append('course_id = NULL')
-                if has_match_score:
-                    set_clauses.append('college_match_score = NULL')
-                if has_match_method:
-                    set_clauses.append("college_match_method = 'cleared_stale_match'")
-                
+            if use_group_mapping:
+                # Set-based grouping wrote seat id -> group_id: one statement joined on group_id
                 cursor.execute(f"""
                     UPDATE {table}
                     SET {', '.join(set_clauses)}
-                    WHERE normalized_state = ?
-                    AND normalized_college_name = ?
-                    AND COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') = ?
-                    AND course_type = ?
-                    AND master_college_id IS NOT NULL
-                """, (norm_state, norm_college, norm_addr, course_type))
-                stale_cleared += cursor.rowcount
+                    WHERE master_college_id IS NOT NULL
+                    AND id IN (
+                        SELECT m.seat_id
+                        FROM {GROUP_MAPPING_TABLE} m
+                        JOIN group_matching_queue gmq ON gmq.group_id = m.group_id
+                        WHERE gmq.matched_college_id IS NULL OR gmq.matched_college_id = ''
+                    )
+                """)
+                stale_cleared = cursor.rowcount
+            else:
+                # Fetch unmatchable groups (matched_college_id IS NULL in queue)
+                cursor.execute("""
+                    SELECT 
+                        normalized_state,
+                        normalized_college_name,
+                        COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') as normalized_address,
+                        sample_course_type
+                    FROM group_matching_queue
+                    WHERE matched_college_id IS NULL OR matched_college_id = ''
+                """)
+                unmatchable_groups = cursor.fetchall()
+
+                # Clear seat_data matches for these groups (they may have stale matches from previous runs)
+                for group in unmatchable_groups:
+                    norm_state, norm_college, norm_addr, course_type = group
+
+                    cursor.execute(f"""
+                        UPDATE {table}
+                        SET {', '.join(set_clauses)}
+                        WHERE normalized_state = ?
+                        AND normalized_college_name = ?
+                        AND COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') = ?
+                        AND course_type = ?
+                        AND master_college_id IS NOT NULL
+                    """, (norm_state, norm_college, norm_addr, course_type))
+                    stale_cleared += cursor.rowcount
             
             conn.commit()
             if stale_cleared > 0:
@@ -4805,72 +5013,99 @@ class Integrated5PassOrchestrator:
             # Old approach: O(n*m*4) where n=500K seats, m=16K groups = billions of operations
             # New approach: O(n+m) - fetch groups once, update in batches
             
-            # Step 1: Fetch all matched groups (fast - only ~16K rows)
-            console.print("   [cyan]Fetching matched groups...[/cyan]")
-            cursor.execute("""
-                SELECT 
-                    normalized_state,
-                    normalized_college_name,
-                    COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') as normalized_address,
-                    sample_course_type,
-                    matched_college_id,
-                    match_score,
-                    match_method
-                FROM group_matching_queue
-                WHERE matched_college_id IS NOT NULL AND matched_college_id != ''
-            """)
-            matched_groups = cursor.fetchall()
-            console.print(f"   [cyan]Found {len(matched_groups)} matched groups[/cyan]")
+            if use_group_mapping:
+                # One UPDATE ... FROM joined on group_id (replaces the per-group 4-column match)
+                console.print("   [cyan]Propagating matched groups via group_id...[/cyan]")
+                set_parts = ['master_college_id = gmq.matched_college_id']
+                if has_match_score:
+                    set_parts.append('college_match_score = gmq.match_score')
+                if has_match_method:
+                    set_parts.append('college_match_method = gmq.match_method')
+
+                # Same guard as the per-group path: only fill rows without a complete match
+                if has_match_score and has_match_method:
+                    where_extra = "AND (master_college_id IS NULL OR master_college_id = '' OR college_match_score IS NULL OR college_match_method IS NULL)"
+                else:
+                    where_extra = "AND (master_college_id IS NULL OR master_college_id = '')"
+
+                cursor.execute(f"""
+                    UPDATE {table}
+                    SET {', '.join(set_parts)}
+                    FROM {GROUP_MAPPING_TABLE} m
+                    JOIN group_matching_queue gmq ON gmq.group_id = m.group_id
+                    WHERE m.seat_id = {table}.id
+                    AND gmq.matched_college_id IS NOT NULL AND gmq.matched_college_id != ''
+                    {where_extra}
+                """)
+                college_updated = cursor.rowcount
+                conn.commit()
+            else:
+                # Step 1: Fetch all matched groups (fast - only ~16K rows)
+                console.print("   [cyan]Fetching matched groups...[/cyan]")
+                cursor.execute("""
+                    SELECT 
+                        normalized_state,
+                        normalized_college_name,
+                        COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') as normalized_address,
+                        sample_course_type,
+                        matched_college_id,
+                        match_score,
+                        match_method
+                    FROM group_matching_queue
+                    WHERE matched_college_id IS NOT NULL AND matched_college_id != ''
+                """)
+                matched_groups = cursor.fetchall()
+                console.print(f"   [cyan]Found {len(matched_groups)} matched groups[/cyan]")
             
-            # Step 2: Update seat_data in batches (using indexed columns)
-            college_updated = 0
-            batch_size = 100
+                # Step 2: Update seat_data in batches (using indexed columns)
+                college_updated = 0
+                batch_size = 100
             
-            for i in range(0, len(matched_groups), batch_size):
-                batch = matched_groups[i:i + batch_size]
+                for i in range(0, len(matched_groups), batch_size):
+                    batch = matched_groups[i:i + batch_size]
                 
-                for group in batch:
-                    norm_state, norm_college, norm_addr, course_type, matched_id, score, method = group
+                    for group in batch:
+                        norm_state, norm_college, norm_addr, course_type, matched_id, score, method = group
                     
-                    # Build dynamic SET and WHERE clauses based on available columns
-                    set_parts = ['master_college_id = ?']
-                    params = [matched_id]
+                        # Build dynamic SET and WHERE clauses based on available columns
+                        set_parts = ['master_college_id = ?']
+                        params = [matched_id]
                     
-                    if has_match_score:
-                        set_parts.append('college_match_score = ?')
-                        params.append(score)
-                    if has_match_method:
-                        set_parts.append('college_match_method = ?')
-                        params.append(method)
+                        if has_match_score:
+                            set_parts.append('college_match_score = ?')
+                            params.append(score)
+                        if has_match_method:
+                            set_parts.append('college_match_method = ?')
+                            params.append(method)
                     
-                    params.extend([norm_state, norm_college, norm_addr, course_type])
+                        params.extend([norm_state, norm_college, norm_addr, course_type])
                     
-                    # Build WHERE clause - if no score/method columns, just check master_id
-                    if has_match_score and has_match_method:
-                        where_extra = "AND (master_college_id IS NULL OR master_college_id = '' OR college_match_score IS NULL OR college_match_method IS NULL)"
-                    else:
-                        where_extra = "AND (master_college_id IS NULL OR master_college_id = '')"
+                        # Build WHERE clause - if no score/method columns, just check master_id
+                        if has_match_score and has_match_method:
+                            where_extra = "AND (master_college_id IS NULL OR master_college_id = '' OR college_match_score IS NULL OR college_match_method IS NULL)"
+                        else:
+                            where_extra = "AND (master_college_id IS NULL OR master_college_id = '')"
                     
-                    # Update using indexed WHERE clause (fast lookup)
-                    cursor.execute(f"""
-                        UPDATE {table}
-                        SET {', '.join(set_parts)}
-                        WHERE normalized_state = ?
-                        AND normalized_college_name = ?
-                        AND COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') = ?
-                        AND course_type = ?
-                        {where_extra}
-                    """, params)
+                        # Update using indexed WHERE clause (fast lookup)
+                        cursor.execute(f"""
+                            UPDATE {table}
+                            SET {', '.join(set_parts)}
+                            WHERE normalized_state = ?
+                            AND normalized_college_name = ?
+                            AND COALESCE(NULLIF(normalized_address, ''), 'NO_ADDRESS') = ?
+                            AND course_type = ?
+                            {where_extra}
+                        """, params)
                     
-                    college_updated += cursor.rowcount
+                        college_updated += cursor.rowcount
                 
-                # Commit every batch to prevent memory buildup
-                conn.commit()
+                    # Commit every batch to prevent memory buildup
+                    conn.commit()
                 
-                # Progress update every 10 batches
-                if (i // batch_size) % 10 == 0:
-                    console.print(f"   [dim]Progress: {i + len(batch)}/{len(matched_groups)} groups processed[/dim]")
-            
+                    # Progress update every 10 batches
+                    if (i // batch_size) % 10 == 0:
+                        console.print(f"   [dim]Progress: {i + len(batch)}/{len(matched_groups)} groups processed[/dim]")
+
             stages[0] = (stages[0][0], college_updated)
             console.print(f"   [green]✅ Stage 1: {college_updated} records updated[/green]")
 
@@ -5622,9 +5857,8 @@ class Integrated5PassOrchestrator:
             'course_type': course_type
         }
 
-        for candidate in candidates:
-            decision, confidence, votes = self.council_chairman.evaluate_candidate(unmatched_record, candidate)
-            
+        evaluations = self.council_chairman.evaluate_candidates(unmatched_record, candidates)
+        for candidate, (decision, confidence, votes) in zip(candidates, evaluations):
             if decision == 'MATCH' and confidence > best_confidence:
                 best_confidence = confidence
                 best_decision = decision
@@ -5648,9 +5882,22 @@ class Integrated5PassOrchestrator:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Integrated 5-pass college matching orchestrator")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only match new groups or groups whose master data changed; keep existing matches")
+    parser.add_argument('--execution-mode', choices=['thread', 'process'], default='thread',
+                        help="Run PASS 1-5 group matching in threads or worker processes")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Number of match workers (default: CPU count)")
+    args = parser.parse_args()
+
     orchestrator = Integrated5PassOrchestrator()
     try:
-        orchestrator.run_complete_workflow()
+        orchestrator.run_complete_workflow(incremental=args.incremental,
+                                           execution_mode=args.execution_mode,
+                                           max_workers=args.workers)
     except Exception as e:
         logger.error(f"Workflow failed: {e}", exc_info=True)
         sys.exit(1)
@@ -9,16 +9,24 @@ Algorithm:
   Stage 3: ONLY unmatched from Stage 2 through hierarchical+ensemble (98.99%)
 
 Key principle: Only apply advanced matchers to hard cases (3.5% of records)
+
+Execution (config['parallel']):
+  execution_mode: 'chunked' (default) - records are split into chunks of
+      chunk_size and matched in a process pool (num_processes workers) that
+      holds the master frames as read-only state; each chunk's matches are
+      written with one executemany
+  execution_mode: 'threads' - one thread-pool future and one UPDATE per record
 """
 
 import logging
 import time
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from dataclasses import dataclass, field
 
 from lib.database import PostgreSQLManager
 from .hierarchical_filters import HierarchicalFilters
@@ -35,6 +43,7 @@ class PerformanceMetrics:
     matched: int = 0
     start_time: float = 0.0
     end_time: float = 0.0
+    record_times: List[float] = field(default_factory=list)  # Seconds per record (matching only)
 
     @property
     def elapsed_time(self) -> float:
@@ -51,6 +60,139 @@ class PerformanceMetrics:
         """Percentage of records matched"""
         return (self.matched / self.processed * 100) if self.processed > 0 else 0.0
 
+    def percentile_ms(self, q: float) -> float:
+        """Per-record matching time percentile in milliseconds"""
+        return float(np.percentile(self.record_times, q)) * 1000 if self.record_times else 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        return self.percentile_ms(50)
+
+    @property
+    def p95_ms(self) -> float:
+        return self.percentile_ms(95)
+
+    def report(self) -> str:
+        """One-line benchmark summary"""
+        return (f"Stage {self.stage}: {self.processed:,}/{self.total_records:,} records, "
+                f"{self.matched:,} matched ({self.match_rate:.1f}%) in {self.elapsed_time:.1f}s | "
+                f"{self.records_per_second:.0f} records/sec | "
+                f"p50 {self.p50_ms:.1f} ms, p95 {self.p95_ms:.1f} ms per record")
+
+
+def lookup_course_id(courses_df: pd.DataFrame, course_name: str) -> Optional[str]:
+    """
+    Look up course ID by course name.
+
+    Args:
+        courses_df: Courses dataframe (course_id, course_name)
+        course_name: Name of course to look up
+
+    Returns:
+        Course ID if found, None otherwise
+    """
+    if courses_df.empty or not course_name:
+        return None
+
+    try:
+        # Normalize course name
+        course_upper = str(course_name).upper().strip()
+
+        # Exact match first
+        exact = courses_df[
+            courses_df['course_name'].str.upper() == course_upper
+        ]
+        if not exact.empty:
+            return exact.iloc[0]['course_id']
+
+        # Partial match (if exact not found)
+        partial_match = courses_df[
+            courses_df['course_name'].str.upper().str.contains(course_upper[:10], na=False)
+        ]
+        if not partial_match.empty:
+            return partial_match.iloc[0]['course_id']
+
+        return None
+    except Exception as e:
+        logger.debug(f"Error looking up course {course_name}: {e}")
+        return None
+
+
+def match_record(
+    filters: HierarchicalFilters,
+    colleges_df: pd.DataFrame,
+    course_availability_df: Optional[pd.DataFrame],
+    lookup_course: Callable[[str], Optional[str]],
+    record_dict: dict,
+    fallback_method: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Match a single record against the master frames.
+
+    Returns:
+        Tuple of (record_id, college_id) if matched, None otherwise
+    """
+    # If course_id is None, try to look it up from course name (with caching)
+    if pd.isna(record_dict.get('course_id')) and pd.notna(record_dict.get('course_name')):
+        course_id = lookup_course(record_dict['course_name'])
+        if course_id:
+            record_dict['course_id'] = course_id
+
+    # Match using hierarchical filters
+    matched_college = filters.match_record_hierarchical(
+        record_dict,
+        colleges_df,
+        course_availability_df,
+        fallback_method=fallback_method
+    )
+
+    if matched_college:
+        return (record_dict['id'], matched_college['college_id'])
+    return None
+
+
+# Read-only master state of a chunk worker process (set once by _init_chunk_worker)
+_worker_state: Dict = {}
+
+
+def _init_chunk_worker(filters, colleges_df, course_availability_df, courses_df):
+    """Process pool initializer: keep the master frames for every chunk this worker runs"""
+    _worker_state.update(
+        filters=filters,
+        colleges_df=colleges_df,
+        course_availability_df=course_availability_df,
+        lookup_course=lru_cache(maxsize=1000)(partial(lookup_course_id, courses_df)),
+    )
+
+
+def _match_chunk(records: List[dict], fallback_method: Optional[str]) -> Tuple[List[Tuple[str, str]], List[float]]:
+    """
+    Match a chunk of records in a worker process.
+
+    Returns:
+        (matches as (record_id, college_id), seconds per record)
+    """
+    matches = []
+    timings = []
+    for record_dict in records:
+        start = time.perf_counter()
+        try:
+            result = match_record(
+                _worker_state['filters'],
+                _worker_state['colleges_df'],
+                _worker_state['course_availability_df'],
+                _worker_state['lookup_course'],
+                record_dict,
+                fallback_method
+            )
+        except Exception as e:
+            logger.warning(f"Error processing record {record_dict.get('id')}: {e}")
+            result = None
+        timings.append(time.perf_counter() - start)
+        if result:
+            matches.append(result)
+    return matches, timings
+
 
 class CascadingHierarchicalEnsemblePipeline:
     """
@@ -82,6 +224,9 @@ class CascadingHierarchicalEnsemblePipeline:
 
         # Load master data into memory once
         self.colleges_df = self._load_master_colleges()
+        if not self.colleges_df.empty:
+            # TF-IDF models are fitted once; queries only transform themselves
+            self.filters.fit(self.colleges_df)
         self.course_availability_df = self._load_course_availability()
         self.courses_df = self._load_courses()
 
@@ -94,8 +239,11 @@ class CascadingHierarchicalEnsemblePipeline:
         self.metrics = {}
 
         # Parallel processing config
-        self.num_threads = config.get('parallel', {}).get('num_processes', 16)
-        self.enable_parallel = config.get('parallel', {}).get('enable_parallel', True)
+        parallel_config = self.config.get('parallel', {})
+        self.num_threads = parallel_config.get('num_processes', 16)
+        self.enable_parallel = parallel_config.get('enable_parallel', True)
+        self.execution_mode = parallel_config.get('execution_mode', 'chunked')  # 'chunked' or 'threads'
+        self.chunk_size = max(1, int(parallel_config.get('chunk_size', 500)))
 
         # Create cached course lookup function
         self._cached_lookup_course_id = lru_cache(maxsize=1000)(self._uncached_lookup_course_id)
@@ -300,23 +448,24 @@ class CascadingHierarchicalEnsemblePipeline:
         Returns:
             Tuple of (record_id, college_id) if matched, None otherwise
         """
-        # If course_id is None, try to look it up from course name (with caching)
-        if pd.isna(record_dict.get('course_id')) and pd.notna(record_dict.get('course_name')):
-            course_id = self._cached_lookup_course_id(record_dict['course_name'])
-            if course_id:
-                record_dict['course_id'] = course_id
-
-        # Match using hierarchical filters
-        matched_college = self.filters.match_record_hierarchical(
-            record_dict,
+        return match_record(
+            self.filters,
             self.colleges_df,
             self.course_availability_df,
-            fallback_method=fallback_method
+            self._cached_lookup_course_id,
+            record_dict,
+            fallback_method
         )
 
-        if matched_college:
-            return (record_dict['id'], matched_college['college_id'])
-        return None
+    def _timed_process_record(
+        self,
+        record_dict: dict,
+        fallback_method: Optional[str]
+    ) -> Tuple[Optional[Tuple[str, str]], float]:
+        """_process_record_worker() plus its duration in seconds"""
+        start = time.perf_counter()
+        result = self._process_record_worker(record_dict, fallback_method)
+        return result, time.perf_counter() - start
 
     def _run_stage(
         self,
@@ -347,7 +496,12 @@ class CascadingHierarchicalEnsemblePipeline:
             return self._count_matched(table_name)
 
         total_records = len(unmatched_records)
-        logger.info(f"Processing {total_records:,} unmatched records (parallel: {self.num_threads} threads)...\n")
+        parallel = self.enable_parallel and total_records > 100
+        if parallel and self.execution_mode == 'chunked':
+            logger.info(f"Processing {total_records:,} unmatched records "
+                        f"(parallel: {self.num_threads} processes, chunks of {self.chunk_size:,})...\n")
+        else:
+            logger.info(f"Processing {total_records:,} unmatched records (parallel: {self.num_threads} threads)...\n")
 
         metrics = PerformanceMetrics(stage=stage, total_records=total_records)
         metrics.start_time = time.time()
@@ -355,20 +509,45 @@ class CascadingHierarchicalEnsemblePipeline:
         matched_count = 0
         processed_count = 0
 
+        if parallel and self.execution_mode == 'chunked':
+            records = unmatched_records.to_dict('records')
+            chunks = [records[i:i + self.chunk_size] for i in range(0, len(records), self.chunk_size)]
+
+            with ProcessPoolExecutor(
+                max_workers=min(self.num_threads, len(chunks)),
+                initializer=_init_chunk_worker,
+                initargs=(self.filters, self.colleges_df, self.course_availability_df, self.courses_df)
+            ) as executor:
+                futures = {executor.submit(_match_chunk, chunk, fallback_method): len(chunk) for chunk in chunks}
+
+                # Apply each chunk's matches with one executemany as chunks complete
+                for future in as_completed(futures):
+                    try:
+                        matches, timings = future.result()
+                        self._update_records(table_name, matches)
+                        matched_count += len(matches)
+                        metrics.record_times.extend(timings)
+                    except Exception as e:
+                        logger.warning(f"Error processing chunk: {e}")
+                    processed_count += futures[future]
+
+                    logger.info(f"  Processed {processed_count:,}/{total_records:,}, matched: {matched_count:,}")
+
         # Use parallel processing for matching (I/O and CPU bound)
-        if self.enable_parallel and total_records > 100:
+        elif parallel:
             with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
                 # Submit all matching tasks
                 futures = {}
                 for idx, record in unmatched_records.iterrows():
                     record_dict = record.to_dict()
-                    future = executor.submit(self._process_record_worker, record_dict, fallback_method)
+                    future = executor.submit(self._timed_process_record, record_dict, fallback_method)
                     futures[future] = idx
 
                 # Process results as they complete
                 for future in as_completed(futures):
                     try:
-                        result = future.result()
+                        result, elapsed = future.result()
+                        metrics.record_times.append(elapsed)
                         if result:
                             record_id, college_id = result
                             self._update_record(table_name, record_id, college_id)
@@ -387,7 +566,8 @@ class CascadingHierarchicalEnsemblePipeline:
             # Fallback to sequential processing for small datasets
             for idx, record in unmatched_records.iterrows():
                 record_dict = record.to_dict()
-                result = self._process_record_worker(record_dict, fallback_method)
+                result, elapsed = self._timed_process_record(record_dict, fallback_method)
+                metrics.record_times.append(elapsed)
 
                 if result:
                     record_id, college_id = result
@@ -405,7 +585,7 @@ class CascadingHierarchicalEnsemblePipeline:
         metrics.matched = matched_count
         self.metrics[f'stage_{stage}'] = metrics
 
-        logger.info(f"Stage {stage} matched {matched_count:,} records in {metrics.elapsed_time:.1f}s ({metrics.records_per_second:.0f} records/sec)\n")
+        logger.info(f"{metrics.report()}\n")
         return self._count_matched(table_name)
 
     def _get_unmatched_records(self, table_name: str) -> pd.DataFrame:
@@ -443,46 +623,40 @@ class CascadingHierarchicalEnsemblePipeline:
         Returns:
             Course ID if found, None otherwise
         """
-        if self.courses_df.empty or not course_name:
-            return None
-
-        try:
-            # Normalize course name
-            course_upper = str(course_name).upper().strip()
-
-            # Exact match first
-            exact = self.courses_df[
-                self.courses_df['course_name'].str.upper() == course_upper
-            ]
-            if not exact.empty:
-                return exact.iloc[0]['course_id']
-
-            # Partial match (if exact not found)
-            partial = self.courses_df[
-                self.courses_df['course_name'].str.upper().str.contains(course_upper[:10], na=False)
-            ]
-            if not partial.empty:
-                return partial.iloc[0]['course_id']
+        return lookup_course_id(self.courses_df, course_name)
 
-            return None
-        except Exception as e:
-            logger.debug(f"Error looking up course {course_name}: {e}")
-            return None
-
-    def _update_record(self, table_name: str, record_id: int, college_id: int):
-        """Update record with matched college_id"""
-        sql = f"""
+    @staticmethod
+    def _update_sql(table_name: str) -> str:
+        return f"""
         UPDATE {table_name}
         SET master_college_id = %s,
             updated_at = CURRENT_TIMESTAMP
         WHERE id = %s
         """
 
+    def _update_record(self, table_name: str, record_id: int, college_id: int):
+        """Update record with matched college_id"""
         try:
-            self.seat_db.execute_query(sql, (college_id, record_id))
+            self.seat_db.execute_query(self._update_sql(table_name), (college_id, record_id))
         except Exception as e:
             logger.warning(f"Error updating record {record_id}: {e}")
 
+    def _update_records(self, table_name: str, matches: List[Tuple[str, str]]):
+        """Apply (record_id, college_id) matches with one executemany (one transaction)"""
+        if not matches:
+            return
+
+        try:
+            self.seat_db.execute_many(
+                self._update_sql(table_name),
+                [(college_id, record_id) for record_id, college_id in matches]
+            )
+        except Exception as e:
+            # Rolled back as a whole - retry row by row so one bad row does not drop the chunk
+            logger.warning(f"Batch update of {len(matches)} records failed ({e}), retrying individually")
+            for record_id, college_id in matches:
+                self._update_record(table_name, record_id, college_id)
+
     def _count_total(self, table_name: str) -> int:
         """Count total records"""
         result = self.seat_db.fetch_one(f"SELECT COUNT(*) FROM {table_name}")
@@ -580,4 +754,9 @@ class CascadingHierarchicalEnsemblePipeline:
         print(f"    • Time: {s3['time']:.1f}s")
 
         print(f"\nTotal Execution Time: {results['execution_time']:.1f}s")
+
+        if self.metrics:
+            print(f"\nBenchmark ({self.execution_mode if self.enable_parallel else 'sequential'}):")
+            for key in sorted(self.metrics):
+                print(f"  {self.metrics[key].report()}")
         print("="*120 + "\n")
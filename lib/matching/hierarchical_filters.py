@@ -11,13 +11,17 @@ Implements the hierarchy:
   COLLEGE NAME (47 → ~4)
     ↓
   ADDRESS (4 → 1)
+
+Call fit() once with the master colleges frame: the TF-IDF models are then
+fitted on all master names/addresses up front and each query only transforms
+itself and scores the rows left by the state/stream filters.
 """
 
 import logging
 import pandas as pd
 import numpy as np
 from typing import Optional, List, Callable
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -31,6 +35,102 @@ class HierarchicalFilters:
         """Initialize filters with configuration"""
         self.config = config or {}
 
+        # Prefitted master-side state (see fit())
+        self._fitted_index: Optional[pd.Index] = None
+        self._names: Optional[np.ndarray] = None            # normalized_name ('' for missing)
+        self._names_upper: Optional[np.ndarray] = None
+        self._addresses_upper: Optional[np.ndarray] = None  # '' for missing
+        self._address_notna: Optional[np.ndarray] = None
+        self._name_vectorizer: Optional[TfidfVectorizer] = None
+        self._name_matrix = None
+        self._address_vectorizer: Optional[TfidfVectorizer] = None
+        self._address_matrix = None
+
+    @staticmethod
+    def _name_tfidf() -> TfidfVectorizer:
+        """Character-level n-gram model for college names"""
+        return TfidfVectorizer(
+            analyzer='char',
+            ngram_range=(2, 3),
+            lowercase=True,
+            min_df=1
+        )
+
+    @staticmethod
+    def _address_tfidf() -> TfidfVectorizer:
+        """Word-level n-gram model for addresses"""
+        return TfidfVectorizer(
+            analyzer='word',
+            ngram_range=(1, 2),
+            lowercase=True,
+            min_df=1,
+            stop_words='english'
+        )
+
+    def fit(self, colleges_df: pd.DataFrame):
+        """
+        Fit the name/address TF-IDF models once on all master colleges.
+
+        Frames later passed to the filters must be row subsets of `colleges_df`
+        (as produced by filter_by_state/stream/course); other frames fall back
+        to per-call fitting.
+
+        Args:
+            colleges_df: Master colleges dataframe
+        """
+        if colleges_df.empty or not colleges_df.index.is_unique:
+            logger.warning("TF-IDF prefit skipped (empty master frame or duplicate index)")
+            return
+
+        names = colleges_df['normalized_name'].fillna('').astype(str)
+        addresses = colleges_df['address']
+
+        self._fitted_index = colleges_df.index
+        self._names = names.to_numpy(dtype=object)
+        self._names_upper = names.str.upper().to_numpy(dtype=object)
+        self._address_notna = addresses.notna().to_numpy()
+        self._addresses_upper = addresses.fillna('').astype(str).str.upper().to_numpy(dtype=object)
+
+        self._name_vectorizer = self._name_tfidf()
+        self._name_matrix = self._name_vectorizer.fit_transform(self._names.tolist()).tocsr()
+
+        try:
+            self._address_vectorizer = self._address_tfidf()
+            self._address_matrix = self._address_vectorizer.fit_transform(
+                addresses.fillna('').astype(str).tolist()
+            ).tocsr()
+        except ValueError as e:  # Empty vocabulary (no usable addresses)
+            logger.warning(f"Address TF-IDF prefit skipped: {e}")
+            self._address_vectorizer, self._address_matrix = None, None
+
+        logger.info(f"✓ TF-IDF models fitted on {len(colleges_df):,} master colleges "
+                    f"({self._name_matrix.shape[1]:,} name n-grams)")
+
+    def _fitted_rows(self, colleges_df: pd.DataFrame) -> Optional[np.ndarray]:
+        """Positions of `colleges_df` rows in the fitted master frame, or None if it is not a subset"""
+        if self._fitted_index is None:
+            return None
+        rows = self._fitted_index.get_indexer(colleges_df.index)
+        if (rows < 0).any():
+            return None
+        names = colleges_df['normalized_name'].fillna('').astype(str).to_numpy(dtype=object)
+        if not np.array_equal(self._names[rows], names):
+            return None
+        return rows
+
+    def _upper_names(self, colleges_df: pd.DataFrame, rows: Optional[np.ndarray]) -> np.ndarray:
+        if rows is not None:
+            return self._names_upper[rows]
+        return colleges_df['normalized_name'].fillna('').astype(str).str.upper().to_numpy(dtype=object)
+
+    def _upper_addresses(self, colleges_df: pd.DataFrame, rows: Optional[np.ndarray]):
+        """(upper-cased addresses, not-null mask) of the frame rows"""
+        if rows is not None:
+            return self._addresses_upper[rows], self._address_notna[rows]
+        addresses = colleges_df['address']
+        return (addresses.fillna('').astype(str).str.upper().to_numpy(dtype=object),
+                addresses.notna().to_numpy())
+
     # ============================================================================
     # LEVEL 1: STATE FILTERING
     # ============================================================================
@@ -195,11 +295,14 @@ class HierarchicalFilters:
             logger.debug(f"NAME filter: Exact match on normalized_name found {len(exact)} colleges")
             return exact
 
+        # Candidate names scored as one array per scorer (no per-row Python lambdas)
+        rows = self._fitted_rows(colleges_df)
+        names_upper = self._upper_names(colleges_df, rows)
+
         # ===== ATTEMPT 2: Fuzzy match 85%+ (all stages) =====
         fuzzy = colleges_df[
-            colleges_df['normalized_name'].apply(
-                lambda x: fuzz.ratio(input_name, x.upper()) >= 85
-            )
+            process.cdist([input_name], names_upper, scorer=fuzz.ratio,
+                          score_cutoff=85, dtype=np.float64)[0] >= 85
         ]
         if not fuzzy.empty:
             logger.debug(f"NAME filter: Fuzzy match found {len(fuzzy)} colleges")
@@ -208,9 +311,8 @@ class HierarchicalFilters:
         # ===== ATTEMPT 3: RapidFuzz fallback (stage 2+) =====
         if fallback_method in ('rapidfuzz', 'ensemble'):
             rapidfuzz_matches = colleges_df[
-                colleges_df['normalized_name'].apply(
-                    lambda x: fuzz.token_set_ratio(input_name, x.upper()) >= name_threshold
-                )
+                process.cdist([input_name], names_upper, scorer=fuzz.token_set_ratio,
+                              score_cutoff=name_threshold, dtype=np.float64)[0] >= name_threshold
             ]
             if not rapidfuzz_matches.empty:
                 logger.debug(f"NAME filter: RapidFuzz fallback found {len(rapidfuzz_matches)} colleges")
@@ -265,13 +367,12 @@ class HierarchicalFilters:
             return colleges_df
 
         input_address_upper = input_address.strip().upper()
+        addresses_upper, address_notna = self._upper_addresses(colleges_df, self._fitted_rows(colleges_df))
 
         # ===== ATTEMPT 1: Keyword containment (all stages) =====
         keyword = colleges_df[
-            colleges_df['address'].apply(
-                lambda x: input_address_upper in str(x).upper()
-                if pd.notna(x) else False
-            )
+            np.fromiter((input_address_upper in address for address in addresses_upper),
+                        dtype=bool, count=len(addresses_upper)) & address_notna
         ]
         if not keyword.empty:
             logger.debug(f"ADDRESS filter: Keyword match found {len(keyword)} colleges")
@@ -280,10 +381,8 @@ class HierarchicalFilters:
         # ===== ATTEMPT 2: RapidFuzz fallback (stage 2+) =====
         if fallback_method in ('rapidfuzz', 'ensemble'):
             rapidfuzz = colleges_df[
-                colleges_df['address'].apply(
-                    lambda x: fuzz.token_set_ratio(input_address_upper, str(x).upper()) >= address_threshold
-                    if pd.notna(x) else False
-                )
+                (process.cdist([input_address_upper], addresses_upper, scorer=fuzz.token_set_ratio,
+                               score_cutoff=address_threshold, dtype=np.float64)[0] >= address_threshold) & address_notna
             ]
             if not rapidfuzz.empty:
                 logger.debug(f"ADDRESS filter: RapidFuzz fallback found {len(rapidfuzz)} colleges")
@@ -420,25 +519,24 @@ class HierarchicalFilters:
             return colleges_df.iloc[:0]
 
         try:
-            # Get college names
-            college_names = colleges_df['normalized_name'].fillna('').tolist()
-            if not college_names:
-                return colleges_df.iloc[:0]
-
-            # Create TF-IDF vectorizer with character-level n-grams
-            vectorizer = TfidfVectorizer(
-                analyzer='char',
-                ngram_range=(2, 3),
-                lowercase=True,
-                min_df=1
-            )
+            rows = self._fitted_rows(colleges_df) if self._name_matrix is not None else None
+            if rows is not None:
+                # Prefitted model: transform only the query, score the selected rows
+                similarities = self._prefitted_similarities(
+                    self._name_vectorizer, self._name_matrix, rows, input_name
+                )
+            else:
+                # Get college names
+                college_names = colleges_df['normalized_name'].fillna('').tolist()
+                if not college_names:
+                    return colleges_df.iloc[:0]
 
-            # Fit on all colleges + input
-            all_texts = college_names + [input_name]
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
+                # Fit on all colleges + input
+                all_texts = college_names + [input_name]
+                tfidf_matrix = self._name_tfidf().fit_transform(all_texts)
 
-            # Calculate similarity with input (last row)
-            similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
+                # Calculate similarity with input (last row)
+                similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
 
             # Filter by threshold
             matches = similarities >= threshold
@@ -458,6 +556,12 @@ class HierarchicalFilters:
             logger.debug(f"Error in TF-IDF matching: {e}")
             return colleges_df.iloc[:0]
 
+    @staticmethod
+    def _prefitted_similarities(vectorizer: TfidfVectorizer, matrix, rows: np.ndarray, text: str) -> np.ndarray:
+        """Cosine of `text` against the given rows of a prefitted (L2-normalized) TF-IDF matrix"""
+        query = vectorizer.transform([text]).toarray().ravel()
+        return matrix[rows] @ query
+
     def tfidf_match_address(
         self,
         colleges_df: pd.DataFrame,
@@ -480,26 +584,24 @@ class HierarchicalFilters:
             return colleges_df.iloc[:0]
 
         try:
-            # Get addresses
-            addresses = colleges_df['address'].fillna('').tolist()
-            if not addresses:
-                return colleges_df.iloc[:0]
-
-            # Create TF-IDF vectorizer with word-level n-grams
-            vectorizer = TfidfVectorizer(
-                analyzer='word',
-                ngram_range=(1, 2),
-                lowercase=True,
-                min_df=1,
-                stop_words='english'
-            )
-
-            # Fit on all addresses + input
-            all_texts = addresses + [input_address]
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
-
-            # Calculate similarity with input (last row)
-            similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
+            rows = self._fitted_rows(colleges_df) if self._address_matrix is not None else None
+            if rows is not None:
+                # Prefitted model: transform only the query, score the selected rows
+                similarities = self._prefitted_similarities(
+                    self._address_vectorizer, self._address_matrix, rows, input_address
+                )
+            else:
+                # Get addresses
+                addresses = colleges_df['address'].fillna('').tolist()
+                if not addresses:
+                    return colleges_df.iloc[:0]
+
+                # Fit on all addresses + input
+                all_texts = addresses + [input_address]
+                tfidf_matrix = self._address_tfidf().fit_transform(all_texts)
+
+                # Calculate similarity with input (last row)
+                similarities = cosine_similarity(tfidf_matrix[-1:], tfidf_matrix[:-1])[0]
 
             # Filter by threshold
             matches = similarities >= threshold
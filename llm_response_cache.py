@@ -10,12 +10,17 @@ import hashlib
 import json
 import time
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, List, Iterable
 from dataclasses import dataclass
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Keys per "WHERE cache_key IN (...)" query (well below SQLITE_MAX_VARIABLE_NUMBER)
+LOOKUP_CHUNK_SIZE = 500
+
 
 @dataclass
 class CacheEntry:
@@ -30,7 +35,231 @@ class CacheEntry:
     verified: bool = False  # True = Guardian approved, False = LLM match only
 
 
-class LLMResponseCache:
+def cache_stream_key(course_type: Optional[str]) -> str:
+    """Course type as used in cache keys (diploma courses share the MEDICAL key)."""
+    norm_course = (course_type or '').upper().strip()
+    
+    # Diploma courses are offered by medical colleges, so use same cache key
+    if norm_course == 'DIPLOMA':
+        norm_course = 'MEDICAL'
+    return norm_course
+
+
+class _SQLiteCacheBase:
+    """
+    Shared plumbing for the SQLite-backed LLM caches.
+    
+    - One persistent WAL connection per cache (guarded by a lock, so the
+      caches stay safe to share between worker threads)
+    - In-process LRU front tier in front of the table (row dicts by cache_key)
+    - Chunked "WHERE cache_key IN (...)" lookups for batches
+    - hit_count increments buffered and written with executemany
+    - TTL cleanup every `cleanup_interval` seconds on a background thread
+    """
+    
+    TABLE = ''
+    HIT_FLUSH_SIZE = 256
+    
+    def __init__(self, db_path: str, ttl_days: int, lru_size: int = 10000, cleanup_interval: float = 3600.0):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.lru_size = lru_size
+        self.cleanup_interval = cleanup_interval
+        
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+        self._lru: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._pending_hits: Dict[str, int] = {}
+        self._last_cleanup = time.time()
+        self._cleanup_thread: Optional[threading.Thread] = None
+        
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'lru_hits': 0, 'db_hits': 0, 'lru_evictions': 0}
+    
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def _get_conn(self):
+        """Persistent connection (thread-safe: one caller at a time)."""
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            yield self._conn
+    
+    def close(self):
+        """Flush buffered hit counts and close the connection."""
+        self._flush_hits()
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    # ------------------------------------------------------------------
+    # LRU front tier
+    # ------------------------------------------------------------------
+    
+    def _lru_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with self._lru_lock:
+            row = self._lru.get(cache_key)
+            if row is not None:
+                self._lru.move_to_end(cache_key)
+            return row
+    
+    def _lru_put(self, cache_key: str, row: Dict[str, Any]):
+        if self.lru_size <= 0:
+            return
+        with self._lru_lock:
+            self._lru[cache_key] = row
+            self._lru.move_to_end(cache_key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+                self.stats['lru_evictions'] += 1
+    
+    def _lru_discard(self, cache_key: str):
+        with self._lru_lock:
+            self._lru.pop(cache_key, None)
+    
+    def _lru_clear(self):
+        with self._lru_lock:
+            self._lru.clear()
+    
+    # ------------------------------------------------------------------
+    # Batched reads / hit counting / cleanup
+    # ------------------------------------------------------------------
+    
+    def _lookup(self, cache_keys: Iterable[str], is_usable, track_stats: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Rows for `cache_keys` (LRU first, then one IN query per chunk).
+        
+        Only unexpired rows for which is_usable(row) holds are returned;
+        hit_count increments are buffered and, with track_stats, session
+        hits/misses are counted.
+        """
+        cutoff = time.time() - self.ttl_seconds
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        requested = 0
+        
+        for key in dict.fromkeys(cache_keys):  # unique, order kept
+            requested += 1
+            row = self._lru_get(key)
+            if row is not None and row['created_at'] > cutoff and is_usable(row):
+                found[key] = row
+                if track_stats:
+                    self.stats['lru_hits'] += 1
+            else:
+                missing.append(key)
+        
+        if missing:
+            with self._get_conn() as conn:
+                for i in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                    chunk = missing[i:i + LOOKUP_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(f"""
+                        SELECT * FROM {self.TABLE}
+                        WHERE cache_key IN ({placeholders}) AND created_at > ?
+                    """, (*chunk, cutoff))
+                    for db_row in cursor.fetchall():
+                        row = dict(db_row)
+                        self._lru_put(row['cache_key'], row)
+                        if is_usable(row):
+                            found[row['cache_key']] = row
+                            if track_stats:
+                                self.stats['db_hits'] += 1
+        
+        if track_stats:
+            self.stats['hits'] += len(found)
+            self.stats['misses'] += requested - len(found)
+        
+        if found:
+            self._record_hits(found.keys())
+        self._maybe_cleanup()
+        return found
+    
+    def _record_hits(self, cache_keys: Iterable[str]):
+        flush = False
+        with self._lru_lock:
+            for key in cache_keys:
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+                row = self._lru.get(key)
+                if row is not None:
+                    row['hit_count'] = (row.get('hit_count') or 0) + 1
+            flush = len(self._pending_hits) >= self.HIT_FLUSH_SIZE
+        if flush:
+            self._flush_hits()
+    
+    def _flush_hits(self):
+        """Write buffered hit_count increments in one executemany."""
+        with self._lru_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if not pending:
+            return
+        with self._get_conn() as conn:
+            conn.executemany(
+                f"UPDATE {self.TABLE} SET hit_count = hit_count + ? WHERE cache_key = ?",
+                [(count, key) for key, count in pending.items()],
+            )
+            conn.commit()
+    
+    def _maybe_cleanup(self):
+        """Start TTL cleanup in the background when it is due (never blocks callers)."""
+        if time.time() - self._last_cleanup < self.cleanup_interval:
+            return
+        if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
+            return
+        self._last_cleanup = time.time()
+        self._cleanup_thread = threading.Thread(target=self._background_cleanup, daemon=True)
+        self._cleanup_thread.start()
+    
+    def _background_cleanup(self):
+        try:
+            # Own connection: WAL lets the caller's connection keep reading meanwhile
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                cursor = conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+                conn.commit()
+                if cursor.rowcount:
+                    logger.info(f"{self.TABLE}: removed {cursor.rowcount} expired entries")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"{self.TABLE} background cleanup failed: {e}")
+    
+    def cleanup_expired(self) -> int:
+        """Remove expired cache entries. Returns count of deleted rows."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._get_conn() as conn:
+            cursor = conn.execute(f"DELETE FROM {self.TABLE} WHERE created_at < ?", (cutoff,))
+            conn.commit()
+        with self._lru_lock:
+            for key in [k for k, row in self._lru.items() if row['created_at'] < cutoff]:
+                del self._lru[key]
+        self._last_cleanup = time.time()
+        return cursor.rowcount
+    
+    def _lru_stats(self) -> Dict[str, Any]:
+        return {
+            'lru_size': len(self._lru),
+            'lru_capacity': self.lru_size,
+            'lru_hits': self.stats['lru_hits'],
+            'db_hits': self.stats['db_hits'],
+            'lru_evictions': self.stats['lru_evictions'],
+        }
+
+
+class LLMResponseCache(_SQLiteCacheBase):
     """
     SQLite-based cache for LLM matching responses.
     
@@ -38,28 +267,28 @@ class LLMResponseCache:
     - Hash-based lookup for (college_name, state, address) tuples
     - TTL-based expiration (default 7 days)
     - Hit count tracking for analytics
-    - Thread-safe with connection per thread
+    - Batch lookups/writes (get_many / set_many) over one WAL connection
+    - LRU front tier (lru_size entries) with hit/miss counters in get_stats()
     """
     
+    TABLE = 'llm_cache'
+    
     def __init__(
         self, 
         db_path: str = 'data/sqlite/llm_cache.db',
         ttl_days: int = 7,
+        lru_size: int = 10000,
+        cleanup_interval: float = 3600.0,
     ):
-        self.db_path = db_path
-        self.ttl_seconds = ttl_days * 24 * 3600
+        super().__init__(db_path, ttl_days, lru_size=lru_size, cleanup_interval=cleanup_interval)
         self._init_db()
         
-        # Stats
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'writes': 0,
-        }
+        # Optional near-duplicate tier (semantic_llm_cache.SemanticCacheTier), fed by set_many()
+        self.semantic_tier = None
     
     def _init_db(self):
         """Initialize cache database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.execute("""
             CREATE TABLE IF NOT EXISTS llm_cache (
                 cache_key TEXT PRIMARY KEY,
@@ -89,16 +318,6 @@ class LLMResponseCache:
         conn.close()
         logger.info(f"LLM Response Cache initialized at {self.db_path}")
     
-    @contextmanager
-    def _get_conn(self):
-        """Get a database connection (thread-safe)."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
-    
     def _create_cache_key(
         self, 
         college_name: str, 
@@ -115,12 +334,7 @@ class LLMResponseCache:
         norm_name = (college_name or '').upper().strip()
         norm_state = (state or '').upper().strip()
         norm_addr = (address or '').upper().strip()
-        norm_course = (course_type or '').upper().strip()
-        
-        # Normalize course types for better cache hit rate
-        # Diploma courses are offered by medical colleges, so use same cache key
-        if norm_course == 'DIPLOMA':
-            norm_course = 'MEDICAL'
+        norm_course = cache_stream_key(course_type)
         
         # Create composite string
         composite = f"{norm_name}|{norm_state}|{norm_addr}|{norm_course}"
@@ -128,6 +342,19 @@ class LLMResponseCache:
         # SHA256 hash
         return hashlib.sha256(composite.encode()).hexdigest()[:32]
     
+    @staticmethod
+    def _to_entry(row: Dict[str, Any]) -> CacheEntry:
+        return CacheEntry(
+            cache_key=row['cache_key'],
+            matched_college_id=row['matched_college_id'],
+            confidence=row['confidence'],
+            reason=row['reason'],
+            model_name=row['model_name'],
+            created_at=row['created_at'],
+            hit_count=row.get('hit_count') or 0,
+            verified=bool(row.get('verified')),
+        )
+    
     def get(
         self, 
         college_name: str, 
@@ -145,45 +372,33 @@ class LLMResponseCache:
         
         Returns None if not found, expired, or not verified (when verified_only=True).
         """
-        cache_key = self._create_cache_key(college_name, state, address, course_type)
+        return self.get_many([(college_name, state, address, course_type)], verified_only=verified_only)[0]
+    
+    def get_many(
+        self,
+        requests: List[Tuple[str, str, str, Optional[str]]],
+        verified_only: bool = True,
+    ) -> List[Optional[CacheEntry]]:
+        """
+        Batch version of get().
         
-        with self._get_conn() as conn:
-            if verified_only:
-                cursor = conn.execute("""
-                    SELECT * FROM llm_cache 
-                    WHERE cache_key = ? AND created_at > ? AND verified = 1
-                """, (cache_key, time.time() - self.ttl_seconds))
-            else:
-                cursor = conn.execute("""
-                    SELECT * FROM llm_cache 
-                    WHERE cache_key = ? AND created_at > ?
-                """, (cache_key, time.time() - self.ttl_seconds))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                # Update hit count
-                conn.execute("""
-                    UPDATE llm_cache SET hit_count = hit_count + 1 
-                    WHERE cache_key = ?
-                """, (cache_key,))
-                conn.commit()
-                
-                self.stats['hits'] += 1
-                
-                return CacheEntry(
-                    cache_key=row['cache_key'],
-                    matched_college_id=row['matched_college_id'],
-                    confidence=row['confidence'],
-                    reason=row['reason'],
-                    model_name=row['model_name'],
-                    created_at=row['created_at'],
-                    hit_count=row['hit_count'] + 1,
-                    verified=bool(row['verified']) if 'verified' in row.keys() else False,
-                )
-            
-            self.stats['misses'] += 1
-            return None
+        Args:
+            requests: (college_name, state, address, course_type) tuples
+            verified_only: As in get()
+        
+        Returns:
+            CacheEntry or None per request, in order
+        """
+        keys = [self._create_cache_key(*request) for request in requests]
+        rows = self._lookup(keys, lambda row: bool(row.get('verified')) or not verified_only)
+        return [self._to_entry(rows[key]) if key in rows else None for key in keys]
+    
+    def get_entries(self, cache_keys: List[str], verified_only: bool = True) -> Dict[str, CacheEntry]:
+        """Unexpired entries by cache_key (used by the semantic tier; not counted in session hit rate)."""
+        rows = self._lookup(
+            cache_keys, lambda row: bool(row.get('verified')) or not verified_only, track_stats=False
+        )
+        return {key: self._to_entry(row) for key, row in rows.items()}
     
     def set(
         self,
@@ -204,21 +419,64 @@ class LLMResponseCache:
             verified: If True, mark as Guardian-approved (will be used for future matches).
                      If False, this is just an LLM suggestion (won't be returned by default).
         """
-        cache_key = self._create_cache_key(college_name, state, address, course_type)
+        self.set_many([{
+            'college_name': college_name,
+            'state': state,
+            'address': address,
+            'course_type': course_type,
+            'matched_college_id': matched_college_id,
+            'confidence': confidence,
+            'reason': reason,
+            'model_name': model_name,
+            'verified': verified,
+        }])
+    
+    def set_many(self, entries: List[Dict[str, Any]]):
+        """
+        Cache many LLM responses in one transaction (executemany upsert).
+        
+        Args:
+            entries: Dicts with the keyword arguments of set()
+        """
+        if not entries:
+            return
+        now = time.time()
+        rows = []
+        for e in entries:
+            cache_key = self._create_cache_key(
+                e.get('college_name', ''), e.get('state', ''), e.get('address', ''), e.get('course_type')
+            )
+            rows.append({
+                'cache_key': cache_key,
+                'matched_college_id': e.get('matched_college_id'),
+                'confidence': e.get('confidence'),
+                'reason': e.get('reason'),
+                'model_name': e.get('model_name'),
+                'created_at': now,
+                'hit_count': 0,
+                'verified': 1 if e.get('verified') else 0,
+                'request_hash': None,
+                'college_name': e.get('college_name'),
+                'state': e.get('state'),
+                'address': e.get('address'),
+            })
         
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO llm_cache 
                 (cache_key, matched_college_id, confidence, reason, model_name, 
                  created_at, hit_count, verified, college_name, state, address)
-                VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
-            """, (
-                cache_key, matched_college_id, confidence, reason, model_name,
-                time.time(), 1 if verified else 0, college_name, state, address
-            ))
+                VALUES (:cache_key, :matched_college_id, :confidence, :reason, :model_name,
+                        :created_at, 0, :verified, :college_name, :state, :address)
+            """, rows)
             conn.commit()
         
-        self.stats['writes'] += 1
+        for row in rows:
+            self._lru_put(row['cache_key'], row)
+        self.stats['writes'] += len(rows)
+        
+        if self.semantic_tier is not None:
+            self.semantic_tier.add_many(entries)
     
     def mark_verified(
         self,
@@ -242,6 +500,10 @@ class LLMResponseCache:
             """, (cache_key,))
             conn.commit()
             
+            row = self._lru_get(cache_key)
+            if row is not None:
+                row['verified'] = 1
+            
             if cursor.rowcount > 0:
                 logger.info(f"Cache entry verified: {cache_key[:8]}...")
                 return True
@@ -267,6 +529,7 @@ class LLMResponseCache:
                 DELETE FROM llm_cache WHERE cache_key = ?
             """, (cache_key,))
             conn.commit()
+            self._lru_discard(cache_key)
             
             if cursor.rowcount > 0:
                 logger.info(f"Cache entry invalidated: {cache_key[:8]}...")
@@ -286,14 +549,13 @@ class LLMResponseCache:
         cached = []
         uncached = []
         
-        for record in records:
-            entry = self.get(
-                college_name=record.get('college_name', ''),
-                state=record.get('state', ''),
-                address=record.get('address', ''),
-                course_type=record.get('course_type'),
-            )
-            
+        entries = self.get_many([
+            (record.get('college_name', ''), record.get('state', ''),
+             record.get('address', ''), record.get('course_type'))
+            for record in records
+        ])
+        
+        for record, entry in zip(records, entries):
             if entry:
                 # Add cache result to record
                 record['_cache_hit'] = True
@@ -323,32 +585,24 @@ class LLMResponseCache:
         # Build lookup from record_id to result
         result_map = {r.record_id: r for r in results if hasattr(r, 'record_id')}
         
-        for record in records:
-            record_id = record.get('record_id')
-            if record_id and record_id in result_map:
-                result = result_map[record_id]
-                self.set(
-                    college_name=record.get('college_name', ''),
-                    state=record.get('state', ''),
-                    address=record.get('address', ''),
-                    matched_college_id=result.matched_college_id,
-                    confidence=result.confidence,
-                    reason=result.reason,
-                    model_name=model_name,
-                    course_type=record.get('course_type'),
-                )
-    
-    def cleanup_expired(self) -> int:
-        """Remove expired cache entries. Returns count of deleted rows."""
-        with self._get_conn() as conn:
-            cursor = conn.execute("""
-                DELETE FROM llm_cache WHERE created_at < ?
-            """, (time.time() - self.ttl_seconds,))
-            conn.commit()
-            return cursor.rowcount
+        self.set_many([
+            {
+                'college_name': record.get('college_name', ''),
+                'state': record.get('state', ''),
+                'address': record.get('address', ''),
+                'matched_college_id': result_map[record['record_id']].matched_college_id,
+                'confidence': result_map[record['record_id']].confidence,
+                'reason': result_map[record['record_id']].reason,
+                'model_name': model_name,
+                'course_type': record.get('course_type'),
+            }
+            for record in records
+            if record.get('record_id') and record['record_id'] in result_map
+        ])
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        self._flush_hits()
         with self._get_conn() as conn:
             cursor = conn.execute("SELECT COUNT(*) as count FROM llm_cache")
             total_entries = cursor.fetchone()['count']
@@ -365,37 +619,43 @@ class LLMResponseCache:
             'session_writes': self.stats['writes'],
             'hit_rate': f"{hit_rate:.1%}",
             'total_historical_hits': total_hits,
+            **self._lru_stats(),
         }
     
     def clear(self):
         """Clear entire cache (for testing/reset)."""
+        with self._lru_lock:
+            self._pending_hits = {}
         with self._get_conn() as conn:
             conn.execute("DELETE FROM llm_cache")
             conn.commit()
-        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
+        self._lru_clear()
+        self.stats = {key: 0 for key in self.stats}
 
 
 # Verification cache (separate from matcher)
-class VerificationCache:
+class VerificationCache(_SQLiteCacheBase):
     """
     Cache for LLM verification results.
     
     Different from matcher cache - keyed by (seat_name, master_id) pair.
     """
     
+    TABLE = 'verification_cache'
+    
     def __init__(
         self, 
         db_path: str = 'data/sqlite/llm_cache.db',
         ttl_days: int = 7,
+        lru_size: int = 10000,
+        cleanup_interval: float = 3600.0,
     ):
-        self.db_path = db_path
-        self.ttl_seconds = ttl_days * 24 * 3600
+        super().__init__(db_path, ttl_days, lru_size=lru_size, cleanup_interval=cleanup_interval)
         self._init_db()
-        self.stats = {'hits': 0, 'misses': 0, 'writes': 0}
     
     def _init_db(self):
         """Initialize verification cache schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.execute("""
             CREATE TABLE IF NOT EXISTS verification_cache (
                 cache_key TEXT PRIMARY KEY,
@@ -410,16 +670,6 @@ class VerificationCache:
         conn.commit()
         conn.close()
     
-    @contextmanager
-    def _get_conn(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
-    
     def _create_key(self, seat_name: str, master_id: str, match_score: float) -> str:
         """Create cache key from verification inputs."""
         composite = f"{(seat_name or '').upper()}|{master_id}|{match_score:.2f}"
@@ -427,33 +677,21 @@ class VerificationCache:
     
     def get(self, seat_name: str, master_id: str, match_score: float) -> Optional[Dict]:
         """Get cached verification result."""
-        cache_key = self._create_key(seat_name, master_id, match_score)
-        
-        with self._get_conn() as conn:
-            cursor = conn.execute("""
-                SELECT * FROM verification_cache 
-                WHERE cache_key = ? AND created_at > ?
-            """, (cache_key, time.time() - self.ttl_seconds))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                conn.execute("""
-                    UPDATE verification_cache SET hit_count = hit_count + 1 
-                    WHERE cache_key = ?
-                """, (cache_key,))
-                conn.commit()
-                
-                self.stats['hits'] += 1
-                return {
-                    'verdict': row['verdict'],
-                    'confidence': row['confidence'],
-                    'reason': row['reason'],
-                    'model_name': row['model_name'],
-                }
-            
-            self.stats['misses'] += 1
-            return None
+        return self.get_many([(seat_name, master_id, match_score)])[0]
+    
+    def get_many(self, requests: List[Tuple[str, str, float]]) -> List[Optional[Dict]]:
+        """Batch get(): (seat_name, master_id, match_score) tuples -> result dict or None, in order."""
+        keys = [self._create_key(*request) for request in requests]
+        rows = self._lookup(keys, lambda row: True)
+        return [
+            {
+                'verdict': rows[key]['verdict'],
+                'confidence': rows[key]['confidence'],
+                'reason': rows[key]['reason'],
+                'model_name': rows[key]['model_name'],
+            } if key in rows else None
+            for key in keys
+        ]
     
     def set(
         self, 
@@ -466,17 +704,53 @@ class VerificationCache:
         model_name: str,
     ):
         """Cache a verification result."""
-        cache_key = self._create_key(seat_name, master_id, match_score)
+        self.set_many([(seat_name, master_id, match_score, verdict, confidence, reason, model_name)])
+    
+    def set_many(self, entries: List[Tuple[str, str, float, str, float, str, str]]):
+        """Cache many results: (seat_name, master_id, match_score, verdict, confidence, reason, model_name)."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            {
+                'cache_key': self._create_key(seat_name, master_id, match_score),
+                'verdict': verdict,
+                'confidence': confidence,
+                'reason': reason,
+                'model_name': model_name,
+                'created_at': now,
+                'hit_count': 0,
+            }
+            for seat_name, master_id, match_score, verdict, confidence, reason, model_name in entries
+        ]
         
         with self._get_conn() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO verification_cache 
                 (cache_key, verdict, confidence, reason, model_name, created_at, hit_count)
-                VALUES (?, ?, ?, ?, ?, ?, 0)
-            """, (cache_key, verdict, confidence, reason, model_name, time.time()))
+                VALUES (:cache_key, :verdict, :confidence, :reason, :model_name, :created_at, 0)
+            """, rows)
             conn.commit()
         
-        self.stats['writes'] += 1
+        for row in rows:
+            self._lru_put(row['cache_key'], row)
+        self.stats['writes'] += len(rows)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        self._flush_hits()
+        with self._get_conn() as conn:
+            total_entries = conn.execute("SELECT COUNT(*) FROM verification_cache").fetchone()[0]
+        
+        hit_rate = self.stats['hits'] / max(self.stats['hits'] + self.stats['misses'], 1)
+        return {
+            'total_entries': total_entries,
+            'session_hits': self.stats['hits'],
+            'session_misses': self.stats['misses'],
+            'session_writes': self.stats['writes'],
+            'hit_rate': f"{hit_rate:.1%}",
+            **self._lru_stats(),
+        }
 
 
 # Singleton instances
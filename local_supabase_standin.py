@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Local SQLite stand-in for the Supabase (PostgREST) client.
+
+Implements the part of supabase-py used by sync_sqlite_to_supabase.py -
+table().upsert(on_conflict=...), table().delete().in_()/.match(),
+table().select(count="exact") and rpc() - on top of a SQLite file, so the
+sync can be run, tested and benchmarked offline. Tables and columns are
+created on first write. Every request is counted, and a fraction of
+requests can be made to fail to exercise retries.
+
+Usage:
+    python sync_sqlite_to_supabase.py --local-target /tmp/supabase_standin.db
+
+    # In code / tests
+    from local_supabase_standin import LocalSupabaseClient
+    client = LocalSupabaseClient(':memory:', failure_ratio=0.1)
+    sync_table_to_supabase(client, 'courses', TABLE_CONFIG['courses'])
+    client.stats   # {'requests': ..., 'rows_upserted': ..., 'rows_deleted': ..., 'failures': ...}
+"""
+
+import json
+import random
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+
+class StandInAPIError(Exception):
+    """Raised for injected failures and bad requests (like postgrest.APIError)."""
+
+
+class StandInResponse:
+    def __init__(self, data: List[Dict], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _sqlite_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+class _QueryBuilder:
+    """One request against one table; executed by execute()."""
+
+    def __init__(self, client: 'LocalSupabaseClient', table: str):
+        self._client = client
+        self._table = table
+        self._action = None
+        self._rows: List[Dict] = []
+        self._on_conflict: List[str] = []
+        self._filters: List[tuple] = []  # (sql, params)
+        self._count = None
+        self._limit = None
+
+    def upsert(self, rows: Union[Dict, List[Dict]], on_conflict: str = 'id', **_) -> '_QueryBuilder':
+        self._action = 'upsert'
+        self._rows = [rows] if isinstance(rows, dict) else list(rows)
+        self._on_conflict = [c.strip() for c in on_conflict.split(',') if c.strip()]
+        return self
+
+    def delete(self, **_) -> '_QueryBuilder':
+        self._action = 'delete'
+        return self
+
+    def select(self, columns: str = '*', count: Optional[str] = None) -> '_QueryBuilder':
+        self._action = 'select'
+        self._count = count
+        return self
+
+    def eq(self, column: str, value: Any) -> '_QueryBuilder':
+        self._filters.append((f"{_quote(column)} = ?", [value]))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> '_QueryBuilder':
+        values = list(values)
+        self._filters.append((f"{_quote(column)} IN ({','.join('?' * len(values))})" if values else "0", values))
+        return self
+
+    def match(self, query: Dict[str, Any]) -> '_QueryBuilder':
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+
+    def limit(self, size: int) -> '_QueryBuilder':
+        self._limit = size
+        return self
+
+    def execute(self) -> StandInResponse:
+        return self._client._execute(self)
+
+
+class LocalSupabaseClient:
+    """
+    SQLite-backed stand-in for supabase.Client.
+
+    Args:
+        db_path: SQLite file (':memory:' for a throwaway target)
+        failure_ratio: Fraction of requests that raise StandInAPIError
+    """
+
+    def __init__(self, db_path: str = ':memory:', failure_ratio: float = 0.0):
+        self.db_path = db_path
+        self.failure_ratio = failure_ratio
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'rows_upserted': 0, 'rows_deleted': 0, 'failures': 0, 'rpc_calls': 0}
+
+    def table(self, name: str) -> _QueryBuilder:
+        return _QueryBuilder(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict] = None) -> '_RpcCall':
+        return _RpcCall(self, name)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {key: 0 for key in self.stats}
+
+    def fetch_all(self, table: str) -> List[Dict]:
+        """All rows of a table (for assertions)"""
+        with self._lock:
+            if not self._columns(table):
+                return []
+            return [dict(row) for row in self.conn.execute(f"SELECT * FROM {_quote(table)}")]
+
+    def _columns(self, table: str) -> List[str]:
+        return [row[1] for row in self.conn.execute(f"PRAGMA table_info({_quote(table)})")]
+
+    def _ensure_table(self, table: str, columns: List[str], key_columns: List[str]):
+        existing = self._columns(table)
+        if not existing:
+            column_sql = ', '.join(_quote(c) for c in columns)
+            key_sql = ', '.join(_quote(c) for c in key_columns)
+            self.conn.execute(f"CREATE TABLE {_quote(table)} ({column_sql}, PRIMARY KEY ({key_sql}))")
+            return
+        for column in columns:
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)}")
+
+    def _request(self):
+        self.stats['requests'] += 1
+        if self.failure_ratio and random.random() < self.failure_ratio:
+            self.stats['failures'] += 1
+            raise StandInAPIError("injected failure")
+
+    def _execute(self, query: _QueryBuilder) -> StandInResponse:
+        with self._lock:
+            self._request()
+            where = ' AND '.join(sql for sql, _ in query._filters) or '1'
+            params = [p for _, values in query._filters for p in values]
+
+            if query._action == 'upsert':
+                if not query._rows:
+                    return StandInResponse([])
+                columns = list(dict.fromkeys(c for row in query._rows for c in row))
+                missing = [c for c in query._on_conflict if c not in columns]
+                if missing:
+                    raise StandInAPIError(f"on_conflict columns {missing} not in payload")
+                self._ensure_table(query._table, columns, query._on_conflict)
+                updates = ', '.join(f"{_quote(c)} = excluded.{_quote(c)}" for c in columns if c not in query._on_conflict)
+                sql = (
+                    f"INSERT INTO {_quote(query._table)} ({', '.join(_quote(c) for c in columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))}) "
+                    f"ON CONFLICT ({', '.join(_quote(c) for c in query._on_conflict)}) "
+                    + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+                )
+                self.conn.executemany(sql, [[_sqlite_value(row.get(c)) for c in columns] for row in query._rows])
+                self.conn.commit()
+                self.stats['rows_upserted'] += len(query._rows)
+                return StandInResponse(query._rows)
+
+            if not self._columns(query._table):
+                return StandInResponse([], 0 if query._count else None)
+
+            if query._action == 'delete':
+                if not query._filters:
+                    raise StandInAPIError("DELETE requires a filter")
+                deleted = self.conn.execute(f"DELETE FROM {_quote(query._table)} WHERE {where}", params).rowcount
+                self.conn.commit()
+                self.stats['rows_deleted'] += deleted
+                return StandInResponse([])
+
+            if query._action == 'select':
+                count = None
+                if query._count:
+                    count = self.conn.execute(f"SELECT COUNT(*) FROM {_quote(query._table)} WHERE {where}", params).fetchone()[0]
+                limit = f" LIMIT {int(query._limit)}" if query._limit is not None else ''
+                rows = self.conn.execute(f"SELECT * FROM {_quote(query._table)} WHERE {where}{limit}", params).fetchall()
+                return StandInResponse([dict(row) for row in rows], count)
+
+            raise StandInAPIError(f"Unsupported request: {query._action}")
+
+
+class _RpcCall:
+    """rpc() is recorded but not executed (the stand-in has no Postgres functions)."""
+
+    def __init__(self, client: LocalSupabaseClient, name: str):
+        self._client = client
+        self._name = name
+
+    def execute(self) -> StandInResponse:
+        with self._client._lock:
+            self._client._request()
+            self._client.stats['rpc_calls'] += 1
+        return StandInResponse([])
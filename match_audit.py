@@ -10,6 +10,7 @@ import csv
 import os
 import sqlite3
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field, asdict
@@ -48,11 +49,30 @@ class MatchAuditLogger:
         audit = MatchAuditLogger()
         audit.log_group(group_id, ...)
         audit.export_csv("audit_2024.csv")
+        
+        # Many decisions: one transaction instead of one per entry
+        with audit.deferred_writes():
+            audit.log_match(...)
+    """
+    
+    UPSERT_SQL = """
+        INSERT INTO match_audit_v2 
+        (group_id, seat_college_name, seat_state, seat_address,
+         matched_college_id, master_college_name, master_state, master_address,
+         confidence, name_similarity, status, reason, model, record_count, timestamp, batch_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(group_id, status) DO UPDATE SET
+            matched_college_id = excluded.matched_college_id,
+            confidence = excluded.confidence,
+            name_similarity = excluded.name_similarity,
+            reason = excluded.reason,
+            timestamp = excluded.timestamp
     """
     
     def __init__(self, db_path: str = 'data/sqlite/match_audit.db'):
         self.db_path = db_path
         self.entries: List[MatchAuditEntry] = []
+        self._deferred: Optional[List[tuple]] = None  # Buffered rows inside deferred_writes()
         self._init_db()
     
     def _init_db(self):
@@ -133,28 +153,39 @@ class MatchAuditLogger:
     
     def _save_entry(self, entry: MatchAuditEntry, batch_id: str = ""):
         """Save entry to database using UPSERT (group_id + status unique)."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO match_audit_v2 
-            (group_id, seat_college_name, seat_state, seat_address,
-             matched_college_id, master_college_name, master_state, master_address,
-             confidence, name_similarity, status, reason, model, record_count, timestamp, batch_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(group_id, status) DO UPDATE SET
-                matched_college_id = excluded.matched_college_id,
-                confidence = excluded.confidence,
-                name_similarity = excluded.name_similarity,
-                reason = excluded.reason,
-                timestamp = excluded.timestamp
-        """, (
+        params = (
             entry.group_id, entry.seat_college_name, entry.seat_state, entry.seat_address,
             entry.matched_college_id, entry.master_college_name, entry.master_state, entry.master_address,
             entry.confidence, entry.name_similarity, entry.status, entry.reason,
             entry.model, entry.record_count, entry.timestamp, batch_id
-        ))
+        )
+        if self._deferred is not None:
+            self._deferred.append(params)
+            return
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(self.UPSERT_SQL, params)
         conn.commit()
         conn.close()
     
+    @contextmanager
+    def deferred_writes(self):
+        """Buffer log_match() writes and persist them in one transaction on exit."""
+        if self._deferred is not None:
+            yield  # Already buffering (nested use)
+            return
+        
+        self._deferred = []
+        try:
+            yield
+        finally:
+            rows, self._deferred = self._deferred, None
+            if rows:
+                conn = sqlite3.connect(self.db_path)
+                conn.executemany(self.UPSERT_SQL, rows)  # In order, so upserts resolve as before
+                conn.commit()
+                conn.close()
+    
     def export_csv(
         self,
         filepath: str = None,
@@ -6,13 +6,30 @@ Provides async/sync access to OpenRouter LLM models for entity matching.
 
 import os
 import json
+import time
+import random
+import asyncio
 import logging
+import threading
 import httpx
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# httpcore's async pool rescans every connection per request event, which turns
+# quadratic with large pools; split async connections into small pools instead
+ASYNC_LANE_CONNECTIONS = 8
+
 
 @dataclass
 class OpenRouterResponse:
@@ -23,6 +40,58 @@ class OpenRouterResponse:
     raw: Dict[str, Any]
 
 
+class KeyRateLimiter:
+    """
+    Per-API-key pacing for asyncio callers (never blocks the event loop).
+    
+    Requests are spaced by 1/requests_per_second (unlimited if None). A 429
+    puts the whole key into a cooldown (Retry-After or exponential backoff)
+    so concurrent requests on that key wait instead of hammering it.
+    """
+    
+    def __init__(self, requests_per_second: Optional[float] = None):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = 0.0
+        self._cooldown_until = 0.0
+        self._consecutive_429 = 0
+    
+    async def acquire(self):
+        """Wait (asynchronously) until this key may send the next request."""
+        while True:
+            now = time.monotonic()
+            if self._cooldown_until > now:
+                await asyncio.sleep(self._cooldown_until - now)
+                continue
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval  # reserve before yielding
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            if self._cooldown_until <= time.monotonic():
+                return
+            # Key hit a 429 while we waited for our slot - wait out the cooldown
+    
+    def rate_limited(self, retry_after: Optional[float] = None, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
+        """Record a 429; returns the cooldown applied to the key."""
+        self._consecutive_429 += 1
+        if retry_after is None:
+            retry_after = min(max_delay, base_delay * (2 ** (self._consecutive_429 - 1)))
+            retry_after *= 1 + random.random() * 0.25  # jitter so keys don't resync
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+        return retry_after
+    
+    def succeeded(self):
+        self._consecutive_429 = 0
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header (seconds), if present."""
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
 class OpenRouterClient:
     """
     Client for OpenRouter API with support for free models.
@@ -33,6 +102,15 @@ class OpenRouterClient:
             model="google/gemini-2.0-flash-exp:free",
             messages=[{"role": "user", "content": "Hello"}]
         )
+        
+        # Hundreds of requests from one event loop (pooled connections)
+        responses = asyncio.run(client.complete_many(
+            [{"messages": [...]}, ...], concurrency=64
+        ))
+    
+    One pooled keep-alive connection set is kept per client (HTTP/2 when the
+    'h2' package is installed). Set OPENROUTER_BASE_URL (or base_url) to point
+    at a local mock server (see openrouter_mock_server.py).
     """
     
     BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -54,13 +132,23 @@ class OpenRouterClient:
         "gpt20b": "openai/gpt-oss-20b:free",
     }
     
-    def __init__(self, api_key: Optional[str] = None, timeout: float = 120.0):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: float = 120.0,
+        base_url: Optional[str] = None,
+        max_connections: int = 32,
+        requests_per_second: Optional[float] = None,
+    ):
         """
         Initialize OpenRouter client.
         
         Args:
             api_key: OpenRouter API key. Falls back to OPENROUTER_API_KEY env var.
             timeout: Request timeout in seconds (default 120s for large contexts).
+            base_url: Chat completions URL override (default: OPENROUTER_BASE_URL env var or BASE_URL).
+            max_connections: Connection pool bound (shared by all threads / tasks using this client).
+            requests_per_second: Optional per-key pacing for the async batch API.
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
@@ -74,6 +162,115 @@ class OpenRouterClient:
             "HTTP-Referer": "https://github.com/your-repo",  # Required by OpenRouter
             "X-Title": "CourseStandardizer-AgenticMatcher",
         }
+        self.base_url = base_url or os.getenv("OPENROUTER_BASE_URL") or self.BASE_URL
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30.0,
+        )
+        self.rate_limiter = KeyRateLimiter(requests_per_second)
+        
+        # Long-lived transports (created lazily; httpx.Client is thread-safe,
+        # AsyncClient is bound to the event loop that created it)
+        self._client: Optional[httpx.Client] = None
+        self._client_pid: Optional[int] = None
+        self._client_lock = threading.Lock()
+        self._async_lanes: List[httpx.AsyncClient] = []
+        self._async_lane_index = 0
+        self._async_loop = None
+    
+    # ------------------------------------------------------------------
+    # Pooled transports
+    # ------------------------------------------------------------------
+    
+    def _get_client(self) -> httpx.Client:
+        """Shared keep-alive client (recreated after fork - sockets aren't shareable)."""
+        pid = os.getpid()
+        if self._client is None or self._client_pid != pid:
+            with self._client_lock:
+                if self._client is None or self._client_pid != pid:
+                    self._client = httpx.Client(
+                        headers=self._headers,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=HTTP2_AVAILABLE,
+                    )
+                    self._client_pid = pid
+        return self._client
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Pooled async client for the running event loop (lanes picked round-robin)."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop or not self._async_lanes or self._async_lanes[0].is_closed:
+            max_connections = self.limits.max_connections or ASYNC_LANE_CONNECTIONS
+            lane_count = max(1, -(-max_connections // ASYNC_LANE_CONNECTIONS))
+            lane_limits = httpx.Limits(
+                max_connections=min(max_connections, ASYNC_LANE_CONNECTIONS),
+                max_keepalive_connections=min(max_connections, ASYNC_LANE_CONNECTIONS),
+                keepalive_expiry=self.limits.keepalive_expiry,
+            )
+            self._async_lanes = [
+                httpx.AsyncClient(
+                    headers=self._headers,
+                    timeout=self.timeout,
+                    limits=lane_limits,
+                    http2=HTTP2_AVAILABLE,
+                )
+                for _ in range(lane_count)
+            ]
+            self._async_loop = loop
+        self._async_lane_index = (self._async_lane_index + 1) % len(self._async_lanes)
+        return self._async_lanes[self._async_lane_index]
+    
+    def close(self):
+        """Close the pooled sync transport."""
+        with self._client_lock:
+            if self._client is not None and self._client_pid == os.getpid():
+                self._client.close()
+            self._client = None
+    
+    async def aclose(self):
+        """Close the pooled async transport (call from its event loop)."""
+        lanes, self._async_lanes = self._async_lanes, []
+        self._async_loop = None
+        for lane in lanes:
+            await lane.aclose()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict] = None,
+        stream: bool = False,
+    ) -> Dict[str, Any]:
+        payload = {
+            "model": model or self.MODELS["primary"],
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if response_format:
+            payload["response_format"] = response_format
+        if stream:
+            payload["stream"] = True
+        return payload
+    
+    @staticmethod
+    def _parse_response(data: Dict[str, Any], model: str) -> OpenRouterResponse:
+        return OpenRouterResponse(
+            content=data["choices"][0]["message"]["content"],
+            model=data.get("model", model),
+            usage=data.get("usage", {}),
+            raw=data,
+        )
     
     def complete(
         self,
@@ -97,37 +294,13 @@ class OpenRouterClient:
         Returns:
             OpenRouterResponse with content and metadata.
         """
-        model = model or self.MODELS["primary"]
-        
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-        
-        if response_format:
-            payload["response_format"] = response_format
-        
-        
+        payload = self._build_payload(messages, model, temperature, max_tokens, response_format)
         request_timeout = timeout if timeout is not None else self.timeout
         
         try:
-            with httpx.Client(timeout=request_timeout) as client:
-                response = client.post(
-                    self.BASE_URL,
-                    headers=self._headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                return OpenRouterResponse(
-                    content=data["choices"][0]["message"]["content"],
-                    model=data.get("model", model),
-                    usage=data.get("usage", {}),
-                    raw=data,
-                )
+            response = self._get_client().post(self.base_url, json=payload, timeout=request_timeout)
+            response.raise_for_status()
+            return self._parse_response(response.json(), payload["model"])
                 
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenRouter API error: {e.response.status_code} - {e.response.text}")
@@ -150,9 +323,9 @@ class OpenRouterClient:
         Completion with retry logic and fallback to secondary model.
         
         If primary model is rate limited, falls back to Llama 3.3 70B.
+        Blocks the calling thread while backing off; asyncio callers should
+        use complete_with_retry_async / complete_many instead.
         """
-        import time
-        
         models_to_try = [
             model or self.MODELS["primary"],
             self.MODELS["fallback"],
@@ -202,35 +375,102 @@ class OpenRouterClient:
         temperature: float = 0.1,
         max_tokens: int = 8192,
         timeout: Optional[float] = None,
+        response_format: Optional[Dict] = None,
     ) -> OpenRouterResponse:
-        """Async version of complete()."""
-        model = model or self.MODELS["primary"]
+        """Async version of complete() (pooled connection, one per event loop)."""
+        payload = self._build_payload(messages, model, temperature, max_tokens, response_format)
+        request_timeout = timeout if timeout is not None else self.timeout
         
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "max_tokens": max_tokens,
-        }
+        response = await self._get_async_client().post(self.base_url, json=payload, timeout=request_timeout)
+        response.raise_for_status()
+        return self._parse_response(response.json(), payload["model"])
+    
+    async def complete_with_retry_async(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = None,
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: Optional[float] = None,
+        response_format: Optional[Dict] = None,
+    ) -> OpenRouterResponse:
+        """
+        complete_async with per-key pacing, non-blocking backoff and the same
+        fallback-model switch as complete_with_retry.
         
-        request_timeout = timeout if timeout is not None else self.timeout
+        A 429 cools down the whole key (Retry-After honoured); 5xx and
+        transport errors back off with jitter. Auth errors (401/403) or
+        exhausted retries move on to the fallback model; other HTTP errors raise.
+        """
+        models_to_try = [
+            model or self.MODELS["primary"],
+            self.MODELS["fallback"],
+        ]
         
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
-            response = await client.post(
-                self.BASE_URL,
-                headers=self._headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        last_error = None
+        
+        for idx, current_model in enumerate(models_to_try):
+            if idx > 0:
+                logger.info(f"Switching to fallback model {current_model} in 2 seconds...")
+                await asyncio.sleep(2.0)
             
-            return OpenRouterResponse(
-                content=data["choices"][0]["message"]["content"],
-                model=data.get("model", model),
-                usage=data.get("usage", {}),
-                raw=data,
-            )
+            for attempt in range(max_retries + 1):
+                await self.rate_limiter.acquire()
+                try:
+                    result = await self.complete_async(
+                        messages, model=current_model, temperature=temperature, max_tokens=max_tokens,
+                        timeout=timeout, response_format=response_format,
+                    )
+                    self.rate_limiter.succeeded()
+                    return result
+                except httpx.HTTPStatusError as e:
+                    last_error = e
+                    status = e.response.status_code
+                    if status in (401, 403):
+                        logger.warning(f"Auth error on {current_model}, trying fallback...")
+                        break
+                    if status not in RETRYABLE_STATUS:
+                        raise
+                    if attempt == max_retries:
+                        break
+                    if status == 429:
+                        wait = self.rate_limiter.rate_limited(_retry_after_seconds(e.response), base_delay=retry_delay)
+                        logger.debug(f"Rate limited on {current_model}, key cooling down {wait:.1f}s")
+                    else:
+                        await asyncio.sleep(retry_delay * (2 ** attempt) * (1 + random.random() * 0.25))
+                except (httpx.TransportError, asyncio.TimeoutError) as e:
+                    last_error = e
+                    if attempt == max_retries:
+                        break
+                    await asyncio.sleep(retry_delay * (2 ** attempt) * (1 + random.random() * 0.25))
+        
+        raise last_error or Exception("All models failed")
+    
+    async def complete_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        concurrency: int = 16,
+        max_retries: int = 3,
+        return_exceptions: bool = True,
+    ) -> List[Union[OpenRouterResponse, BaseException]]:
+        """
+        Run many completions concurrently on this key from one event loop.
+        
+        Args:
+            requests: kwargs dicts for complete_async (messages, model, temperature, ...)
+            concurrency: Maximum in-flight requests
+            max_retries: Default retries per request (a request's own max_retries wins)
+            return_exceptions: Put exceptions in the result list instead of raising
+        
+        Returns:
+            Responses (or exceptions) in the same order as requests.
+        """
+        return await complete_many_across_keys(
+            [self], requests, concurrency_per_key=concurrency,
+            max_retries=max_retries, return_exceptions=return_exceptions,
+        )
     
     def complete_stream(
         self,
@@ -259,47 +499,37 @@ class OpenRouterClient:
             for chunk in client.complete_stream(messages, model):
                 print(chunk, end='', flush=True)
         """
-        model = model or self.MODELS["primary"]
-        
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": True,  # Enable streaming
-        }
-        
+        payload = self._build_payload(messages, model, temperature, max_tokens, stream=True)
         request_timeout = timeout if timeout is not None else self.timeout
         
         try:
-            with httpx.Client(timeout=request_timeout) as client:
-                with client.stream(
-                    "POST",
-                    self.BASE_URL,
-                    headers=self._headers,
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
+            with self._get_client().stream(
+                "POST",
+                self.base_url,
+                json=payload,
+                timeout=request_timeout,
+            ) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
                     
-                    for line in response.iter_lines():
-                        if not line:
-                            continue
+                    # SSE format: "data: {...}"
+                    if line.startswith("data: "):
+                        data_str = line[6:]  # Remove "data: " prefix
+                        
+                        if data_str.strip() == "[DONE]":
+                            break
                         
-                        # SSE format: "data: {...}"
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-                            
-                            if data_str.strip() == "[DONE]":
-                                break
-                            
-                            try:
-                                data = json.loads(data_str)
-                                delta = data.get("choices", [{}])[0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                            except json.JSONDecodeError:
-                                continue  # Skip malformed chunks
+                        try:
+                            data = json.loads(data_str)
+                            delta = data.get("choices", [{}])[0].get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue  # Skip malformed chunks
                                 
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenRouter streaming error: {e.response.status_code}")
@@ -313,6 +543,40 @@ class OpenRouterClient:
         return self.MODELS.copy()
 
 
+async def complete_many_across_keys(
+    clients: Sequence[OpenRouterClient],
+    requests: Sequence[Dict[str, Any]],
+    concurrency_per_key: int = 8,
+    max_retries: int = 3,
+    return_exceptions: bool = True,
+) -> List[Union[OpenRouterResponse, BaseException]]:
+    """
+    Fan requests out over several API keys from a single event loop.
+    
+    Requests are assigned round-robin to clients; each key gets its own
+    in-flight bound, pacing and 429 cooldown (KeyRateLimiter), so one
+    throttled key does not stall the others.
+    
+    Returns:
+        Responses (or exceptions, if return_exceptions) in request order.
+    """
+    if not clients:
+        raise ValueError("At least one OpenRouterClient is required")
+    
+    semaphores = [asyncio.Semaphore(max(1, concurrency_per_key)) for _ in clients]
+    
+    async def run(index: int, request: Dict[str, Any]):
+        key_index = index % len(clients)
+        async with semaphores[key_index]:
+            # A request's own max_retries wins over the batch default
+            return await clients[key_index].complete_with_retry_async(**{'max_retries': max_retries, **request})
+    
+    return await asyncio.gather(
+        *(run(i, request) for i, request in enumerate(requests)),
+        return_exceptions=return_exceptions,
+    )
+
+
 # Quick test
 if __name__ == "__main__":
     client = OpenRouterClient()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Local mock of the OpenRouter chat completions endpoint.
+
+Lets OpenRouterClient (and everything built on it) run and be benchmarked
+offline. Responses echo a small JSON body after a configurable latency;
+a fraction of requests can be answered with 429 + Retry-After to exercise
+backoff. Keep-alive (HTTP/1.1) is supported and new TCP connections are
+counted, so connection reuse is visible.
+
+Usage:
+    python openrouter_mock_server.py --port 8765 --latency 0.2
+    OPENROUTER_BASE_URL=http://127.0.0.1:8765/api/v1/chat/completions python agentic_matcher.py ...
+
+    # In code / tests
+    with MockOpenRouterServer(latency=0.05) as server:
+        client = OpenRouterClient(api_key="test", base_url=server.url)
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def setup(self):
+        super().setup()
+        self.server.stats_increment('connections')
+
+    def log_message(self, format, *args):
+        pass  # Quiet
+
+    def _send_json(self, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "invalid JSON"}})
+            return
+
+        self.server.stats_increment('requests')
+        if self.server.rate_limit_ratio and random.random() < self.server.rate_limit_ratio:
+            self.server.stats_increment('rate_limited')
+            self._send_json(429, {"error": {"message": "rate limited"}},
+                            {"Retry-After": str(self.server.retry_after)})
+            return
+
+        time.sleep(self.server.latency)
+
+        messages = payload.get("messages", [])
+        prompt = messages[-1].get("content", "") if messages else ""
+        content = json.dumps({"echo": prompt[:80], "decisions": []})
+        self._send_json(200, {
+            "id": f"mock-{self.server.stats['requests']}",
+            "model": payload.get("model", "mock/model"),
+            "choices": [{"message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4},
+        })
+
+
+class MockOpenRouterServer(ThreadingHTTPServer):
+    """Threaded mock server; use as a context manager to run it in the background."""
+
+    daemon_threads = True
+    request_queue_size = 512  # Many concurrent connects during benchmarks
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.05,
+                 rate_limit_ratio: float = 0.0, retry_after: float = 0.1):
+        super().__init__((host, port), _MockHandler)
+        self.latency = latency
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.stats = {'connections': 0, 'requests': 0, 'rate_limited': 0}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/v1/chat/completions"
+
+    def stats_increment(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats = {key: 0 for key in self.stats}
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock OpenRouter chat completions server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.2, help="Seconds per completion")
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument('--retry-after', type=float, default=1.0, help="Retry-After seconds on 429")
+    args = parser.parse_args()
+
+    server = MockOpenRouterServer(args.host, args.port, args.latency, args.rate_limit_ratio, args.retry_after)
+    print(f"Mock OpenRouter listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stats: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ from typing import List, Dict, Optional, Tuple
 import os
 from pathlib import Path
 
+from embedding_store import get_embedding_store
+
 class SemanticMatcher:
     """
     Uses Sentence Transformers to create semantic embeddings
@@ -57,12 +59,15 @@ class SemanticMatcher:
         # Extract college names
         college_names = [college.get('name', '') for college in colleges_data]
 
-        # Generate embeddings
-        embeddings = self.model.encode(
+        # Generate embeddings (shared persistent store - only new names are encoded)
+        embeddings = get_embedding_store(self.model_name).encode(
             college_names,
-            show_progress_bar=True,
-            convert_to_tensor=False,
-            batch_size=32
+            lambda texts: self.model.encode(
+                texts,
+                show_progress_bar=True,
+                convert_to_tensor=False,
+                batch_size=32
+            )
         )
 
         # Store
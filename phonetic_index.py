@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Shared Phonetic-Key Index for Master Colleges
+
+Phonetic checks (MultiStageFilter blocking, AdvancedSQLiteMatcher phonetic
+fallback, the council's Phonetic Listener, CrossGroupValidator) used to run
+jellyfish on the master side of every comparison, once per query. Codes only
+depend on the text, so they are computed once per process here:
+
+- phonetic_code / phonetic_keys / token_codes: memoized soundex / metaphone /
+  NYSIIS codes of texts and of their words (query-side codes are cached the
+  same way)
+- PhoneticIndex: built once per master load - whole-name keys plus per-token
+  codes (for the algorithms a caller asks for), with inverted indexes code ->
+  college keys. "Which colleges share a phonetic key with this name" becomes a
+  few dict lookups instead of a loop over every candidate (and every word pair).
+
+Usage:
+    from phonetic_index import PhoneticIndex, phonetic_keys, token_soundex_set
+
+    index = PhoneticIndex.build((college['id'], college['name']) for college in colleges)
+    index.name_matches(phonetic_keys("GOVT MEDICAL COLEGE KOTA"))   # -> {college_id, ...}
+    index.candidates("GOVT MEDICAL COLEGE KOTA", min_shared=2)      # -> {college_id: shared tokens}
+
+    # Whole-name lookups only (no token postings)
+    PhoneticIndex.build(items, token_algorithms=())
+
+    # Any soundex-equal word (len >= 4) between two names
+    not token_soundex_set(name1).isdisjoint(token_soundex_set(name2))
+"""
+
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, Iterable, NamedTuple, Optional, Set, Tuple
+
+try:
+    import jellyfish
+    JELLYFISH_AVAILABLE = True
+except ImportError:
+    JELLYFISH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PHONETIC_ALGORITHMS = ('soundex', 'metaphone', 'nysiis')
+
+
+class PhoneticKeys(NamedTuple):
+    """Soundex, Metaphone and NYSIIS codes of one text ('' when unavailable)"""
+    soundex: str
+    metaphone: str
+    nysiis: str
+
+
+@lru_cache(maxsize=262144)
+def phonetic_code(text: str, algorithm: str = 'metaphone') -> str:
+    """Memoized jellyfish code of `text` ('' for empty text or without jellyfish)"""
+    if not text or not JELLYFISH_AVAILABLE:
+        return ''
+    return getattr(jellyfish, algorithm)(text)
+
+
+def phonetic_keys(text: str) -> PhoneticKeys:
+    """All three codes of `text` (each memoized)"""
+    return PhoneticKeys(*(phonetic_code(text, algorithm) for algorithm in PHONETIC_ALGORITHMS))
+
+
+@lru_cache(maxsize=65536)
+def token_codes(text: str, algorithm: str = 'soundex', min_len: int = 4) -> FrozenSet[str]:
+    """Codes of the upper-cased words of `text` with at least `min_len` characters (empty without jellyfish)"""
+    codes = (phonetic_code(word, algorithm) for word in text.upper().split() if len(word) >= min_len)
+    return frozenset(code for code in codes if code)
+
+
+def token_soundex_set(text: str, min_len: int = 4) -> FrozenSet[str]:
+    """Soundex codes of the words of `text` with at least `min_len` characters"""
+    return token_codes(text, 'soundex', min_len)
+
+
+class PhoneticIndex:
+    """
+    Master-side phonetic index keyed by caller-chosen college keys.
+
+    Args:
+        min_token_len: Shorter words are not indexed as tokens (they carry
+            little signal and match everything phonetically)
+        token_algorithms: Algorithms whose per-token postings are built (what
+            candidates() can be asked for); () indexes whole names only
+    """
+
+    def __init__(self, min_token_len: int = 3, token_algorithms: Iterable[str] = PHONETIC_ALGORITHMS):
+        self.min_token_len = min_token_len
+        self._name_keys: Dict[Hashable, PhoneticKeys] = {}
+        # algorithm -> whole-name code -> college keys
+        self._name_postings: Dict[str, Dict[str, Set[Hashable]]] = {a: {} for a in PHONETIC_ALGORITHMS}
+        # algorithm -> token code -> college keys
+        self._token_postings: Dict[str, Dict[str, Set[Hashable]]] = {a: {} for a in token_algorithms}
+
+    @classmethod
+    def build(cls, items: Iterable[Tuple[Hashable, str]], min_token_len: int = 3,
+              token_algorithms: Iterable[str] = PHONETIC_ALGORITHMS) -> 'PhoneticIndex':
+        """Index (key, name) pairs"""
+        index = cls(min_token_len=min_token_len, token_algorithms=token_algorithms)
+        for key, name in items:
+            index.add(key, name)
+        logger.debug(f"Phonetic index: {len(index)} names, "
+                     f"{sum(len(p) for p in index._token_postings.values())} token codes")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._name_keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._name_keys
+
+    def add(self, key: Hashable, name: str, name_keys: Optional[PhoneticKeys] = None):
+        """
+        Index one name.
+
+        Args:
+            key: College key returned by lookups
+            name: Name whose tokens are indexed
+            name_keys: Whole-name codes, if the caller derives them differently
+                (e.g. from its own normalization); defaults to phonetic_keys(name)
+        """
+        name = name or ''
+        name_keys = PhoneticKeys(*name_keys) if name_keys is not None else phonetic_keys(name)
+        self._name_keys[key] = name_keys
+        for algorithm, code in zip(PHONETIC_ALGORITHMS, name_keys):
+            if code:
+                self._name_postings[algorithm].setdefault(code, set()).add(key)
+
+        for algorithm, postings in self._token_postings.items():
+            for code in token_codes(name, algorithm, self.min_token_len):
+                postings.setdefault(code, set()).add(key)
+
+    def keys_of(self, key: Hashable) -> Optional[PhoneticKeys]:
+        """Whole-name codes stored for a college key"""
+        return self._name_keys.get(key)
+
+    def name_matches(self, query_keys: PhoneticKeys) -> Set[Hashable]:
+        """College keys sharing any non-empty whole-name code with `query_keys`"""
+        matches: Set[Hashable] = set()
+        for algorithm, code in zip(PHONETIC_ALGORITHMS, query_keys):
+            if code:
+                matches |= self._name_postings[algorithm].get(code, set())
+        return matches
+
+    def candidates(self, query: str, min_shared: int = 1, algorithm: str = 'metaphone') -> Dict[Hashable, int]:
+        """
+        College keys sharing at least `min_shared` phonetic tokens with `query`.
+
+        Returns:
+            {college key: number of distinct query token codes it shares}
+        """
+        postings = self._token_postings.get(algorithm)
+        if postings is None:
+            raise ValueError(f"no {algorithm} token postings (index built with {tuple(self._token_postings)})")
+        counts: Counter = Counter()
+        for code in token_codes(query or '', algorithm, self.min_token_len):
+            keys = postings.get(code)
+            if keys:
+                counts.update(keys)
+        return {key: shared for key, shared in counts.items() if shared >= min_shared}
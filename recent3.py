@@ -50,6 +50,7 @@ from threading import Lock, Condition
 import threading
 from typing import Dict, List, Tuple, Optional, Any, Union, Callable, Set
 from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 import mmap
 import asyncio
@@ -78,6 +79,8 @@ except Exception:
         def nysiis(self, s):
             return ''
     jellyfish = _JellyFallback()
+from phonetic_index import PhoneticIndex, PhoneticKeys, token_soundex_set
+from blocking_index import BlockingIndex
 from collections import defaultdict, Counter
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
@@ -464,6 +467,334 @@ class RedisCache:
 # MEMORY-MAPPED FILE CACHE (ULTRA-FAST DATA ACCESS)
 # ============================================================================
 
+class SnapshotTable(Sequence):
+    """
+    Read-only columnar table inside a ColumnarSnapshot
+
+    Columns are numpy views over the memory-mapped file; strings are indexes into
+    the snapshot's interned string pool. Indexing decodes just that row (once; the
+    same dict is returned on later accesses, so identity-keyed indexes keep working).
+    Rows must not be mutated - use ColumnarSnapshot.materialize() for a writable copy.
+    """
+
+    def __init__(self, snapshot: 'ColumnarSnapshot', name: str, length: int, columns: List[Dict[str, Any]]):
+        self._snapshot = snapshot
+        self.name = name
+        self.length = length
+        self.column_names = [col['name'] for col in columns]
+        self._column_specs = {col['name']: col for col in columns}
+        self._decoded: Dict[str, List[Any]] = {}
+        self._arrays: Optional[List[Tuple[str, str, np.ndarray]]] = None
+        self._rows: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(f"{self.name}: row {index} out of range")
+        row = self._rows.get(index)
+        if row is None:
+            row = self._rows[index] = self._decode_row(index)
+        return row
+
+    def _decode_row(self, index: int) -> Dict[str, Any]:
+        """Decode one row straight from the mapped column buffers"""
+        if self._arrays is None:
+            self._arrays = [
+                (name, spec['kind'], self._snapshot._array(spec, self.length))
+                for name, spec in self._column_specs.items()
+            ]
+        pool = self._snapshot._pool_string
+        row = {}
+        for name, kind, values in self._arrays:
+            value = values[index].item()
+            if kind == 'str':
+                value = None if value < 0 else pool(value)
+            elif kind == 'json':
+                value = json.loads(pool(value))
+            elif kind == 'bool':
+                value = bool(value)
+            row[name] = value
+        return row
+
+    def column(self, name: str) -> List[Any]:
+        """Decode one column to Python values (cached)"""
+        if name not in self._decoded:
+            spec = self._column_specs[name]
+            values = self._snapshot._array(spec, self.length)
+            kind = spec['kind']
+            if kind == 'str':
+                pool = self._snapshot._pool_string
+                self._decoded[name] = [None if idx < 0 else pool(idx) for idx in values.tolist()]
+            elif kind == 'json':
+                pool = self._snapshot._pool_string
+                self._decoded[name] = [json.loads(pool(idx)) for idx in values.tolist()]
+            elif kind == 'bool':
+                self._decoded[name] = values.astype(bool).tolist()
+            else:
+                self._decoded[name] = values.tolist()
+        return self._decoded[name]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize all rows as new dicts (same shape as DataFrame.to_dict('records'))"""
+        names = self.column_names
+        columns = [self.column(name) for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def release(self):
+        """Drop the column views (needed before the snapshot's mmap can be closed)"""
+        self._arrays = None
+
+
+class ColumnarSnapshot:
+    """
+    Columnar, memory-mapped snapshot of master data (replaces pickle in MMapCache)
+
+    Layout: magic | header length | JSON header | 64-byte aligned buffers.
+    - Lists of flat dicts (colleges, courses, aliases, ...) become columnar tables:
+      int64/float64/bool numpy columns, strings as int32 indexes into one interned
+      string pool (each distinct string stored and decoded once)
+    - Everything else is kept as a small JSON skeleton in the header
+
+    Reading maps the file with ACCESS_READ and wraps buffers with np.frombuffer, so
+    worker processes share the pages. view() returns the structure with SnapshotTable
+    in place of each table (rows decoded on first access, read-only); materialize()
+    decodes everything into plain lists of dicts for callers that mutate the rows.
+    """
+
+    MAGIC = b'MCSNAP01'
+    ALIGNMENT = 64
+    TABLE_MARKER = '__snapshot_table__'
+
+    def __init__(self, mapped: mmap.mmap, header: Dict[str, Any]):
+        self._mmap = mapped
+        self._header = header
+        pool = header['pool']
+        self._pool_offsets = np.frombuffer(mapped, dtype=np.int64, count=pool['count'] + 1, offset=pool['offsets_offset'])
+        self._pool_data_offset = pool['data_offset']
+        self._pool_cache: Dict[int, str] = {}
+        self.tables = {
+            name: SnapshotTable(self, name, spec['length'], spec['columns'])
+            for name, spec in header['tables'].items()
+        }
+        self._view = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_table(value: Any) -> bool:
+        """A non-empty list of dicts that all share the same string keys"""
+        if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+            return False
+        keys = list(value[0].keys())
+        if not keys or not all(isinstance(k, str) for k in keys):
+            return False
+        return all(isinstance(row, dict) and list(row.keys()) == keys for row in value)
+
+    @staticmethod
+    def _column_kind(values: List[Any]) -> str:
+        """Pick the narrowest lossless column encoding"""
+        if all(v is None or isinstance(v, str) for v in values):
+            return 'str'
+        if all(isinstance(v, (bool, np.bool_)) for v in values):
+            return 'bool'
+        if all(isinstance(v, (int, np.integer)) and not isinstance(v, (bool, np.bool_)) for v in values):
+            return 'int'
+        if all(isinstance(v, (float, np.floating)) for v in values):
+            return 'float'
+        return 'json'
+
+    @classmethod
+    def write(cls, path: Path, data: Any) -> bool:
+        """
+        Write data as a snapshot (atomically, via a temp file)
+
+        Returns:
+            False if data can't be represented (caller falls back to pickle)
+        """
+        pool_index: Dict[str, int] = {}
+        pool_strings: List[bytes] = []
+        buffers: List[bytes] = []
+        tables: Dict[str, Dict[str, Any]] = {}
+
+        def intern(value: str) -> int:
+            idx = pool_index.get(value)
+            if idx is None:
+                idx = pool_index[value] = len(pool_strings)
+                pool_strings.append(value.encode('utf-8'))
+            return idx
+
+        def add_table(rows: List[Dict[str, Any]]) -> str:
+            name = f"t{len(tables)}"
+            columns = []
+            for col_name in rows[0].keys():
+                values = [row[col_name] for row in rows]
+                kind = cls._column_kind(values)
+                if kind == 'str':
+                    array = np.array([-1 if v is None else intern(v) for v in values], dtype=np.int32)
+                elif kind == 'json':
+                    array = np.array([intern(json.dumps(v)) for v in values], dtype=np.int32)
+                elif kind == 'bool':
+                    array = np.array(values, dtype=np.uint8)
+                elif kind == 'int':
+                    array = np.array(values, dtype=np.int64)
+                else:
+                    array = np.array(values, dtype=np.float64)
+                columns.append({'name': col_name, 'kind': kind, 'dtype': array.dtype.str,
+                                 'buffer': len(buffers)})
+                buffers.append(array.tobytes())
+            tables[name] = {'length': len(rows), 'columns': columns}
+            return name
+
+        def to_skeleton(value: Any) -> Any:
+            if cls._is_table(value):
+                return {cls.TABLE_MARKER: add_table(value)}
+            if isinstance(value, dict):
+                if not all(isinstance(k, str) for k in value):
+                    raise TypeError("snapshot dict keys must be strings")
+                return {k: to_skeleton(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [to_skeleton(v) for v in value]
+            if value is None or isinstance(value, (str, bool, int, float)):
+                return value
+            raise TypeError(f"unsupported snapshot value: {type(value).__name__}")
+
+        try:
+            skeleton = to_skeleton(data)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Data not representable as columnar snapshot: {e}")
+            return False
+
+        pool_offsets = np.zeros(len(pool_strings) + 1, dtype=np.int64)
+        if pool_strings:
+            np.cumsum([len(s) for s in pool_strings], out=pool_offsets[1:])
+        pool_data = b''.join(pool_strings)
+
+        # Assign aligned offsets relative to the end of the header (fixed up below)
+        blobs = [pool_offsets.tobytes(), pool_data] + buffers
+        relative, position = [], 0
+        for blob in blobs:
+            position = -(-position // cls.ALIGNMENT) * cls.ALIGNMENT
+            relative.append(position)
+            position += len(blob)
+
+        def build_header(base: int) -> bytes:
+            header_tables = {
+                name: {'length': spec['length'], 'columns': [
+                    {'name': col['name'], 'kind': col['kind'], 'dtype': col['dtype'],
+                     'offset': base + relative[2 + col['buffer']]}
+                    for col in spec['columns']
+                ]}
+                for name, spec in tables.items()
+            }
+            header = {
+                'version': 1,
+                'skeleton': skeleton,
+                'tables': header_tables,
+                'pool': {'count': len(pool_strings), 'offsets_offset': base + relative[0],
+                         'data_offset': base + relative[1]},
+            }
+            return json.dumps(header).encode('utf-8')
+
+        # Header size depends on the offsets it contains: iterate until stable
+        prefix = len(cls.MAGIC) + 8
+        base = cls.ALIGNMENT
+        while True:
+            header_bytes = build_header(base)
+            needed = -(-(prefix + len(header_bytes)) // cls.ALIGNMENT) * cls.ALIGNMENT
+            if needed <= base:
+                break
+            base = needed
+
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.MAGIC)
+            f.write(len(header_bytes).to_bytes(8, 'little'))
+            f.write(header_bytes)
+            for offset, blob in zip(relative, blobs):
+                f.write(b'\0' * (base + offset - f.tell()))
+                f.write(blob)
+        os.replace(tmp_path, path)
+        return True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def is_snapshot(cls, path: Path) -> bool:
+        """Check the file magic"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(cls.MAGIC)) == cls.MAGIC
+        except OSError:
+            return False
+
+    @classmethod
+    def open(cls, path: Path) -> 'ColumnarSnapshot':
+        """Memory-map a snapshot file (read-only, shared between processes)"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(cls.MAGIC)] != cls.MAGIC:
+            mapped.close()
+            raise ValueError(f"{path} is not a columnar snapshot")
+        header_len = int.from_bytes(mapped[len(cls.MAGIC):len(cls.MAGIC) + 8], 'little')
+        header_start = len(cls.MAGIC) + 8
+        header = json.loads(mapped[header_start:header_start + header_len].decode('utf-8'))
+        return cls(mapped, header)
+
+    def _array(self, spec: Dict[str, Any], length: int) -> np.ndarray:
+        """Zero-copy numpy view of a column buffer"""
+        return np.frombuffer(self._mmap, dtype=np.dtype(spec['dtype']), count=length, offset=spec['offset'])
+
+    def _pool_string(self, idx: int) -> str:
+        """Decode an interned string once; later rows share the same str object"""
+        value = self._pool_cache.get(idx)
+        if value is None:
+            start = self._pool_data_offset + int(self._pool_offsets[idx])
+            end = self._pool_data_offset + int(self._pool_offsets[idx + 1])
+            value = self._pool_cache[idx] = self._mmap[start:end].decode('utf-8')
+        return value
+
+    def _build(self, table_value: Callable[[SnapshotTable], Any]) -> Any:
+        """Rebuild the skeleton, replacing each table marker with table_value(table)"""
+        def build(value: Any) -> Any:
+            if isinstance(value, dict):
+                if set(value) == {self.TABLE_MARKER}:
+                    return table_value(self.tables[value[self.TABLE_MARKER]])
+                return {k: build(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [build(v) for v in value]
+            return value
+        return build(self._header['skeleton'])
+
+    def view(self) -> Any:
+        """Read-only structure backed by the mapped columns (tables are SnapshotTable)"""
+        if self._view is None:
+            self._view = self._build(lambda table: table)
+        return self._view
+
+    def materialize(self) -> Any:
+        """Rebuild the original structure (tables become new, mutable lists of dicts)"""
+        return self._build(lambda table: table.to_records())
+
+    def close(self):
+        """Release the memory map"""
+        for table in self.tables.values():
+            table.release()
+        self._pool_offsets = None
+        self.tables = {}
+        self._view = None
+        self._mmap.close()
+
+
 class MMapCache:
     """
     Memory-Mapped File Cache for ultra-fast zero-copy data access
@@ -472,7 +803,8 @@ class MMapCache:
     - Zero-copy data access (2-5x faster than loading from disk)
     - Shared memory across processes (reduces memory footprint)
     - Persistent cache (survives script restarts)
-    - Automatic cache invalidation on source data changes
+    - Automatic cache invalidation on source data changes (content hash of master tables)
+    - Columnar snapshot format (ColumnarSnapshot); pickle is kept as a fallback
 
     Performance Impact:
     - First load: Creates mmap cache (~100MB for full master data)
@@ -480,18 +812,27 @@ class MMapCache:
     - Memory efficient: Shared across all worker processes
     """
 
-    def __init__(self, cache_dir: str = 'data/mmap_cache', enabled: bool = True):
+    # Master tables whose content decides whether a cache built from master_data.db is stale
+    MASTER_CONTENT_TABLES = (
+        'medical_colleges', 'dental_colleges', 'dnb_colleges', 'courses', 'states',
+        'quotas', 'categories', 'Sources', 'Levels', 'state_college_link', 'state_mappings',
+        'college_aliases', 'course_aliases', 'quota_aliases', 'category_aliases'
+    )
+
+    def __init__(self, cache_dir: str = 'data/mmap_cache', enabled: bool = True, snapshot_format: str = 'columnar'):
         """
         Initialize memory-mapped cache
 
         Args:
             cache_dir: Directory to store mmap cache files
             enabled: Enable/disable mmap caching
+            snapshot_format: 'columnar' (ColumnarSnapshot) or 'pickle'
         """
         self.cache_dir = Path(cache_dir)
         self.enabled = enabled
-        self.mmap_files: Dict[str, Any] = {}  # cache_name -> mmap object
-        self.data_cache: Dict[str, Any] = {}  # cache_name -> unpickled data
+        self.snapshot_format = snapshot_format
+        self.mmap_files: Dict[str, Any] = {}  # cache_name -> open ColumnarSnapshot (lazy readers)
+        self.data_cache: Dict[str, Any] = {}  # cache_name -> loaded data
 
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -506,15 +847,51 @@ class MMapCache:
         return self.cache_dir / f"{cache_name}.meta"
 
     def _calculate_hash(self, source_path: str) -> str:
-        """Calculate hash of source file to detect changes"""
+        """Calculate hash of source file to detect changes
+
+        For a SQLite source, hashes the rows of the core master tables, so in-place
+        UPDATEs invalidate the cache while writes to derived tables (master_embeddings,
+        FTS) don't (see cache_utils.get_master_data_hash). Other files use mtime + size.
+        """
         if not Path(source_path).exists():
             return ""
 
+        content_hash = self._calculate_content_hash(source_path)
+        if content_hash:
+            return content_hash
+
         hasher = hashlib.md5()
         hasher.update(str(Path(source_path).stat().st_mtime).encode())
         hasher.update(str(Path(source_path).stat().st_size).encode())
         return hasher.hexdigest()
 
+    def _calculate_content_hash(self, source_path: str) -> Optional[str]:
+        """Checksum of every row of the master tables; None if not a SQLite DB"""
+        try:
+            conn = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True)
+        except sqlite3.Error:
+            return None
+
+        try:
+            hasher = hashlib.md5()
+            for table in self.MASTER_CONTENT_TABLES:
+                hasher.update(f"|{table}:".encode())
+                try:
+                    cursor = conn.execute(f"SELECT * FROM {table} ORDER BY ROWID")
+                except sqlite3.DatabaseError as e:
+                    if 'no such table' not in str(e):
+                        return None  # Not a SQLite database
+                    continue
+                while True:
+                    rows = cursor.fetchmany(10000)
+                    if not rows:
+                        break
+                    for row in rows:
+                        hasher.update(repr(row).encode())
+            return 'content:' + hasher.hexdigest()
+        finally:
+            conn.close()
+
     def _is_cache_valid(self, cache_name: str, source_path: Optional[str] = None) -> bool:
         """Check if cache is valid (exists and not stale)"""
         cache_path = self._get_cache_path(cache_name)
@@ -548,7 +925,7 @@ class MMapCache:
 
         Args:
             cache_name: Name of cache (e.g., 'colleges', 'courses')
-            data: Data to cache (will be pickled)
+            data: Data to cache (columnar snapshot, or pickled if not representable)
             source_path: Optional source file path for invalidation tracking
         """
         if not self.enabled:
@@ -556,14 +933,19 @@ class MMapCache:
 
         try:
             cache_path = self._get_cache_path(cache_name)
+            self._close_snapshot(cache_name)
 
-            # Serialize data
-            pickled_data = pickle.dumps(data)
-            data_size = len(pickled_data)
+            cache_format = 'pickle'
+            if self.snapshot_format == 'columnar' and ColumnarSnapshot.write(cache_path, data):
+                cache_format = 'columnar'
+            else:
+                # Serialize data
+                pickled_data = pickle.dumps(data)
 
-            # Write to file
-            with open(cache_path, 'wb') as f:
-                f.write(pickled_data)
+                # Write to file
+                with open(cache_path, 'wb') as f:
+                    f.write(pickled_data)
+            data_size = cache_path.stat().st_size
 
             # Write metadata
             if source_path:
@@ -571,24 +953,28 @@ class MMapCache:
                     'source_path': str(source_path),
                     'source_hash': self._calculate_hash(source_path),
                     'created_at': datetime.now().isoformat(),
-                    'size_bytes': data_size
+                    'size_bytes': data_size,
+                    'format': cache_format
                 }
 
                 with open(self._get_metadata_path(cache_name), 'w') as f:
                     json.dump(metadata, f, indent=2)
 
-            logger.info(f"✅ Created mmap cache '{cache_name}' ({data_size / 1024 / 1024:.2f} MB)")
+            logger.info(f"✅ Created mmap cache '{cache_name}' ({data_size / 1024 / 1024:.2f} MB, {cache_format})")
 
         except Exception as e:
             logger.warning(f"Failed to create mmap cache '{cache_name}': {e}")
 
-    def get_data(self, cache_name: str, source_path: Optional[str] = None) -> Optional[Any]:
+    def get_data(self, cache_name: str, source_path: Optional[str] = None, read_only: bool = False) -> Optional[Any]:
         """
         Get data from memory-mapped cache (zero-copy)
 
         Args:
             cache_name: Name of cache
             source_path: Optional source file path for validation
+            read_only: Return the lazy ColumnarSnapshot.view() (tables read straight
+                from the shared mapping) instead of a materialized, mutable copy.
+                Pickle caches are always materialized.
 
         Returns:
             Cached data or None if cache miss/invalid
@@ -596,6 +982,12 @@ class MMapCache:
         if not self.enabled:
             return None
 
+        if read_only:
+            snapshot = self.get_snapshot(cache_name, source_path)
+            if snapshot is not None:
+                logger.info(f"✅ Mapped mmap cache '{cache_name}' (columnar snapshot, read-only)")
+                return snapshot.view()
+
         # Check in-memory cache first
         if cache_name in self.data_cache:
             return self.data_cache[cache_name]
@@ -608,6 +1000,17 @@ class MMapCache:
         try:
             cache_path = self._get_cache_path(cache_name)
 
+            if ColumnarSnapshot.is_snapshot(cache_path):
+                # Columnar snapshot: mutable rows rebuilt from the mapped columns, strings decoded once
+                snapshot = ColumnarSnapshot.open(cache_path)
+                try:
+                    data = snapshot.materialize()
+                finally:
+                    snapshot.close()
+                self.data_cache[cache_name] = data
+                logger.info(f"✅ Loaded mmap cache '{cache_name}' (columnar snapshot)")
+                return data
+
             # Memory-map the file
             with open(cache_path, 'rb') as f:
                 # Create memory map (zero-copy)
@@ -629,6 +1032,44 @@ class MMapCache:
             logger.warning(f"Failed to load mmap cache '{cache_name}': {e}")
             return None
 
+    def get_snapshot(self, cache_name: str, source_path: Optional[str] = None) -> Optional[ColumnarSnapshot]:
+        """
+        Open a columnar snapshot for lazy, read-only access (kept open for reuse)
+
+        Returns:
+            ColumnarSnapshot or None if disabled, missing, stale or pickle-format
+        """
+        if not self.enabled:
+            return None
+
+        if cache_name in self.mmap_files:
+            return self.mmap_files[cache_name]
+
+        if not self._is_cache_valid(cache_name, source_path):
+            logger.debug(f"Cache '{cache_name}' is invalid or stale")
+            return None
+
+        cache_path = self._get_cache_path(cache_name)
+        if not ColumnarSnapshot.is_snapshot(cache_path):
+            return None
+
+        try:
+            snapshot = ColumnarSnapshot.open(cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to open mmap snapshot '{cache_name}': {e}")
+            return None
+        self.mmap_files[cache_name] = snapshot
+        return snapshot
+
+    def _close_snapshot(self, cache_name: str):
+        """Release the memory map of an open snapshot"""
+        snapshot = self.mmap_files.pop(cache_name, None)
+        if snapshot is not None:
+            try:
+                snapshot.close()
+            except BufferError:
+                pass  # Rows/column views still referenced; mapping is freed with them
+
     def invalidate(self, cache_name: str):
         """Invalidate and delete a cache"""
         if not self.enabled:
@@ -647,6 +1088,7 @@ class MMapCache:
             # Remove from memory
             if cache_name in self.data_cache:
                 del self.data_cache[cache_name]
+            self._close_snapshot(cache_name)
 
             logger.info(f"Invalidated cache: {cache_name}")
 
@@ -666,6 +1108,8 @@ class MMapCache:
                 meta_file.unlink()
 
             self.data_cache.clear()
+            for cache_name in list(self.mmap_files):
+                self._close_snapshot(cache_name)
 
             logger.info("Invalidated all mmap caches")
 
@@ -1090,6 +1534,10 @@ class MultiStageFilter:
     - Stage 3: Expensive fuzzy matching (TF-IDF, embeddings)
     - OR-based logic (liberal - high recall)
     - Accuracy monitoring and auto-adjustment
+    - Optional BlockingIndex over master colleges (build_index) so stage 2 counts
+      shared features over postings instead of re-tokenizing every candidate, and a
+      soundex PhoneticIndex that answers the phonetic test for all of them at once;
+      check_recall() compares both with the brute-force path
     """
 
     def __init__(self, config: Dict[str, Any] = None):
@@ -1103,6 +1551,7 @@ class MultiStageFilter:
             'min_ngram_overlap': self.config.get('min_ngram_overlap', 0.35),  # 35% n-gram overlap
             'length_tolerance': self.config.get('length_tolerance', 0.5),  # 50% length diff OK
             'use_phonetic': self.config.get('use_phonetic', True),
+            'min_phonetic_tokens': self.config.get('min_phonetic_tokens', 1),  # Soundex-equal words (len >= 4)
             'use_location_boost': self.config.get('use_location_boost', True),
         }
 
@@ -1117,8 +1566,16 @@ class MultiStageFilter:
             'token_matches': 0,
             'ngram_matches': 0,
             'location_matches': 0,
+            'index_candidates': 0,     # Candidates answered from the blocking index
+            'bruteforce_candidates': 0,  # Candidates not in the index (features computed per call)
+            'recall_checks': 0,
+            'recall_sum': 0.0,
         }
 
+        self.blocking_index: Optional[BlockingIndex] = None
+        self.phonetic_index: Optional[PhoneticIndex] = None  # Keyed like BlockingIndex rows: (id, name)
+        self._last_query: Optional[Tuple[str, Any]] = None  # (input_text, (query features, overlap counts, phonetic hits))
+
         logger.info("✓ Multi-stage filter initialized")
 
     def _get_tokens(self, text: str) -> Set[str]:
@@ -1138,25 +1595,49 @@ class MultiStageFilter:
         words = text.upper().split()
         return [w[:n] for w in words if len(w) >= n]
 
+    def _extract_features(self, text: str) -> Dict[str, Set[str]]:
+        """Blocking feature sets of a name (tokens, trigrams, first chars)"""
+        return {
+            'token': self._get_tokens(text),
+            'ngram': self._get_ngrams(text),
+            'first_char': set(self._get_first_chars(text)),
+        }
+
+    def build_index(self, colleges: List[Dict]):
+        """Build the blocking and phonetic indexes over master colleges (once per master load)"""
+        self.blocking_index = BlockingIndex(colleges, self._extract_features)
+        # Same rows as the blocking index; soundex of words with len >= 4, as in _phonetic_match()
+        names = [c.get('name') for c in colleges]
+        self.phonetic_index = PhoneticIndex.build(
+            (((c.get('id'), name), name) for c, name in zip(colleges, names) if name and isinstance(name, str)),
+            min_token_len=4, token_algorithms=('soundex',)
+        )
+        self._last_query = None
+        logger.info(f"✓ Multi-stage blocking index: {len(self.blocking_index)} master colleges")
+
+    def _index_overlaps(self, input_text: str) -> Tuple[Dict[str, Set[str]], Dict[str, np.ndarray], Set[Tuple[Any, str]]]:
+        """Query features, per-row overlap counts and phonetic hits (reused by the safety-net retry)"""
+        if self._last_query is None or self._last_query[0] != input_text:
+            features = self._extract_features(input_text)
+            try:
+                phonetic_hits = set(self.phonetic_index.candidates(
+                    input_text, min_shared=self.thresholds['min_phonetic_tokens'], algorithm='soundex'))
+            except:
+                phonetic_hits = set()  # Same as a failing _phonetic_match(): never a phonetic match
+            self._last_query = (input_text, (features, self.blocking_index.overlap_counts(features), phonetic_hits))
+        return self._last_query[1]
+
     def _phonetic_match(self, text1: str, text2: str) -> bool:
         """Check if texts match phonetically."""
         try:
-            # Use soundex for phonetic matching
-            words1 = text1.upper().split()
-            words2 = text2.upper().split()
-
-            for w1 in words1:
-                for w2 in words2:
-                    if len(w1) >= 4 and len(w2) >= 4:
-                        # Simple soundex check
-                        if jellyfish.soundex(w1) == jellyfish.soundex(w2):
-                            return True
-            return False
+            # At least min_phonetic_tokens soundex-equal words (len >= 4); codes are memoized per text
+            shared = token_soundex_set(text1) & token_soundex_set(text2)
+            return len(shared) >= self.thresholds['min_phonetic_tokens']
         except:
             return False
 
     def stage2_blocking(self, input_text: str, candidates: List[Dict],
-                       location: str = None) -> List[Dict]:
+                       location: str = None, use_index: bool = True) -> List[Dict]:
         """
         Stage 2: Cheap blocking filters (phonetic, tokens, n-grams).
         Uses OR logic - candidate passes if ANY test matches.
@@ -1165,6 +1646,8 @@ class MultiStageFilter:
             input_text: Input college name
             candidates: List of candidate colleges from DB filter
             location: Optional location for boosting
+            use_index: Answer indexed candidates from the blocking index (False forces
+                the brute-force path, e.g. for check_recall())
 
         Returns:
             Filtered list of candidates (typically 10-20 from 50-100)
@@ -1182,17 +1665,44 @@ class MultiStageFilter:
         input_length = len(input_text)
         location_normalized = location.upper() if location else None
 
+        # Overlap counts for indexed candidates come from one pass over the postings
+        index = self.blocking_index if use_index else None
+        rows = [index.row_of(c) for c in candidates] if index is not None else [None] * len(candidates)
+        indexed = [(i, row) for i, row in enumerate(rows) if row is not None]
+        index_overlaps = {}
+        if indexed:
+            query_features, counts, phonetic_hits = self._index_overlaps(input_text)
+            row_ids = np.fromiter((row for _, row in indexed), dtype=np.int64, count=len(indexed))
+            gathered = [
+                counts['token'][row_ids].tolist(), index.sizes['token'][row_ids].tolist(),
+                counts['ngram'][row_ids].tolist(), index.sizes['ngram'][row_ids].tolist(),
+                counts['first_char'][row_ids].tolist(), index.sizes['first_char'][row_ids].tolist(),
+                [(candidates[i].get('id'), candidates[i].get('name', '')) in phonetic_hits for i, _ in indexed],
+            ]
+            index_overlaps = {i: values for (i, _), values in zip(indexed, zip(*gathered))}
+
         blocked_candidates = []
 
-        for candidate in candidates:
+        for i, candidate in enumerate(candidates):
             cand_name = candidate.get('name', '')
             if not cand_name:
                 continue
 
-            # Extract features from candidate
-            cand_tokens = self._get_tokens(cand_name)
-            cand_ngrams = self._get_ngrams(cand_name)
-            cand_first_chars = set(self._get_first_chars(cand_name))
+            if i in index_overlaps:
+                (token_overlap, n_cand_tokens, ngram_overlap, n_cand_ngrams,
+                 char_overlap, n_cand_first_chars, phonetic) = index_overlaps[i]
+                self.stats['index_candidates'] += 1
+            else:
+                # Extract features from candidate
+                cand_tokens = self._get_tokens(cand_name)
+                cand_ngrams = self._get_ngrams(cand_name)
+                cand_first_chars = set(self._get_first_chars(cand_name))
+                token_overlap, n_cand_tokens = len(input_tokens & cand_tokens), len(cand_tokens)
+                ngram_overlap, n_cand_ngrams = len(input_ngrams & cand_ngrams), len(cand_ngrams)
+                char_overlap, n_cand_first_chars = len(input_first_chars & cand_first_chars), len(cand_first_chars)
+                phonetic = None  # Checked lazily (only if no other test passed)
+                self.stats['bruteforce_candidates'] += 1
+
             cand_length = len(cand_name)
             cand_location = candidate.get('state', '').upper()
 
@@ -1201,10 +1711,9 @@ class MultiStageFilter:
             reasons = []
 
             # Test 1: Token overlap
-            if input_tokens and cand_tokens:
-                overlap = len(input_tokens & cand_tokens)
-                max_tokens = max(len(input_tokens), len(cand_tokens))
-                token_ratio = overlap / max_tokens if max_tokens > 0 else 0
+            if input_tokens and n_cand_tokens:
+                max_tokens = max(len(input_tokens), n_cand_tokens)
+                token_ratio = token_overlap / max_tokens if max_tokens > 0 else 0
 
                 if token_ratio >= self.thresholds['min_token_overlap']:
                     passed = True
@@ -1212,10 +1721,9 @@ class MultiStageFilter:
                     self.stats['token_matches'] += 1
 
             # Test 2: N-gram overlap
-            if input_ngrams and cand_ngrams:
-                overlap = len(input_ngrams & cand_ngrams)
-                max_ngrams = max(len(input_ngrams), len(cand_ngrams))
-                ngram_ratio = overlap / max_ngrams if max_ngrams > 0 else 0
+            if input_ngrams and n_cand_ngrams:
+                max_ngrams = max(len(input_ngrams), n_cand_ngrams)
+                ngram_ratio = ngram_overlap / max_ngrams if max_ngrams > 0 else 0
 
                 if ngram_ratio >= self.thresholds['min_ngram_overlap']:
                     passed = True
@@ -1223,15 +1731,16 @@ class MultiStageFilter:
                     self.stats['ngram_matches'] += 1
 
             # Test 3: First-char matching
-            if input_first_chars and cand_first_chars:
-                char_overlap = len(input_first_chars & cand_first_chars)
+            if input_first_chars and n_cand_first_chars:
                 if char_overlap >= 2:  # At least 2 words match in first chars
                     passed = True
                     reasons.append(f"first_char_match={char_overlap}")
 
             # Test 4: Phonetic matching
             if self.thresholds['use_phonetic'] and not passed:
-                if self._phonetic_match(input_text, cand_name):
+                if phonetic is None:
+                    phonetic = self._phonetic_match(input_text, cand_name)
+                if phonetic:
                     passed = True
                     reasons.append("phonetic_match")
                     self.stats['phonetic_matches'] += 1
@@ -1267,12 +1776,66 @@ class MultiStageFilter:
             original_thresholds = self.thresholds.copy()
             self.thresholds['min_token_overlap'] *= 0.7
             self.thresholds['min_ngram_overlap'] *= 0.7
-            blocked_candidates = self.stage2_blocking(input_text, candidates, location)
+            blocked_candidates = self.stage2_blocking(input_text, candidates, location, use_index=use_index)
             self.thresholds = original_thresholds
 
         logger.debug(f"Stage 2 blocking: {len(candidates)} → {len(blocked_candidates)} candidates")
         return blocked_candidates
 
+    def check_recall(self, input_text: str, candidates: List[Dict], location: str = None) -> float:
+        """
+        Recall of the indexed stage 2 against the brute-force path for one query.
+
+        Both paths run on the same candidates; filter statistics are left untouched
+        apart from the recall counters. 1.0 means the index lost nothing.
+        """
+        saved_stats = dict(self.stats)
+        try:
+            expected = {id(c) for c in self.stage2_blocking(input_text, candidates, location, use_index=False)}
+            kept = {id(c) for c in self.stage2_blocking(input_text, candidates, location)}
+        finally:
+            self.stats = saved_stats
+
+        recall = len(expected & kept) / len(expected) if expected else 1.0
+        self.stats['recall_checks'] += 1
+        self.stats['recall_sum'] += recall
+        if recall < 1.0:
+            logger.warning(f"Blocking index recall {recall:.1%} for '{input_text}' "
+                           f"({len(expected - kept)} brute-force candidates missing)")
+        return recall
+
+    def measure_recall(self, samples: List[Dict]) -> Dict[str, Any]:
+        """
+        Recall report over sample queries.
+
+        Args:
+            samples: Dicts with 'input_text', 'candidates', optional 'location' and
+                optional 'expected_id' (the correct master college id)
+
+        Returns:
+            index_recall: mean recall of the index vs the brute-force path
+            match_recall: share of labelled samples whose correct college survives stage 2
+                (the 98% recall target)
+        """
+        index_recalls = []
+        labelled = survived = 0
+        for sample in samples:
+            candidates = sample['candidates']
+            index_recalls.append(self.check_recall(sample['input_text'], candidates, sample.get('location')))
+            if sample.get('expected_id') is not None:
+                labelled += 1
+                saved_stats = dict(self.stats)
+                kept = self.stage2_blocking(sample['input_text'], candidates, sample.get('location'))
+                self.stats = saved_stats
+                survived += any(c.get('id') == sample['expected_id'] for c in kept)
+
+        return {
+            'samples': len(index_recalls),
+            'index_recall': sum(index_recalls) / len(index_recalls) if index_recalls else 1.0,
+            'labelled_samples': labelled,
+            'match_recall': survived / labelled if labelled else None,
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """Get filtering statistics."""
         total = self.stats['total_candidates']
@@ -1289,6 +1852,14 @@ class MultiStageFilter:
                 'token': self.stats['token_matches'],
                 'ngram': self.stats['ngram_matches'],
                 'location': self.stats['location_matches'],
+            },
+            'blocking_index': {
+                'indexed_colleges': len(self.blocking_index) if self.blocking_index is not None else 0,
+                'index_candidates': self.stats['index_candidates'],
+                'bruteforce_candidates': self.stats['bruteforce_candidates'],
+                'recall_checks': self.stats['recall_checks'],
+                'avg_recall': (f"{self.stats['recall_sum'] / self.stats['recall_checks']:.1%}"
+                               if self.stats['recall_checks'] else "N/A"),
             }
         }
 
@@ -2188,6 +2759,261 @@ class GraphEntityMatcher:
             logger.error(f"GNN initialization failed: {e}", exc_info=True)
             return False
 
+# ============================================================================
+# COMPILED NORMALIZATION ENGINE
+# ============================================================================
+
+class NormalizationEngine:
+    """
+    Compiled single-pass text normalizer backing AdvancedSQLiteMatcher.normalize_text().
+
+    Every pattern, translate table and keep-character class is compiled ONCE from the
+    `normalization` section of config.yaml instead of being rebuilt on every call.
+    The stage order is fixed and identical to the original per-call implementation,
+    so output is byte-identical; results are memoized in a bounded LRU keyed on the
+    raw input value.
+
+    Master-data dependent stages (concatenated state cleanup, OCR repair, smart
+    abbreviation expansion) are injected as callables. Call invalidate() whenever
+    master data or abbreviations change so memoized results are recomputed.
+    """
+
+    # Context-aware medical degree patterns, applied in this order (before dot removal)
+    MEDICAL_DEGREE_PATTERNS = (
+        (r'\bM\.B\.B\.S\.?\b', 'MBBS'),
+        (r'\bM\.B\.B\.S\b', 'MBBS'),
+        (r'\bB\.D\.S\.?\b', 'BDS'),
+        (r'\bB\.D\.S\b', 'BDS'),
+        (r'\bM\.D\.S\.?\b', 'MDS'),
+        (r'\bM\.D\.S\b', 'MDS'),
+        (r'\bM\.D\.?\b', 'MD'),
+        (r'\bM\.S\.?\b', 'MS'),
+        (r'\bD\.M\.?\b', 'DM'),
+        (r'\bM\.CH\.?\b', 'MCH'),
+        (r'\bD\.N\.B\.?\b', 'DNB'),
+        (r'\bM\.SC\.?\b', 'MSC'),
+        (r'\bPH\.D\.?\b', 'PHD'),
+    )
+
+    _PINCODE_RE = re.compile(r'\b\d{6}\b')
+    _HYPHEN_SPACING_RE = re.compile(r'(?<!\s)-(?!\s)')
+    _STRICT_SPECIAL_RE = re.compile(r'[^\w\s,()]')
+    _MULTI_COMMA_SPACED_RE = re.compile(r',(\s*,)+')
+    _MULTI_COMMA_RE = re.compile(r',{2,}')
+    _MULTI_DOT_RE = re.compile(r'\.{2,}')
+    _SPACE_BEFORE_COMMA_RE = re.compile(r'\s+,')
+    _COMMA_NO_SPACE_RE = re.compile(r',(?=[^\s,])')
+    _COMMA_MULTI_SPACE_RE = re.compile(r',\s{2,}')
+    _LEADING_PUNCT_RE = re.compile(r'^[\s,.\-]+')
+    _TRAILING_PUNCT_RE = re.compile(r'[\s,.\-]+$')
+    _WORD_PAREN_RE = re.compile(r'(\w)\(')
+    _MULTI_SPACE_PAREN_RE = re.compile(r'\s{2,}\(')
+    _OPEN_PAREN_SPACE_RE = re.compile(r'\(\s+')
+    _CLOSE_PAREN_SPACE_RE = re.compile(r'\s+\)')
+    _TRAILING_COMMA_RE = re.compile(r',$')
+    _MULTI_SPACE_RE = re.compile(r'\s{2,}')
+    _WHITESPACE_RE = re.compile(r'\s+')
+
+    def __init__(
+        self,
+        normalization_config: Dict[str, Any],
+        abbreviations: Dict[str, str],
+        clean_state_names: Callable[[str], str],
+        clean_ocr_errors: Callable[[str], str],
+        expand_abbreviations: Callable[[str, Dict[str, str]], str],
+        cache_size: int = 10000
+    ):
+        cfg = normalization_config or {}
+        context_aware = cfg.get('context_aware', {})
+        fix_punct = cfg.get('fix_punctuation', {})
+
+        self._abbreviations = abbreviations
+        self._clean_state_names = clean_state_names
+        self._clean_ocr_errors = clean_ocr_errors
+        self._expand_abbreviations = expand_abbreviations
+
+        self._clean_ocr = cfg.get('clean_ocr_errors', True)
+        self._degree_patterns = tuple(
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in self.MEDICAL_DEGREE_PATTERNS
+        ) if context_aware.get('medical_degrees', True) else ()
+
+        # Character replacement: one str.translate() when the replacements cannot
+        # chain into each other, otherwise keep the sequential str.replace() order
+        replace_chars = cfg.get('replace_chars', {}) or {}
+        self._replace_pairs = tuple(replace_chars.items())
+        chainable = any(
+            key in replacement
+            for key in replace_chars
+            for replacement in replace_chars.values()
+        )
+        if replace_chars and all(len(key) == 1 for key in replace_chars) and not chainable:
+            self._replace_table = str.maketrans(dict(replace_chars))
+        else:
+            self._replace_table = None
+
+        self._to_upper = cfg.get('to_uppercase', True)
+        self._remove_pincodes = cfg.get('remove_pincodes', True)
+        self._handle_hyphens = cfg.get('handle_hyphens_dots', True)
+        self._compound_words = context_aware.get('compound_words', True)
+
+        # Always preserve: alphanumeric, spaces, commas, parentheses (+ configured chars)
+        if cfg.get('remove_special_chars', False):
+            self._special_chars_re = self._STRICT_SPECIAL_RE
+        else:
+            base_keep = r'\w\s,()' + ''.join(re.escape(char) for char in cfg.get('preserve_chars', []))
+            self._special_chars_re = re.compile(f'[^{base_keep}]')
+
+        self._remove_double_commas = fix_punct.get('remove_double_commas', True)
+        self._remove_double_dots = fix_punct.get('remove_double_dots', True)
+        self._fix_comma_spacing = fix_punct.get('fix_comma_spacing', True)
+        self._remove_leading = fix_punct.get('remove_leading_punctuation', True)
+        self._remove_trailing = fix_punct.get('remove_trailing_punctuation', True)
+        self._space_before_paren = fix_punct.get('remove_space_before_paren', True)
+        self._space_after_open_paren = fix_punct.get('remove_space_after_open_paren', True)
+        self._space_before_close_paren = fix_punct.get('remove_space_before_close_paren', True)
+        self._remove_extra_spaces = fix_punct.get('remove_extra_spaces', True)
+        self._normalize_whitespace = cfg.get('normalize_whitespace', True)
+
+        self._cached_normalize = lru_cache(maxsize=cache_size)(self._normalize_uncached)
+
+    def normalize(self, text) -> str:
+        """Normalize a single value (memoized on the raw value)"""
+        if text is None or pd.isna(text) or text == '':
+            return ''
+        return self._cached_normalize(text)
+
+    def normalize_many(self, values):
+        """Normalize a pandas Series or any iterable of values in one call.
+
+        Series are normalized once per distinct value and mapped back (index is
+        preserved; nulls become ''). Other iterables return a list.
+        """
+        if isinstance(values, pd.Series):
+            present = values.notna()
+            mapping = {value: self.normalize(value) for value in values[present].unique()}
+            return values.map(mapping).where(present, '')
+        return [self.normalize(value) for value in values]
+
+    def invalidate(self):
+        """Drop memoized results (call after master data or abbreviations change)"""
+        self._cached_normalize.cache_clear()
+
+    def cache_info(self):
+        """LRU hit/miss statistics"""
+        return self._cached_normalize.cache_info()
+
+    def _normalize_uncached(self, text) -> str:
+        start_time = time.time()
+
+        text = str(text).strip()
+        if not text:
+            perf_monitor.record_timing("normalize_text", time.time() - start_time)
+            return ''
+
+        # STAGE -1/0: malformed state prefixes and OCR breaks (original case)
+        text = self._clean_state_names(text)
+        if self._clean_ocr:
+            text = self._clean_ocr_errors(text)
+
+        # STAGE 1: medical degrees (every pattern needs a literal dot)
+        if self._degree_patterns and '.' in text:
+            for pattern, replacement in self._degree_patterns:
+                text = pattern.sub(replacement, text)
+
+        # STAGE 2: smart character replacement
+        if self._replace_table is not None:
+            text = text.translate(self._replace_table)
+        else:
+            for char, replacement in self._replace_pairs:
+                text = text.replace(char, replacement)
+
+        # STAGE 3: case, pincodes, dots, abbreviations, hyphens
+        if self._to_upper:
+            text = text.upper()
+        if self._remove_pincodes:
+            text = self._PINCODE_RE.sub('', text)
+        text = text.replace('.', ' ')
+        text = self._expand_abbreviations(text, self._abbreviations)
+        if self._handle_hyphens and '-' in text:
+            if self._compound_words:
+                text = self._HYPHEN_SPACING_RE.sub(' - ', text)
+            else:
+                text = text.replace('-', ' ')
+
+        # STAGE 4: selective character removal
+        text = self._special_chars_re.sub('', text)
+
+        # STAGE 5: punctuation correction
+        has_comma = ',' in text
+        if self._remove_double_commas and has_comma:
+            text = self._MULTI_COMMA_SPACED_RE.sub(',', text)
+            text = self._MULTI_COMMA_RE.sub(',', text)
+        if self._remove_double_dots and '..' in text:
+            text = self._MULTI_DOT_RE.sub('.', text)
+        if self._fix_comma_spacing and has_comma:
+            text = self._SPACE_BEFORE_COMMA_RE.sub(',', text)
+            text = self._COMMA_NO_SPACE_RE.sub(', ', text)
+            text = self._COMMA_MULTI_SPACE_RE.sub(', ', text)
+        # A single anchored greedy pass removes the whole leading/trailing run
+        if self._remove_leading:
+            text = self._LEADING_PUNCT_RE.sub('', text)
+        if self._remove_trailing:
+            text = self._TRAILING_PUNCT_RE.sub('', text)
+        if '(' in text:
+            if self._space_before_paren:
+                text = self._WORD_PAREN_RE.sub(r'\1 (', text)
+                text = self._MULTI_SPACE_PAREN_RE.sub(' (', text)
+            if self._space_after_open_paren:
+                text = self._OPEN_PAREN_SPACE_RE.sub('(', text)
+        if self._space_before_close_paren and ')' in text:
+            text = self._CLOSE_PAREN_SPACE_RE.sub(')', text)
+        text = self._TRAILING_COMMA_RE.sub('', text).strip()
+        if self._remove_extra_spaces:
+            text = self._MULTI_SPACE_RE.sub(' ', text)
+
+        # STAGE 6: final whitespace normalization
+        if self._normalize_whitespace:
+            text = self._WHITESPACE_RE.sub(' ', text).strip()
+
+        perf_monitor.record_timing("normalize_text", time.time() - start_time)
+        return text
+
+
+class MasterCollegeRecord:
+    """
+    Candidate-side matching fields of one master college, computed once per master load.
+
+    Everything here depends only on master data, so pass3_college_name_matching() and
+    related passes read these instead of re-normalizing every candidate for every query.
+    `college` is the original master dict (identity is used to look records up).
+    """
+
+    __slots__ = (
+        'college',                 # Original master college dict
+        'normalized_name',         # normalize_text(name)
+        'name_key',                # Normalized name part of composite_college_key (fallback: normalized_name)
+        'primary_name',            # Normalized primary name (before first bracket)
+        'secondary_name',          # Normalized secondary name (inside brackets) or None
+        'normalized_address',      # normalize_text(address)
+        'address_keywords',        # extract_address_keywords(normalized_address)
+        'address_keywords_lower',  # Lower-cased address keywords (alias validation)
+        'name_tokens',             # Token set of normalized_name
+    )
+
+    def __init__(self, college, normalized_name, name_key, primary_name, secondary_name,
+                 normalized_address, address_keywords):
+        self.college = college
+        self.normalized_name = normalized_name
+        self.name_key = name_key
+        self.primary_name = primary_name
+        self.secondary_name = secondary_name
+        self.normalized_address = normalized_address
+        self.address_keywords = frozenset(address_keywords)
+        self.address_keywords_lower = frozenset(kw.lower() for kw in address_keywords)
+        self.name_tokens = frozenset(normalized_name.split())
+
+
 # ============================================================================
 
 class AdvancedSQLiteMatcher:
@@ -2237,6 +3063,13 @@ class AdvancedSQLiteMatcher:
         self.course_corrections = {}
         self.abbreviations = self.config.get('abbreviations', {})
         self.college_code_index = {} # Map: 6-digit code -> college_id
+        self._ocr_master_names = None  # Cached master college names for clean_ocr_errors()
+        self._master_college_records = {}  # Map: id(master college dict) -> MasterCollegeRecord
+        self._master_phonetic_index = None  # PhoneticIndex over _master_college_records (built on first use)
+        self._college_pool_index = None  # Map: (normalized_state, stream) -> tuple of colleges
+        self._college_pool_unions = {}   # Map: (normalized_state, streams) -> tuple of colleges
+        self._college_pool_state_types = {}  # Map: normalized_state -> set of streams present
+        self._college_pool_state_keys = {}   # Map: raw query state -> normalized_state
 
         # Performance caches
         self.phonetic_cache = {}  # Cache for phonetic keys {text: {soundex, metaphone, nysiis}}
@@ -2344,7 +3177,8 @@ class AdvancedSQLiteMatcher:
         mmap_config = self.config.get('mmap_cache', {})
         self.mmap_cache = MMapCache(
             cache_dir=mmap_config.get('cache_dir', 'data/mmap_cache'),
-            enabled=mmap_config.get('enabled', True)  # Enabled by default
+            enabled=mmap_config.get('enabled', True),  # Enabled by default
+            snapshot_format=mmap_config.get('format', 'columnar')  # 'columnar' or 'pickle'
         )
         if self.mmap_cache.enabled:
             logger.info("Memory-mapped file cache enabled (zero-copy data access)")
@@ -2405,6 +3239,16 @@ class AdvancedSQLiteMatcher:
             self._seat_link_cache = {}
             self._use_cachetools = False
         
+        # Compiled normalization engine (patterns/translate tables built once from config)
+        self.normalization_engine = NormalizationEngine(
+            self.config['normalization'],
+            self.abbreviations,
+            clean_state_names=self.clean_concatenated_state_names,
+            clean_ocr_errors=self.clean_ocr_errors,
+            expand_abbreviations=self._smart_expand_abbreviations,
+            cache_size=max_cache_size
+        )
+
         self._cache_hits = {'normalize': 0, 'pool': 0, 'seat_link': 0, 'course_id': 0, 'match': 0, 'state_id': 0}
         self._cache_misses = {'normalize': 0, 'pool': 0, 'seat_link': 0, 'course_id': 0, 'match': 0, 'state_id': 0}
         self._max_cache_sizes = {
@@ -3178,12 +4022,34 @@ class AdvancedSQLiteMatcher:
         """Build in-memory indices from master data"""
         # 1. College Code Index (Pass 0.5)
         self.college_code_index = {}
+
+        # Master-data dependent normalization (OCR repair) must be recomputed
+        self._ocr_master_names = None
+        self.normalization_engine.invalidate()
+        self._master_college_records = {}
+        self._master_phonetic_index = None
+
+        # Invalidate the college pool index (rebuilt below from the new master data)
+        self._college_pool_index = None
+        self._college_pool_unions = {}
+        self._college_pool_state_types = {}
+        self._college_pool_state_keys = {}
         
         # Check if colleges are loaded (not lazy)
         colleges = self.master_data.get('colleges', [])
         if isinstance(colleges, dict): # Lazy loaded
             return
 
+        # 2. (normalized_state, stream) College Pool Index (get_college_pool)
+        self._build_college_pool_index()
+
+        # 3. Candidate-side normalization (pass3_college_name_matching)
+        self._build_master_college_records()
+
+        # 4. Inverted-token blocking index (MultiStageFilter.stage2_blocking)
+        if getattr(self, 'multi_stage_filter', None) is not None:
+            self.multi_stage_filter.build_index(colleges)
+
         for record in colleges:
             addr = record.get('address', '')
             if addr:
@@ -3195,12 +4061,132 @@ class AdvancedSQLiteMatcher:
         
         console.print(f"✅ Indexed {len(self.college_code_index)} unique college codes for Pass 0.5")
 
+    # Canonical stream order of the master college lists (medical → dental → dnb).
+    # Pool unions are concatenated in this order so results match the old list scan.
+    _COLLEGE_POOL_STREAMS = ('MEDICAL', 'DENTAL', 'DNB')
+    _COLLEGE_POOL_LEVELS = {
+        'UG': ('MEDICAL', 'DENTAL'),   # MBBS + BDS
+        'PG': ('MEDICAL', 'DNB'),      # Medical PG + DNB
+        'DEN': ('DENTAL',),            # Dental PG
+    }
+
+    def _build_college_pool_index(self):
+        """Build the (normalized_state, stream) → colleges index used by get_college_pool().
+
+        State normalization runs once per distinct master state instead of once per
+        college per lookup. A college is indexed under both its import-normalized
+        state and its pre-normalized `normalized_state` field (when present), which
+        mirrors the OR condition of the previous per-call filter.
+        """
+        buckets = {}
+        state_types = {}
+        state_cache = {}
+
+        for stream in ('medical', 'dental', 'dnb'):
+            for c in self.master_data.get(stream, {}).get('colleges', []):
+                college_state = c.get('state', '')
+                if college_state:
+                    if college_state not in state_cache:
+                        state_cache[college_state] = (self.normalize_state_name_import(college_state) or '').upper()
+                    state_keys = {state_cache[college_state]}
+                else:
+                    state_keys = set()
+
+                normalized_state_field = c.get('normalized_state', '')
+                if normalized_state_field:
+                    state_keys.add(normalized_state_field.upper())
+                state_keys.discard('')
+
+                college_type = (c.get('type', '') or '').upper()
+                for state_key in state_keys:
+                    buckets.setdefault((state_key, college_type), []).append(c)
+                    state_types.setdefault(state_key, set()).add(college_type or 'NO_TYPE')
+
+        self._college_pool_index = {key: tuple(colleges) for key, colleges in buckets.items()}
+        self._college_pool_state_types = state_types
+
+        logger.debug(f"College pool index: {len(self._college_pool_index)} (state, stream) buckets "
+                     f"across {len(state_types)} states")
+
+    def _build_master_college_records(self):
+        """Precompute MasterCollegeRecord for every college served by get_college_pool()"""
+        records = {}
+        for stream in ('medical', 'dental', 'dnb'):
+            for college in self.master_data.get(stream, {}).get('colleges', []):
+                records[id(college)] = self._create_master_college_record(college)
+        self._master_college_records = records
+        self._master_phonetic_index = None
+        logger.debug(f"Precomputed candidate-side normalization for {len(records)} master colleges")
+
+    def _create_master_college_record(self, college):
+        """Compute the candidate-side matching fields of one master college"""
+        name = college.get('name', '')
+        name = name if isinstance(name, str) else ''
+        normalized_name = self.normalize_text(name)
+
+        composite_key = college.get('composite_college_key', '')
+        if isinstance(composite_key, str) and ',' in composite_key:
+            name_key = self.normalize_text(self.extract_college_name_from_composite_key(composite_key))
+        else:
+            name_key = normalized_name
+
+        primary, secondary = self.extract_primary_name(name)
+        normalized_address = self.normalize_text(college.get('address', ''))
+
+        return MasterCollegeRecord(
+            college,
+            normalized_name=normalized_name,
+            name_key=name_key,
+            primary_name=self.normalize_text(primary),
+            secondary_name=self.normalize_text(secondary) if secondary else None,
+            normalized_address=normalized_address,
+            address_keywords=self.extract_address_keywords(normalized_address),
+        )
+
+    def _master_college_record(self, college):
+        """Precomputed MasterCollegeRecord for a candidate dict.
+
+        Candidates that are not master dicts from the current load (copies, ad-hoc
+        dicts) are computed on the fly and not cached.
+        """
+        record = self._master_college_records.get(id(college))
+        if record is not None and record.college is college:
+            return record
+        return self._create_master_college_record(college)
+
+    def _get_college_pool_union(self, state_key, streams):
+        """Return the cached union of (state, stream) buckets in canonical stream order"""
+        union_key = (state_key, streams)
+        pool = self._college_pool_unions.get(union_key)
+        if pool is None:
+            if len(streams) == 1:
+                pool = self._college_pool_index.get((state_key, streams[0]), ())
+            else:
+                pool = tuple(
+                    c
+                    for stream in self._COLLEGE_POOL_STREAMS if stream in streams
+                    for c in self._college_pool_index.get((state_key, stream), ())
+                )
+            self._college_pool_unions[union_key] = pool
+        return pool
+
+    def _get_college_pool_state_key(self, state):
+        """Normalize a query state for the college pool index (memoized per raw state)"""
+        state_key = self._college_pool_state_keys.get(state)
+        if state_key is None:
+            state_key = (self.normalize_state_name_import(state) or '').upper()
+            self._college_pool_state_keys[state] = state_key
+        return state_key
+
 
-    def load_master_data(self, lazy_load=False):
+    def load_master_data(self, lazy_load=False, read_only=False):
         """Load master data from SQLite with Rich UI.
 
         Args:
             lazy_load: If True, only load metadata, fetch data on demand
+            read_only: Caller never mutates master rows - on an mmap cache hit, serve
+                tables straight from the shared columnar snapshot (SnapshotTable)
+                instead of decoding a private copy (e.g. process-pool match workers)
 
         Performance:
         - First run: Loads from SQLite and creates mmap cache (~2-5 seconds)
@@ -3209,7 +4195,7 @@ class AdvancedSQLiteMatcher:
         # ========== TIER 1: MMAP CACHE (ZERO-COPY, ULTRA-FAST) ==========
         # Try to load from memory-mapped cache first (2-5x faster)
         if self.mmap_cache.enabled and not lazy_load:
-            cached_data = self.mmap_cache.get_data('master_data', self.master_db_path)
+            cached_data = self.mmap_cache.get_data('master_data', self.master_db_path, read_only=read_only)
 
             if cached_data:
                 # Cache hit! Ultra-fast zero-copy loading
@@ -4120,8 +5106,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_state'] = normalized_states
             progress.update(task3, completed=len(df))
 
-<<<<<<< Updated upstream
-=======
             # CRITICAL FIX: Normalize addresses (Rule #1: Always use normalized fields)
             task_addr = progress.add_task("[cyan]Normalizing addresses...", total=len(df))
             normalized_addresses = []
@@ -4133,7 +5117,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_address'] = normalized_addresses
             progress.update(task_addr, completed=len(df))
 
->>>>>>> Stashed changes
             # Create TF-IDF vectors
             task4 = progress.add_task("[cyan]Creating TF-IDF vectors...", total=None)
             college_names = df['normalized_name'].tolist()
@@ -4310,8 +5293,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_state'] = normalized_states
             progress.update(task3, completed=len(df))
 
-<<<<<<< Updated upstream
-=======
             # CRITICAL FIX: Normalize addresses (Rule #1: Always use normalized fields)
             task_addr = progress.add_task("[cyan]Normalizing addresses...", total=len(df))
             normalized_addresses = []
@@ -4323,7 +5304,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_address'] = normalized_addresses
             progress.update(task_addr, completed=len(df))
 
->>>>>>> Stashed changes
             # Create TF-IDF vectors
             task4 = progress.add_task("[cyan]Creating TF-IDF vectors...", total=None)
             college_names = df['normalized_name'].tolist()
@@ -4500,8 +5480,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_state'] = normalized_states
             progress.update(task3, completed=len(df))
 
-<<<<<<< Updated upstream
-=======
             # CRITICAL FIX: Normalize addresses (Rule #1: Always use normalized fields)
             task_addr = progress.add_task("[cyan]Normalizing addresses...", total=len(df))
             normalized_addresses = []
@@ -4513,7 +5491,6 @@ class AdvancedSQLiteMatcher:
             df['normalized_address'] = normalized_addresses
             progress.update(task_addr, completed=len(df))
 
->>>>>>> Stashed changes
             # Create TF-IDF vectors
             task4 = progress.add_task("[cyan]Creating TF-IDF vectors...", total=None)
             college_names = df['normalized_name'].tolist()
@@ -4635,7 +5612,7 @@ class AdvancedSQLiteMatcher:
                 'id': ['CRS' + str(start_id + i).zfill(4) for i in range(len(courses))]
             })
 
-            df['normalized_name'] = df['name'].apply(self.normalize_text)  # Use unified normalization from config.yaml
+            df['normalized_name'] = self.normalize_texts(df['name'])  # Use unified normalization from config.yaml
 
             course_names = df['normalized_name'].tolist()
             tfidf_vectors = self.vectorize_text_batch(course_names)
@@ -5573,29 +6550,7 @@ class AdvancedSQLiteMatcher:
         if len(words) <= 1:
             return text
         
-        # Build master database lookup set for fast validation
-        # Use normalized names directly (already normalized in master_data)
-        master_college_names = set()
-        if self.master_data:
-            # Collect all college names from master database
-            for college_type in ['medical', 'dental', 'dnb']:
-                if college_type in self.master_data and isinstance(self.master_data[college_type], dict):
-                    for college in self.master_data[college_type].get('colleges', []):
-                        # Use normalized_name if available (already normalized)
-                        if college.get('normalized_name'):
-                            master_college_names.add(college['normalized_name'].upper())
-                        elif college.get('name'):
-                            # Fallback to raw name, simple uppercase
-                            master_college_names.add(str(college['name']).upper().strip())
-            
-            # Also check the combined colleges list
-            if 'colleges' in self.master_data:
-                for college in self.master_data.get('colleges', []):
-                    if isinstance(college, dict):
-                        if college.get('normalized_name'):
-                            master_college_names.add(college['normalized_name'].upper())
-                        elif college.get('name'):
-                            master_college_names.add(str(college['name']).upper().strip())
+        master_college_names = self._get_ocr_master_names()
 
         # ========== STRATEGY: Detect and fix broken word patterns ==========
 
@@ -5783,6 +6738,42 @@ class AdvancedSQLiteMatcher:
 
         return result
 
+    def _get_ocr_master_names(self):
+        """Master college name set used by clean_ocr_errors() to validate merges.
+
+        Built once per master data load (invalidated in _build_indices) instead of
+        on every clean_ocr_errors() call.
+        """
+        if self._ocr_master_names is not None:
+            return self._ocr_master_names
+
+        # Use normalized names directly (already normalized in master_data)
+        master_college_names = set()
+        if self.master_data:
+            # Collect all college names from master database
+            for college_type in ['medical', 'dental', 'dnb']:
+                if college_type in self.master_data and isinstance(self.master_data[college_type], dict):
+                    for college in self.master_data[college_type].get('colleges', []):
+                        # Use normalized_name if available (already normalized)
+                        if college.get('normalized_name'):
+                            master_college_names.add(college['normalized_name'].upper())
+                        elif college.get('name'):
+                            # Fallback to raw name, simple uppercase
+                            master_college_names.add(str(college['name']).upper().strip())
+            
+            # Also check the combined colleges list
+            if 'colleges' in self.master_data:
+                for college in self.master_data.get('colleges', []):
+                    if isinstance(college, dict):
+                        if college.get('normalized_name'):
+                            master_college_names.add(college['normalized_name'].upper())
+                        elif college.get('name'):
+                            master_college_names.add(str(college['name']).upper().strip())
+
+        if self.master_data:
+            self._ocr_master_names = master_college_names
+        return master_college_names
+
     def _has_vowels(self, word):
         """Check if word has vowels (A, E, I, O, U)
 
@@ -5994,7 +6985,6 @@ class AdvancedSQLiteMatcher:
         result = ', '.join(processed_segments)
         return result
 
-    @lru_cache(maxsize=10000)
     def normalize_text(self, text):
         """Enhanced text normalization with config support and caching
 
@@ -6005,194 +6995,19 @@ class AdvancedSQLiteMatcher:
         - Selective character preservation
         - Punctuation correction (,, removal, leading/trailing cleanup)
         - Configurable rules
-        """
-        # Performance monitoring (manual timing because of @lru_cache)
-        start_time = time.time()
-
-        # Handle None, NaN, and empty strings
-        if text is None or pd.isna(text) or text == '':
-            perf_monitor.record_timing("normalize_text", time.time() - start_time)
-            return ''
-
-        text = str(text).strip()
-
-        # Double-check after strip
-        if not text:
-            perf_monitor.record_timing("normalize_text", time.time() - start_time)
-            return ''
-
-
-        # ========== STAGE -1: Fix Malformed Addresses ==========
-        # Clean concatenated state names BEFORE other processing
-        # This must be done on original case text for proper detection
-        text = self.clean_concatenated_state_names(text)
-
-        # ========== STAGE 0: OCR Error Cleanup ==========
-        # Clean common OCR errors from PDF-to-Excel conversion
-        # Must be done BEFORE other normalization to work on original case
-        if self.config['normalization'].get('clean_ocr_errors', True):
-            text = self.clean_ocr_errors(text)
-
-        # ========== STAGE 1: Context-Aware Pre-Processing ==========
-
-        context_aware = self.config['normalization'].get('context_aware', {})
-
-        # 1.1: Medical degrees normalization (before removing dots)
-        if context_aware.get('medical_degrees', True):
-            # Common degree patterns
-            medical_degrees = {
-                r'\bM\.B\.B\.S\.?\b': 'MBBS',
-                r'\bM\.B\.B\.S\b': 'MBBS',
-                r'\bB\.D\.S\.?\b': 'BDS',
-                r'\bB\.D\.S\b': 'BDS',
-                r'\bM\.D\.S\.?\b': 'MDS',
-                r'\bM\.D\.S\b': 'MDS',
-                r'\bM\.D\.?\b': 'MD',
-                r'\bM\.S\.?\b': 'MS',
-                r'\bD\.M\.?\b': 'DM',
-                r'\bM\.CH\.?\b': 'MCH',
-                r'\bD\.N\.B\.?\b': 'DNB',
-                r'\bM\.SC\.?\b': 'MSC',
-                r'\bPH\.D\.?\b': 'PHD',
-            }
-
-            for pattern, replacement in medical_degrees.items():
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
 
-        # ========== STAGE 2: Smart Character Replacement ==========
-
-        replace_chars = self.config['normalization'].get('replace_chars', {})
-        for char, replacement in replace_chars.items():
-            text = text.replace(char, replacement)
-
-        # ========== STAGE 3: Standard Normalization ==========
-
-        # Convert to uppercase
-        if self.config['normalization'].get('to_uppercase', True):
-            text = text.upper()
-
-        # Remove 6-digit numbers (pincodes)
-        if self.config['normalization'].get('remove_pincodes', True):
-            text = re.sub(r'\b\d{6}\b', '', text)
-
-        # Remove dots (after medical degree normalization)
-        text = re.sub(r'\.', ' ', text)
-
-        # Expand abbreviations from config (SMART: only if standalone)
-        text = self._smart_expand_abbreviations(text, self.abbreviations)
-
-        # Handle hyphens for compound words
-        if self.config['normalization'].get('handle_hyphens_dots', True):
-            if context_aware.get('compound_words', True):
-                # Keep hyphens in known compound patterns (POST-GRADUATE, etc.)
-                # Add space around hyphens but don't remove them yet
-                text = re.sub(r'(?<!\s)-(?!\s)', ' - ', text)
-            else:
-                # Remove hyphens entirely
-                text = re.sub(r'-', ' ', text)
-
-        # ========== STAGE 4: Selective Character Removal ==========
-
-        # Build pattern for characters to keep
-        preserve_chars = self.config['normalization'].get('preserve_chars', [])
-
-        # Always preserve: alphanumeric, spaces, commas, parentheses
-        base_keep = r'\w\s,()'
-
-        # Add preserved characters to the pattern
-        for char in preserve_chars:
-            base_keep += re.escape(char)
-
-        # Remove special characters (but preserve configured chars)
-        if self.config['normalization'].get('remove_special_chars', False):
-            # Old behavior: aggressive removal
-            text = re.sub(r'[^\w\s,()]', '', text)
-        else:
-            # New behavior: selective removal
-            # Remove only chars NOT in our keep list
-            pattern = f'[^{base_keep}]'
-            text = re.sub(pattern, '', text)
-
-        # ========== STAGE 5: Enhanced Punctuation Correction ==========
-
-        fix_punct = self.config['normalization'].get('fix_punctuation', {})
-
-        # ENHANCED: Remove multiple consecutive commas first (before spacing fixes)
-        # This handles ",," and ", ," patterns
-        if fix_punct.get('remove_double_commas', True):
-            # Remove patterns like ",," or ", ," or ",,,"
-            text = re.sub(r',(\s*,)+', ',', text)  # Multiple commas with optional spaces → single comma
-            text = re.sub(r',{2,}', ',', text)  # Double commas → single comma (backup)
-
-        if fix_punct.get('remove_double_dots', True):
-            text = re.sub(r'\.{2,}', '.', text)  # .. or ... → .
-
-        # ENHANCED: Fix comma-space patterns comprehensively
-        if fix_punct.get('fix_comma_spacing', True):
-            # Step 1: Remove all spaces before commas: " ," or "  ," → ","
-            text = re.sub(r'\s+,', ',', text)
-
-            # Step 2: Normalize spaces after commas
-            # First, ensure at least one space after comma (unless at end or before another comma)
-            text = re.sub(r',(?=[^\s,])', ', ', text)  # ",X" → ", X" (but not ",,")
-
-            # Then, collapse multiple spaces after comma to single space
-            text = re.sub(r',\s{2,}', ', ', text)  # ", X" → ", X"
-
-        # ENHANCED: Remove leading punctuation and whitespace aggressively
-        # This handles cases like ", NEW DELHI" or " ,NEW DELHI" or "  , NEW DELHI"
-        if fix_punct.get('remove_leading_punctuation', True):
-            # Keep removing leading punctuation and spaces until none left
-            while True:
-                old_text = text
-                text = re.sub(r'^[\s,.\-]+', '', text)
-                if old_text == text:
-                    break
-
-        # ENHANCED: Remove trailing punctuation and whitespace aggressively
-        if fix_punct.get('remove_trailing_punctuation', True):
-            # Keep removing trailing punctuation and spaces until none left
-            while True:
-                old_text = text
-                text = re.sub(r'[\s,.\-]+$', '', text)
-                if old_text == text:
-                    break
-
-
-        # NEW: Normalize space before opening parenthesis (keep one space, remove extras)
-        # "HOSPITAL  ( A UNIT" or "HOSPITAL( A UNIT" → "HOSPITAL (A UNIT"
-        if fix_punct.get('remove_space_before_paren', True):
-            # First ensure there's at least one space if word precedes parenthesis
-            text = re.sub(r'(\w)\(', r'\1 (', text)  # Add space if missing: "WORD(" → "WORD ("
-            # Then collapse multiple spaces to single space
-            text = re.sub(r'\s{2,}\(', ' (', text)  # Multiple spaces → single space: "WORD  (" → "WORD ("
-        
-        # NEW: Remove space after opening parenthesis
-        # "HOSPITAL (  A UNIT" → "HOSPITAL (A UNIT"
-        if fix_punct.get('remove_space_after_open_paren', True):
-            text = re.sub(r'\(\s+', '(', text)
-        
-        # NEW: Remove space before closing parenthesis
-        # "HOSPITAL (A UNIT )" → "HOSPITAL (A UNIT)"
-        if fix_punct.get('remove_space_before_close_paren', True):
-            text = re.sub(r'\s+\)', ')', text)
-
-        # NEW: Remove comma at the very end if it exists (after other cleanup)
-        text = re.sub(r',$', '', text).strip()
-
-        # Remove multiple consecutive spaces (cleanup after all operations)
-        if fix_punct.get('remove_extra_spaces', True):
-            text = re.sub(r'\s{2,}', ' ', text)
-
-        # ========== STAGE 6: Final Whitespace Normalization ==========
+        Delegates to the compiled NormalizationEngine (patterns compiled once from
+        config.yaml, bounded LRU keyed on the raw string).
+        """
+        return self.normalization_engine.normalize(text)
 
-        # Normalize whitespace (collapse multiple spaces)
-        if self.config['normalization'].get('normalize_whitespace', True):
-            text = re.sub(r'\s+', ' ', text).strip()
+    def normalize_texts(self, values):
+        """Batch version of normalize_text() for a pandas Series or list.
 
-        # Record performance timing before return
-        perf_monitor.record_timing("normalize_text", time.time() - start_time)
-        return text
+        Each distinct value is normalized once; nulls become ''.
+        Returns a Series (same index) for Series input, otherwise a list.
+        """
+        return self.normalization_engine.normalize_many(values)
 
     # ==================== BEST-IN-CLASS SEAT ID GENERATION ====================
     def generate_seat_id(self, row_or_state, college_name=None, address=None, course_name=None):
@@ -8094,7 +8909,8 @@ class AdvancedSQLiteMatcher:
             state_first: If True, apply state filter before course type (DEFAULT: True)
 
         Returns:
-            list: List of college dictionaries
+            list: List of college dictionaries (an immutable tuple when served from the
+            precomputed (state, stream) index built in _build_indices)
 
         Examples:
             # Optimized: state-first + course name stream detection
@@ -8113,6 +8929,25 @@ class AdvancedSQLiteMatcher:
         """
         colleges = []
 
+        # FAST PATH: O(1) lookup in the precomputed (normalized_state, stream) index.
+        # Returns immutable tuples shared across calls - callers must not mutate them.
+        if state_first and state and (course_type or course_name or level) and self._college_pool_index is not None:
+            state_key = self._get_college_pool_state_key(state)
+
+            if course_type:
+                colleges = self._college_pool_index.get((state_key, course_type.upper()), ())
+                if not colleges and state_key in self._college_pool_state_types:
+                    logger.info(f"No {course_type} colleges found in state. Available types: {self._college_pool_state_types[state_key]}")
+            elif course_name:
+                requested = {s.upper() for s in self.get_stream_from_course_name(course_name)}
+                streams = tuple(s for s in self._COLLEGE_POOL_STREAMS if s in requested)
+                colleges = self._get_college_pool_union(state_key, streams) if streams else ()
+            else:
+                streams = self._COLLEGE_POOL_LEVELS.get(level)
+                colleges = self._get_college_pool_union(state_key, streams) if streams else ()
+
+            return colleges
+
         # OPTIMIZATION: Apply STATE filter first when state + (course_type OR course_name OR level) provided
         if state_first and state and (course_type or course_name or level):
             # Step 1: Get ALL colleges first
@@ -8782,7 +9617,7 @@ class AdvancedSQLiteMatcher:
                     # Check if secondary name matches extracted secondary OR full master name
                     # Case 4: Input "KIMS (A UNIT OF KIMS PVT LTD)" -> Secondary "KIMS PVT LTD" -> Master Name "KIMS PVT LTD"
                     if (master_secondary and master_secondary == seat_secondary) or \
-                       (self.normalize_text(cand['name']) == self.normalize_text(seat_secondary)):
+                       (self._master_college_record(cand).normalized_name == self.normalize_text(seat_secondary)):
                         filtered_candidates.append(cand)
                 
                 if filtered_candidates:
@@ -8820,8 +9655,6 @@ class AdvancedSQLiteMatcher:
         else:
             fast_match, fast_score, fast_method = None, 0, 'no_match'
 
-<<<<<<< Updated upstream
-=======
         # ========== AMBIGUITY CHECK: Skip address validation for unambiguous colleges ==========
         # For colleges with unique names in their state, address validation is unnecessary
         # This fixes: TOMO RIBA INSTITUTE, CHOUDHURY EYE HOSPITAL, etc.
@@ -8851,7 +9684,7 @@ class AdvancedSQLiteMatcher:
                     # Count colleges with same NORMALIZED NAME
                     matching_names = [
                         c for c in state_colleges
-                        if self.normalize_text(c.get('name', '')) == normalized_matched
+                        if self._master_college_record(c).normalized_name == normalized_matched
                     ]
                     
                     if len(matching_names) > 1:
@@ -8950,7 +9783,6 @@ class AdvancedSQLiteMatcher:
                 logger.info(f"✅ POSITIVE MATCH (Secondary Name): {seat_secondary}")
                 fast_score = max(fast_score, 0.98) # Boost confidence
 
->>>>>>> Stashed changes
         # Check if fast match is good enough
         if fast_match and fast_score >= fast_threshold:
             logger.info(
@@ -8995,7 +9827,7 @@ class AdvancedSQLiteMatcher:
                         normalized_ai_match = self.normalize_text(ai_match.get('name', ''))
                         matching_names = [
                             c for c in state_colleges
-                            if self.normalize_text(c.get('name', '')) == normalized_ai_match
+                            if self._master_college_record(c).normalized_name == normalized_ai_match
                         ]
                         if len(matching_names) > 1:
                             ai_is_ambiguous = True
@@ -9458,10 +10290,45 @@ class AdvancedSQLiteMatcher:
 
         return False, None, 0.0
 
+    def _get_master_phonetic_index(self):
+        """PhoneticIndex of the current master load, keyed by id(master college dict).
+
+        Whole-name keys come from generate_phonetic_keys(normalized_name), i.e. exactly
+        what phonetic_match() compares for a master candidate. Built once per load.
+        """
+        if self._master_phonetic_index is None:
+            index = PhoneticIndex(token_algorithms=())  # Only whole-name lookups (name_matches)
+            for key, record in self._master_college_records.items():
+                keys = self.generate_phonetic_keys(record.normalized_name)
+                index.add(key, record.normalized_name,
+                          PhoneticKeys(keys.get('soundex', ''), keys.get('metaphone', ''), keys.get('nysiis', '')))
+            self._master_phonetic_index = index
+            logger.debug(f"Phonetic index built for {len(index)} master colleges")
+        return self._master_phonetic_index
+
+    def _phonetic_prefilter(self, normalized_college, candidates):
+        """Drop master candidates that cannot phonetic_match() normalized_college.
+
+        The query is encoded once and master candidates are checked by index lookup;
+        candidates that are not master dicts of the current load are kept for the
+        per-pair check. Order is preserved.
+        """
+        if not normalized_college or not self._master_college_records:
+            return candidates
+
+        index = self._get_master_phonetic_index()
+        keys = self.generate_phonetic_keys(normalized_college)
+        matches = index.name_matches(
+            PhoneticKeys(keys.get('soundex', ''), keys.get('metaphone', ''), keys.get('nysiis', ''))
+        )
+        return [c for c in candidates if id(c) in matches or id(c) not in index]
+
     def _parallel_phonetic_match(self, normalized_college, candidates):
         """Perform phonetic matching for large candidate sets
 
-        Note: Sequential processing used to avoid pickle issues with nested functions
+        Note: Sequential processing used to avoid pickle issues with nested functions.
+        Master candidates are prefiltered through the phonetic index, so phonetic_match()
+        only runs on candidates that share a key with the query.
 
         Args:
             normalized_college: Normalized college name to match
@@ -9473,7 +10340,7 @@ class AdvancedSQLiteMatcher:
         matches = []
 
         # Sequential processing (faster than parallel for phonetic matching anyway)
-        for candidate in candidates:
+        for candidate in self._phonetic_prefilter(normalized_college, candidates):
             # UNIFIED: Use dynamic normalization, not pre-computed normalized_name
             candidate_name = candidate.get('name', '')
             candidate_normalized = self.normalize_text(candidate_name)
@@ -9870,11 +10737,7 @@ class AdvancedSQLiteMatcher:
             best_score = 0.0
             for c in candidates:
                 # CRITICAL FIX: Use composite_college_key for college name extraction (NOT normalized_name)
-                composite_key = c.get('composite_college_key', '')
-                if composite_key and ',' in composite_key:
-                    cand_name = self.normalize_text(self.extract_college_name_from_composite_key(composite_key))
-                else:
-                    cand_name = self.normalize_text(c.get('name', ''))
+                cand_name = self._master_college_record(c).name_key
 
                 if cand_name.startswith(normalized_college):
                     coverage_ratio = len(normalized_college) / max(1, len(cand_name))
@@ -9959,11 +10822,7 @@ class AdvancedSQLiteMatcher:
             
             for c in candidates:
                 # CRITICAL FIX: Extract name from composite_college_key (NOT normalized_name)
-                composite_key = c.get('composite_college_key', '')
-                if composite_key and ',' in composite_key:
-                    cand_name = self.normalize_text(self.extract_college_name_from_composite_key(composite_key))
-                else:
-                    cand_name = self.normalize_text(c.get('name', ''))
+                cand_name = self._master_college_record(c).name_key
 
                 sim = fuzz.ratio(normalized_college, cand_name) / 100
                 
@@ -10791,19 +11650,11 @@ class AdvancedSQLiteMatcher:
                                     # Address validation gate
                                     addr_config = self.config.get('validation', {}).get('address_validation', {})
                                     is_generic = self.is_generic_college_name(normalized_college)
-<<<<<<< Updated upstream
-                                    if addr_config.get('enabled', True) and (addr_config.get('require_for_single_candidate', True) and len(group) == 1) or (addr_config.get('require_for_generic_names', True) and is_generic):
-                                        is_addr_valid, addr_score_check, addr_reason = self.validate_address_match(
-                                            normalized_address, master_college_address, normalized_college, 'prefix'
-                                        )
-                                        
-=======
                                     if addr_config.get('enabled', True) and ((addr_config.get('require_for_single_candidate', True) and len(group) == 1) or (addr_config.get('require_for_generic_names', True) and is_generic)):
                                         is_addr_valid, addr_score_check, addr_reason = self.validate_address_match(
                                             normalized_address, master_college_address, normalized_college, 'prefix'
                                         )
 
->>>>>>> Stashed changes
                                         # For generic names, require HIGH address similarity (≥0.6)
                                         if is_generic:
                                             if not is_addr_valid or addr_score_check < 0.6:
@@ -10858,11 +11709,7 @@ class AdvancedSQLiteMatcher:
                                 # CRITICAL: For generic names, require STRICT address validation
                                 addr_config = self.config.get('validation', {}).get('address_validation', {})
                                 is_generic = self.is_generic_college_name(normalized_college)
-<<<<<<< Updated upstream
-                                if addr_config.get('enabled', True) and (addr_config.get('require_for_single_candidate', True) and len(group) == 1) or (addr_config.get('require_for_generic_names', True) and is_generic):
-=======
                                 if addr_config.get('enabled', True) and ((addr_config.get('require_for_single_candidate', True) and len(group) == 1) or (addr_config.get('require_for_generic_names', True) and is_generic)):
->>>>>>> Stashed changes
                                     is_addr_valid, addr_score_check, addr_reason = self.validate_address_match(
                                         normalized_address, master_college_address, normalized_college, 'fuzzy'
                                     )
@@ -11282,15 +12129,9 @@ class AdvancedSQLiteMatcher:
                 LEFT JOIN masterdb.states s ON s.id = sd.master_state_id
                 WHERE sd.master_college_id IS NOT NULL
                   AND sd.master_course_id IS NOT NULL
-<<<<<<< Updated upstream
-                  AND sd.state IS NOT NULL
-                  AND sd.state != ''
-                GROUP BY s.id, sd.state, sd.master_course_id, sd.master_college_id, sd.address;
-=======
                   AND sd.master_state_id IS NOT NULL
                   AND sd.master_state_id != ''
                 GROUP BY sd.master_state_id, COALESCE(s.normalized_name, sd.state), sd.master_course_id, sd.master_college_id, sd.normalized_address;
->>>>>>> Stashed changes
                 """
             )
 
@@ -11470,12 +12311,6 @@ class AdvancedSQLiteMatcher:
                 
                 # Group addresses and count occurrences
                 addrs = row['addresses'].split(' ||| ')
-<<<<<<< Updated upstream
-                for addr_idx, addr in enumerate(addrs[:3], 1):
-                    console.print(f"       {addr_idx}. {addr[:70]}...")
-                if len(addrs) > 3:
-                    console.print(f"       ... and {len(addrs) - 3} more")
-=======
                 from collections import Counter
                 addr_counts = Counter(addrs)
                 
@@ -11486,7 +12321,6 @@ class AdvancedSQLiteMatcher:
                         console.print(f"       {addr_idx}. [cyan](NORMALIZED, {count} records)[/cyan] {normalized_addr[:70]}...")
                     else:
                         console.print(f"       {addr_idx}. [cyan](NORMALIZED)[/cyan] {normalized_addr[:70]}...")
->>>>>>> Stashed changes
                 console.print()
 
             if len(df_address_violations) > 10:
@@ -11962,7 +12796,7 @@ class AdvancedSQLiteMatcher:
             state_candidates = all_candidates  # Fallback to all
 
         # Try phonetic matching
-        for candidate in state_candidates:
+        for candidate in self._phonetic_prefilter(normalized_college, state_candidates):
             # UNIFIED: Use dynamic normalization, not pre-computed normalized_name
             candidate_name = candidate.get('name', '')
             candidate_normalized = self.normalize_text(candidate_name)
@@ -14137,22 +14971,15 @@ class AdvancedSQLiteMatcher:
         logger.debug(f"🔍 SHORTLIST 2 (1/2): Filtering {len(candidates)} candidates by college name: '{normalized_college[:50]}...'")
         
         for candidate in candidates:
+            # Candidate-side fields are precomputed once per master load (MasterCollegeRecord)
+            record = self._master_college_record(candidate)
+
             # NEW: Use composite_college_key for college name filtering
             # This preserves all campuses with the same name (different addresses)
+            # name_key = normalized name part of "COLLEGE_NAME, ADDRESS", or the freshly
+            # normalized college name when no composite_college_key is available
             composite_key = candidate.get('composite_college_key', '')
-
-            if composite_key and ',' in composite_key:
-                # COMPOSITE_COLLEGE_KEY AVAILABLE: Extract college name from it
-                # Format: "COLLEGE_NAME, ADDRESS"
-                candidate_name = self.extract_college_name_from_composite_key(composite_key)
-                candidate_normalized = self.normalize_text(candidate_name)
-            else:
-                # FALLBACK: If no composite_college_key, use college_name or normalized_name
-                # This ensures backward compatibility with old data
-                candidate_name = self.normalize_text(candidate.get('name', ''))
-                # IMPORTANT: Use freshly normalized name, not pre-stored normalized_name
-                # This ensures consistent normalization between seat data and master data
-                candidate_normalized = candidate_name
+            candidate_normalized = record.name_key
 
             # Strategy 1: Exact match (on composite_college_key name part or fallback)
             # Both paths (composite_key and fallback) now use freshly normalized candidate_normalized
@@ -14160,9 +14987,7 @@ class AdvancedSQLiteMatcher:
 
             # Strategy 2: Primary name match (extract from full name if present)
             if not name_matches and candidate.get('name'):
-                primary_name, _ = self.extract_primary_name(candidate.get('name', ''))
-                normalized_primary = self.normalize_text(primary_name)
-                name_matches = normalized_college == normalized_primary
+                name_matches = normalized_college == record.primary_name
 
             # Strategy 3: Fuzzy match (for typos/variations in college name)
             if not name_matches:
@@ -14190,7 +15015,7 @@ class AdvancedSQLiteMatcher:
                 if composite_key:
                     logger.debug(f"✅ COMPOSITE_KEY MATCH: '{composite_key[:60]}...' (ID: {candidate.get('id')})")
                 else:
-                    logger.debug(f"✅ NAME MATCH (fallback): '{candidate_name[:50]}...' (ID: {candidate.get('id')})")
+                    logger.debug(f"✅ NAME MATCH (fallback): '{candidate_normalized[:50]}...' (ID: {candidate.get('id')})")
         
         name_filtered_count = len(name_filtered_candidates)
         logger.info(f"📍 SHORTLIST 3: Composite_college_key filtering: {len(candidates)} → {name_filtered_count} candidates")
@@ -14263,12 +15088,11 @@ class AdvancedSQLiteMatcher:
                             # This ensures alias matches also respect address filtering
                             if normalized_address:
                                 # Check if candidate passed address pre-filtering
-                                candidate_address = self.normalize_text(candidate.get('address', ''))
-                                if candidate_address:
+                                record = self._master_college_record(candidate)
+                                if record.normalized_address:
                                     # Verify address matches
                                     seat_keywords = self.extract_address_keywords(normalized_address)
-                                    master_keywords = self.extract_address_keywords(candidate_address)
-                                    common_keywords = {kw.lower() for kw in seat_keywords} & {kw.lower() for kw in master_keywords}
+                                    common_keywords = {kw.lower() for kw in seat_keywords} & record.address_keywords_lower
                                     
                                     # For generic names, require ≥2 common keywords or high overlap
                                     if is_generic:
@@ -14294,7 +15118,7 @@ class AdvancedSQLiteMatcher:
         # Strategy 1: Exact match with address validation (highest priority)
         # CRITICAL: Don't return early - let address validation happen in the combined scoring phase
         for candidate in candidates:
-            candidate_normalized = self.normalize_text(candidate['name'])
+            candidate_normalized = self._master_college_record(candidate).normalized_name
             if normalized_college == candidate_normalized:
                 # Add exact match to candidates list - address validation will happen later
                 # This ensures we don't skip address validation for exact matches
@@ -14313,8 +15137,7 @@ class AdvancedSQLiteMatcher:
         
         # Strategy 1.5: Primary name match (extract primary name from master data)
         for candidate in candidates:
-            primary_name, secondary_name = self.extract_primary_name(candidate['name'])
-            normalized_primary = self.normalize_text(primary_name)
+            normalized_primary = self._master_college_record(candidate).primary_name
             
             # Check exact match
             if normalized_college == normalized_primary:
@@ -14343,9 +15166,8 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 2: Normalized match
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization, not pre-computed normalized_name
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
+            # UNIFIED: Same config-driven normalization as seat data (precomputed per master load)
+            candidate_normalized = self._master_college_record(candidate).normalized_name
 
             if normalized_college == candidate_normalized:
                 matches.append({
@@ -14356,9 +15178,8 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 3: Fuzzy matching with STRICT word overlap check (prevents false matches)
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization, not pre-computed normalized_name
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
+            # UNIFIED: Same config-driven normalization as seat data (precomputed per master load)
+            candidate_normalized = self._master_college_record(candidate).normalized_name
 
             similarity = fuzz.ratio(normalized_college, candidate_normalized) / 100
 
@@ -14418,9 +15239,8 @@ class AdvancedSQLiteMatcher:
             else:
                 # Sequential for small sets
                 for candidate in candidates:
-                    # UNIFIED: Use dynamic normalization
-                    candidate_name = candidate.get('name', '')
-                    candidate_normalized = self.normalize_text(candidate_name)
+                    # UNIFIED: Same config-driven normalization (precomputed per master load)
+                    candidate_normalized = self._master_college_record(candidate).normalized_name
 
                     is_phonetic_match, algorithm, phone_score = self.phonetic_match(
                         normalized_college,
@@ -14436,9 +15256,8 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 4: Prefix matching (for cases like "DR VIRENDRA LASER" -> "DR VIRENDRA LASER PHACO...")
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
+            # UNIFIED: Same config-driven normalization (precomputed per master load)
+            candidate_normalized = self._master_college_record(candidate).normalized_name
 
             if candidate_normalized.startswith(normalized_college) and len(normalized_college) >= 10:  # Minimum length to avoid false positives
                 # Calculate score based on how much of the candidate name is covered
@@ -14452,9 +15271,8 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 5: Substring matching
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
+            # UNIFIED: Same config-driven normalization (precomputed per master load)
+            candidate_normalized = self._master_college_record(candidate).normalized_name
 
             if (normalized_college in candidate_normalized or candidate_normalized in normalized_college):
                 similarity = fuzz.ratio(normalized_college, candidate_normalized) / 100
@@ -14467,12 +15285,9 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 6: Partial word matching
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
-
+            # UNIFIED: Same config-driven normalization (precomputed per master load)
             words1 = set(normalized_college.split())
-            words2 = set(candidate_normalized.split())
+            words2 = self._master_college_record(candidate).name_tokens
 
             if words1 and words2:
                 intersection = words1.intersection(words2)
@@ -14488,9 +15303,8 @@ class AdvancedSQLiteMatcher:
 
         # Strategy 6: TF-IDF similarity
         for candidate in candidates:
-            # UNIFIED: Use dynamic normalization
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self.normalize_text(candidate_name)
+            # UNIFIED: Same config-driven normalization (precomputed per master load)
+            candidate_normalized = self._master_college_record(candidate).normalized_name
 
             similarity = self.calculate_tfidf_similarity(normalized_college, candidate_normalized, 'medical')  # Use medical as default
             if similarity >= self.config['matching']['thresholds']['tfidf_match']:
@@ -14504,9 +15318,8 @@ class AdvancedSQLiteMatcher:
         # Handles OCR errors and typos (e.g., "MEDCAL" → "MEDICAL")
         if self.enable_soft_tfidf and self.soft_tfidf:
             for candidate in candidates:
-                # UNIFIED: Use dynamic normalization
-                candidate_name = candidate.get('name', '')
-                candidate_normalized = self.normalize_text(candidate_name)
+                # UNIFIED: Same config-driven normalization (precomputed per master load)
+                candidate_normalized = self._master_college_record(candidate).normalized_name
 
                 if candidate_normalized:
                     try:
@@ -14549,10 +15362,10 @@ class AdvancedSQLiteMatcher:
         
         # Strategy 7: Secondary name fallback (if primary name didn't match)
         for candidate in candidates:
-            primary_name, secondary_name = self.extract_primary_name(candidate['name'])
-            if secondary_name:
+            secondary_normalized = self._master_college_record(candidate).secondary_name
+            if secondary_normalized is not None:
                 # Try matching against secondary name
-                if normalized_college == self.normalize_text(secondary_name):
+                if normalized_college == secondary_normalized:
                     matches.append({
                         'candidate': candidate,
                         'score': 0.90,
@@ -14560,7 +15373,7 @@ class AdvancedSQLiteMatcher:
                     })
                 else:
                     # Fuzzy match against secondary name
-                    similarity = fuzz.ratio(normalized_college, self.normalize_text(secondary_name)) / 100
+                    similarity = fuzz.ratio(normalized_college, secondary_normalized) / 100
                     if similarity >= self.config['matching']['thresholds']['fuzzy_match']:
                         matches.append({
                             'candidate': candidate,
@@ -14639,12 +15452,13 @@ class AdvancedSQLiteMatcher:
                     # can still indicate a strong match (e.g., 50% address + 90% name + 100% state)
                     
                     # Method 1: Address keyword overlap
+                    record = self._master_college_record(candidate)
                     seat_keywords = self.extract_address_keywords(normalized_address)
-                    master_keywords = self.extract_address_keywords(self.normalize_text(master_address))
+                    master_keywords = record.address_keywords
                     keyword_score = self.calculate_keyword_overlap(seat_keywords, master_keywords)
                     
                     # Method 2: Address fuzzy similarity
-                    fuzzy_score = fuzz.ratio(normalized_address, self.normalize_text(master_address)) / 100.0
+                    fuzzy_score = fuzz.ratio(normalized_address, record.normalized_address) / 100.0
                     
                     # Method 3: Location keywords (city/district)
                     location_score, common_locs = self.match_addresses(normalized_address, master_address)
@@ -14659,7 +15473,7 @@ class AdvancedSQLiteMatcher:
                     
                     # Extract all words from master data (college name + address)
                     master_all_words = set()
-                    master_college_words = set(self.normalize_text(candidate.get('name', '')).split())
+                    master_college_words = record.name_tokens
                     master_all_words.update(master_college_words)
                     master_all_words.update(master_keywords)
                     
@@ -14944,7 +15758,7 @@ class AdvancedSQLiteMatcher:
                     
                     # Calculate word overlap (college name only)
                     seat_words = set(normalized_college.split())
-                    master_words = set(self.normalize_text(candidate.get('name', '')).split())
+                    master_words = self._master_college_record(candidate).name_tokens
                     common_words = seat_words & master_words
                     union_words = seat_words | master_words
                     word_overlap = len(common_words) / len(union_words) if union_words else 0.0
@@ -16422,10 +17236,6 @@ class AdvancedSQLiteMatcher:
 
         return results
 
-<<<<<<< Updated upstream
-    def match_and_link_parallel(self, data_source, table_name):
-        """Match and link data using parallel processing"""
-=======
     def run_complete_unified_matching(self, data_source, table_name):
         """
         ═══════════════════════════════════════════════════════════════════════
@@ -16871,7 +17681,6 @@ class AdvancedSQLiteMatcher:
             table_name: Name of the table to match
             unmatched_only: If True, only process records where master_college_id IS NULL
         """
->>>>>>> Stashed changes
         logger.info(f"Starting parallel matching for {table_name}...")
         
         # Load data - use the correct database based on data type
@@ -16982,73 +17791,20 @@ class AdvancedSQLiteMatcher:
         with sqlite3.connect(db_path) as conn:
             cursor = conn.cursor()
 
-            # Read existing data from source table
-            existing_df = pd.read_sql(f"SELECT * FROM {table_name}", conn)
+            # Read only the mapping columns needed for the merge (not the whole table)
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            table_cols = {row[1] for row in cursor.fetchall()}
+            mapping_cols = [col for fields in self._MANUAL_MAPPING_FIELDS for col in fields[1:] if col in table_cols]
+            existing_df = pd.read_sql(
+                f"SELECT {', '.join(['id'] + mapping_cols)} FROM {table_name}", conn
+            ) if 'id' in table_cols else pd.DataFrame()
             console.print(f"[dim]  Total records: {len(existing_df):,}[/dim]")
 
-            # Create a dict for fast lookup by ID
-            existing_records = {}
-            if 'id' in existing_df.columns:
-                for _, row in existing_df.iterrows():
-                    existing_records[row['id']] = row
-
-            # Merge logic: Preserve manual mappings, update automatic ones
-            updated_count = 0
-            preserved_college_count = 0
-            preserved_course_count = 0
-            new_matches_count = 0
-
-            for idx, new_row in results_df.iterrows():
-                record_id = new_row.get('id')
-
-                if record_id in existing_records:
-                    existing_row = existing_records[record_id]
-
-                    # Check if this record was manually mapped
-                    # Manual mappings have master_college_id/master_course_id set AND match_method='manual'
-                    existing_college_method = existing_row.get('college_match_method', '')
-                    existing_course_method = existing_row.get('course_match_method', '')
-
-                    has_manual_college = (
-                        existing_row.get('master_college_id') and
-                        pd.notna(existing_row.get('master_college_id')) and
-                        ('manual' in str(existing_college_method) or existing_row.get('college_match_score', 0) == 100)
-                    )
-
-                    has_manual_course = (
-                        existing_row.get('master_course_id') and
-                        pd.notna(existing_row.get('master_course_id')) and
-                        ('manual' in str(existing_course_method) or existing_row.get('course_match_score', 0) == 100)
-                    )
-
-                    # Preserve manual college mappings
-                    if has_manual_college:
-                        new_row['master_college_id'] = existing_row['master_college_id']
-                        new_row['college_match_score'] = existing_row.get('college_match_score', 100)
-                        new_row['college_match_method'] = existing_row.get('college_match_method', 'manual')
-                        preserved_college_count += 1
-                    else:
-                        # New automatic match
-                        if new_row.get('master_college_id') and pd.notna(new_row.get('master_college_id')):
-                            new_matches_count += 1
-
-                    # Preserve manual course mappings
-                    if has_manual_course:
-                        new_row['master_course_id'] = existing_row['master_course_id']
-                        new_row['course_match_score'] = existing_row.get('course_match_score', 100)
-                        new_row['course_match_method'] = existing_row.get('course_match_method', 'manual')
-                        preserved_course_count += 1
-
-                    # Update is_linked status
-                    if (new_row.get('master_college_id') and pd.notna(new_row.get('master_college_id')) and
-                        new_row.get('master_course_id') and pd.notna(new_row.get('master_course_id'))):
-                        new_row['is_linked'] = True
-                    else:
-                        new_row['is_linked'] = False
-
-                # Store back
-                results_df.loc[idx] = new_row
-                updated_count += 1
+            # Merge logic (vectorized join on id): Preserve manual mappings, update automatic ones
+            results_df, merge_stats = self._merge_preserving_manual_mappings(results_df, existing_df)
+            preserved_college_count = merge_stats['preserved_college']
+            preserved_course_count = merge_stats['preserved_course']
+            new_matches_count = merge_stats['new_matches']
 
             # Ensure all required columns are present before saving
             results_df = self._ensure_dataframe_columns(results_df, table_name)
@@ -17135,45 +17891,22 @@ class AdvancedSQLiteMatcher:
                     results_df = results_df.sort_index()
 
             # ================================================================
-            # CRITICAL FIX: MERGE ORIGINAL COLUMNS BACK BEFORE SAVING
+            # PERSIST: UPDATE only changed rows (no DROP/replace of the table)
             # ================================================================
-            # PROBLEM: results_df only has matching results columns
-            # (master_college_id, match_scores, match_methods, is_linked)
-            # It LOSES original columns (normalized_*, management, university_affiliation, seats, etc)
-            #
-            # SOLUTION: Merge original columns from existing_df back into results_df
-            # Keep ALL original columns, update ONLY matching-related columns
+            # Original columns (normalized_*, management, seats, ...) are never
+            # rewritten, so they no longer need to be merged back before saving.
             # ================================================================
-
-            if 'id' in existing_df.columns and 'id' in results_df.columns:
-                # Identify columns to preserve from existing_df
-                original_cols = set(existing_df.columns)
-                matching_cols = set(results_df.columns)
-
-                # Columns that should be preserved from existing data
-                preserve_cols = [col for col in original_cols
-                                if col not in matching_cols and col != 'id']
-
-                if preserve_cols:
-                    console.print(f"[cyan]🔄 Preserving {len(preserve_cols)} original columns: {', '.join(preserve_cols[:5])}{'...' if len(preserve_cols) > 5 else ''}[/cyan]")
-
-                    # For each preserved column, add it back from existing_df
-                    for col in preserve_cols:
-                        if col in existing_df.columns:
-                            # Create mapping: id -> column value
-                            existing_map = dict(zip(existing_df['id'], existing_df[col]))
-                            results_df[col] = results_df['id'].map(existing_map)
-
-            # Replace table with merged data (now has all original columns!)
-            results_df.to_sql(table_name, conn, if_exists='replace', index=False)
+            persist_stats = self._persist_changed_rows(conn, table_name, results_df)
 
             console.print(f"[green]✅ PASS 1 Results saved to {table_name}:[/green]")
+            console.print(f"[green]   • {persist_stats['changed']:,} rows changed[/green]")
             console.print(f"[green]   • {preserved_college_count:,} manual college mappings preserved[/green]")
             console.print(f"[green]   • {preserved_course_count:,} manual course mappings preserved[/green]")
+            console.print(f"[green]   • {persist_stats['unchanged']:,} unchanged rows skipped[/green]")
+            if persist_stats['missing'] or persist_stats['duplicates']:
+                console.print(f"[yellow]   • {persist_stats['missing']:,} rows not in table, {persist_stats['duplicates']:,} duplicate ids skipped[/yellow]")
             console.print(f"[green]   • {new_matches_count:,} new automatic matches found[/green]")
 
-            conn.commit()
-
         # ═══════════════════════════════════════════════════════════════
         # PASS 2: Run aliases on UNMATCHED records only
         # ═══════════════════════════════════════════════════════════════
@@ -17316,9 +18049,10 @@ class AdvancedSQLiteMatcher:
                     #   - Not have PASS 2 updates applied
                     #   - Overwrite deduplicated data with old database state
                     #
-                    # results_df ALREADY has all the processed data, just save it
-                    results_df.to_sql(table_name, conn, if_exists='replace', index=False)
-                    conn.commit()
+                    # results_df ALREADY has all the processed data; persist only changed rows
+                    pass2_persist_stats = self._persist_changed_rows(conn, table_name, results_df)
+                    console.print(f"[dim]  {pass2_persist_stats['changed']:,} rows changed, "
+                                  f"{pass2_persist_stats['unchanged']:,} unchanged rows skipped[/dim]")
 
                     console.print(f"[green]✅ PASS 2 Results:[/green]")
                     console.print(f"[green]   • {pass2_matched:,} records recovered via aliases[/green]")
@@ -17396,6 +18130,138 @@ class AdvancedSQLiteMatcher:
 
         return results_df
     
+    # Matching columns owned by the matcher; manual mappings on these are preserved
+    _MANUAL_MAPPING_FIELDS = (
+        ('college', 'master_college_id', 'college_match_score', 'college_match_method'),
+        ('course', 'master_course_id', 'course_match_score', 'course_match_method'),
+    )
+
+    @staticmethod
+    def _present_id_mask(series):
+        """Vectorized `value and pd.notna(value)` for an ID column"""
+        return series.notna() & (series.astype(str).str.len() > 0)
+
+    def _merge_preserving_manual_mappings(self, results_df, existing_df):
+        """Merge match results with the stored rows, preserving manual mappings.
+
+        Vectorized equivalent of the old per-row UPSERT loop: rows are joined on `id`
+        and a stored mapping is kept when it is set AND (its method contains 'manual'
+        OR its score is 100). `is_linked` is recomputed for rows that exist in the table.
+
+        Returns:
+            tuple: (merged results_df, stats dict with preserved/new match counts)
+        """
+        stats = {'preserved_college': 0, 'preserved_course': 0, 'new_matches': 0}
+        if results_df.empty or 'id' not in results_df.columns or 'id' not in existing_df.columns:
+            return results_df, stats
+
+        # Last stored row wins for duplicate ids (same as the old dict lookup)
+        existing = existing_df.drop_duplicates('id', keep='last').set_index('id')
+        in_existing = results_df['id'].isin(existing.index)
+        aligned = existing.reindex(results_df['id'])
+        aligned.index = results_df.index
+
+        def stored(col, default):
+            if col in aligned.columns:
+                return aligned[col]
+            return pd.Series(default, index=results_df.index, dtype=object)
+
+        for kind, id_col, score_col, method_col in self._MANUAL_MAPPING_FIELDS:
+            stored_id = stored(id_col, None)
+            stored_score = stored(score_col, 0)
+            stored_method = stored(method_col, '')
+
+            has_manual = (
+                in_existing
+                & self._present_id_mask(stored_id)
+                & (stored_method.astype(str).str.contains('manual', regex=False) | (stored_score == 100))
+            )
+
+            if kind == 'college' and id_col in results_df.columns:
+                new_match = in_existing & ~has_manual & self._present_id_mask(results_df[id_col])
+                stats['new_matches'] = int(new_match.sum())
+
+            if has_manual.any():
+                for col, default in ((id_col, None), (score_col, 100), (method_col, 'manual')):
+                    if col not in results_df.columns:
+                        results_df[col] = None
+                    value = aligned[col] if col in aligned.columns else default
+                    results_df[col] = results_df[col].astype(object).mask(has_manual, value)
+            stats[f'preserved_{kind}'] = int(has_manual.sum())
+
+        # Update is_linked status for rows that exist in the table
+        if 'master_college_id' in results_df.columns and 'master_course_id' in results_df.columns:
+            linked = (self._present_id_mask(results_df['master_college_id'])
+                      & self._present_id_mask(results_df['master_course_id']))
+            if 'is_linked' not in results_df.columns:
+                results_df['is_linked'] = False
+            results_df['is_linked'] = results_df['is_linked'].astype(object).mask(in_existing, linked)
+
+        return results_df, stats
+
+    def _persist_changed_rows(self, conn, table_name, results_df):
+        """Write only the rows whose values differ from the table, in one transaction.
+
+        Replaces `to_sql(..., if_exists='replace')`: the table is never dropped, so
+        columns the matcher does not produce are left untouched. Result columns missing
+        from the table are added first. Rows are compared on `id`; unchanged rows and
+        ids not present in the table are skipped.
+
+        Returns:
+            dict: {'changed': n, 'unchanged': n, 'missing': n, 'duplicates': n}
+        """
+        stats = {'changed': 0, 'unchanged': 0, 'missing': 0, 'duplicates': 0}
+        if results_df.empty or 'id' not in results_df.columns:
+            return stats
+
+        cursor = conn.cursor()
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        table_cols = [row[1] for row in cursor.fetchall()]
+
+        for col in results_df.columns:
+            if col not in table_cols:
+                cursor.execute(f'ALTER TABLE {table_name} ADD COLUMN "{col}"')
+                table_cols.append(col)
+        write_cols = [col for col in results_df.columns if col != 'id']
+        if not write_cols:
+            return stats
+
+        # One row per id: prefer a linked row over rows unlinked by deduplication
+        persist_df = results_df
+        if results_df['id'].duplicated().any():
+            if 'master_college_id' in results_df.columns:
+                has_id = self._present_id_mask(results_df['master_college_id'])
+                persist_df = results_df.loc[has_id.sort_values(ascending=False, kind='stable').index]
+            persist_df = persist_df.drop_duplicates('id', keep='first')
+            stats['duplicates'] = len(results_df) - len(persist_df)
+
+        column_list = ', '.join(f'"{col}"' for col in write_cols)
+        stored = pd.read_sql(f'SELECT id, {column_list} FROM {table_name}', conn)
+        stored = stored.drop_duplicates('id', keep='last').set_index('id')
+
+        in_table = persist_df['id'].isin(stored.index)
+        stats['missing'] = int((~in_table).sum())
+        persist_df = persist_df[in_table]
+
+        new_values = persist_df[write_cols].to_numpy(dtype=object)
+        old_values = stored.reindex(persist_df['id'])[write_cols].to_numpy(dtype=object)
+        same = (new_values == old_values) | (pd.isna(new_values) & pd.isna(old_values))
+        changed = ~same.all(axis=1)
+        stats['unchanged'] = int((~changed).sum())
+
+        changed_df = persist_df[changed]
+        if len(changed_df) > 0:
+            frame = changed_df[write_cols + ['id']].astype(object)
+            frame = frame.where(frame.notna(), None)
+            set_clause = ', '.join(f'"{col}" = ?' for col in write_cols)
+            with conn:
+                conn.executemany(
+                    f'UPDATE {table_name} SET {set_clause} WHERE id = ?',
+                    frame.itertuples(index=False, name=None)
+                )
+        stats['changed'] = len(changed_df)
+        return stats
+
     def _batch_operations_menu(self, table_name):
         """Batch operations menu for handling multiple unmatched records
 
@@ -17526,16 +18392,12 @@ class AdvancedSQLiteMatcher:
         course_field = self._get_actual_column_name(conn, table_name,
             ['course_name', 'course_normalized', 'course_raw'])
         address_field = self._get_actual_column_name(conn, table_name,
-<<<<<<< Updated upstream
-            ['address', 'college_address', 'location', 'city'])
-=======
             ['normalized_address', 'address_normalized', 'address', 'college_address', 'location', 'city'])
         
         # CRITICAL FIX: Add Stream/Course Type to Grouping to prevent Cross-Stream Contamination
         # e.g. Prevent AFMC (Medical) grouping with AFMC (Dental)
         stream_field = self._get_actual_column_name(conn, table_name,
             ['course_type', 'stream', 'exam_type'])
->>>>>>> Stashed changes
 
         # Get DEDUPLICATED unmatched colleges with courses and address
         try:
@@ -17560,23 +18422,6 @@ class AdvancedSQLiteMatcher:
                     LIMIT 100
                 """, conn)
             else:
-<<<<<<< Updated upstream
-                df = pd.read_sql(f"""
-                    SELECT
-                        {college_field} as college,
-                        {state_field} as state,
-                        '' as address,
-                        GROUP_CONCAT({course_field}) as courses,
-                        COUNT(*) as record_count
-                    FROM {table_name}
-                    WHERE master_college_id IS NULL
-                        AND {college_field} IS NOT NULL
-                        AND {college_field} != ''
-                    GROUP BY {college_field}, {state_field}
-                    ORDER BY record_count DESC
-                    LIMIT 100
-                """, conn)
-=======
                 # CRITICAL FIX: Even without address field, try to use normalized_address if available
                 # This prevents grouping different addresses together (false matches like DNB1157 → 4 addresses)
                 try:
@@ -17640,7 +18485,6 @@ class AdvancedSQLiteMatcher:
                         ORDER BY record_count DESC
                         LIMIT 100
                     """, conn)
->>>>>>> Stashed changes
         except Exception as e:
             console.print(f"[red]Error loading colleges: {e}[/red]")
             return
@@ -21482,9 +22326,9 @@ class AdvancedSQLiteMatcher:
         # CRITICAL: Ensure normalized columns are calculated if missing
         # This handles cases where normalized columns might not be in the DataFrame
         if 'normalized_college_name' not in df_import.columns or df_import['normalized_college_name'].isna().all():
-            df_import['normalized_college_name'] = df_import['college_name'].apply(lambda x: self.normalize_text(x) if pd.notna(x) else '')
+            df_import['normalized_college_name'] = self.normalize_texts(df_import['college_name'])
         if 'normalized_course_name' not in df_import.columns or df_import['normalized_course_name'].isna().all():
-            df_import['normalized_course_name'] = df_import['course_name'].apply(lambda x: self.normalize_text(x) if pd.notna(x) else '')
+            df_import['normalized_course_name'] = self.normalize_texts(df_import['course_name'])
         if 'normalized_state' not in df_import.columns or df_import['normalized_state'].isna().all():
             df_import['normalized_state'] = df_import['state'].apply(lambda x: self.normalize_state(x) if pd.notna(x) else '')
             if 'address' in df_import.columns and 'college_name' in df_import.columns and 'state' in df_import.columns:
@@ -21492,7 +22336,7 @@ class AdvancedSQLiteMatcher:
                     lambda row: self.clean_address(row['address'], row['college_name'], row['state']), axis=1
                 )
             else:
-                df_import['normalized_address'] = df_import['address'].apply(lambda x: self.normalize_text(x) if pd.notna(x) else '')
+                df_import['normalized_address'] = self.normalize_texts(df_import['address'])
         
         # Select columns in the correct order
         df_import = df_import[expected_columns]
@@ -21918,8 +22762,6 @@ class AdvancedSQLiteMatcher:
             conn = sqlite3.connect(self.data_db_path)
             cursor = conn.cursor()
 
-<<<<<<< Updated upstream
-=======
             # ================================================================
             # CRITICAL FIX: Ensure table exists before inserting
             # ================================================================
@@ -22018,7 +22860,6 @@ class AdvancedSQLiteMatcher:
                 logger.info("✅ Created counselling_records table with indexes")
                 console.print("[green]✅ Table created successfully[/green]")
 
->>>>>>> Stashed changes
             # Insert records
             for record in records:
                 cursor.execute("""
@@ -22748,24 +23589,20 @@ class AdvancedSQLiteMatcher:
                 if not batch:
                     break
                 
-                # Process batch
-                updates = []
-                for row in batch:
-                    record_id, college_name, course_name, state, address = row
-                    
-                    # Calculate normalized columns
-                    normalized_college = self.normalize_text(college_name) if college_name else ''
-                    normalized_course = self.normalize_text(course_name) if course_name else ''
-                    normalized_state_val = self.normalize_state(state) if state else ''
-                    normalized_address_val = self.normalize_text(address) if address else ''
-                    
-                    updates.append((
-                        normalized_college,
-                        normalized_course,
-                        normalized_state_val,
-                        normalized_address_val,
-                        record_id
-                    ))
+                # Process batch (text columns normalized in one batch call each)
+                record_ids, college_names, course_names, states, addresses = zip(*batch)
+                normalized_colleges = self.normalize_texts(college_names)
+                normalized_courses = self.normalize_texts(course_names)
+                normalized_addresses = self.normalize_texts(addresses)
+                normalized_states = [self.normalize_state(state) if state else '' for state in states]
+
+                updates = list(zip(
+                    normalized_colleges,
+                    normalized_courses,
+                    normalized_states,
+                    normalized_addresses,
+                    record_ids
+                ))
                 
                 # Update batch
                 cursor.executemany(f"""
@@ -23459,7 +24296,12 @@ class AdvancedSQLiteMatcher:
                     conn
                 ).iloc[0]['count']
 
-                # For counselling data, also count category, quota, state
+                unmatched_states = pd.read_sql(
+                    f"SELECT COUNT(*) as count FROM {table_name} WHERE master_state_id IS NULL",
+                    conn
+                ).iloc[0]['count']
+
+                # For counselling data, also count category and quota
                 if self.data_type == 'counselling':
                     unmatched_categories = pd.read_sql(
                         f"SELECT COUNT(*) as count FROM {table_name} WHERE master_category_id IS NULL",
@@ -23471,11 +24313,6 @@ class AdvancedSQLiteMatcher:
                         conn
                     ).iloc[0]['count']
 
-                    unmatched_states = pd.read_sql(
-                        f"SELECT COUNT(*) as count FROM {table_name} WHERE master_state_id IS NULL",
-                        conn
-                    ).iloc[0]['count']
-
                     console.print(f"  [1] 🏥 Unmatched Colleges ({unmatched_colleges:,} records)")
                     console.print(f"  [2] 📚 Unmatched Courses ({unmatched_courses:,} records)")
                     console.print(f"  [3] 🏷️  Unmatched Categories ({unmatched_categories:,} records)")
@@ -23487,17 +24324,11 @@ class AdvancedSQLiteMatcher:
                 else:
                     console.print(f"  [1] 🏥 Unmatched Colleges ({unmatched_colleges:,} records)")
                     console.print(f"  [2] 📚 Unmatched Courses ({unmatched_courses:,} records)")
-<<<<<<< Updated upstream
-                    console.print(f"  [3] ⬅️  Back")
-
-                    cat_choice = Prompt.ask("Choose category", choices=["1", "2", "3"], default="3")
-=======
                     console.print(f"  [3] 🗺️  Unmatched States ({unmatched_states:,} records)")
                     console.print(f"  [4] 🔍 Rebuild and Validate")
                     console.print(f"  [5] ⬅️  Back")
 
                     cat_choice = Prompt.ask("Choose category", choices=["1", "2", "3", "4", "5"], default="5")
->>>>>>> Stashed changes
 
                 # Review selected category
                 if cat_choice == "1":
@@ -23508,6 +24339,8 @@ class AdvancedSQLiteMatcher:
                     self._review_unmatched_categories(conn, table_name, session_stats)
                 elif cat_choice == "4" and self.data_type == 'counselling':
                     self._review_unmatched_quotas(conn, table_name, session_stats)
+                elif cat_choice == "3" and self.data_type != 'counselling':
+                    self._review_unmatched_states(conn, table_name, session_stats)
                 elif cat_choice == "4" and self.data_type != 'counselling':
                     self._validate_data_integrity(conn, table_name)
                 elif cat_choice == "5" and self.data_type == 'counselling':
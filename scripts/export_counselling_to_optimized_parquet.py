@@ -4,12 +4,25 @@ Export counselling data from SQLite to optimized Parquet format with hybrid sche
 Handles missing columns gracefully with fallbacks.
 
 Schema: Aggregated records with pre-calculated ranks + all_ranks array
+
+Partitions are converted column-wise to Arrow and written in parallel; the
+manifest carries per-partition min/max statistics so readers can skip files
+without opening them.
+
+Usage:
+    python scripts/export_counselling_to_optimized_parquet.py data/sqlite/counselling_data_partitioned.db \
+        --output-dir output/counselling_data_optimized --row-group-size 65536 --workers 4
 """
 
+import json
+import os
 import sqlite3
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -31,12 +44,29 @@ LEVEL_MAPPING = {
     'DENTAL': 'LVL003',
 }
 
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+# Columns with per-partition min/max in manifest.json (used for file pruning)
+STATISTICS_COLUMNS = [
+    'year', 'round_normalized', 'opening_rank', 'closing_rank', 'seat_count',
+    'master_college_id', 'master_course_id', 'master_quota_id', 'master_category_id', 'master_state_id',
+]
+
 
 class CounsellingDataExporter:
-    def __init__(self, sqlite_path: str, output_dir: str):
+    def __init__(
+        self,
+        sqlite_path: str,
+        output_dir: str,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        max_workers: Optional[int] = None,
+    ):
         self.sqlite_path = Path(sqlite_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        # pyarrow releases the GIL while converting / compressing, so threads write in parallel
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
         
     def get_schema(self) -> pa.Schema:
         """Define optimized Parquet schema with LIST type for ranks"""
@@ -255,71 +285,94 @@ class CounsellingDataExporter:
         
         return result_df
     
+    @staticmethod
+    def _ranks_array(values: pd.Series) -> pa.ListArray:
+        """all_ranks column (lists of ranks) -> LIST<INT32> via offsets + flat values"""
+        lists = [v if isinstance(v, (list, tuple, np.ndarray)) else [] for v in values]
+        offsets = np.zeros(len(lists) + 1, dtype=np.int32)
+        np.cumsum([len(v) for v in lists], out=offsets[1:])
+        flat = np.concatenate([np.asarray(v, dtype=np.float64) for v in lists]) if offsets[-1] else np.zeros(0)
+        return pa.ListArray.from_arrays(pa.array(offsets), pa.array(flat, type=pa.int32()))
+
+    def _column_array(self, partition_df: pd.DataFrame, field: pa.Field) -> pa.Array:
+        """Convert one DataFrame column to the schema type (missing columns are null)"""
+        if field.name == 'calculated_at':
+            values = partition_df.get(field.name, pd.Series(datetime.now(), index=partition_df.index))
+            timestamps = pa.array(pd.to_datetime(values), from_pandas=True)
+            return pc.cast(timestamps, field.type, safe=False)  # Truncate to ms
+        if field.name not in partition_df.columns:
+            return pa.nulls(len(partition_df), type=field.type)
+        if field.name == 'all_ranks':
+            return self._ranks_array(partition_df[field.name])
+        return pa.array(partition_df[field.name], type=field.type, from_pandas=True)
+
+    def partition_table(self, partition_df: pd.DataFrame) -> pa.Table:
+        """Build the Arrow table of one partition column by column"""
+        schema = self.get_schema()
+        return pa.Table.from_arrays([self._column_array(partition_df, field) for field in schema], schema=schema)
+
+    @staticmethod
+    def partition_statistics(table: pa.Table) -> Dict[str, Dict]:
+        """Min/max/null count of STATISTICS_COLUMNS (JSON-serializable)"""
+        stats = {}
+        for name in STATISTICS_COLUMNS:
+            column = table.column(name)
+            min_max = pc.min_max(column)
+            stats[name] = {
+                'min': min_max['min'].as_py(),
+                'max': min_max['max'].as_py(),
+                'null_count': column.null_count,
+            }
+        return stats
+
+    def _write_partition(self, source_id, level_id, year, partition_df: pd.DataFrame) -> Dict:
+        """Convert and write one partition; returns its manifest entry"""
+        # Create partition filename (Hive-style)
+        filename = f"source={source_id}_level={level_id}_year={year}.parquet"
+        filepath = self.output_dir / filename
+
+        table = self.partition_table(partition_df)
+        pq.write_table(
+            table,
+            str(filepath),
+            compression='snappy',
+            use_dictionary=True,  # Enable dictionary encoding for better compression
+            write_statistics=True,  # Enable statistics for query optimization
+            row_group_size=self.row_group_size,
+        )
+
+        file_size_mb = filepath.stat().st_size / (1024 * 1024)
+        logger.info(f"   ✅ {filename}: {len(partition_df):,} records, {file_size_mb:.2f} MB")
+
+        return {
+            'filename': filename,
+            'records': len(partition_df),
+            'size_mb': round(file_size_mb, 2),
+            'source_id': source_id,
+            'level_id': level_id,
+            'year': year.item() if isinstance(year, np.generic) else year,
+            'row_groups': pq.ParquetFile(str(filepath)).num_row_groups,
+            'statistics': self.partition_statistics(table),
+        }
+
     def write_partitioned_parquet(self, df: pd.DataFrame):
         """Write data to partitioned Parquet files by source/level/year"""
-        logger.info("📦 Writing partitioned Parquet files...")
+        logger.info(f"📦 Writing partitioned Parquet files ({self.max_workers} workers, "
+                    f"row groups of {self.row_group_size:,})...")
         
         if df.empty:
             logger.warning("   No data to write")
             return
         
         # Partition by source, level, year
-        partitions = df.groupby(['master_source_id', 'master_level_id', 'year'])
-        
-        partition_info = []
+        partitions = [
+            (source_id, level_id, year, partition_df)
+            for (source_id, level_id, year), partition_df in df.groupby(['master_source_id', 'master_level_id', 'year'])
+            if not partition_df.empty
+        ]
         
-        for (source_id, level_id, year), partition_df in partitions:
-            if partition_df.empty:
-                continue
-            
-            # Create partition filename (Hive-style)
-            filename = f"source={source_id}_level={level_id}_year={year}.parquet"
-            filepath = self.output_dir / filename
-            
-            # Convert DataFrame to PyArrow Table with proper schema
-            # Handle all_ranks array conversion
-            table_data = []
-            
-            for _, row in partition_df.iterrows():
-                record = {}
-                for field in self.get_schema():
-                    field_name = field.name
-                    
-                    if field_name == 'all_ranks':
-                        # Convert list to PyArrow array
-                        record[field_name] = row.get(field_name, [])
-                    elif field_name == 'calculated_at':
-                        # Convert timestamp
-                        record[field_name] = pd.Timestamp(row.get(field_name, datetime.now()))
-                    else:
-                        record[field_name] = row.get(field_name)
-                
-                table_data.append(record)
-            
-            # Create PyArrow Table
-            table = pa.Table.from_pylist(table_data, schema=self.get_schema())
-            
-            # Write to Parquet
-            pq.write_table(
-                table,
-                str(filepath),
-                compression='snappy',
-                use_dictionary=True,  # Enable dictionary encoding for better compression
-                write_statistics=True,  # Enable statistics for query optimization
-            )
-            
-            file_size_mb = filepath.stat().st_size / (1024 * 1024)
-            
-            partition_info.append({
-                'filename': filename,
-                'records': len(partition_df),
-                'size_mb': round(file_size_mb, 2),
-                'source_id': source_id,
-                'level_id': level_id,
-                'year': year,
-            })
-            
-            logger.info(f"   ✅ {filename}: {len(partition_df):,} records, {file_size_mb:.2f} MB")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            partition_info = list(executor.map(lambda partition: self._write_partition(*partition), partitions))
         
         # Create manifest
         manifest = {
@@ -327,11 +380,11 @@ class CounsellingDataExporter:
             'source_database': str(self.sqlite_path),
             'total_partitions': len(partition_info),
             'total_records': len(df),
+            'row_group_size': self.row_group_size,
             'partitions': partition_info,
         }
         
         manifest_path = self.output_dir / 'manifest.json'
-        import json
         with open(manifest_path, 'w') as f:
             json.dump(manifest, f, indent=2)
         
@@ -380,10 +433,27 @@ def main():
         default='output/counselling_data_optimized',
         help='Output directory for Parquet files'
     )
+    parser.add_argument(
+        '--row-group-size',
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help='Rows per Parquet row group'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Partitions written in parallel (default: min(8, CPU count))'
+    )
     
     args = parser.parse_args()
     
-    exporter = CounsellingDataExporter(args.sqlite_path, args.output_dir)
+    exporter = CounsellingDataExporter(
+        args.sqlite_path,
+        args.output_dir,
+        row_group_size=args.row_group_size,
+        max_workers=args.workers,
+    )
     exporter.export()
 
 
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Semantic Near-Duplicate Tier for the LLM Response Cache
+
+The exact cache (llm_response_cache.LLMResponseCache) keys on the raw
+upper-cased name|state|address|course string, so "GOVT MEDICAL COLLEGE, KOTA"
+and "GOVERNMENT MEDICAL COLLEGE KOTA" are two separate paid LLM round trips.
+This tier runs each request through DataNormalizer (abbreviation expansion,
+pincode/state removal), embeds the normalized "name | address" text and keeps
+one exact vector index per (state, stream) partition. A cached decision is
+offered for reuse when cosine similarity reaches the threshold; the caller
+still applies its own guards (AgenticMatcher re-checks the state/stream rules
+of _apply_decisions) before accepting it.
+
+Vectors are stored next to the cache (table llm_cache_semantic in the same
+SQLite file). The default encoder is a local hashed character-trigram
+embedding - free and deterministic, so the tier never costs an API call
+itself; any encode_fn (e.g. a sentence-transformers model) can be plugged in.
+
+Usage:
+    from llm_response_cache import get_matcher_cache
+    from semantic_llm_cache import get_semantic_cache_tier
+
+    tier = get_semantic_cache_tier(get_matcher_cache(), threshold=0.92)
+    hits = tier.get_many([(name, state, address, course_type), ...])
+    # -> SemanticHit(entry, similarity, ...) or None per request
+    # New cache.set_many() writes are indexed automatically
+"""
+
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from advanced_vector_search import NumpyIndex
+from lib.utils.data_normalizer import DataNormalizer
+from llm_response_cache import CacheEntry, LLMResponseCache, cache_stream_key
+
+logger = logging.getLogger(__name__)
+
+HASH_EMBEDDING_MODEL = 'char-trigram-hash-1024'
+HASH_EMBEDDING_DIM = 1024
+DEFAULT_THRESHOLD = 0.92
+
+_normalizer: Optional[DataNormalizer] = None
+
+
+def hashed_ngram_embeddings(texts: List[str], dim: int = HASH_EMBEDDING_DIM, n: int = 3) -> np.ndarray:
+    """Character n-gram count vectors hashed into `dim` buckets (crc32, stable across runs)"""
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        padded = f" {text} "
+        grams = [padded[i:i + n] for i in range(max(len(padded) - n + 1, 0))]
+        if grams:
+            buckets = np.fromiter((zlib.crc32(g.encode('utf-8')) % dim for g in grams), dtype=np.int64, count=len(grams))
+            vectors[row] = np.bincount(buckets, minlength=dim)
+    return vectors
+
+
+def semantic_cache_text(college_name: str, address: str, state: str) -> str:
+    """Normalized "name | address" text that is embedded for a request"""
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = DataNormalizer()
+    name = _normalizer.normalize_college_name(college_name or '')
+    addr = _normalizer.normalize_address(address or '', state or None)
+    return f"{name} | {addr}"
+
+
+def _partition_key(state: str, course_type: Optional[str]) -> Tuple[str, str]:
+    return (state or '').upper().strip(), cache_stream_key(course_type)
+
+
+@dataclass
+class SemanticHit:
+    """A cached decision reused for a near-duplicate request."""
+    entry: CacheEntry
+    similarity: float
+    cached_text: str
+    query_text: str
+
+
+class SemanticCacheTier:
+    """
+    Second-tier lookup over embeddings of normalized cache requests.
+
+    Args:
+        cache: The exact LLMResponseCache (entries, TTL and verification live there)
+        threshold: Minimum cosine similarity for reuse
+        encode_fn: texts -> (n, dim) array; defaults to hashed_ngram_embeddings
+        model_name: Identifies the encoder (rows of other encoders are ignored)
+        top_k: Neighbours checked per request (the best one may fail the guards)
+    """
+
+    def __init__(
+        self,
+        cache: LLMResponseCache,
+        threshold: float = DEFAULT_THRESHOLD,
+        encode_fn: Optional[Callable[[List[str]], np.ndarray]] = None,
+        model_name: Optional[str] = None,
+        top_k: int = 3,
+    ):
+        self.cache = cache
+        self.threshold = threshold
+        self.encode_fn = encode_fn or hashed_ngram_embeddings
+        self.model_name = model_name or (HASH_EMBEDDING_MODEL if encode_fn is None else 'custom')
+        self.top_k = top_k
+
+        # (state, stream) -> (index, cache_keys, texts)
+        self._partitions: Dict[Tuple[str, str], Tuple[NumpyIndex, List[str], List[str]]] = {}
+        self._indexed: set = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+        self.stats = {'lookups': 0, 'hits': 0, 'below_threshold': 0, 'guard_rejected': 0, 'writes': 0}
+
+        self._init_db()
+
+    def _init_db(self):
+        with self.cache._get_conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache_semantic (
+                    cache_key TEXT PRIMARY KEY,
+                    state TEXT,
+                    stream TEXT,
+                    normalized_text TEXT,
+                    model_name TEXT,
+                    embedding BLOB
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_semantic_partition ON llm_cache_semantic(state, stream)")
+            conn.commit()
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vectors = np.asarray(self.encode_fn(texts), dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(texts):
+            raise ValueError(f"encode_fn returned shape {vectors.shape} for {len(texts)} texts")
+        return vectors
+
+    def _index_rows(self, rows: List[Tuple[str, str, str, str, np.ndarray]]):
+        """Add (cache_key, state, stream, text, vector) rows to the in-memory partitions"""
+        grouped: Dict[Tuple[str, str], List[Tuple[str, str, np.ndarray]]] = {}
+        for cache_key, state, stream, text, vector in rows:
+            if cache_key in self._indexed:
+                continue  # Same key -> same text -> same vector
+            self._indexed.add(cache_key)
+            grouped.setdefault((state, stream), []).append((cache_key, text, vector))
+
+        for partition, items in grouped.items():
+            if partition not in self._partitions:
+                self._partitions[partition] = (NumpyIndex(len(items[0][2]), normalize=True), [], [])
+            index, keys, texts = self._partitions[partition]
+            index.add(np.stack([vector for _, _, vector in items]))
+            keys.extend(key for key, _, _ in items)
+            texts.extend(text for _, text, _ in items)
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self.cache._get_conn() as conn:
+            # Drop vectors whose cache entry was invalidated or expired
+            conn.execute("DELETE FROM llm_cache_semantic WHERE cache_key NOT IN (SELECT cache_key FROM llm_cache)")
+            conn.commit()
+            db_rows = conn.execute("""
+                SELECT cache_key, state, stream, normalized_text, embedding
+                FROM llm_cache_semantic WHERE model_name = ?
+            """, (self.model_name,)).fetchall()
+
+        self._index_rows([
+            (row['cache_key'], row['state'], row['stream'], row['normalized_text'],
+             np.frombuffer(row['embedding'], dtype=np.float32))
+            for row in db_rows
+        ])
+        self._loaded = True
+        if db_rows:
+            logger.info(f"Semantic cache tier: indexed {len(db_rows):,} cached requests in {len(self._partitions)} partitions")
+
+    def add_many(self, entries: List[Dict]):
+        """
+        Index cached requests (dicts with the keyword arguments of LLMResponseCache.set).
+
+        Called by LLMResponseCache.set_many() once the tier is attached.
+        """
+        entries = [e for e in entries if e.get('college_name') or e.get('address')]
+        if not entries:
+            return
+
+        texts = [semantic_cache_text(e.get('college_name'), e.get('address'), e.get('state')) for e in entries]
+        vectors = self._encode(texts)
+        rows = []
+        for entry, text, vector in zip(entries, texts, vectors):
+            state, stream = _partition_key(entry.get('state'), entry.get('course_type'))
+            cache_key = self.cache._create_cache_key(
+                entry.get('college_name', ''), entry.get('state', ''), entry.get('address', ''), entry.get('course_type')
+            )
+            rows.append((cache_key, state, stream, text, vector))
+
+        with self.cache._get_conn() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO llm_cache_semantic
+                (cache_key, state, stream, normalized_text, model_name, embedding)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(key, state, stream, text, self.model_name, vector.tobytes()) for key, state, stream, text, vector in rows])
+            conn.commit()
+
+        with self._lock:
+            if self._loaded:
+                self._index_rows(rows)
+        self.stats['writes'] += len(rows)
+
+    def get_many(
+        self,
+        requests: List[Tuple[str, str, str, Optional[str]]],
+        verified_only: bool = True,
+        accept: Optional[Callable[[int, CacheEntry], bool]] = None,
+        prepare: Optional[Callable[[List[CacheEntry]], None]] = None,
+    ) -> List[Optional[SemanticHit]]:
+        """
+        Near-duplicate lookup for (college_name, state, address, course_type) requests.
+
+        Args:
+            requests: Requests that missed the exact cache
+            verified_only: Only reuse Guardian-verified entries
+            accept: Optional guard(request_index, entry) -> bool; neighbours are
+                tried in similarity order until one is accepted
+            prepare: Optional callback with every candidate entry, called once
+                before `accept` (e.g. to bulk-load what the guard needs)
+
+        Returns:
+            SemanticHit or None per request, in order
+        """
+        results: List[Optional[SemanticHit]] = [None] * len(requests)
+        if not requests:
+            return results
+
+        with self._lock:
+            self._ensure_loaded()
+            self.stats['lookups'] += len(requests)
+
+            # Group requests by partition - only the same state and stream are searched
+            grouped: Dict[Tuple[str, str], List[int]] = {}
+            for i, (name, state, address, course_type) in enumerate(requests):
+                if name or address:
+                    grouped.setdefault(_partition_key(state, course_type), []).append(i)
+
+            texts = {i: semantic_cache_text(requests[i][0], requests[i][2], requests[i][1])
+                     for members in grouped.values() for i in members}
+
+            # Neighbours above threshold: request index -> [(cache_key, cached_text, similarity)]
+            candidates: Dict[int, List[Tuple[str, str, float]]] = {}
+            for partition, members in grouped.items():
+                if partition not in self._partitions:
+                    continue
+                index, keys, cached_texts = self._partitions[partition]
+                query_vectors = self._encode([texts[i] for i in members])
+                distances, ids = index.search(query_vectors, self.top_k)
+                similarities = 1.0 - distances / 2.0  # unit vectors: ||q - v||^2 = 2 - 2cos
+
+                for row, i in enumerate(members):
+                    found = [
+                        (keys[idx], cached_texts[idx], float(sim))
+                        for idx, sim in zip(ids[row], similarities[row])
+                        if idx >= 0 and sim >= self.threshold
+                    ]
+                    if found:
+                        candidates[i] = found
+                    else:
+                        self.stats['below_threshold'] += 1
+
+        if not candidates:
+            return results
+
+        entries = self.cache.get_entries(
+            list({key for found in candidates.values() for key, _, _ in found}), verified_only=verified_only
+        )
+        if prepare is not None:
+            prepare([entry for entry in entries.values() if entry.matched_college_id])
+        for i, found in candidates.items():
+            for cache_key, cached_text, similarity in found:
+                entry = entries.get(cache_key)
+                if entry is None or not entry.matched_college_id:
+                    continue
+                if accept is not None and not accept(i, entry):
+                    self.stats['guard_rejected'] += 1
+                    continue
+                results[i] = SemanticHit(entry, similarity, cached_text, texts[i])
+                self.stats['hits'] += 1
+                break
+
+        return results
+
+    def get_stats(self) -> Dict:
+        """Session counters plus index size"""
+        return {
+            **self.stats,
+            'indexed': len(self._indexed),
+            'partitions': len(self._partitions),
+            'threshold': self.threshold,
+        }
+
+
+# One tier per cache instance
+_tiers: Dict[int, SemanticCacheTier] = {}
+_tiers_lock = threading.Lock()
+
+
+def get_semantic_cache_tier(cache: LLMResponseCache, threshold: float = DEFAULT_THRESHOLD) -> SemanticCacheTier:
+    """Get (or create and attach) the semantic tier for a cache"""
+    with _tiers_lock:
+        tier = _tiers.get(id(cache))
+        if tier is None:
+            tier = SemanticCacheTier(cache, threshold=threshold)
+            cache.semantic_tier = tier
+            _tiers[id(cache)] = tier
+        tier.threshold = threshold
+        return tier
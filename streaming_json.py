@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON Object Decoder
+
+Pulls complete JSON objects out of a (streamed) LLM response without
+re-scanning what was already seen. The scanner keeps a cursor, a brace
+stack and string/escape state across chunks, so total work is linear in
+the response length. Braces inside strings (e.g. a "reason" mentioning
+"{A} vs {B}") and nested objects are handled correctly.
+
+Usage:
+    decoder = IncrementalJSONObjectDecoder(required_key='record_id')
+    for chunk in client.complete_stream(...):
+        for obj in decoder.feed(chunk):
+            handle(obj)            # each record exactly once, as soon as it closes
+
+    # Whole responses (batch parsers): fenced, wrapped or raw arrays
+    items = extract_json_objects(content, required_key='group_id')
+"""
+
+import json
+from typing import Dict, List, Optional
+
+
+class IncrementalJSONObjectDecoder:
+    """
+    Emits each completed JSON object once, in closing order.
+
+    Args:
+        required_key: Only emit objects with this top-level key (at any nesting
+            depth - e.g. records inside {"matches": [...]}). If None, emit the
+            outermost objects only.
+    """
+
+    def __init__(self, required_key: Optional[str] = None):
+        self.required_key = required_key
+        self._key_marker = f'"{required_key}"' if required_key else None
+        self._buffer = ''
+        self._pos = 0            # Scan cursor into _buffer
+        self._starts: List[Optional[int]] = []  # Offsets of open '{' (None: wrapper, not kept)
+        self._in_string = False
+        self._escape = False
+        self.emitted = 0
+        self.skipped = 0         # Complete objects that failed to parse
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """Consume a chunk; return objects completed by it."""
+        if not chunk:
+            return []
+        self._buffer += chunk
+        completed = []
+
+        buffer = self._buffer
+        starts = self._starts
+        in_string = self._in_string
+        escape = self._escape
+
+        pos = self._pos
+        end = len(buffer)
+        while pos < end:
+            char = buffer[pos]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == '\\':
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                starts.append(pos)
+            elif char == '}' and starts:
+                start = starts.pop()
+                if start is not None:
+                    obj = self._complete(buffer, start, pos + 1, outermost=not starts)
+                    if obj is not None:
+                        completed.append(obj)
+                        if self.required_key is not None:
+                            # Enclosing objects are wrappers ({"matches": [...]}) -
+                            # stop buffering them so memory stays bounded
+                            starts[:] = [None] * len(starts)
+            pos += 1
+
+        self._in_string = in_string
+        self._escape = escape
+
+        # Drop text that can no longer be part of an emitted object
+        offset = next((s for s in starts if s is not None), pos)
+        if offset:
+            self._buffer = buffer[offset:]
+            self._starts = [None if s is None else s - offset for s in starts]
+            pos -= offset
+        self._pos = pos
+
+        self.emitted += len(completed)
+        return completed
+
+    def _complete(self, buffer: str, start: int, stop: int, outermost: bool) -> Optional[Dict]:
+        """Parse a closed object if it is one we emit."""
+        if self._key_marker is None:
+            if not outermost:
+                return None
+        elif self._key_marker not in buffer[start:stop]:
+            return None
+
+        try:
+            obj = json.loads(buffer[start:stop])
+        except json.JSONDecodeError:
+            self.skipped += 1
+            return None
+
+        if self.required_key is not None and self.required_key not in obj:
+            return None
+        return obj
+
+
+def extract_json_objects(content: str, required_key: Optional[str] = None) -> List[Dict]:
+    """All objects in a complete response (see IncrementalJSONObjectDecoder)."""
+    return IncrementalJSONObjectDecoder(required_key).feed(content or '')
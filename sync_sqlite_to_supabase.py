@@ -5,8 +5,16 @@ Sync SQLite Master Data to Supabase
 This script syncs data from local SQLite databases to Supabase.
 SQLite is the source of truth for master data tables.
 
+Only changes are sent: source tables are streamed in chunks and every row gets
+a content hash, which is compared with the hashes recorded at the last
+successful sync (watermark table in SYNC_STATE_DB). New and changed rows are
+upserted in concurrent batches with retry; rows that disappeared since the
+last sync are deleted. --full-resync forgets the watermark and re-sends all rows.
+
 Usage:
     python sync_sqlite_to_supabase.py [--tables TABLE1,TABLE2] [--dry-run]
+    python sync_sqlite_to_supabase.py --workers 8 --batch-size 500 --full-resync
+    python sync_sqlite_to_supabase.py --local-target /tmp/supabase_standin.db   # offline (local_supabase_standin)
 """
 
 import os
@@ -14,8 +22,10 @@ import sqlite3
 import json
 import argparse
 import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import logging
 
 # Try to import supabase client
@@ -24,6 +34,7 @@ try:
     HAS_SUPABASE = True
 except ImportError:
     HAS_SUPABASE = False
+    Client = Any  # Annotations only (e.g. when syncing into local_supabase_standin)
     print("Warning: supabase-py not installed. Install with: pip install supabase")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,6 +44,14 @@ logger = logging.getLogger(__name__)
 SQLITE_MASTER_DB = "data/sqlite/master_data.db"
 SQLITE_SEAT_DB = "data/sqlite/seat_data.db"
 SQLITE_COUNSELLING_DB = "data/sqlite/counselling_data_partitioned.db"
+SYNC_STATE_DB = "data/sqlite/supabase_sync_state.db"
+
+# Streaming / upload defaults
+READ_CHUNK_SIZE = 5000
+UPSERT_BATCH_SIZE = 500
+SYNC_WORKERS = 4
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0  # seconds, doubled per attempt
 
 # Table configurations: SQLite table -> Supabase table
 TABLE_CONFIG = {
@@ -197,42 +216,53 @@ def convert_value(value: Any, conversion_type: str) -> Any:
     return value
 
 
+def iter_sqlite_table(
+    db_path: str,
+    table_name: str,
+    columns: List[str],
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[List[Dict]]:
+    """Stream rows of a SQLite table as lists of dicts (chunk_size rows at a time)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        
+        # Check which columns exist
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        
+        # Filter to only existing columns
+        valid_columns = [c for c in columns if c in existing_columns]
+        
+        if not valid_columns:
+            logger.warning(f"No valid columns found for {table_name}")
+            return
+        
+        cursor.execute(f"SELECT {', '.join(valid_columns)} FROM {table_name}")
+        
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            rows = []
+            for values in chunk:
+                row_dict = dict(zip(valid_columns, values))
+                for col, value in row_dict.items():
+                    # Handle bytes (BLOB) columns - convert to string or None
+                    if isinstance(value, bytes):
+                        try:
+                            row_dict[col] = value.decode('utf-8')
+                        except UnicodeDecodeError:
+                            row_dict[col] = None  # Skip binary data that can't be decoded
+                rows.append(row_dict)
+            yield rows
+    finally:
+        conn.close()
+
+
 def read_sqlite_table(db_path: str, table_name: str, columns: List[str]) -> List[Dict]:
     """Read data from SQLite table."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    # Check which columns exist
-    cursor.execute(f"PRAGMA table_info({table_name})")
-    existing_columns = {row[1] for row in cursor.fetchall()}
-    
-    # Filter to only existing columns
-    valid_columns = [c for c in columns if c in existing_columns]
-    
-    if not valid_columns:
-        logger.warning(f"No valid columns found for {table_name}")
-        return []
-    
-    query = f"SELECT {', '.join(valid_columns)} FROM {table_name}"
-    cursor.execute(query)
-    
-    rows = []
-    for row in cursor.fetchall():
-        row_dict = {}
-        for col in valid_columns:
-            value = row[col]
-            # Handle bytes (BLOB) columns - convert to string or None
-            if isinstance(value, bytes):
-                try:
-                    value = value.decode('utf-8')
-                except:
-                    value = None  # Skip binary data that can't be decoded
-            row_dict[col] = value
-        rows.append(row_dict)
-    
-    conn.close()
-    return rows
+    return [row for chunk in iter_sqlite_table(db_path, table_name, columns) for row in chunk]
 
 
 def apply_type_conversions(row: Dict, type_conversions: Dict[str, str]) -> Dict:
@@ -270,72 +300,291 @@ def generate_seat_id(row: Dict) -> str:
     return f"{state_prefix}_{hash_suffix}"
 
 
+def row_content_hash(row: Dict) -> str:
+    """Stable hash of a row's content (what is compared with the watermark)."""
+    payload = json.dumps(row, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _primary_key_columns(config: Dict) -> List[str]:
+    primary_key = config["primary_key"]
+    return list(primary_key) if isinstance(primary_key, list) else [primary_key]
+
+
+class SyncWatermark:
+    """
+    Hashes of the rows last synced per table, kept in a local SQLite file.
+
+    Rows are keyed by the JSON list of their primary key values. A run stages the
+    current hashes in a temp table (only rows differing from the watermark keep
+    their payload), so the delta is a pair of SQL queries and memory stays bounded.
+    """
+
+    def __init__(self, db_path: str = SYNC_STATE_DB):
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS supabase_sync_watermark (
+                table_name TEXT NOT NULL,
+                row_key TEXT NOT NULL,
+                row_hash TEXT NOT NULL,
+                synced_at TEXT NOT NULL,
+                PRIMARY KEY (table_name, row_key)
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def forget(self, table_name: str, commit: bool = True):
+        """Drop the watermark of a table (next sync re-sends every row); commit=False lets rollback() undo it."""
+        self.conn.execute("DELETE FROM supabase_sync_watermark WHERE table_name = ?", (table_name,))
+        if commit:
+            self.conn.commit()
+
+    def rollback(self):
+        """Discard uncommitted changes (the forget() of a dry run)."""
+        self.conn.rollback()
+
+    def stage(self, table_name: str, rows: Iterator[Tuple[str, str, Dict]]) -> int:
+        """Stage (row_key, row_hash, row) of the current source; later rows win on duplicate keys."""
+        self.conn.execute("DROP TABLE IF EXISTS temp.sync_stage")
+        self.conn.execute("""
+            CREATE TEMP TABLE sync_stage (
+                row_key TEXT PRIMARY KEY,
+                row_hash TEXT NOT NULL,
+                payload TEXT,  -- Only for rows that differ from the watermark
+                is_new INTEGER NOT NULL
+            )
+        """)
+        staged = 0
+        for chunk in rows:
+            keys = [key for key, _, _ in chunk]
+            synced = {}
+            for i in range(0, len(keys), 500):  # Stay under SQLite's parameter limit
+                part = keys[i:i + 500]
+                synced.update(self.conn.execute(
+                    f"SELECT row_key, row_hash FROM supabase_sync_watermark "
+                    f"WHERE table_name = ? AND row_key IN ({','.join('?' * len(part))})",
+                    [table_name, *part],
+                ).fetchall())
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sync_stage (row_key, row_hash, payload, is_new) VALUES (?, ?, ?, ?)",
+                [
+                    (key, row_hash,
+                     None if synced.get(key) == row_hash else json.dumps(row, default=str),
+                     int(key not in synced))
+                    for key, row_hash, row in chunk
+                ],
+            )
+            staged += len(chunk)
+        return staged
+
+    def delta_counts(self, table_name: str) -> Dict[str, int]:
+        inserts, updates, unchanged = self.conn.execute("""
+            SELECT COALESCE(SUM(payload IS NOT NULL AND is_new), 0),
+                   COALESCE(SUM(payload IS NOT NULL AND NOT is_new), 0),
+                   COALESCE(SUM(payload IS NULL), 0)
+            FROM sync_stage
+        """).fetchone()
+        deletes = self.conn.execute("""
+            SELECT COUNT(*) FROM supabase_sync_watermark
+            WHERE table_name = ? AND row_key NOT IN (SELECT row_key FROM sync_stage)
+        """, (table_name,)).fetchone()[0]
+        return {"inserts": inserts, "updates": updates, "deletes": deletes, "unchanged": unchanged}
+
+    def iter_changed(self, batch_size: int) -> Iterator[List[Tuple[str, str, int, Dict]]]:
+        """Batches of (row_key, row_hash, is_new, row) to upsert."""
+        cursor = self.conn.execute(
+            "SELECT row_key, row_hash, is_new, payload FROM sync_stage WHERE payload IS NOT NULL"
+        )
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            yield [(key, row_hash, is_new, json.loads(payload)) for key, row_hash, is_new, payload in batch]
+
+    def iter_deleted(self, table_name: str, batch_size: int) -> Iterator[List[str]]:
+        """Batches of row keys synced before but no longer in the source."""
+        cursor = self.conn.execute("""
+            SELECT row_key FROM supabase_sync_watermark
+            WHERE table_name = ? AND row_key NOT IN (SELECT row_key FROM sync_stage)
+        """, (table_name,))
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            yield [key for (key,) in batch]
+
+    def mark_synced(self, table_name: str, rows: List[Tuple[str, str]]):
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO supabase_sync_watermark (table_name, row_key, row_hash, synced_at) VALUES (?, ?, ?, ?)",
+            [(table_name, key, row_hash, now) for key, row_hash in rows],
+        )
+        self.conn.commit()
+
+    def mark_deleted(self, table_name: str, keys: List[str]):
+        self.conn.executemany(
+            "DELETE FROM supabase_sync_watermark WHERE table_name = ? AND row_key = ?",
+            [(table_name, key) for key in keys],
+        )
+        self.conn.commit()
+
+
+def _with_retry(fn, description: str, retries: int = MAX_RETRIES, backoff: float = RETRY_BACKOFF):
+    """Call fn(), retrying with exponential backoff; re-raises the last error."""
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = backoff * (2 ** attempt)
+            logger.warning(f"{description} failed ({e}); retry {attempt + 1}/{retries} in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def _run_bounded(executor: ThreadPoolExecutor, jobs: Iterator, submit, on_done, max_in_flight: int):
+    """Submit jobs lazily with at most max_in_flight pending; on_done(job, future) runs in this thread."""
+    pending = {}
+    for job in jobs:
+        if len(pending) >= max_in_flight:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                on_done(pending.pop(future), future)
+        pending[submit(job)] = job
+    done, _ = wait(pending)
+    for future in done:
+        on_done(pending.pop(future), future)
+
+
 def sync_table_to_supabase(
     supabase: Client,
     table_name: str,
     config: Dict,
     dry_run: bool = False,
-    batch_size: int = 500
+    batch_size: int = UPSERT_BATCH_SIZE,
+    watermark: Optional[SyncWatermark] = None,
+    workers: int = SYNC_WORKERS,
+    chunk_size: int = READ_CHUNK_SIZE,
+    full_resync: bool = False,
 ) -> Dict[str, int]:
-    """Sync a single table from SQLite to Supabase."""
-    stats = {"inserted": 0, "updated": 0, "errors": 0}
+    """Sync the changes of a single table from SQLite to Supabase (every row with full_resync)."""
+    stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0, "errors": 0}
     
-    # Read from SQLite (use source_table if specified, otherwise use table_name)
-    source_table = config.get("source_table", table_name)
-    logger.info(f"Reading {source_table} from SQLite...")
-    rows = read_sqlite_table(config["source_db"], source_table, config["columns"])
-
-    
-    if not rows:
-        logger.warning(f"No data found in {table_name}")
-        return stats
-    
-    logger.info(f"Found {len(rows)} rows in {table_name}")
-    
-    # Apply type conversions
-    converted_rows = [apply_type_conversions(row, config.get("type_conversions", {})) for row in rows]
+    own_watermark = watermark is None
+    if own_watermark:
+        watermark = SyncWatermark()
     
-    # Special handling for seat_data: regenerate unique IDs to fix duplicates
-    if table_name == "seat_data":
-        logger.info("Regenerating unique IDs for seat_data...")
-        for row in converted_rows:
-            row['id'] = generate_seat_id(row)
+    try:
+        if full_resync:
+            # A dry run only counts against the forgotten watermark, then rolls it back
+            watermark.forget(table_name, commit=not dry_run)
         
-        # Deduplicate by keeping last occurrence per ID
-        seen = {}
-        for row in converted_rows:
-            seen[row['id']] = row
-        converted_rows = list(seen.values())
-        logger.info(f"After deduplication: {len(converted_rows)} unique rows")
-    
-    if dry_run:
-        logger.info(f"[DRY RUN] Would upsert {len(converted_rows)} rows to {table_name}")
-        return {"would_upsert": len(converted_rows)}
-    
-    # Upsert in batches
-    for i in range(0, len(converted_rows), batch_size):
-        batch = converted_rows[i:i + batch_size]
-        try:
-            # Use upsert to handle both inserts and updates
-            primary_key = config["primary_key"]
-            if isinstance(primary_key, list):
-                pk_str = ",".join(primary_key)
-            else:
-                pk_str = primary_key
-            
-            result = supabase.table(table_name).upsert(
-                batch,
-                on_conflict=pk_str
-            ).execute()
-            
-            stats["inserted"] += len(batch)
-            logger.info(f"Upserted batch {i//batch_size + 1}: {len(batch)} rows")
-            
-        except Exception as e:
-            logger.error(f"Error upserting batch to {table_name}: {e}")
-            stats["errors"] += len(batch)
-    
-    return stats
+        # Read from SQLite (use source_table if specified, otherwise use table_name)
+        source_table = config.get("source_table", table_name)
+        key_columns = _primary_key_columns(config)
+        type_conversions = config.get("type_conversions", {})
+        
+        def keyed_chunks():
+            for chunk in iter_sqlite_table(config["source_db"], source_table, config["columns"], chunk_size):
+                keyed = []
+                for row in chunk:
+                    row = apply_type_conversions(row, type_conversions)
+                    # Special handling for seat_data: regenerate unique IDs to fix duplicates
+                    # (rows sharing an ID are deduplicated by staging - the last one wins)
+                    if table_name == "seat_data":
+                        row['id'] = generate_seat_id(row)
+                    key = json.dumps([row.get(c) for c in key_columns], default=str)
+                    keyed.append((key, row_content_hash(row), row))
+                yield keyed
+        
+        logger.info(f"Reading {source_table} from SQLite...")
+        total_rows = watermark.stage(table_name, keyed_chunks())
+        delta = watermark.delta_counts(table_name)
+        stats["unchanged"] = delta["unchanged"]
+        
+        if not total_rows and not delta["deletes"]:
+            logger.warning(f"No data found in {table_name}")
+            return stats
+        
+        logger.info(f"Found {total_rows} rows in {table_name}: {delta['inserts']} new, {delta['updates']} changed, "
+                    f"{delta['deletes']} deleted, {delta['unchanged']} unchanged")
+        
+        if dry_run:
+            logger.info(f"[DRY RUN] Would upsert {delta['inserts'] + delta['updates']} rows and "
+                        f"delete {delta['deletes']} rows in {table_name}")
+            return {
+                "would_insert": delta["inserts"],
+                "would_update": delta["updates"],
+                "would_delete": delta["deletes"],
+                "unchanged": delta["unchanged"],
+            }
+        
+        on_conflict = ",".join(key_columns)
+        
+        def upsert(batch):
+            return _with_retry(
+                lambda: supabase.table(table_name).upsert([row for _, _, _, row in batch], on_conflict=on_conflict).execute(),
+                f"Upsert of {len(batch)} rows to {table_name}",
+            )
+        
+        def delete(keys):
+            values = [json.loads(key) for key in keys]
+            if len(key_columns) == 1:
+                return _with_retry(
+                    lambda: supabase.table(table_name).delete().in_(key_columns[0], [v[0] for v in values]).execute(),
+                    f"Delete of {len(keys)} rows from {table_name}",
+                )
+            for value in values:
+                _with_retry(
+                    lambda: supabase.table(table_name).delete().match(dict(zip(key_columns, value))).execute(),
+                    f"Delete of a row from {table_name}",
+                )
+        
+        def upserted(batch, future):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error upserting batch to {table_name}: {e}")
+                stats["errors"] += len(batch)
+                return
+            # Watermark moves only for rows Supabase accepted
+            watermark.mark_synced(table_name, [(key, row_hash) for key, row_hash, _, _ in batch])
+            new_rows = sum(is_new for _, _, is_new, _ in batch)
+            stats["inserted"] += new_rows
+            stats["updated"] += len(batch) - new_rows
+        
+        def deleted(keys, future):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error deleting rows from {table_name}: {e}")
+                stats["errors"] += len(keys)
+                return
+            watermark.mark_deleted(table_name, keys)
+            stats["deleted"] += len(keys)
+        
+        # Materialize delete keys first: marking rows synced must not shift the delete query
+        deleted_batches = list(watermark.iter_deleted(table_name, batch_size))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _run_bounded(executor, watermark.iter_changed(batch_size),
+                         lambda batch: executor.submit(upsert, batch), upserted, max_in_flight=workers * 2)
+            _run_bounded(executor, iter(deleted_batches),
+                         lambda keys: executor.submit(delete, keys), deleted, max_in_flight=workers * 2)
+        
+        logger.info(f"Synced {table_name}: {stats['inserted']} inserted, {stats['updated']} updated, "
+                    f"{stats['deleted']} deleted, {stats['errors']} errors")
+        return stats
+    finally:
+        if dry_run:
+            watermark.rollback()
+        if own_watermark:
+            watermark.close()
 
 
 def refresh_consolidated_colleges(supabase: Client) -> bool:
@@ -425,9 +674,18 @@ def refresh_consolidated_colleges(supabase: Client) -> bool:
         return False
 
 
-def sync_all_tables(supabase: Client, tables: Optional[List[str]] = None, dry_run: bool = False):
+def sync_all_tables(
+    supabase: Client,
+    tables: Optional[List[str]] = None,
+    dry_run: bool = False,
+    state_db: str = SYNC_STATE_DB,
+    full_resync: bool = False,
+    workers: int = SYNC_WORKERS,
+    batch_size: int = UPSERT_BATCH_SIZE,
+):
     """Sync all configured tables or specified subset."""
     target_tables = tables if tables else list(TABLE_CONFIG.keys())
+    watermark = SyncWatermark(state_db)
     
     all_stats = {}
     for table_name in target_tables:
@@ -443,10 +701,15 @@ def sync_all_tables(supabase: Client, tables: Optional[List[str]] = None, dry_ru
             supabase,
             table_name,
             TABLE_CONFIG[table_name],
-            dry_run=dry_run
+            dry_run=dry_run,
+            batch_size=batch_size,
+            watermark=watermark,
+            workers=workers,
+            full_resync=full_resync,
         )
         all_stats[table_name] = stats
     
+    watermark.close()
     return all_stats
 
 
@@ -467,10 +730,20 @@ def main():
     parser.add_argument("--tables", type=str, help="Comma-separated list of tables to sync")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
     parser.add_argument("--count", action="store_true", help="Show current row counts")
+    parser.add_argument("--full-resync", action="store_true", help="Ignore the sync watermark and re-send every row")
+    parser.add_argument("--workers", type=int, default=SYNC_WORKERS, help="Concurrent upsert/delete requests")
+    parser.add_argument("--batch-size", type=int, default=UPSERT_BATCH_SIZE, help="Rows per upsert request")
+    parser.add_argument("--state-db", type=str, default=SYNC_STATE_DB, help="SQLite file holding the sync watermark")
+    parser.add_argument("--local-target", type=str,
+                        help="Sync into a local SQLite stand-in instead of Supabase (see local_supabase_standin.py)")
     args = parser.parse_args()
     
     # Initialize Supabase client
-    supabase = get_supabase_client()
+    if args.local_target:
+        from local_supabase_standin import LocalSupabaseClient
+        supabase = LocalSupabaseClient(args.local_target)
+    else:
+        supabase = get_supabase_client()
     
     if not supabase:
         logger.error("Failed to initialize Supabase client")
@@ -496,7 +769,15 @@ def main():
     if args.dry_run:
         logger.info("[DRY RUN MODE]")
     
-    stats = sync_all_tables(supabase, tables, dry_run=args.dry_run)
+    stats = sync_all_tables(
+        supabase,
+        tables,
+        dry_run=args.dry_run,
+        state_db=args.state_db,
+        full_resync=args.full_resync,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
     
     # Refresh consolidated colleges table if master tables were synced
     if not args.dry_run and (not tables or any(t in tables for t in ["medical_colleges", "dental_colleges", "dnb_colleges"])):
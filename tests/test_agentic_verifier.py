@@ -0,0 +1,66 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentic_verifier import AgenticVerifier, VerificationRecord, VerificationVerdict
+
+
+def _record(i):
+    return VerificationRecord(
+        record_id=f'REC_{i}',
+        seat_college_name=f'SEAT COLLEGE {i}',
+        seat_state='KERALA',
+        seat_address=None,
+        seat_course_type='medical',
+        master_college_id=f'MED{i:04d}',
+        master_name=f'MASTER COLLEGE {i}',
+        master_state='KERALA',
+        master_address=None,
+        match_score=0.9,
+        match_method='test',
+    )
+
+
+def _parse(content, records):
+    # _parse_batch_response uses no instance state (no API clients needed)
+    verifier = AgenticVerifier.__new__(AgenticVerifier)
+    return verifier._parse_batch_response(content, records)
+
+
+def test_valid_array_keeps_positional_fallback():
+    records = [_record(i) for i in range(2)]
+    content = '[{"group_id": "first", "verdict": "reject"}, {"group_id": "second", "verdict": "approve"}]'
+
+    results = _parse(content, records)
+
+    assert results['REC_0'][0] == VerificationVerdict.REJECT
+    assert results['REC_1'][0] == VerificationVerdict.APPROVE
+
+
+def test_recovery_after_skipped_middle_object_never_uses_position():
+    records = [_record(i) for i in range(4)]
+    content = (
+        '```json\n['
+        '{"group_id": "GROUP_000", "verdict": "reject", "confidence": 0.9, "reason": "different {city}"}, '
+        '{"group_id": "GROUP_001", "verdict": approve, "confidence": 0.9}, '
+        '{"group_id": "2", "verdict": "approve", "confidence": 0.95, "reason": "no GROUP id"}, '
+        '{"group_id": "GROUP_003", "verdict": "approve", "confidence": 0.85, "reason": "same campus"}'
+        ']\n```'
+    )
+
+    results = _parse(content, records)
+
+    assert set(results) == {'REC_0', 'REC_3'}
+    assert results['REC_0'][0] == VerificationVerdict.REJECT
+    assert results['REC_3'] == (VerificationVerdict.APPROVE, 0.85, 'same campus')
+
+
+def test_recovery_with_only_unattributable_objects_uses_pattern_fallback():
+    records = [_record(i) for i in range(2)]
+    content = '[{"group_id": "x", "verdict": "reject"}, {"group_id": GROUP_001, "verdict": "reject"}'
+
+    results = _parse(content, records)
+
+    assert 'REC_0' not in results
+    assert results['REC_1'] == (VerificationVerdict.REJECT, 0.7, 'Pattern match')
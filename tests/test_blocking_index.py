@@ -0,0 +1,136 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blocking_index import BlockingIndex
+from recent3 import MultiStageFilter
+
+WORDS = ['GOVERNMENT', 'GOVT', 'MEDICAL', 'COLLEGE', 'DENTAL', 'INSTITUTE', 'OF', 'SCIENCES', 'AND',
+         'HOSPITAL', 'KASTURBA', 'KASTOORBA', 'MANIPAL', 'MANGALORE', 'KOTA', 'KOLLAM', 'KOZHIKODE',
+         'SRI', 'SHRI', 'RAMACHANDRA', 'RESEARCH', 'AIIMS', 'GB', 'PANT', 'ST', 'JOHNS']
+STATES = ['KERALA', 'KARNATAKA', 'RAJASTHAN', 'DELHI', 'TAMIL NADU']
+
+
+@pytest.fixture
+def msf():
+    """The production filter - features come from MultiStageFilter._extract_features"""
+    return MultiStageFilter()
+
+
+def _random_name(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+
+
+def _colleges(rng, n):
+    return [{'id': f'MED{i:04d}', 'name': _random_name(rng), 'state': rng.choice(STATES)} for i in range(n)]
+
+
+def test_overlap_counts_match_set_intersections(msf):
+    rng = random.Random(3)
+    colleges = _colleges(rng, 300)
+    index = BlockingIndex(colleges, msf._extract_features)
+    master_features = [msf._extract_features(c['name']) for c in colleges]
+
+    for _ in range(50):
+        query = msf._extract_features(_random_name(rng))
+        counts = index.overlap_counts(query)
+        for family in BlockingIndex.FEATURES:
+            expected = [len(query[family] & features[family]) for features in master_features]
+            assert counts[family].tolist() == expected
+            assert index.sizes[family].tolist() == [len(features[family]) for features in master_features]
+
+
+def test_query_matches_brute_force_thresholds(msf):
+    rng = random.Random(7)
+    colleges = _colleges(rng, 300)
+    index = BlockingIndex(colleges, msf._extract_features)
+
+    for _ in range(50):
+        query = msf._extract_features(_random_name(rng))
+        expected = []
+        for college in colleges:
+            cand = msf._extract_features(college['name'])
+            passed = len(query['first_char'] & cand['first_char']) >= 2
+            for family, threshold in (('token', 0.3), ('ngram', 0.35)):
+                if query[family] and cand[family]:
+                    ratio = len(query[family] & cand[family]) / max(len(query[family]), len(cand[family]))
+                    passed |= ratio >= threshold
+            if passed:
+                expected.append(college['id'])
+        assert index.query(query, 0.3, 0.35) == expected
+
+
+@pytest.mark.parametrize('config', [
+    {},
+    {'min_token_overlap': 0.6, 'min_ngram_overlap': 0.7, 'length_tolerance': 0.05, 'use_location_boost': False},
+    {'min_token_overlap': 0.9, 'min_ngram_overlap': 0.9, 'length_tolerance': 0.0,
+     'use_location_boost': False, 'min_phonetic_tokens': 2},
+])
+def test_stage2_index_has_full_recall_against_brute_force(config):
+    rng = random.Random(20)
+    msf = MultiStageFilter(config)
+    colleges = _colleges(rng, 300)
+    msf.build_index(colleges)
+
+    for _ in range(40):
+        candidates = rng.sample(colleges, 60)
+        # A candidate renamed since the index was built takes the brute-force path
+        candidates.append({'id': 'MED0000', 'name': _random_name(rng), 'state': 'KERALA'})
+        location = rng.choice(STATES + [None])
+
+        assert msf.check_recall(_random_name(rng), candidates, location) == 1.0
+
+    assert msf.stats['recall_checks'] == 40
+    assert msf.stats['recall_sum'] == 40.0
+
+
+@pytest.mark.parametrize('min_phonetic_tokens', [1, 2, 3])
+def test_phonetic_index_hits_match_brute_force_phonetic_match(min_phonetic_tokens):
+    rng = random.Random(19)
+    msf = MultiStageFilter({'min_phonetic_tokens': min_phonetic_tokens})
+    colleges = _colleges(rng, 300)
+    msf.build_index(colleges)
+
+    hit_counts = []
+    for _ in range(40):
+        query = _random_name(rng)
+        _, _, phonetic_hits = msf._index_overlaps(query)
+        expected = {(c['id'], c['name']) for c in colleges if msf._phonetic_match(query, c['name'])}
+        assert phonetic_hits == expected
+        hit_counts.append(len(expected))
+    assert any(hit_counts)  # Not vacuously equal
+
+
+def test_stage2_index_path_keeps_the_same_candidates(msf):
+    rng = random.Random(21)
+    colleges = _colleges(rng, 200)
+    msf.build_index(colleges)
+
+    for _ in range(20):
+        query, candidates = _random_name(rng), rng.sample(colleges, 50)
+        brute = msf.stage2_blocking(query, candidates, use_index=False)
+        indexed = msf.stage2_blocking(query, candidates)
+        assert [c['id'] for c in indexed] == [c['id'] for c in brute]
+    assert msf.stats['index_candidates'] > 0
+
+
+def test_rows_keyed_by_id_and_name(msf):
+    colleges = [
+        {'id': 'MED1', 'name': 'KASTURBA MEDICAL COLLEGE MANIPAL'},
+        {'id': 'MED1', 'name': 'KASTURBA MEDICAL COLLEGE MANIPAL'},  # Duplicate row
+        {'id': 'MED2', 'name': ''},  # Not indexable
+        {'id': 'MED3', 'name': 'GOVT MEDICAL COLLEGE KOTA'},
+    ]
+    index = BlockingIndex(colleges, msf._extract_features)
+
+    assert len(index) == 2
+    assert index.row_of({'id': 'MED3', 'name': 'GOVT MEDICAL COLLEGE KOTA'}) == 1
+    assert index.row_of({'id': 'MED3', 'name': 'GOVT MEDICAL COLLEGE KOLLAM'}) is None  # Renamed since build
+    assert index.row_of({'id': 'MED2', 'name': ''}) is None
+    counts = index.overlap_counts(msf._extract_features('NOWHERE'))
+    assert all(np.count_nonzero(counts[family]) == 0 for family in BlockingIndex.FEATURES)
@@ -0,0 +1,136 @@
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from council_matcher import Candidate, CouncilChairman
+
+MASTER = [
+    {'id': 'MED0001', 'name': 'KASTURBA MEDICAL COLLEGE', 'state': 'KARNATAKA', 'type': 'MEDICAL',
+     'address': 'MADHAV NAGAR, MANIPAL 576104 (902791) dean.kmc@manipal.edu'},
+    {'id': 'MED0002', 'name': 'KASTOORBA MEDICAL COLLEGE', 'state': 'KARNATAKA', 'type': 'MEDICAL',
+     'address': 'LIGHT HOUSE HILL ROAD, MANGALORE 575001 (902792) dean.kmcmlr@manipal.edu'},
+    {'id': 'MED0003', 'name': 'GOVERNMENT MEDICAL COLLEGE', 'state': 'RAJASTHAN', 'type': 'MEDICAL',
+     'address': 'RANGBARI ROAD, KOTA 324010 www.gmckota.ac.in'},
+    {'id': 'DNB0001', 'name': 'DISTRICT HOSPITAL', 'state': 'KARNATAKA', 'type': 'DNB',
+     'address': 'HOSPITAL ROAD, TUMKUR 572101'},
+    {'id': 'DNB0002', 'name': 'ARALAGUPPE MALLEGOWDA DISTRICT HOSPITAL', 'state': 'KARNATAKA', 'type': 'DNB',
+     'address': 'BH ROAD, TUMKUR 572101 dhtumkur@gmail.com'},
+    {'id': 'DEN0001', 'name': 'MANIPAL COLLEGE OF DENTAL SCIENCES', 'state': 'KARNATAKA', 'type': 'DENTAL',
+     'address': 'MANIPAL 576104 (902793)'},
+    {'id': 'DNB0003', 'name': '', 'state': 'KERALA', 'type': 'DNB', 'address': 'KOLLAM'},  # No letters to encode
+]
+
+RECORDS = [
+    # Code, domain and pincode signals; other coded candidates are vetoed by The Code Breaker
+    {'college_name': 'KASTURBA MED COLL', 'state': 'KARNATAKA',
+     'address': 'MANIPAL 576104 (902791) principal@manipal.edu'},
+    # Generic name: The Local Hero matches by city, The Devil's Advocate may overturn
+    {'college_name': 'DIST HOSPITAL', 'state': 'KARNATAKA', 'address': 'TUMKUR 572101'},
+    {'college_name': 'GOVT MEDICAL COLLEGE', 'state': 'RAJASTHAN', 'address': 'KOTA'},
+    # Empty metaphone codes: The Phonetic Listener abstains
+    {'college_name': '123 - 456', 'state': 'KERALA', 'address': ''},
+    {'college_name': '', 'state': 'KERALA', 'address': 'KOLLAM'},
+]
+
+
+def letter_counts(texts):
+    """Deterministic embeddings: similar spellings get similar vectors"""
+    vectors = np.zeros((len(texts), 26), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for char in text.upper():
+            if 'A' <= char <= 'Z':
+                vectors[row, ord(char) - ord('A')] += 1
+    return vectors + 1e-3  # No all-zero rows
+
+
+def _chairman():
+    named = [college for college in MASTER if college['name']]
+    vectorizer = TfidfVectorizer()
+    matrix = vectorizer.fit_transform([college['name'] for college in named])
+    # DEN0001 is left out of the TF-IDF index (The Keyword Guardian abstains on it)
+    indices = {college['id']: i for i, college in enumerate(named) if college['id'] != 'DEN0001'}
+    chairman = CouncilChairman(
+        vector_engine=types.SimpleNamespace(model=types.SimpleNamespace(encode=letter_counts)),
+        tfidf_vectorizer=vectorizer, tfidf_matrix=matrix, tfidf_indices=indices,
+    )
+    chairman.load_master_data(MASTER)
+    return chairman
+
+
+def _candidates():
+    return [Candidate(c['id'], c['name'], c['address'], c['state'], c['type']) for c in MASTER]
+
+
+def _flatten(result):
+    decision, confidence, votes = result
+    return decision, confidence, [(v.member_name, v.decision, v.confidence, v.reason, v.is_veto) for v in votes]
+
+
+@pytest.mark.parametrize('record', RECORDS, ids=lambda record: record['college_name'] or 'empty')
+def test_evaluate_candidates_equals_one_by_one(record):
+    candidates = _candidates()
+
+    # Separate chairmen, so neither side reads the other's per-candidate caches
+    batch = _chairman().evaluate_candidates(record, candidates)
+    single = _chairman()
+    one_by_one = [single.evaluate_candidate(record, candidate) for candidate in candidates]
+
+    assert len(batch) == len(candidates)
+    for got, expected in zip(batch, one_by_one):
+        got, expected = _flatten(got), _flatten(expected)
+        assert got[0] == expected[0]
+        assert got[1] == pytest.approx(expected[1])
+        assert [vote[:2] + vote[3:] for vote in got[2]] == [vote[:2] + vote[3:] for vote in expected[2]]
+        assert [vote[2] for vote in got[2]] == pytest.approx([vote[2] for vote in expected[2]])
+
+
+@pytest.mark.parametrize('record', RECORDS, ids=lambda record: record['college_name'] or 'empty')
+def test_member_vote_many_equals_vote(record):
+    candidates = _candidates()
+    # The Chairman strips emails from the query address; the raw record reaches The Detective's domain path
+    for query in (record, _chairman()._enhance_record(record)):
+        batch_members, single_members = _chairman().members, _chairman().members
+        for batch_member, single_member in zip(batch_members, single_members):
+            batch = batch_member.vote_many(query, candidates)
+            one_by_one = [single_member.vote(query, candidate) for candidate in candidates]
+            assert [(v.decision, v.reason, v.is_veto) for v in batch] == \
+                [(v.decision, v.reason, v.is_veto) for v in one_by_one]
+            assert [v.confidence for v in batch] == pytest.approx([v.confidence for v in one_by_one])
+
+
+def test_detective_finds_the_domain_in_a_raw_address():
+    detective = next(member for member in _chairman().members if member.name == 'The Detective')
+    votes = detective.vote_many(RECORDS[0], _candidates())
+
+    # Both Kasturba campuses use manipal.edu
+    assert [(v.decision, v.confidence) for v in votes[:2]] == [('MATCH', 0.70)] * 2
+    assert votes[0].reason == 'Shared Domain Match (manipal.edu) - Chain Identified'
+    assert [v.decision for v in votes[2:]] == ['ABSTAIN'] * (len(MASTER) - 2)
+
+
+def test_every_batched_member_votes_and_paths_are_covered():
+    chairman = _chairman()
+    results = {
+        record['college_name']: chairman.evaluate_candidates(record, _candidates()) for record in RECORDS
+    }
+    reasons = {v.reason for outcome in results.values() for _, _, votes in outcome for v in votes}
+
+    assert not any('not available' in reason or 'not loaded' in reason or 'Error' in reason
+                   for reason in reasons)
+    assert 'No phonetic code' in reasons
+    assert 'Candidate not in TF-IDF index' in reasons
+    assert any(reason.startswith('Same City/Pin') for reason in reasons)
+
+    kmc = results['KASTURBA MED COLL']
+    assert kmc[0][0] == 'MATCH'
+    assert kmc[1] == ('REJECT', 1.0, kmc[1][2])  # College Code Mismatch veto
+    assert any(v.is_veto and v.member_name == 'The Code Breaker' for v in kmc[1][2])
+
+    phonetic = [v for _, _, votes in results['123 - 456'] for v in votes if v.member_name == 'The Phonetic Listener']
+    assert [v.decision for v in phonetic] == ['ABSTAIN'] * len(MASTER)
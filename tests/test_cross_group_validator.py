@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vector_index
+from cross_group_validator import CrossGroupValidator
+
+WORDS = ['GOVERNMENT', 'GOVT', 'MEDICAL', 'COLLEGE', 'DENTAL', 'INSTITUTE', 'OF', 'SCIENCES', 'AND',
+         'KASTURBA', 'KASTOORBA', 'MANIPAL', 'MANGALORE', 'KOTA', 'GB', 'PANT', 'A', 'ST', 'JOHNS']
+
+
+class FakeVectorIndex:
+    """Deterministic embeddings; a zero vector for names containing 'PANT'."""
+
+    def _vector(self, text):
+        key = text.upper().strip()
+        if 'PANT' in key:
+            return np.zeros(16, dtype=np.float32)
+        return np.random.default_rng(zlib.crc32(key.encode())).normal(size=16).astype(np.float32)
+
+    def get_embeddings(self, texts):
+        return [self._vector(text) if text else None for text in texts]
+
+    def get_similarity(self, name1, name2):
+        if not name1 or not name2:
+            return 0.0
+        vec1, vec2 = self._vector(name1), self._vector(name2)
+        norm = np.linalg.norm(vec1) * np.linalg.norm(vec2)
+        if norm == 0:
+            return 0.0
+        return max(0.0, min(100.0, float(np.dot(vec1, vec2) / norm) * 100))
+
+
+@pytest.fixture
+def validator(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_index, '_vector_index', FakeVectorIndex())
+    return CrossGroupValidator(
+        counselling_db_path=str(tmp_path / 'counselling.db'),
+        master_db_path=str(tmp_path / 'master.db'),
+    )
+
+
+def _random_name(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 6)))
+
+
+def test_batch_scores_match_per_pair_scores(validator):
+    rng = random.Random(16)
+    for _ in range(40):
+        master_name = _random_name(rng)
+        master_address = _random_name(rng)
+        group_names = [_random_name(rng) for _ in range(rng.randint(1, 12))]
+        group_addresses = [_random_name(rng) for _ in group_names]
+
+        batch = validator.calculate_ensemble_similarities(group_names, master_name, group_addresses, master_address)
+        assert len(batch) == len(group_names)
+        for scores, group_name, group_address in zip(batch, group_names, group_addresses):
+            expected = validator.calculate_ensemble_similarity(group_name, master_name, group_address, master_address)
+            for metric, value in expected.to_dict().items():
+                # Vector (and so the weighted total) only differ by float32 rounding
+                assert getattr(scores, 'weighted_total' if metric == 'weighted' else metric) == pytest.approx(value, abs=1e-3), metric
+
+
+def test_set_overlap_ratios_match_jaccard():
+    rng = random.Random(5)
+    for _ in range(100):
+        master_set = set(_random_name(rng).split())
+        group_sets = [set(_random_name(rng).split()) for _ in range(8)]
+        expected = [
+            len(group & master_set) / len(group | master_set) * 100 if group and master_set else 0.0
+            for group in group_sets
+        ]
+        assert CrossGroupValidator._set_overlap_ratios(group_sets, master_set).tolist() == pytest.approx(expected)
+
+
+def test_embeddings_are_encoded_in_one_batch(validator, monkeypatch):
+    calls = []
+    fake = vector_index._vector_index
+    original = fake.get_embeddings
+    monkeypatch.setattr(fake, 'get_embeddings', lambda texts: calls.append(list(texts)) or original(texts))
+
+    validator.calculate_ensemble_similarities(['KASTURBA MEDICAL COLLEGE', 'GOVT MEDICAL COLLEGE KOTA', ''],
+                                              'KASTURBA MEDICAL COLLEGE MANIPAL')
+    assert len(calls) == 1
+    assert sorted(calls[0]) == ['GOVT MEDICAL COLLEGE KOTA', 'KASTURBA MEDICAL COLLEGE', 'KASTURBA MEDICAL COLLEGE MANIPAL']
+
+    validator.calculate_ensemble_similarities(['KASTURBA MEDICAL COLLEGE'], 'KASTURBA MEDICAL COLLEGE MANIPAL')
+    assert len(calls) == 1  # Cached
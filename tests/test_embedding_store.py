@@ -0,0 +1,60 @@
+import os
+import sys
+import zlib
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_store import EmbeddingStore
+
+
+def fake_encode(texts):
+    """Deterministic, case-sensitive vectors"""
+    return np.stack([
+        np.random.default_rng(zlib.crc32(text.encode())).normal(size=8).astype(np.float32)
+        for text in texts
+    ])
+
+
+def test_keys_keep_case_and_encoder_sees_the_keyed_text(tmp_path):
+    store = EmbeddingStore('BAAI/bge-m3', root=str(tmp_path))
+    seen = []
+
+    def encode(texts):
+        seen.extend(texts)
+        return fake_encode(texts)
+
+    vectors = store.encode(['AIIMS  Delhi', 'aiims delhi', ' AIIMS Delhi '], encode)
+
+    assert seen == ['AIIMS Delhi', 'aiims delhi']
+    assert len(store) == 2
+    np.testing.assert_array_equal(vectors, fake_encode(['AIIMS Delhi', 'aiims delhi', 'AIIMS Delhi']))
+
+
+def test_encode_params_get_their_own_store(tmp_path):
+    plain = EmbeddingStore('BAAI/bge-m3', root=str(tmp_path))
+    short = EmbeddingStore('BAAI/bge-m3', root=str(tmp_path), encode_params={'max_length': 128})
+    plain.encode(['KASTURBA MEDICAL COLLEGE'], fake_encode)
+
+    assert plain.path != short.path
+    assert 'KASTURBA MEDICAL COLLEGE' not in short
+    assert 'KASTURBA MEDICAL COLLEGE' in EmbeddingStore('BAAI/bge-m3', root=str(tmp_path))
+
+
+def test_interleaved_writers_never_overwrite_each_other(tmp_path):
+    # Two instances over one directory stand in for two processes sharing the store
+    first = EmbeddingStore('model', root=str(tmp_path))
+    second = EmbeddingStore('model', root=str(tmp_path))
+
+    first.encode(['A1', 'A2'], fake_encode)
+    second.encode(['B1', 'B2', 'B3'], fake_encode)  # Loaded before A1/A2 were written
+    first.encode(['A3'], fake_encode)
+
+    texts = ['A1', 'A2', 'A3', 'B1', 'B2', 'B3']
+    expected = fake_encode(texts)
+    for store in (first, second, EmbeddingStore('model', root=str(tmp_path))):
+        calls = []
+        vectors = store.encode(texts, lambda batch: calls.append(batch) or fake_encode(batch))
+        assert calls == []  # Everything is picked up from the shared files
+        np.testing.assert_array_equal(vectors, expected)
@@ -0,0 +1,130 @@
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('psycopg2')  # lib.matching imports the PostgreSQL matchers
+
+from lib.matching.hierarchical_filters import HierarchicalFilters
+
+NAME_WORDS = ['GOVERNMENT', 'MEDICAL', 'COLLEGE', 'DENTAL', 'INSTITUTE', 'OF', 'SCIENCES', 'KASTURBA',
+              'KASTOORBA', 'MANIPAL', 'MANGALORE', 'KOTA', 'SRI', 'RAMACHANDRA', 'ST', 'JOHNS']
+ADDRESS_WORDS = ['MG', 'ROAD', 'NEAR', 'BUS', 'STAND', 'KOTA', 'KOLLAM', 'KOZHIKODE', 'MANIPAL',
+                 'UDUPI', 'DISTRICT', '576104', 'CIVIL', 'LINES', 'HOSPITAL', 'CAMPUS']
+
+
+def _phrase(rng, words, low, high):
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(low, high)))
+
+
+def _master_frame(rng, n=400):
+    return pd.DataFrame({
+        'id': [f'MED{i:04d}' for i in range(n)],
+        'normalized_name': [_phrase(rng, NAME_WORDS, 1, 6) for _ in range(n)],
+        'address': [None if rng.random() < 0.1 else _phrase(rng, ADDRESS_WORDS, 1, 6) for _ in range(n)],
+    }, index=pd.RangeIndex(1000, 1000 + n))
+
+
+def _fitted(master):
+    filters = HierarchicalFilters()
+    filters.fit(master)
+    return filters
+
+
+def _reference_name_filter(frame, input_name, name_threshold):
+    """The former per-row DataFrame.apply implementation of attempts 2-4"""
+    input_name = input_name.strip().upper()
+    for mask in (
+        frame['normalized_name'].str.upper() == input_name,
+        frame['normalized_name'].apply(lambda x: fuzz.ratio(input_name, x.upper()) >= 85),
+        frame['normalized_name'].apply(lambda x: fuzz.token_set_ratio(input_name, x.upper()) >= name_threshold),
+    ):
+        if mask.any():
+            return list(frame[mask].index)
+    return None
+
+
+def _reference_address_filter(frame, input_address, address_threshold):
+    input_address = input_address.strip().upper()
+    for mask in (
+        frame['address'].apply(lambda x: input_address in str(x).upper() if pd.notna(x) else False),
+        frame['address'].apply(lambda x: fuzz.token_set_ratio(input_address, str(x).upper()) >= address_threshold
+                               if pd.notna(x) else False),
+    ):
+        if mask.any():
+            return list(frame[mask].index)
+    return None
+
+
+def test_array_fuzzy_filters_match_per_row_apply():
+    rng = random.Random(21)
+    master = _master_frame(rng)
+    for filters in (HierarchicalFilters(), _fitted(master)):
+        compared = 0
+        for _ in range(60):
+            subset = master.sample(n=rng.randint(1, 60), random_state=rng.randint(0, 10 ** 6))
+
+            name = _phrase(rng, NAME_WORDS, 1, 6)
+            expected = _reference_name_filter(subset, name, 80)
+            if expected is not None:
+                result = filters.filter_by_college_name(subset, name, fallback_method='rapidfuzz', name_threshold=80)
+                assert list(result.index) == expected
+                compared += 1
+
+            address = _phrase(rng, ADDRESS_WORDS, 1, 3)
+            expected = _reference_address_filter(subset, address, 75)
+            if expected is not None:
+                result = filters.filter_by_address(subset, address, fallback_method='rapidfuzz', address_threshold=75)
+                assert list(result.index) == expected
+                compared += 1
+        assert compared > 60
+
+
+def test_prefitted_tfidf_matches_cosine_on_master_model():
+    rng = random.Random(5)
+    master = _master_frame(rng)
+    filters = _fitted(master)
+    name_vectors = filters._name_vectorizer.transform(master['normalized_name'].tolist())
+    address_vectors = filters._address_vectorizer.transform(master['address'].fillna('').tolist())
+
+    for _ in range(40):
+        subset = master.sample(n=rng.randint(1, 80), random_state=rng.randint(0, 10 ** 6))
+        rows = master.index.get_indexer(subset.index)
+
+        for column, vectors, match, query, threshold in (
+            ('normalized_name', name_vectors, filters.tfidf_match_college_name, _phrase(rng, NAME_WORDS, 1, 5), 0.6),
+            ('address', address_vectors, filters.tfidf_match_address, _phrase(rng, ADDRESS_WORDS, 1, 4), 0.3),
+        ):
+            vectorizer = filters._name_vectorizer if column == 'normalized_name' else filters._address_vectorizer
+            similarities = cosine_similarity(vectorizer.transform([query]), vectors[rows])[0]
+            expected = set(subset.index[similarities >= threshold - 1e-9])
+            result = match(subset, query, threshold=threshold)
+            assert set(result.index) <= expected
+            assert expected - set(result.index) <= set(subset.index[np.isclose(similarities, threshold)])
+            ordered = similarities[subset.index.get_indexer(result.index)]
+            assert np.all(np.diff(ordered) <= 1e-9)  # Highest similarity first
+
+
+def test_frames_outside_the_fit_use_per_call_tfidf():
+    rng = random.Random(9)
+    master = _master_frame(rng)
+    filters = _fitted(master)
+
+    subset = master.iloc[:50]
+    assert filters._fitted_rows(subset) is not None
+
+    renamed = subset.copy()
+    renamed.loc[renamed.index[0], 'normalized_name'] = 'KASTURBA MEDICAL COLLEGE MANIPAL'
+    foreign = subset.set_index(pd.RangeIndex(0, 50))
+    for frame in (renamed, foreign):
+        assert filters._fitted_rows(frame) is None
+        for query in ('KASTURBA MEDICAL COLLEGE', 'GOVERNMENT MEDICAL COLLEGE KOTA'):
+            expected = HierarchicalFilters().tfidf_match_college_name(frame, query, threshold=0.5)
+            assert list(filters.tfidf_match_college_name(frame, query, threshold=0.5).index) == list(expected.index)
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('sentence_transformers')  # Imported by embedding_name_fixer
+
+from embedding_name_fixer import EmbeddingSimilaritySearch, MasterEmbeddingMatrix
+
+STATES = ['KERALA', 'Kerala', 'KARNATAKA', 'karnataka', 'DELHI']
+COURSE_TYPES = ['medical', 'dental', 'dnb']
+DIM = 8
+
+
+def _make_master_db(path, n_rows, rng):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE master_embeddings (
+            college_id TEXT PRIMARY KEY,
+            college_name TEXT NOT NULL,
+            state TEXT NOT NULL,
+            course_type TEXT NOT NULL,
+            embedding BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    rows = []
+    for i in range(n_rows):
+        vector = np.zeros(DIM, dtype=np.float32) if i % 37 == 0 else rng.normal(size=DIM).astype(np.float32)
+        rows.append((f'MED{i:04d}', f'COLLEGE {i}', STATES[i % len(STATES)], COURSE_TYPES[i % 3], vector.tobytes()))
+    conn.executemany("INSERT INTO master_embeddings (college_id, college_name, state, course_type, embedding) "
+                     "VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def _brute_force(path, query, state, course_type, top_k):
+    """The former per-call SQL load + per-row cosine loop (zero vectors skipped)"""
+    conn = sqlite3.connect(path)
+    sql = "SELECT college_id, state, course_type, embedding FROM master_embeddings WHERE 1=1"
+    params = []
+    if state:
+        sql += " AND UPPER(state) = UPPER(?)"
+        params.append(state)
+    mapped = {'medical': 'medical', 'mbbs': 'medical', 'diploma': 'medical', 'dental': 'dental',
+              'bds': 'dental', 'dnb': 'dnb'}.get((course_type or '').lower())
+    if mapped:
+        sql += " AND course_type = ?"
+        params.append(mapped)
+    scored = []
+    for college_id, _, _, blob in conn.execute(sql + " ORDER BY rowid", params):
+        vector = np.frombuffer(blob, dtype=np.float32)
+        if np.linalg.norm(vector) == 0:
+            continue
+        scored.append((college_id, float(np.dot(query, vector) / (np.linalg.norm(query) * np.linalg.norm(vector)))))
+    conn.close()
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:top_k]
+
+
+class FakeModel:
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def encode(self, texts, **_):
+        return np.stack([self.vectors[text] for text in texts])
+
+
+def test_top_k_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(23)
+    path = str(tmp_path / 'master.db')
+    _make_master_db(path, 400, rng)
+    matrix = MasterEmbeddingMatrix.get(path)
+
+    partitions = [(state, course_type)
+                  for state in (None, 'KERALA', 'karnataka', 'Delhi', 'GOA')
+                  for course_type in (None, 'MBBS', 'dental', 'DNB', 'diploma', 'nursing')]
+    queries = rng.normal(size=(len(partitions), DIM)).astype(np.float32)
+    for top_k in (1, 5, 500):
+        results = matrix.top_k(queries, partitions, top_k)
+        for query, (state, course_type), hits in zip(queries, partitions, results):
+            expected = _brute_force(path, query, state, course_type, top_k)
+            assert [college['id'] for college, _ in hits] == [college_id for college_id, _ in expected]
+            assert [score for _, score in hits] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+    zero_query = matrix.top_k(np.zeros((1, DIM), dtype=np.float32), [(None, None)], 5)
+    assert zero_query == [[]]
+
+
+def test_search_and_batch_search_agree(tmp_path):
+    rng = np.random.default_rng(7)
+    path = str(tmp_path / 'master.db')
+    _make_master_db(path, 200, rng)
+
+    records = [
+        {'group_id': i, 'normalized_college_name': f'QUERY {i}', 'normalized_state': state, 'sample_course_type': ctype}
+        for i, (state, ctype) in enumerate([('KERALA', 'MBBS'), ('DELHI', None), (None, 'BDS'), ('GOA', 'MBBS')])
+    ]
+    searcher = EmbeddingSimilaritySearch.__new__(EmbeddingSimilaritySearch)
+    searcher.master_db_path = path
+    searcher.model = FakeModel({r['normalized_college_name']: rng.normal(size=DIM).astype(np.float32) for r in records})
+
+    batch = searcher.batch_search(records, top_k=5)
+    for record in records:
+        single = searcher.search(record['normalized_college_name'], record['normalized_state'],
+                                 record['sample_course_type'], top_k=5)
+        assert [c['id'] for c, _ in batch[record['group_id']]] == [c['id'] for c, _ in single]
+        expected = _brute_force(path, searcher.model.vectors[record['normalized_college_name']],
+                                record['normalized_state'], record['sample_course_type'], 5)
+        assert [c['id'] for c, _ in single] == [college_id for college_id, _ in expected]
+    assert batch[3] == []  # No master college in GOA
+
+
+def test_matrix_reloads_when_table_changes(tmp_path):
+    rng = np.random.default_rng(1)
+    path = str(tmp_path / 'master.db')
+    _make_master_db(path, 50, rng)
+
+    matrix = MasterEmbeddingMatrix.get(path)
+    assert len(matrix) == 50
+    assert MasterEmbeddingMatrix.get(path) is matrix
+    assert not matrix.refresh()
+
+    vector = np.ones(DIM, dtype=np.float32)
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO master_embeddings (college_id, college_name, state, course_type, embedding) "
+                 "VALUES ('MED9999', 'NEW COLLEGE', 'GOA', 'medical', ?)", (vector.tobytes(),))
+    conn.commit()
+    conn.close()
+
+    assert len(MasterEmbeddingMatrix.get(path)) == 51
+    hits = matrix.top_k(vector[None, :], [('GOA', 'MBBS')], 5)[0]
+    assert [(college['id'], round(score, 5)) for college, score in hits] == [('MED9999', 1.0)]
+
+    MasterEmbeddingMatrix.invalidate(path)
+    assert matrix.refresh()
@@ -0,0 +1,225 @@
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recent3 import AdvancedSQLiteMatcher, NormalizationEngine, perf_monitor
+
+ABBREVIATIONS = {
+    'GOVT': 'GOVERNMENT', 'MED': 'MEDICAL', 'COLL': 'COLLEGE', 'HOSP': 'HOSPITAL', 'INST': 'INSTITUTE',
+    'AIIMS': 'ALL INDIA INSTITUTE OF MEDICAL SCIENCES', 'PGIMER': 'POST GRADUATE INSTITUTE OF MEDICAL EDUCATION',
+    'ESIC': 'EMPLOYEES STATE INSURANCE CORPORATION',
+}
+
+MASTER_NAMES = ['GOVERNMENT DENTAL COLLEGE', 'CONSERVATIVE DENTISTRY', 'KASTURBA MEDICAL COLLEGE']
+
+CORPUS = [
+    None, '', '   ', float('nan'), 123, 560001,
+    # Abbreviations (smart expansion keeps compound names)
+    'GOVT MED COLL', 'govt. med. coll., kota', 'AIIMS PATNA', 'AIIMS, NEW DELHI', 'PGIMER, DR RML HOSPITAL',
+    'PGIMER', 'ESIC MEDICAL COLLEGE', 'Inst of Med Sciences',
+    # Medical degrees and dots
+    'M.B.B.S.', 'm.d. (general medicine)', 'M.CH. NEURO SURGERY', 'D.N.B.- FAMILY MEDICINE', 'PH.D...', 'B.D.S',
+    # Punctuation
+    ',, NEW DELHI ,', ' ,NEW DELHI', 'HOSPITAL( A UNIT )', 'HOSPITAL  (  A UNIT OF X )', 'A,,B , , C,D',
+    'POST-GRADUATE INSTITUTE', 'SRI - RAM', 'ST. JOHN\'S MEDICAL COLLEGE', 'K.S. HEGDE & SONS / TRUST',
+    'MANIPAL - 576104, KARNATAKA', '--KOTA--', '#1 @ HOSPITAL!', 'RAM & SHYAM/HOSPITAL',
+    # State names (concatenated state prefixes are stripped in original case)
+    'KERALAAPOLLO ADLUX HOSPITAL, ANGAMALY', 'TAMIL NADUGOVT MEDICAL COLLEGE', 'ANDHRA PRADESH', 'KARNATAKA',
+    'MADHYA PRADESHGANDHI MEDICAL COLLEGE, BHOPAL', 'DELHI (NCT)',
+    # OCR breaks
+    'Governm ent Dent al Colleg e', 'CONSER VATIVE DENTIST RY', 'KASTUR BA MEDICAL COLLEGE',
+]
+
+CONFIGS = {
+    'defaults': {},
+    'repo': {'remove_special_chars': True, 'to_uppercase': True, 'normalize_whitespace': True,
+             'handle_hyphens_dots': True},
+    'translate': {'replace_chars': {'&': ' AND ', '/': ' '}, 'preserve_chars': ['&', '-', "'"]},
+    'chained': {'replace_chars': {'&': 'AND', 'A': '4'}, 'clean_ocr_errors': False},
+    'minimal': {'to_uppercase': False, 'remove_pincodes': False,
+                'context_aware': {'medical_degrees': False, 'compound_words': False},
+                'fix_punctuation': {'remove_leading_punctuation': False, 'fix_comma_spacing': False,
+                                    'remove_space_before_paren': False}},
+}
+
+
+def legacy_normalize_text(self, text):
+    """The per-call normalize_text() the engine replaced, as the reference (comments dropped)"""
+    start_time = time.time()
+
+    if text is None or pd.isna(text) or text == '':
+        perf_monitor.record_timing("normalize_text", time.time() - start_time)
+        return ''
+
+    text = str(text).strip()
+
+    if not text:
+        perf_monitor.record_timing("normalize_text", time.time() - start_time)
+        return ''
+
+    text = self.clean_concatenated_state_names(text)
+
+    if self.config['normalization'].get('clean_ocr_errors', True):
+        text = self.clean_ocr_errors(text)
+
+    context_aware = self.config['normalization'].get('context_aware', {})
+
+    if context_aware.get('medical_degrees', True):
+        medical_degrees = {
+            r'\bM\.B\.B\.S\.?\b': 'MBBS',
+            r'\bM\.B\.B\.S\b': 'MBBS',
+            r'\bB\.D\.S\.?\b': 'BDS',
+            r'\bB\.D\.S\b': 'BDS',
+            r'\bM\.D\.S\.?\b': 'MDS',
+            r'\bM\.D\.S\b': 'MDS',
+            r'\bM\.D\.?\b': 'MD',
+            r'\bM\.S\.?\b': 'MS',
+            r'\bD\.M\.?\b': 'DM',
+            r'\bM\.CH\.?\b': 'MCH',
+            r'\bD\.N\.B\.?\b': 'DNB',
+            r'\bM\.SC\.?\b': 'MSC',
+            r'\bPH\.D\.?\b': 'PHD',
+        }
+        for pattern, replacement in medical_degrees.items():
+            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+
+    replace_chars = self.config['normalization'].get('replace_chars', {})
+    for char, replacement in replace_chars.items():
+        text = text.replace(char, replacement)
+
+    if self.config['normalization'].get('to_uppercase', True):
+        text = text.upper()
+
+    if self.config['normalization'].get('remove_pincodes', True):
+        text = re.sub(r'\b\d{6}\b', '', text)
+
+    text = re.sub(r'\.', ' ', text)
+
+    text = self._smart_expand_abbreviations(text, self.abbreviations)
+
+    if self.config['normalization'].get('handle_hyphens_dots', True):
+        if context_aware.get('compound_words', True):
+            text = re.sub(r'(?<!\s)-(?!\s)', ' - ', text)
+        else:
+            text = re.sub(r'-', ' ', text)
+
+    preserve_chars = self.config['normalization'].get('preserve_chars', [])
+    base_keep = r'\w\s,()'
+    for char in preserve_chars:
+        base_keep += re.escape(char)
+
+    if self.config['normalization'].get('remove_special_chars', False):
+        text = re.sub(r'[^\w\s,()]', '', text)
+    else:
+        pattern = f'[^{base_keep}]'
+        text = re.sub(pattern, '', text)
+
+    fix_punct = self.config['normalization'].get('fix_punctuation', {})
+
+    if fix_punct.get('remove_double_commas', True):
+        text = re.sub(r',(\s*,)+', ',', text)
+        text = re.sub(r',{2,}', ',', text)
+
+    if fix_punct.get('remove_double_dots', True):
+        text = re.sub(r'\.{2,}', '.', text)
+
+    if fix_punct.get('fix_comma_spacing', True):
+        text = re.sub(r'\s+,', ',', text)
+        text = re.sub(r',(?=[^\s,])', ', ', text)
+        text = re.sub(r',\s{2,}', ', ', text)
+
+    if fix_punct.get('remove_leading_punctuation', True):
+        while True:
+            old_text = text
+            text = re.sub(r'^[\s,.\-]+', '', text)
+            if old_text == text:
+                break
+
+    if fix_punct.get('remove_trailing_punctuation', True):
+        while True:
+            old_text = text
+            text = re.sub(r'[\s,.\-]+$', '', text)
+            if old_text == text:
+                break
+
+    if fix_punct.get('remove_space_before_paren', True):
+        text = re.sub(r'(\w)\(', r'\1 (', text)
+        text = re.sub(r'\s{2,}\(', ' (', text)
+
+    if fix_punct.get('remove_space_after_open_paren', True):
+        text = re.sub(r'\(\s+', '(', text)
+
+    if fix_punct.get('remove_space_before_close_paren', True):
+        text = re.sub(r'\s+\)', ')', text)
+
+    text = re.sub(r',$', '', text).strip()
+
+    if fix_punct.get('remove_extra_spaces', True):
+        text = re.sub(r'\s{2,}', ' ', text)
+
+    if self.config['normalization'].get('normalize_whitespace', True):
+        text = re.sub(r'\s+', ' ', text).strip()
+
+    perf_monitor.record_timing("normalize_text", time.time() - start_time)
+    return text
+
+
+def _matcher(normalization):
+    # Only the normalization collaborators are needed (no databases)
+    matcher = AdvancedSQLiteMatcher.__new__(AdvancedSQLiteMatcher)
+    matcher.config = {'normalization': normalization}
+    matcher.abbreviations = ABBREVIATIONS
+    matcher.master_data = {'medical': {'colleges': [{'name': name} for name in MASTER_NAMES]}}
+    matcher._ocr_master_names = None
+    matcher.normalization_engine = NormalizationEngine(
+        normalization,
+        matcher.abbreviations,
+        clean_state_names=matcher.clean_concatenated_state_names,
+        clean_ocr_errors=matcher.clean_ocr_errors,
+        expand_abbreviations=matcher._smart_expand_abbreviations,
+    )
+    return matcher
+
+
+def _random_corpus(rng, n):
+    fragments = [value for value in CORPUS if isinstance(value, str) and value.strip()]
+    return [' '.join(rng.sample(fragments, rng.randint(1, 3))) for _ in range(n)]
+
+
+@pytest.mark.parametrize('name', CONFIGS)
+def test_engine_matches_legacy_normalize_text(name):
+    matcher = _matcher(CONFIGS[name])
+    corpus = CORPUS + _random_corpus(random.Random(2), 300)
+
+    expected = [legacy_normalize_text(matcher, value) for value in corpus]
+
+    assert [matcher.normalize_text(value) for value in corpus] == expected
+    # Memoized second pass and the batch API give the same output
+    assert [matcher.normalize_text(value) for value in corpus] == expected
+    assert matcher.normalize_texts(corpus) == expected
+    series = pd.Series(corpus, index=range(10, 10 + len(corpus)))
+    assert matcher.normalize_texts(series).tolist() == expected
+
+
+def test_corpus_exercises_every_stage():
+    matcher = _matcher({})
+    normalized = {value: matcher.normalize_text(value) for value in CORPUS if isinstance(value, str)}
+
+    assert normalized['PGIMER'] == 'POST GRADUATE INSTITUTE OF MEDICAL EDUCATION'
+    assert normalized['GOVT MED COLL'] == 'GOVT MED COLLEGE'  # Only expanded before generic terms
+    assert normalized['AIIMS PATNA'] == 'AIIMS PATNA'  # Location follows: kept as is
+    assert normalized['KERALAAPOLLO ADLUX HOSPITAL, ANGAMALY'] == 'APOLLO ADLUX HOSPITAL, ANGAMALY'
+    assert normalized['KASTUR BA MEDICAL COLLEGE'] == 'KASTURBA MEDICAL COLLEGE'
+    assert normalized[',, NEW DELHI ,'] == 'NEW DELHI'
+    assert normalized['A,,B , , C,D'] == 'A, B, C, D'
+    assert normalized['HOSPITAL( A UNIT )'] == 'HOSPITAL (A UNIT)'
+    assert normalized['m.d. (general medicine)'] == 'MD (GENERAL MEDICINE)'
+    assert normalized['MANIPAL - 576104, KARNATAKA'] == 'MANIPAL, KARNATAKA'
+    assert matcher.normalize_text(None) == matcher.normalize_text(float('nan')) == ''
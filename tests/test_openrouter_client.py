@@ -0,0 +1,82 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openrouter_client
+from openrouter_client import OpenRouterClient, OpenRouterResponse, complete_many_across_keys
+
+MESSAGES = [{'role': 'user', 'content': 'match?'}]
+
+
+def _status_error(status):
+    request = httpx.Request('POST', OpenRouterClient.BASE_URL)
+    return httpx.HTTPStatusError(f'{status}', request=request, response=httpx.Response(status, request=request))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose complete_async follows a script of statuses per model"""
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(openrouter_client.asyncio, 'sleep', no_sleep)
+    client = OpenRouterClient(api_key='test-key')
+    client.calls = []
+    client.script = {}
+
+    async def complete_async(messages, model=None, **kwargs):
+        client.calls.append(model)
+        outcomes = client.script.get(model, [])
+        status = outcomes.pop(0) if outcomes else 200
+        if status != 200:
+            raise _status_error(status)
+        return OpenRouterResponse(content='ok', model=model, usage={}, raw={})
+
+    client.complete_async = complete_async
+    return client
+
+
+def test_auth_error_switches_to_fallback_model(client):
+    primary, fallback = OpenRouterClient.MODELS['primary'], OpenRouterClient.MODELS['fallback']
+    client.script[primary] = [401]
+
+    response = asyncio.run(client.complete_with_retry_async(MESSAGES))
+
+    assert response.model == fallback
+    assert client.calls == [primary, fallback]
+
+
+def test_exhausted_retries_switch_to_fallback_model(client):
+    primary, fallback = OpenRouterClient.MODELS['primary'], OpenRouterClient.MODELS['fallback']
+    client.script[primary] = [503, 503, 503]
+
+    response = asyncio.run(client.complete_with_retry_async(MESSAGES, max_retries=2))
+
+    assert response.model == fallback
+    assert client.calls == [primary] * 3 + [fallback]
+
+
+def test_other_http_errors_raise(client):
+    client.script[OpenRouterClient.MODELS['primary']] = [400]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.complete_with_retry_async(MESSAGES))
+    assert len(client.calls) == 1
+
+
+def test_request_max_retries_overrides_batch_default(client):
+    primary, fallback = OpenRouterClient.MODELS['primary'], OpenRouterClient.MODELS['fallback']
+    client.script[primary] = [503] * 10
+    client.script[fallback] = [503] * 10
+
+    results = asyncio.run(complete_many_across_keys(
+        [client], [{'messages': MESSAGES, 'max_retries': 0}], max_retries=3,
+    ))
+
+    assert isinstance(results[0], httpx.HTTPStatusError)
+    assert client.calls == [primary, fallback]  # One attempt per model, no TypeError
@@ -0,0 +1,103 @@
+import os
+import random
+import sys
+import types
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonetic_index
+from phonetic_index import PHONETIC_ALGORITHMS, PhoneticIndex, phonetic_keys, token_codes
+
+WORDS = ['GOVERNMENT', 'GOVT', 'MEDICAL', 'MEDICLE', 'COLLEGE', 'COLEGE', 'DENTAL', 'INSTITUTE', 'OF',
+         'KASTURBA', 'KASTOORBA', 'MANIPAL', 'MANGALORE', 'KOTA', 'KOLLAM', 'SRI', 'SHRI', 'AIIMS', 'GB']
+
+
+def _squash(word, keep):
+    """Drop vowels after the first letter (a crude but deterministic phonetic code)"""
+    return word[0] + ''.join(c for c in word[1:] if c not in keep)[:3]
+
+
+@pytest.fixture(autouse=True)
+def fake_jellyfish(monkeypatch):
+    """Deterministic codes, so the tests check the index and not jellyfish"""
+    calls = []
+
+    def code(algorithm, keep):
+        def encode(text):
+            calls.append((algorithm, text))
+            return ' '.join(_squash(word, keep) for word in text.upper().split())
+        return encode
+
+    fake = types.SimpleNamespace(soundex=code('soundex', 'AEIOUHWY'), metaphone=code('metaphone', 'AEIOU'),
+                                 nysiis=code('nysiis', 'AEIOUY'))
+    monkeypatch.setattr(phonetic_index, 'jellyfish', fake, raising=False)
+    monkeypatch.setattr(phonetic_index, 'JELLYFISH_AVAILABLE', True)
+    phonetic_index.phonetic_code.cache_clear()
+    token_codes.cache_clear()
+    yield calls
+    phonetic_index.phonetic_code.cache_clear()
+    token_codes.cache_clear()
+
+
+def _random_name(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+
+
+def test_candidates_match_brute_force_token_overlap():
+    rng = random.Random(19)
+    names = {f'MED{i:04d}': _random_name(rng) for i in range(200)}
+    index = PhoneticIndex.build(names.items())
+
+    for _ in range(40):
+        query = _random_name(rng)
+        for algorithm in PHONETIC_ALGORITHMS:
+            query_codes = token_codes(query, algorithm, 3)
+            for min_shared in (1, 2, 3):
+                expected = {}
+                for key, name in names.items():
+                    shared = len(query_codes & token_codes(name, algorithm, 3))
+                    if shared and shared >= min_shared:
+                        expected[key] = shared
+                assert index.candidates(query, min_shared=min_shared, algorithm=algorithm) == expected
+
+
+def test_candidates_respect_min_token_len():
+    index = PhoneticIndex.build([('A', 'GB PANT HOSPITAL'), ('B', 'GB ROAD CLINIC')], min_token_len=4)
+
+    assert index.candidates('GB', algorithm='soundex') == {}
+    assert index.candidates('PANT', algorithm='soundex') == {'A': 1}
+
+
+def test_name_matches_any_whole_name_code():
+    index = PhoneticIndex.build([('A', 'KASTURBA'), ('B', 'KASTOORBA'), ('C', 'MANIPAL')])
+
+    assert index.name_matches(phonetic_keys('KASTURBA')) == {'A', 'B'}
+    assert index.name_matches(phonetic_keys('MANIPAL')) == {'C'}
+    assert index.name_matches(phonetic_index.PhoneticKeys('', '', '')) == set()
+    assert index.keys_of('C') == phonetic_keys('MANIPAL')
+
+
+def test_name_only_index_builds_no_token_postings():
+    index = PhoneticIndex.build([('A', 'GOVT MEDICAL COLLEGE KOTA')], token_algorithms=())
+
+    assert index.name_matches(phonetic_keys('GOVT MEDICAL COLLEGE KOTA')) == {'A'}
+    with pytest.raises(ValueError):
+        index.candidates('GOVT MEDICAL COLLEGE KOTA')
+
+
+def test_query_codes_are_cached(fake_jellyfish):
+    index = PhoneticIndex.build([('A', 'GOVT MEDICAL COLLEGE KOTA'), ('B', 'MEDICLE COLEGE KOLLAM')],
+                                token_algorithms=('soundex',))
+    fake_jellyfish.clear()
+
+    first = index.candidates('GOVT MADICAL COLLEGE', algorithm='soundex')
+    encoded = list(fake_jellyfish)
+    hits = token_codes.cache_info().hits
+    second = index.candidates('GOVT MADICAL COLLEGE', algorithm='soundex')
+
+    assert first == second == {'A': 3, 'B': 1}  # MADICAL ~ MEDICAL ~ MEDICLE; COLEGE != COLLEGE
+    assert encoded == [('soundex', 'MADICAL')]  # Other words were encoded while indexing
+    assert len(fake_jellyfish) == 1  # Repeated query: no new jellyfish calls
+    assert token_codes.cache_info().hits == hits + 1
@@ -0,0 +1,130 @@
+import os
+import random
+import sqlite3
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sync_sqlite_to_supabase as sync
+from local_supabase_standin import LocalSupabaseClient
+
+
+def _make_source(path, n_rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE courses (id TEXT PRIMARY KEY, name TEXT, normalized_name TEXT)")
+    conn.executemany(
+        "INSERT INTO courses VALUES (?, ?, ?)",
+        [(f"CRS{i:05d}", f"Course {i}", f"COURSE {i}") for i in range(n_rows)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _source_rows(path):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    rows = sorted((dict(row) for row in conn.execute("SELECT * FROM courses")), key=lambda r: r["id"])
+    conn.close()
+    return rows
+
+
+def _target_rows(client):
+    return sorted(client.fetch_all("courses"), key=lambda r: r["id"])
+
+
+def _setup(tmp_path, monkeypatch, n_rows=1200):
+    source_db = str(tmp_path / "master.db")
+    _make_source(source_db, n_rows)
+    config = dict(sync.TABLE_CONFIG["courses"], source_db=source_db)
+    monkeypatch.setitem(sync.TABLE_CONFIG, "courses", config)
+    monkeypatch.setattr(sync.time, "sleep", lambda _: None)  # No retry backoff in tests
+    watermark = sync.SyncWatermark(str(tmp_path / "sync_state.db"))
+    return source_db, config, watermark
+
+
+def _sync(client, config, watermark, **kwargs):
+    return sync.sync_table_to_supabase(client, "courses", config, watermark=watermark,
+                                       batch_size=100, chunk_size=250, **kwargs)
+
+
+def test_first_sync_then_noop_rerun(tmp_path, monkeypatch):
+    source_db, config, watermark = _setup(tmp_path, monkeypatch)
+    client = LocalSupabaseClient()
+
+    stats = _sync(client, config, watermark)
+    assert stats == {"inserted": 1200, "updated": 0, "deleted": 0, "unchanged": 0, "errors": 0}
+    assert _target_rows(client) == _source_rows(source_db)
+    assert client.stats["requests"] == 12
+
+    client.reset_stats()
+    stats = _sync(client, config, watermark)
+    assert stats == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 1200, "errors": 0}
+    assert client.stats["requests"] == 0
+    watermark.close()
+
+
+def test_dry_run_delta_then_insert_update_deletes(tmp_path, monkeypatch):
+    source_db, config, watermark = _setup(tmp_path, monkeypatch)
+    client = LocalSupabaseClient()
+    _sync(client, config, watermark)
+
+    conn = sqlite3.connect(source_db)
+    conn.execute("INSERT INTO courses VALUES ('CRS99999', 'New Course', 'NEW COURSE')")
+    conn.execute("UPDATE courses SET name = 'Renamed' WHERE id = 'CRS00007'")
+    conn.execute("DELETE FROM courses WHERE id IN ('CRS00010', 'CRS01100')")
+    conn.commit()
+    conn.close()
+
+    client.reset_stats()
+    stats = _sync(client, config, watermark, dry_run=True)
+    assert stats == {"would_insert": 1, "would_update": 1, "would_delete": 2, "unchanged": 1197}
+    assert client.stats["requests"] == 0
+
+    # The dry run left the watermark alone: the same delta is applied now
+    stats = _sync(client, config, watermark)
+    assert stats == {"inserted": 1, "updated": 1, "deleted": 2, "unchanged": 1197, "errors": 0}
+    assert client.stats["rows_upserted"] == 2
+    assert client.stats["rows_deleted"] == 2
+    assert _target_rows(client) == _source_rows(source_db)
+    watermark.close()
+
+
+def test_retries_injected_failures(tmp_path, monkeypatch):
+    source_db, config, watermark = _setup(tmp_path, monkeypatch)
+    random.seed(20)
+    client = LocalSupabaseClient(failure_ratio=0.2)
+
+    stats = _sync(client, config, watermark)
+    assert stats["errors"] == 0
+    assert stats["inserted"] == 1200
+    assert client.stats["failures"] > 0
+    assert client.stats["requests"] == 12 + client.stats["failures"]
+    assert _target_rows(client) == _source_rows(source_db)
+
+    client.failure_ratio = 0.0
+    client.reset_stats()
+    assert _sync(client, config, watermark)["unchanged"] == 1200
+    assert client.stats["requests"] == 0
+    watermark.close()
+
+
+def test_full_resync_dry_run_reports_every_row(tmp_path, monkeypatch):
+    source_db, config, watermark = _setup(tmp_path, monkeypatch)
+    client = LocalSupabaseClient()
+    _sync(client, config, watermark)
+    watermark.close()
+    state_db = str(tmp_path / "sync_state.db")
+
+    client.reset_stats()
+    stats = sync.sync_all_tables(client, ["courses"], dry_run=True, state_db=state_db, full_resync=True)
+    assert stats["courses"] == {"would_insert": 1200, "would_update": 0, "would_delete": 0, "unchanged": 0}
+    assert client.stats["requests"] == 0
+
+    # The dry run must not have dropped the watermark
+    stats = sync.sync_all_tables(client, ["courses"], state_db=state_db)
+    assert stats["courses"]["unchanged"] == 1200
+    assert client.stats["requests"] == 0
+
+    stats = sync.sync_all_tables(client, ["courses"], state_db=state_db, full_resync=True, batch_size=100)
+    assert stats["courses"]["inserted"] == 1200
+    assert client.stats["requests"] == 12
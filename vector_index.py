@@ -12,10 +12,13 @@ Usage:
     
     # Get similarity between two college names
     score = get_similarity("AIIMS Delhi", "All India Institute of Medical Sciences")
+    
+    # Warm the cache for many names at once (batched, persistent store)
+    get_vector_index().get_embeddings(names)
 """
 
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 import logging
 from rich.console import Console
@@ -140,6 +143,36 @@ class VectorIndexWrapper:
             logger.warning(f"Embedding failed for '{text[:30]}...': {e}")
             return None
             
+    def get_embeddings(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Get embeddings for many texts at once.
+        
+        Uncached texts are encoded in large batches through the persistent
+        embedding store (shared with the master index), so names seen in an
+        earlier run are never re-encoded. Results land in the same cache as
+        get_embedding(), so later get_similarity() calls are lookups.
+        """
+        keys = [text.upper().strip() if text else None for text in texts]
+        
+        self._ensure_initialized()
+        if not self._engine:
+            return [None] * len(keys)
+        
+        pending = list(dict.fromkeys(
+            key for key in keys if key is not None and key not in self._embedding_cache
+        ))
+        if pending:
+            try:
+                from embedding_store import get_embedding_store
+                store = get_embedding_store(self.model_name, encode_params=self._engine.encode_params)
+                vectors = store.encode(pending, self._engine._encode_texts)
+                for key, vec in zip(pending, vectors):
+                    self._embedding_cache[key] = vec
+            except Exception as e:
+                logger.warning(f"Batch embedding failed for {len(pending)} texts: {e}")
+        
+        return [self._embedding_cache.get(key) if key is not None else None for key in keys]
+    
     def get_similarity(self, name1: str, name2: str) -> float:
         """
         Calculate cosine similarity between two names.